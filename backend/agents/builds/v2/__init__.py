@@ -36,20 +36,22 @@ class V2Build(AgentBuildBase):
         message: str,
         user_context: Dict[str, Any],
         navigation_context: Dict[str, Any],
-        thread_id: Optional[str] = None
+        thread_id: Optional[str] = None,
+        request_id: Optional[str] = None
     ) -> ChatResponse:
         """Synchronous chat invocation."""
-        return _invoke_chat(message, user_context, navigation_context, thread_id)
+        return _invoke_chat(message, user_context, navigation_context, thread_id, request_id)
 
     async def ainvoke_chat(
         self,
         message: str,
         user_context: Dict[str, Any],
         navigation_context: Dict[str, Any],
-        thread_id: Optional[str] = None
+        thread_id: Optional[str] = None,
+        request_id: Optional[str] = None
     ) -> ChatResponse:
         """Async chat invocation."""
-        return await _ainvoke_chat(message, user_context, navigation_context, thread_id)
+        return await _ainvoke_chat(message, user_context, navigation_context, thread_id, request_id)
 
     def resume_chat(
         self,
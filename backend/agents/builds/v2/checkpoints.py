@@ -0,0 +1,311 @@
+"""
+Checkpoint lifecycle management for the main chat graph.
+
+Checkpoints are only needed for runs that can pause for a HITL
+(Human-in-the-Loop) decision. Everything else runs on a stateless graph
+and never touches the checkpointer.
+
+Lifecycle rules:
+- Runs that cannot reach a HITL node (see HITL_ROLES) skip checkpointing.
+- HITL-capable runs get their own thread (chat_{user_id}_{role}_{run}),
+  so concurrent runs and tabs of one user never share checkpoints.
+- Threads whose run finished without requesting HITL are released.
+  Threads waiting on a HITL decision are never deleted; they are kept for
+  resume_chat until the Redis TTL or the in-memory LRU cap drops them.
+
+Usage:
+    from agents.builds.v2.checkpoints import get_checkpoint_manager
+
+    manager = get_checkpoint_manager()
+    if manager.requires_checkpoint(nav_ctx):
+        thread_id = manager.acquire_thread(user_id, nav_ctx, request_id)
+"""
+
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+import logging
+import threading
+import uuid
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from config import settings
+from agents.builds.v2.action_validator import get_role_from_section
+
+logger = logging.getLogger(__name__)
+
+
+# Roles whose nodes can set requires_hitl (publish approvals, destructive admin actions)
+HITL_ROLES = {"editor", "admin"}
+
+# Key prefixes written by langgraph-checkpoint-redis
+REDIS_CHECKPOINT_PREFIXES = ("checkpoint:", "checkpoint_blob:", "checkpoint_write:")
+
+# Channel LangGraph writes interrupts to (langgraph.constants.INTERRUPT)
+INTERRUPT_CHANNEL = "__interrupt__"
+
+
+class BoundedMemorySaver(MemorySaver):
+    """
+    MemorySaver with an LRU cap on the number of threads it retains.
+
+    The stock MemorySaver never forgets a thread, which leaks memory for
+    every chat message when Redis is unavailable.
+    """
+
+    def __init__(self, max_threads: int = 256, **kwargs):
+        super().__init__(**kwargs)
+        self.max_threads = max_threads
+        self._lru: "OrderedDict[str, None]" = OrderedDict()
+        self._lru_lock = threading.Lock()
+
+    def _touch(self, thread_id: str) -> None:
+        """Mark a thread as recently used and evict the oldest beyond the cap."""
+        evicted = []
+        with self._lru_lock:
+            self._lru[thread_id] = None
+            self._lru.move_to_end(thread_id)
+            while len(self._lru) > self.max_threads:
+                oldest, _ = self._lru.popitem(last=False)
+                evicted.append(oldest)
+
+        for oldest in evicted:
+            super().delete_thread(oldest)
+            logger.debug(f"Checkpoint LRU: evicted thread {oldest}")
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        result = super().put(config, checkpoint, metadata, new_versions)
+        self._touch(config["configurable"]["thread_id"])
+        return result
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lru_lock:
+            self._lru.pop(thread_id, None)
+        super().delete_thread(thread_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return thread count, checkpoint count and serialized bytes held in memory."""
+        checkpoint_count = 0
+        total_bytes = 0
+
+        for namespaces in list(self.storage.values()):
+            for checkpoints in list(namespaces.values()):
+                checkpoint_count += len(checkpoints)
+                for checkpoint, metadata, _parent in list(checkpoints.values()):
+                    total_bytes += len(checkpoint[1]) + len(metadata[1])
+
+        for _type, blob in list(self.blobs.values()):
+            total_bytes += len(blob)
+
+        for writes in list(self.writes.values()):
+            for _task_id, _channel, value, _task_path in list(writes.values()):
+                total_bytes += len(value[1])
+
+        return {
+            "backend": "memory",
+            "threads": len(self.storage),
+            "checkpoints": checkpoint_count,
+            "bytes": total_bytes,
+            "max_threads": self.max_threads,
+        }
+
+
+class CheckpointManager:
+    """
+    Owns the checkpointer instance and decides which runs use it.
+    """
+
+    def __init__(self):
+        self._checkpointer = None
+        self._backend = "none"
+
+    @property
+    def checkpointer(self):
+        """Get the checkpointer, creating it on first use."""
+        if self._checkpointer is None:
+            self._checkpointer = self._create_checkpointer()
+        return self._checkpointer
+
+    def _create_checkpointer(self):
+        """
+        Create the checkpointer.
+
+        Uses Redis in production (for HITL state persistence across restarts),
+        falls back to a bounded MemorySaver for development.
+        """
+        if settings.redis_url:
+            try:
+                from langgraph.checkpoint.redis import RedisSaver
+                # from_conn_string returns a context manager; enter it to get the saver instance
+                saver_context = RedisSaver.from_conn_string(
+                    settings.redis_url,
+                    ttl={
+                        "default_ttl": settings.checkpoint_ttl_minutes,
+                        "refresh_on_read": True,
+                    },
+                )
+                saver = saver_context.__enter__()
+                try:
+                    saver.setup()  # Initialize Redis indices (requires RediSearch module)
+                except Exception as setup_err:
+                    # RediSearch module may not be available (e.g., using redis:alpine instead of redis-stack)
+                    # The checkpointer can still work for basic operations without search indices
+                    if "unknown command" in str(setup_err).lower() or "FT." in str(setup_err):
+                        logger.warning(
+                            f"Redis setup() failed (RediSearch module not available): {setup_err}. "
+                            "Consider using redis/redis-stack image for full functionality."
+                        )
+                    else:
+                        raise  # Re-raise if it's a different error
+                self._backend = "redis"
+                logger.info(
+                    f"Using Redis checkpointer for HITL state persistence "
+                    f"(ttl={settings.checkpoint_ttl_minutes}m)"
+                )
+                return saver
+            except ImportError as e:
+                logger.warning(f"Redis checkpointer not available: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis: {e}")
+
+        logger.info(
+            f"Using in-memory checkpointer (max_threads={settings.checkpoint_memory_max_threads})"
+        )
+        self._backend = "memory"
+        return BoundedMemorySaver(max_threads=settings.checkpoint_memory_max_threads)
+
+    # -------------------------------------------------------------------------
+    # Run classification
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def requires_checkpoint(
+        navigation_context: Optional[Dict[str, Any]],
+        thread_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Check whether a run can reach a HITL interrupt and needs checkpointing.
+
+        An explicit thread_id always means the caller wants continuity.
+        """
+        if thread_id:
+            return True
+        nav_context = navigation_context or {}
+        role = get_role_from_section(nav_context.get("section", "home"))
+        return role in HITL_ROLES
+
+    # -------------------------------------------------------------------------
+    # Thread lifecycle
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def thread_slot(user_id: Any, navigation_context: Optional[Dict[str, Any]]) -> str:
+        """Thread ID prefix shared by a user's HITL-capable runs in one role."""
+        nav_context = navigation_context or {}
+        role = get_role_from_section(nav_context.get("section", "home"))
+        return f"chat_{user_id}_{role}"
+
+    def acquire_thread(
+        self,
+        user_id: Any,
+        navigation_context: Optional[Dict[str, Any]],
+        run_id: Optional[str] = None,
+    ) -> str:
+        """
+        Get a new thread for one HITL-capable run.
+
+        Every run gets its own thread, so concurrent runs (other tabs, a new
+        message while a HITL decision is pending) never reset each other.
+        Old threads are bounded by the Redis TTL and the in-memory LRU cap.
+
+        Args:
+            user_id: User the run is for
+            navigation_context: Navigation context (gives the role)
+            run_id: Run identifier, e.g. the chat request ID (generated if not given)
+        """
+        return f"{self.thread_slot(user_id, navigation_context)}_{run_id or uuid.uuid4().hex}"
+
+    def has_pending_hitl(self, thread_id: str) -> bool:
+        """
+        Check whether a thread is paused waiting on a HITL decision.
+
+        Threads that cannot be read are treated as pending, so they are kept.
+        """
+        try:
+            saved = self.checkpointer.get_tuple({"configurable": {"thread_id": thread_id}})
+        except Exception as e:
+            logger.warning(f"Failed to read checkpoint thread {thread_id}: {e}")
+            return True
+        if saved is None:
+            return False
+        if any(write[1] == INTERRUPT_CHANNEL for write in saved.pending_writes or []):
+            return True
+        return bool(saved.checkpoint.get("channel_values", {}).get("requires_hitl"))
+
+    def release_thread(self, thread_id: str) -> None:
+        """
+        Delete all checkpoints for a thread unless it is waiting on a HITL decision.
+
+        Failures are logged, not raised.
+        """
+        if self.has_pending_hitl(thread_id):
+            logger.debug(f"Keeping checkpoint thread {thread_id}: HITL decision pending")
+            return
+        try:
+            self.checkpointer.delete_thread(thread_id)
+        except Exception as e:
+            logger.warning(f"Failed to release checkpoint thread {thread_id}: {e}")
+
+    def finish_run(self, thread_id: str, result: Dict[str, Any]) -> None:
+        """Release a thread unless the run is waiting on a HITL decision."""
+        if not result.get("requires_hitl"):
+            self.release_thread(thread_id)
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get checkpoint count and bytes for the active backend."""
+        checkpointer = self.checkpointer
+
+        if isinstance(checkpointer, BoundedMemorySaver):
+            return checkpointer.stats()
+
+        try:
+            client = checkpointer._redis
+            stats = {
+                "backend": "redis",
+                "checkpoints": 0,
+                "blobs": 0,
+                "writes": 0,
+                "bytes": 0,
+                "ttl_minutes": settings.checkpoint_ttl_minutes,
+            }
+            counters = dict(zip(REDIS_CHECKPOINT_PREFIXES, ("checkpoints", "blobs", "writes")))
+            for prefix, counter in counters.items():
+                keys = list(client.scan_iter(match=f"{prefix}*", count=500))
+                stats[counter] = len(keys)
+                if keys:
+                    pipe = client.pipeline(transaction=False)
+                    for key in keys:
+                        pipe.memory_usage(key)
+                    stats["bytes"] += sum(size or 0 for size in pipe.execute())
+            return stats
+        except Exception as e:
+            return {"backend": self._backend, "error": str(e)}
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_MANAGER: Optional[CheckpointManager] = None
+
+
+def get_checkpoint_manager() -> CheckpointManager:
+    """Get the singleton checkpoint manager."""
+    global _MANAGER
+    if _MANAGER is None:
+        _MANAGER = CheckpointManager()
+    return _MANAGER
@@ -20,9 +20,10 @@ import logging
 import uuid
 
 from config import settings
+from metrics import instrument_node
+from tracing import span
 
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.messages import HumanMessage
 
 from agents.builds.v2.state import (
@@ -32,6 +33,7 @@ from agents.builds.v2.state import (
     NavigationContext,
     create_initial_state,
 )
+from agents.builds.v2.checkpoints import get_checkpoint_manager
 
 logger = logging.getLogger(__name__)
 
@@ -41,53 +43,15 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 _GRAPH = None
-_CHECKPOINTER = None
+_STATELESS_GRAPH = None
 
 
-def _get_checkpointer():
+def _build_graph(checkpointed: bool = True):
     """
-    Get singleton checkpointer instance.
+    Build the main chat graph (called ONCE per variant at startup).
 
-    Uses Redis in production (for HITL state persistence across restarts),
-    falls back to MemorySaver for development.
-    """
-    global _CHECKPOINTER
-    if _CHECKPOINTER is not None:
-        return _CHECKPOINTER
-
-    if settings.redis_url:
-        try:
-            from langgraph.checkpoint.redis import RedisSaver
-            # from_conn_string returns a context manager; enter it to get the saver instance
-            saver_context = RedisSaver.from_conn_string(settings.redis_url)
-            _CHECKPOINTER = saver_context.__enter__()
-            try:
-                _CHECKPOINTER.setup()  # Initialize Redis indices (requires RediSearch module)
-            except Exception as setup_err:
-                # RediSearch module may not be available (e.g., using redis:alpine instead of redis-stack)
-                # The checkpointer can still work for basic operations without search indices
-                if "unknown command" in str(setup_err).lower() or "FT." in str(setup_err):
-                    logger.warning(
-                        f"Redis setup() failed (RediSearch module not available): {setup_err}. "
-                        "Consider using redis/redis-stack image for full functionality."
-                    )
-                else:
-                    raise  # Re-raise if it's a different error
-            logger.info("Using Redis checkpointer for HITL state persistence")
-            return _CHECKPOINTER
-        except ImportError as e:
-            logger.warning(f"Redis checkpointer not available: {e}")
-        except Exception as e:
-            logger.warning(f"Failed to connect to Redis: {e}")
-
-    logger.info("Using in-memory checkpointer")
-    _CHECKPOINTER = MemorySaver()
-    return _CHECKPOINTER
-
-
-def _build_graph():
-    """
-    Build the main chat graph (called ONCE at startup).
+    Two variants share the same structure: a checkpointed graph for runs that
+    may pause for HITL, and a stateless graph for everything else.
 
     Graph Structure:
         START → router → [role nodes] → response_builder → END
@@ -119,16 +83,16 @@ def _build_graph():
     # Create graph with AgentState schema
     workflow = StateGraph(AgentState)
 
-    # Add nodes
-    workflow.add_node("router", router_node)
-    workflow.add_node("navigation", navigation_node)
-    workflow.add_node("user", user_node)
-    workflow.add_node("reader", reader_node)
-    workflow.add_node("analyst", analyst_node)
-    workflow.add_node("editor", editor_node)
-    workflow.add_node("admin", admin_node)
-    workflow.add_node("general_chat", general_chat_node)
-    workflow.add_node("response_builder", response_builder_node)
+    # Add nodes (each wrapped for per-node latency metrics)
+    workflow.add_node("router", instrument_node("router", router_node))
+    workflow.add_node("navigation", instrument_node("navigation", navigation_node))
+    workflow.add_node("user", instrument_node("user", user_node))
+    workflow.add_node("reader", instrument_node("reader", reader_node))
+    workflow.add_node("analyst", instrument_node("analyst", analyst_node))
+    workflow.add_node("editor", instrument_node("editor", editor_node))
+    workflow.add_node("admin", instrument_node("admin", admin_node))
+    workflow.add_node("general_chat", instrument_node("general_chat", general_chat_node))
+    workflow.add_node("response_builder", instrument_node("response_builder", response_builder_node))
 
     # Entry point
     workflow.set_entry_point("router")
@@ -156,19 +120,76 @@ def _build_graph():
     # Response builder goes to END
     workflow.add_edge("response_builder", END)
 
-    # Compile with checkpointer
-    compiled = workflow.compile(checkpointer=_get_checkpointer())
+    # Compile with checkpointer only when HITL state must survive the run
+    checkpointer = get_checkpoint_manager().checkpointer if checkpointed else None
+    compiled = workflow.compile(checkpointer=checkpointer)
 
-    logger.info("Main chat graph built successfully")
+    logger.info(f"Main chat graph built successfully (checkpointed={checkpointed})")
     return compiled
 
 
-def get_graph():
-    """Get the singleton graph instance, building it if necessary."""
-    global _GRAPH
-    if _GRAPH is None:
-        _GRAPH = _build_graph()
-    return _GRAPH
+def get_graph(checkpointed: bool = True):
+    """Get a singleton graph instance, building it if necessary."""
+    global _GRAPH, _STATELESS_GRAPH
+    if checkpointed:
+        if _GRAPH is None:
+            _GRAPH = _build_graph(checkpointed=True)
+        return _GRAPH
+    if _STATELESS_GRAPH is None:
+        _STATELESS_GRAPH = _build_graph(checkpointed=False)
+    return _STATELESS_GRAPH
+
+
+def _prepare_run(
+    user_context: UserContext,
+    navigation_context: Optional[NavigationContext],
+    thread_id: Optional[str],
+    request_id: str,
+):
+    """
+    Pick the graph variant and thread for a run.
+
+    Stateless runs use the request ID as their thread ID, so LangSmith runs,
+    trace spans and log lines of one chat request share an identifier.
+    Checkpointed runs get a thread of their own (named after the request ID
+    unless the caller passes one) and carry the request ID in the run
+    metadata.
+
+    Returns:
+        Tuple of (graph, config, thread_id, release_after_run)
+    """
+    manager = get_checkpoint_manager()
+    metadata = {"request_id": request_id}
+
+    if not manager.requires_checkpoint(navigation_context, thread_id):
+        config = {"configurable": {"thread_id": request_id}, "metadata": metadata}
+        return get_graph(checkpointed=False), config, request_id, False
+
+    if thread_id:
+        # Caller-managed thread: keep it for continuity (bounded by TTL/LRU)
+        config = {"configurable": {"thread_id": thread_id}, "metadata": metadata}
+        return get_graph(), config, thread_id, False
+
+    thread_id = manager.acquire_thread(user_context["user_id"], navigation_context, request_id)
+    config = {"configurable": {"thread_id": thread_id}, "metadata": metadata}
+    return get_graph(), config, thread_id, True
+
+
+def _run_attributes(
+    request_id: str,
+    thread_id: Optional[str],
+    user_context: UserContext,
+    navigation_context: Optional[NavigationContext],
+) -> Dict[str, Any]:
+    """Span attributes for the root span of a graph run."""
+    nav_context = navigation_context or {}
+    return {
+        "chat.request_id": request_id,
+        "chat.thread_id": thread_id,
+        "chat.user_id": str(user_context.get("user_id")),
+        "chat.section": nav_context.get("section"),
+        "chat.topic": nav_context.get("topic"),
+    }
 
 
 # =============================================================================
@@ -180,6 +201,7 @@ def invoke_chat(
     user_context: UserContext,
     navigation_context: Optional[NavigationContext] = None,
     thread_id: Optional[str] = None,
+    request_id: Optional[str] = None,
 ) -> ChatResponse:
     """
     Invoke the chat graph with a user message.
@@ -191,6 +213,7 @@ def invoke_chat(
         user_context: Authenticated user context (from JWT)
         navigation_context: Frontend navigation context (optional)
         thread_id: Thread ID for conversation continuity (optional)
+        request_id: Chat request ID for tracing (generated if not given)
 
     Returns:
         ChatResponse with validated structure
@@ -204,8 +227,6 @@ def invoke_chat(
         print(response.response)  # "Navigating to equity..."
         print(response.ui_action)  # {"type": "goto_home", "params": {"topic": "equity"}}
     """
-    graph = get_graph()
-
     # Create initial state
     state = create_initial_state(
         user_context=user_context,
@@ -213,17 +234,20 @@ def invoke_chat(
         navigation_context=navigation_context,
     )
 
-    # Generate thread ID if not provided
-    if not thread_id:
-        thread_id = f"chat_{user_context['user_id']}_{uuid.uuid4().hex[:8]}"
-
-    config = {"configurable": {"thread_id": thread_id}}
+    # Only HITL-capable runs get a checkpoint thread
+    request_id = request_id or uuid.uuid4().hex
+    graph, config, thread_id, release_after_run = _prepare_run(
+        user_context, navigation_context, thread_id, request_id
+    )
 
-    logger.info(f"Invoking chat graph: thread={thread_id}, message='{message[:50]}...'")
+    logger.info(f"Invoking chat graph: request={request_id}, thread={thread_id}, message='{message[:50]}...'")
 
     try:
         # Invoke graph
-        result = graph.invoke(state, config)
+        with span("chat.invoke", _run_attributes(request_id, thread_id, user_context, navigation_context)):
+            result = graph.invoke(state, config)
+        if release_after_run:
+            get_checkpoint_manager().finish_run(thread_id, result)
 
         # Build response from state
         response = ChatResponse(
@@ -256,6 +280,7 @@ async def ainvoke_chat(
     user_context: UserContext,
     navigation_context: Optional[NavigationContext] = None,
     thread_id: Optional[str] = None,
+    request_id: Optional[str] = None,
 ) -> ChatResponse:
     """
     Async version of invoke_chat.
@@ -265,25 +290,27 @@ async def ainvoke_chat(
         user_context: Authenticated user context
         navigation_context: Frontend navigation context (optional)
         thread_id: Thread ID for conversation continuity (optional)
+        request_id: Chat request ID for tracing (generated if not given)
 
     Returns:
         ChatResponse with validated structure
     """
-    graph = get_graph()
-
     state = create_initial_state(
         user_context=user_context,
         messages=[HumanMessage(content=message)],
         navigation_context=navigation_context,
     )
 
-    if not thread_id:
-        thread_id = f"chat_{user_context['user_id']}_{uuid.uuid4().hex[:8]}"
-
-    config = {"configurable": {"thread_id": thread_id}}
+    request_id = request_id or uuid.uuid4().hex
+    graph, config, thread_id, release_after_run = _prepare_run(
+        user_context, navigation_context, thread_id, request_id
+    )
 
     try:
-        result = await graph.ainvoke(state, config)
+        with span("chat.invoke", _run_attributes(request_id, thread_id, user_context, navigation_context)):
+            result = await graph.ainvoke(state, config)
+        if release_after_run:
+            get_checkpoint_manager().finish_run(thread_id, result)
 
         return ChatResponse(
             response=result.get("response_text") or "No response generated",
@@ -329,10 +356,11 @@ def resume_chat(
     logger.info(f"Resuming workflow: thread={thread_id}, decision={hitl_decision}")
 
     try:
-        result = graph.invoke(
-            {"hitl_decision": hitl_decision, "user_context": user_context},
-            config=config
-        )
+        with span("chat.resume", {"chat.thread_id": thread_id, "chat.hitl_decision": hitl_decision}):
+            result = graph.invoke(
+                {"hitl_decision": hitl_decision, "user_context": user_context},
+                config=config
+            )
 
         return ChatResponse(
             response=result.get("response_text") or "Workflow resumed",
@@ -17,11 +17,12 @@ from typing import Dict, Any, Optional, List
 import logging
 import json
 
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
 from config import settings
 from agents.builds.v2.state import IntentClassification, IntentType, NavigationContext
+from services.llm_client import GovernedChatOpenAI
+from services.model_router import routed_chat_model
 
 logger = logging.getLogger(__name__)
 
@@ -29,16 +30,15 @@ logger = logging.getLogger(__name__)
 _classifier_llm = None
 
 
-def _get_classifier_llm() -> ChatOpenAI:
+def _get_classifier_llm() -> GovernedChatOpenAI:
     """Get singleton LLM instance for classification."""
     global _classifier_llm
     if _classifier_llm is None:
-        _classifier_llm = ChatOpenAI(
-            model=settings.effective_intent_classifier_model,
+        _classifier_llm = routed_chat_model(
+            "intent.classify",
             temperature=settings.intent_classifier_temperature,
-            api_key=settings.openai_api_key
         )
-        logger.info(f"Intent classifier initialized with model: {settings.effective_intent_classifier_model}")
+        logger.info(f"Intent classifier initialized with model: {_classifier_llm.model_name}")
     return _classifier_llm
 
 
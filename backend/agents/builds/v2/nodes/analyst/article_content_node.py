@@ -14,10 +14,11 @@ Used by analyst_node when content generation is needed.
 
 from typing import Dict, Any, Optional, TypedDict, List
 import logging
-import os
 
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+
+from metrics import instrument_node
+from services.model_router import routed_chat_model
 
 logger = logging.getLogger(__name__)
 
@@ -72,13 +73,15 @@ def create_content_node(state: ArticleContentState) -> Dict[str, Any]:
 
         db = SessionLocal()
         try:
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0.7,
-                api_key=os.getenv("OPENAI_API_KEY", "")
+            llm = routed_chat_model("article_content.content", topic=topic, temperature=0.7)
+
+            agent = AnalystAgent(
+                topic=topic,
+                llm=llm,
+                db=db,
+                headline_llm=routed_chat_model("analyst.headline", topic=topic, temperature=0.7),
+                keywords_llm=routed_chat_model("analyst.keywords", topic=topic, temperature=0.3),
             )
-
-            agent = AnalystAgent(topic=topic, llm=llm, db=db)
             result = agent.research_and_write(
                 query=query,
                 user_context=user_context,
@@ -124,11 +127,7 @@ def regenerate_headline_node(state: ArticleContentState) -> Dict[str, Any]:
         }
 
     try:
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("article_content.headline", topic=topic, temperature=0.7)
 
         prompt_parts = [f"Generate a compelling, professional headline for a {topic} research article."]
         if existing_keywords:
@@ -166,11 +165,7 @@ def regenerate_keywords_node(state: ArticleContentState) -> Dict[str, Any]:
         }
 
     try:
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.3,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("article_content.keywords", topic=topic, temperature=0.3)
 
         prompt_parts = [f"Generate 5-8 relevant keywords for a {topic} article."]
         if existing_headline:
@@ -212,11 +207,7 @@ def regenerate_content_node(state: ArticleContentState) -> Dict[str, Any]:
     try:
         tonality = user_context.get("content_tonality_text", "")
 
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("article_content.content", topic=topic, temperature=0.7)
 
         system_prompt = f"""You are a professional financial analyst and writer specializing in {topic}.
 Your task is to rewrite/regenerate article content. The content should be:
@@ -278,11 +269,7 @@ def edit_section_node(state: ArticleContentState) -> Dict[str, Any]:
     try:
         tonality = user_context.get("content_tonality_text", "")
 
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("article_content.edit_section", topic=topic, temperature=0.7)
 
         system_prompt = f"""You are a professional financial editor specializing in {topic}.
 Your task is to edit a SPECIFIC SECTION of an article based on the user's instruction.
@@ -345,11 +332,7 @@ def refine_content_node(state: ArticleContentState) -> Dict[str, Any]:
     try:
         tonality = user_context.get("content_tonality_text", "")
 
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.5,  # Lower temperature for more consistent refinement
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("article_content.refine", topic=topic, temperature=0.5)  # Lower temperature for more consistent refinement
 
         system_prompt = f"""You are a professional financial editor specializing in {topic}.
 Your task is to refine and improve an article based on the user's instruction.
@@ -394,11 +377,7 @@ def _create_content_fallback(
     tonality = user_context.get("content_tonality_text", "")
 
     try:
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("article_content.content", topic=topic, temperature=0.7)
 
         system_prompt = f"""You are a professional financial analyst and writer specializing in {topic}.
 Generate high-quality article content for publication.
@@ -493,14 +472,14 @@ def build_article_content_subgraph():
     """Build the article content sub-graph."""
     workflow = StateGraph(ArticleContentState)
 
-    # Add nodes
-    workflow.add_node("router", route_action_node)
-    workflow.add_node("create_content", create_content_node)
-    workflow.add_node("regenerate_headline", regenerate_headline_node)
-    workflow.add_node("regenerate_keywords", regenerate_keywords_node)
-    workflow.add_node("regenerate_content", regenerate_content_node)
-    workflow.add_node("edit_section", edit_section_node)
-    workflow.add_node("refine_content", refine_content_node)
+    # Add nodes (each wrapped for per-node latency metrics)
+    workflow.add_node("router", instrument_node("router", route_action_node, graph="article_content"))
+    workflow.add_node("create_content", instrument_node("create_content", create_content_node, graph="article_content"))
+    workflow.add_node("regenerate_headline", instrument_node("regenerate_headline", regenerate_headline_node, graph="article_content"))
+    workflow.add_node("regenerate_keywords", instrument_node("regenerate_keywords", regenerate_keywords_node, graph="article_content"))
+    workflow.add_node("regenerate_content", instrument_node("regenerate_content", regenerate_content_node, graph="article_content"))
+    workflow.add_node("edit_section", instrument_node("edit_section", edit_section_node, graph="article_content"))
+    workflow.add_node("refine_content", instrument_node("refine_content", refine_content_node, graph="article_content"))
 
     # Entry point
     workflow.set_entry_point("router")
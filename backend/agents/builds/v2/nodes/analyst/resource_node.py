@@ -16,6 +16,8 @@ import logging
 
 from langgraph.graph import StateGraph, END
 
+from metrics import instrument_node
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,7 +61,7 @@ def browse_resources_node(state: ResourceState) -> Dict[str, Any]:
     try:
         from database import SessionLocal
         from models import Resource
-        from sqlalchemy import or_
+        from services import text_search
 
         db = SessionLocal()
         try:
@@ -72,10 +74,7 @@ def browse_resources_node(state: ResourceState) -> Dict[str, Any]:
             # Apply search filter if query provided
             if query:
                 resources_query = resources_query.filter(
-                    or_(
-                        Resource.name.ilike(f"%{query}%"),
-                        Resource.description.ilike(f"%{query}%")
-                    )
+                    text_search.match_condition(db, text_search.RESOURCE_SEARCH, query)
                 )
 
             resources = resources_query.limit(20).all()
@@ -349,15 +348,15 @@ def build_resource_subgraph():
     """Build the resource management sub-graph."""
     workflow = StateGraph(ResourceState)
 
-    # Add nodes
-    workflow.add_node("router", route_resource_action)
-    workflow.add_node("browse", browse_resources_node)
-    workflow.add_node("add", add_resource_node)
-    workflow.add_node("remove", remove_resource_node)
-    workflow.add_node("link", link_resource_node)
-    workflow.add_node("unlink", unlink_resource_node)
-    workflow.add_node("query", query_resources_node)
-    workflow.add_node("get_article_resources", get_article_resources_node)
+    # Add nodes (each wrapped for per-node latency metrics)
+    workflow.add_node("router", instrument_node("router", route_resource_action, graph="resource"))
+    workflow.add_node("browse", instrument_node("browse", browse_resources_node, graph="resource"))
+    workflow.add_node("add", instrument_node("add", add_resource_node, graph="resource"))
+    workflow.add_node("remove", instrument_node("remove", remove_resource_node, graph="resource"))
+    workflow.add_node("link", instrument_node("link", link_resource_node, graph="resource"))
+    workflow.add_node("unlink", instrument_node("unlink", unlink_resource_node, graph="resource"))
+    workflow.add_node("query", instrument_node("query", query_resources_node, graph="resource"))
+    workflow.add_node("get_article_resources", instrument_node("get_article_resources", get_article_resources_node, graph="resource"))
 
     # Entry point
     workflow.set_entry_point("router")
@@ -464,16 +464,11 @@ def _handle_submit_for_review(
     try:
         from agents.shared.article_query_agent import ArticleQueryAgent
         from database import SessionLocal
-        from langchain_openai import ChatOpenAI
-        import os
+        from services.model_router import routed_chat_model
 
         db = SessionLocal()
         try:
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0,
-                api_key=os.getenv("OPENAI_API_KEY", "")
-            )
+            llm = routed_chat_model("analyst.article_query", topic=topic, temperature=0)
 
             agent = ArticleQueryAgent(llm=llm, db=db, topic=topic)
             result = agent.submit_for_review(
@@ -639,19 +634,11 @@ def _infer_topic_from_query(query: str) -> Optional[str]:
 
 
 def _get_article_content(article_id: int) -> str:
-    """Get article content from database."""
+    """Get article content from the content store."""
     try:
-        from database import SessionLocal
-        from models import ContentArticle
+        from services.content_store import ContentStore
 
-        db = SessionLocal()
-        try:
-            article = db.query(ContentArticle).filter(
-                ContentArticle.id == article_id
-            ).first()
-            return article.content if article else ""
-        finally:
-            db.close()
+        return ContentStore.get_content(article_id) or ""
     except Exception:
         return ""
 
@@ -8,12 +8,10 @@ the actual research and writing work.
 
 from typing import Dict, Any, Optional
 import logging
-import os
-
-from langchain_openai import ChatOpenAI
 
 from agents.builds.v2.state import AgentState
 from agents.shared.permission_utils import validate_article_access
+from services.model_router import routed_chat_model
 
 logger = logging.getLogger(__name__)
 
@@ -263,11 +261,7 @@ def _handle_regenerate_headline(
         }
 
     try:
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("content_gen.headline", topic=topic, temperature=0.7)
 
         # Build prompt for headline generation
         prompt_parts = [f"Generate a compelling, professional headline for a {topic} research article."]
@@ -356,11 +350,7 @@ def _handle_regenerate_keywords(
         }
 
     try:
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.3,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("content_gen.keywords", topic=topic, temperature=0.3)
 
         # Use first 1500 chars of content
         content_excerpt = existing_content[:1500] if existing_content else ""
@@ -452,11 +442,7 @@ def _handle_regenerate_content(
         # Get user's content tonality preference
         tonality = user_context.get("content_tonality_text", "")
 
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("content_gen.content", topic=topic, temperature=0.7)
 
         # Build system prompt
         system_prompt = f"""You are a professional financial analyst and writer specializing in {topic}.
@@ -653,14 +639,16 @@ def _generate_content(
         db = SessionLocal()
 
         try:
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0.7,
-                api_key=os.getenv("OPENAI_API_KEY", "")
+            llm = routed_chat_model("content_gen.content", topic=topic, temperature=0.7)
+
+            agent = AnalystAgent(
+                topic=topic,
+                llm=llm,
+                db=db,
+                headline_llm=routed_chat_model("analyst.headline", topic=topic, temperature=0.7),
+                keywords_llm=routed_chat_model("analyst.keywords", topic=topic, temperature=0.3),
             )
 
-            agent = AnalystAgent(topic=topic, llm=llm, db=db)
-
             # Run the full research and write workflow
             result = agent.research_and_write(
                 query=query,
@@ -711,11 +699,7 @@ def _generate_content_fallback(
     user_prompt = _build_user_prompt(query, nav_context)
 
     try:
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("content_gen.content", topic=topic, temperature=0.7)
 
         response = llm.invoke([
             {"role": "system", "content": system_prompt},
@@ -12,12 +12,10 @@ Routes based on nav_context.role == 'editor'
 
 from typing import Dict, Any, Optional, List
 import logging
-import os
-
-from langchain_openai import ChatOpenAI
 
 from agents.builds.v2.state import AgentState
 from agents.shared.permission_utils import check_topic_permission, get_topics_for_role, validate_article_access
+from services.model_router import routed_chat_model
 
 logger = logging.getLogger("uvicorn")
 
@@ -290,11 +288,7 @@ def _handle_list_pending(topic: Optional[str], user_context: Dict[str, Any]) ->
 
         db = SessionLocal()
         try:
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0,
-                api_key=os.getenv("OPENAI_API_KEY", "")
-            )
+            llm = routed_chat_model("editor.list_pending", topic=topic, temperature=0)
 
             agent = EditorSubAgent(llm=llm, db=db)
             result = agent.get_pending_approvals(
@@ -419,11 +413,7 @@ def _handle_review(
 
         db = SessionLocal()
         try:
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0.3,
-                api_key=os.getenv("OPENAI_API_KEY", "")
-            )
+            llm = routed_chat_model("editor.review", topic=topic, temperature=0.3)
 
             agent = EditorSubAgent(llm=llm, db=db)
             result = agent.review_article(
@@ -613,11 +603,7 @@ def _handle_submit_for_review(
     try:
         from agents.shared.article_query_agent import ArticleQueryAgent
 
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("editor.article_query", topic=topic, temperature=0)
 
         agent = ArticleQueryAgent(llm=llm, db=db, topic=topic)
         result = agent.submit_for_review(
@@ -833,11 +819,7 @@ def _handle_reject(
 
         db = SessionLocal()
         try:
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0,
-                api_key=os.getenv("OPENAI_API_KEY", "")
-            )
+            llm = routed_chat_model("editor.reject", topic=topic, temperature=0)
 
             agent = EditorSubAgent(llm=llm, db=db)
             result = agent.request_changes(
@@ -957,7 +939,7 @@ def _handle_hitl_resume(
             from models import ContentArticle, ArticleStatus
             from services.content_service import ContentService
             from services.article_resource_service import ArticleResourceService
-            from services.vector_service import VectorService
+            from services.content_store import ContentStore
 
             db = SessionLocal()
             try:
@@ -991,7 +973,7 @@ def _handle_hitl_resume(
 
                 # Create publication resources (HTML, PDF)
                 user_id = user_context.get("user_id")
-                content = VectorService.get_article_content(article_id)
+                content = ContentStore.get_content(article_id, db)
                 if content and user_id:
                     ArticleResourceService.create_article_resources(
                         db=db,
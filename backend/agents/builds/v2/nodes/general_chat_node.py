@@ -5,8 +5,7 @@ This node handles general conversation and topic-specific Q&A queries.
 It integrates with:
 - WebSearchAgent for live news and web data
 - DataDownloadAgent for financial data
-- ArticleQueryAgent for existing articles
-- ResourceQueryAgent for linked resources
+- RetrievalService for existing articles and linked resources
 
 LangGraph Features Used:
 - State-based context preservation
@@ -14,15 +13,14 @@ LangGraph Features Used:
 - Topic routing from dynamic database
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import logging
 import os
-import re
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 from agents.builds.v2.state import AgentState
+from services.model_router import routed_chat_model
 
 logger = logging.getLogger(__name__)
 
@@ -92,13 +90,10 @@ def general_chat_node(state: AgentState) -> Dict[str, Any]:
 
     # # Fetch market data using DataDownloadAgent
     # if data_needs.get("needs_market_data"):
-    #     context_data["market_data"] = _fetch_market_data(user_query, topic)
+    #     context_data["market_data"] = _fetch_market_data(user_query, topic, data_needs["symbols"])
 
-    # Search relevant articles using ArticleQueryAgent
-    context_data["articles"] = _search_articles(user_query, topic, user_context)
-
-    # Search relevant resources using ResourceQueryAgent
-    context_data["resources"] = _search_resources(user_query, topic)
+    # Search relevant articles and resources (one embedding, concurrent collections)
+    context_data["articles"], context_data["resources"] = _retrieve_context(user_query, topic, user_context)
 
     # Generate response
     try:
@@ -159,13 +154,17 @@ def _infer_topic(query: str, nav_context: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def _analyze_data_needs(query: str) -> Dict[str, bool]:
-    """Analyze what external data the query needs."""
+def _analyze_data_needs(query: str) -> Dict[str, Any]:
+    """Analyze what external data the query needs (symbols resolved against the ticker universe)."""
+    from services.ticker_universe import find_symbols
+
     query_lower = query.lower()
+    symbols = find_symbols(query, limit=3)
 
     return {
         "needs_web_search": any(kw in query_lower for kw in LIVE_DATA_KEYWORDS),
-        "needs_market_data": any(kw in query_lower for kw in MARKET_DATA_KEYWORDS)
+        "needs_market_data": bool(symbols) or any(kw in query_lower for kw in MARKET_DATA_KEYWORDS),
+        "symbols": symbols,
     }
 
 
@@ -178,11 +177,7 @@ def _fetch_web_search(query: str, topic: Optional[str]) -> List[Dict[str, str]]:
     try:
         from agents.shared.web_search_agent import WebSearchAgent
 
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("general_chat.web_search", topic=topic, temperature=0)
 
         agent = WebSearchAgent(llm=llm, topic=topic)
 
@@ -210,11 +205,11 @@ def _fetch_web_search(query: str, topic: Optional[str]) -> List[Dict[str, str]]:
         return []
 
 
-def _fetch_market_data(query: str, topic: Optional[str]) -> Dict[str, Any]:
+def _fetch_market_data(query: str, topic: Optional[str], symbols: List[str]) -> Dict[str, Any]:
     """
     Fetch market data using DataDownloadAgent.
 
-    Fetches financial data relevant to the query.
+    Fetches financial data relevant to the query for symbols from _analyze_data_needs.
     """
     try:
         from agents.shared.data_download_agent import DataDownloadAgent
@@ -222,23 +217,16 @@ def _fetch_market_data(query: str, topic: Optional[str]) -> Dict[str, Any]:
 
         db = SessionLocal()
         try:
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0,
-                api_key=os.getenv("OPENAI_API_KEY", "")
-            )
+            llm = routed_chat_model("general_chat.market_data", topic=topic, temperature=0)
 
             agent = DataDownloadAgent(llm=llm, db=db, topic=topic)
 
-            # Extract stock symbols from query
-            symbols = re.findall(r'\b[A-Z]{1,5}\b', query)
             data = {}
 
-            # Fetch stock data for mentioned symbols
-            for symbol in symbols[:3]:  # Limit to 3 symbols
-                stock_data = agent.fetch_stock_data(symbol, period="1mo")
+            # Fetch stock data for mentioned symbols (one bulk download)
+            for stock_data in agent.fetch_stock_data_many(symbols, period="1mo"):
                 if stock_data.get("success"):
-                    data[symbol] = {
+                    data[stock_data["symbol"]] = {
                         "latest_price": stock_data.get("latest_price"),
                         "change_percent": stock_data.get("change_percent"),
                         "volume": stock_data.get("volume")
@@ -275,60 +263,60 @@ def _fetch_market_data(query: str, topic: Optional[str]) -> Dict[str, Any]:
         return {}
 
 
-def _search_articles(
+def _retrieve_context(
     query: str,
     topic: Optional[str],
     user_context: Dict[str, Any]
-) -> List[Dict[str, Any]]:
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
-    Search articles using ArticleQueryAgent.
+    Retrieve relevant articles and resources in one pass.
+
+    Uses RetrievalService: one query embedding, article and resource
+    collections searched concurrently, results merged by rank fusion.
+    Only published articles in topics with access_mainchat=True (AI-accessible
+    topics) are used; resources are scoped to the topic when one is given.
+    Includes popup URLs for articles so chat can link to them.
 
-    Finds relevant articles in the system for context.
-    Includes popup URLs for published articles so chat can link to them.
-    Only searches topics with access_mainchat=True (AI-accessible topics).
+    Returns:
+        Tuple of (articles, resources)
     """
     try:
-        from agents.shared.article_query_agent import ArticleQueryAgent
         from agents.shared.topic_manager import get_ai_accessible_topic_slugs
         from services.article_resource_service import ArticleResourceService
+        from services.resource_service import ResourceService
+        from services.retrieval_service import RetrievalService
         from database import SessionLocal
 
+        ai_topics = get_ai_accessible_topic_slugs()
+        article_topic, article_topics = topic, None
+        if topic and topic not in ai_topics:
+            logger.debug(f"Topic '{topic}' is not AI-accessible, skipping article search")
+            article_topic, article_topics = None, []
+        elif not topic:
+            article_topics = ai_topics
+
         db = SessionLocal()
         try:
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0,
-                api_key=os.getenv("OPENAI_API_KEY", "")
-            )
-
-            # If no specific topic, search across all AI-accessible topics
-            search_topic = topic
-            if topic:
-                # Verify the topic is AI-accessible
-                ai_topics = get_ai_accessible_topic_slugs()
-                if topic not in ai_topics:
-                    logger.debug(f"Topic '{topic}' is not AI-accessible, skipping article search")
-                    return []
-
-            agent = ArticleQueryAgent(llm=llm, db=db, topic=search_topic)
-
-            result = agent.search_articles(
-                query=query,
-                user_context=user_context,
-                topic=search_topic,
-                limit=5,
-                include_drafts=False,  # Only published articles for general chat
-                ai_accessible_only=True  # Only search AI-accessible topics
+            resource_ids = ResourceService.get_resource_ids_for_topic(db, topic) if topic else None
+
+            result = RetrievalService.retrieve(
+                db,
+                query,
+                topic=article_topic,
+                topics=article_topics,
+                statuses=["published"],  # Only published articles for general chat
+                article_limit=5,
+                resource_limit=5,
+                resource_ids=resource_ids,
             )
-
-            articles = result.get("articles", [])
-            logger.info(f"📰 Found {len(articles)} relevant articles")
+            logger.info(f"📰 Found {len(result.articles)} relevant articles, "
+                        f"📦 {len(result.resources)} relevant resources")
 
             # Get popup URLs for published articles
             formatted_articles = []
             base_url = os.getenv("PUBLIC_API_URL", "http://localhost:8000")
 
-            for a in articles:
+            for a in result.articles:
                 article_data = {
                     "id": a.get("id"),
                     "headline": a.get("headline"),
@@ -338,8 +326,7 @@ def _search_articles(
                     "url": None  # Will be set if article has popup resource
                 }
 
-                # Get popup URL for published articles
-                if a.get("id") and a.get("status") == "published":
+                if a.get("id"):
                     try:
                         resources = ArticleResourceService.get_article_publication_resources(
                             db, a.get("id")
@@ -351,61 +338,24 @@ def _search_articles(
 
                 formatted_articles.append(article_data)
 
-            return formatted_articles
-
-        finally:
-            db.close()
-
-    except Exception as e:
-        logger.warning(f"Article search failed: {e}")
-        return []
-
-
-def _search_resources(query: str, topic: Optional[str]) -> List[Dict[str, Any]]:
-    """
-    Search resources using ResourceQueryAgent.
-
-    Finds relevant data resources for context.
-    """
-    try:
-        from agents.shared.resource_query_agent import ResourceQueryAgent
-        from database import SessionLocal
-
-        db = SessionLocal()
-        try:
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0,
-                api_key=os.getenv("OPENAI_API_KEY", "")
-            )
-
-            agent = ResourceQueryAgent(llm=llm, db=db, topic=topic)
-
-            result = agent.query(
-                search_query=query,
-                topic=topic,
-                limit=5
-            )
-
-            resources = result.get("resources", [])
-            logger.info(f"📦 Found {len(resources)} relevant resources")
-
-            return [
+            formatted_resources = [
                 {
                     "id": r.get("resource_id"),
                     "name": r.get("name"),
                     "type": r.get("type"),
-                    "description": r.get("description", "")[:100]
+                    "description": (r.get("content_preview") or "")[:100]
                 }
-                for r in resources
+                for r in result.resources
             ]
 
+            return formatted_articles, formatted_resources
+
         finally:
             db.close()
 
     except Exception as e:
-        logger.warning(f"Resource search failed: {e}")
-        return []
+        logger.warning(f"Context retrieval failed: {e}")
+        return [], []
 
 
 def _generate_response(
@@ -439,11 +389,7 @@ def _generate_response(
     llm_messages.append({"role": "user", "content": query})
 
     # Generate response
-    llm = ChatOpenAI(
-        model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-        temperature=0.7,
-        api_key=os.getenv("OPENAI_API_KEY", "")
-    )
+    llm = routed_chat_model("general_chat.answer", topic=topic, temperature=0.7)
 
     response = llm.invoke(llm_messages)
 
@@ -14,12 +14,10 @@ Routes based on nav_context.role == 'reader'
 
 from typing import Dict, Any, Optional, List
 import logging
-import os
-
-from langchain_openai import ChatOpenAI
 
 from agents.builds.v2.state import AgentState
 from agents.shared.permission_utils import validate_article_access
+from services.model_router import routed_chat_model
 
 logger = logging.getLogger(__name__)
 
@@ -155,15 +153,21 @@ def _handle_reader_chat(
     topic = nav_context.get("topic")
 
     try:
-        # Try to use vector search for relevant articles
-        from services.vector_service import VectorService
+        # Retrieve relevant published articles (content comes back with the query)
+        from database import SessionLocal
+        from services.retrieval_service import RetrievalService
 
-        # Search for relevant content
-        search_results = VectorService.search_articles(
-            query=user_query,
-            topic=topic,
-            limit=5
-        )
+        db = SessionLocal()
+        try:
+            search_results = RetrievalService.retrieve(
+                db,
+                user_query,
+                topic=topic,
+                article_limit=5,
+                resource_limit=0
+            ).articles
+        finally:
+            db.close()
 
         if search_results:
             # Build context from search results
@@ -174,7 +178,7 @@ def _handle_reader_chat(
 
             # Include referenced articles
             referenced = [
-                {"id": r.get("article_id"), "headline": r.get("headline"), "topic": r.get("topic", "")}
+                {"id": r.get("id"), "headline": r.get("headline"), "topic": r.get("topic", "")}
                 for r in search_results[:3]
             ]
 
@@ -296,11 +300,7 @@ def _generate_reader_response(
 ) -> str:
     """Generate response for reader queries using LLM."""
     try:
-        llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        llm = routed_chat_model("reader.answer", topic=topic, temperature=0.7)
 
         # Build system prompt
         topic_display = topic.replace("_", " ").title() if topic else "general"
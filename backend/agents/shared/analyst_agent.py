@@ -6,12 +6,15 @@ sub-agents for web search, data download, resource queries, and article creation
 It replaces the legacy specialist agents (equity, economist, fixed_income).
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+import logging
+
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from agents.builds.v1.state import (
+from agents.builds.v2.state import (
     AgentState,
     UserContext,
     WorkflowContext,
@@ -21,9 +24,28 @@ from agents.builds.v1.state import (
 )
 from agents.shared.article_query_agent import ArticleQueryAgent
 from agents.shared.web_search_agent import WebSearchAgent
-from agents.shared.data_download_agent import DataDownloadAgent
+from agents.shared.data_download_agent import DataDownloadAgent, TREASURY_SYMBOLS, fx_symbol
+from services.ticker_universe import find_symbols
 from agents.shared.resource_query_agent import ResourceQueryAgent
 from services.permission_service import PermissionService
+from services.resource_service import ResourceService
+from services.retrieval_service import RetrievalService
+from config import settings
+
+logger = logging.getLogger("uvicorn")
+
+
+class ArticleDraft(BaseModel):
+    """Structured output for a new article: content, headline and keywords in one response."""
+    headline: str = Field(
+        description="Concise, professional headline for the article (max 100 characters)"
+    )
+    keywords: List[str] = Field(
+        description="5-8 relevant keywords for the article"
+    )
+    content: str = Field(
+        description="The full article in markdown"
+    )
 
 
 class AnalystAgent:
@@ -46,6 +68,8 @@ class AnalystAgent:
         topic: str,
         llm: BaseChatModel,
         db: Session,
+        headline_llm: Optional[BaseChatModel] = None,
+        keywords_llm: Optional[BaseChatModel] = None,
     ):
         """
         Initialize the AnalystAgent.
@@ -54,9 +78,13 @@ class AnalystAgent:
             topic: Topic slug (macro, equity, fixed_income, esg)
             llm: Language model for generating content
             db: Database session
+            headline_llm: Language model for headlines (defaults to llm)
+            keywords_llm: Language model for keyword extraction (defaults to llm)
         """
         self.topic = topic
         self.llm = llm
+        self.headline_llm = headline_llm or llm
+        self.keywords_llm = keywords_llm or llm
         self.db = db
 
         # Initialize sub-agents
@@ -100,20 +128,16 @@ class AnalystAgent:
                 "error": f"Analyst permission required for topic '{self.topic}'",
             }
 
-        # Step 1: Search existing articles
-        article_results = self.article_agent.search_articles(
-            query=query,
-            user_context=user_context,
-            topic=self.topic,
-            limit=5,
-            include_drafts=True,
-        )
-
-        # Step 2: Query existing resources
-        resource_results = self.resource_agent.query(
-            search_query=query,
+        # Steps 1-2: Search existing articles (including drafts) and the topic's
+        # resources with one query embedding
+        retrieval = RetrievalService.retrieve(
+            self.db,
+            query,
             topic=self.topic,
-            limit=10,
+            statuses=["draft", "editor", "published"],
+            article_limit=5,
+            resource_limit=10,
+            resource_ids=ResourceService.get_resource_ids_for_topic(self.db, self.topic),
         )
 
         # Step 3: Web search for current information
@@ -125,16 +149,21 @@ class AnalystAgent:
         # Step 4: Download relevant financial data
         data_results = self._fetch_relevant_data(query)
 
-        # Step 5: Synthesize findings into article content (with user's content tonality)
-        content = self._synthesize_content(
+        # Step 5: Synthesize findings into article content (with user's content tonality).
+        # A new article also needs a headline and keywords.
+        research = dict(
             query=query,
-            articles=article_results.get("articles", []),
-            resources=resource_results.get("resources", []),
+            articles=retrieval.articles,
+            resources=retrieval.resources,
             web_results=web_results.get("results", []),
             data_results=data_results,
             user_context=user_context,
             conversation_history=conversation_history,
         )
+        if article_id:
+            content = self._synthesize_content(**research)
+        else:
+            content, headline, keywords = self._synthesize_article(**research)
 
         # Step 6: Create or update article
         if article_id:
@@ -147,12 +176,6 @@ class AnalystAgent:
             headline = None  # Keep existing headline
             keywords = None  # Keep existing keywords
         else:
-            # Generate headline
-            headline = self._generate_headline(query)
-
-            # Generate keywords from headline and content
-            keywords = self._generate_keywords(headline, content)
-
             # Create new draft article
             create_result = self.article_agent.create_draft_article(
                 headline=headline,
@@ -178,7 +201,7 @@ class AnalystAgent:
 
         # Step 7: Link found resources to the article
         linked_resources = []
-        found_resources = resource_results.get("resources", [])
+        found_resources = retrieval.resources
         if found_resources and article_id:
             linked_resources = self._link_resources_to_article(
                 article_id=article_id,
@@ -194,8 +217,8 @@ class AnalystAgent:
             "content": content,
             "linked_resources": linked_resources,
             "sources": {
-                "existing_articles": len(article_results.get("articles", [])),
-                "resources": len(resource_results.get("resources", [])),
+                "existing_articles": len(retrieval.articles),
+                "resources": len(retrieval.resources),
                 "web_results": len(web_results.get("results", [])),
                 "data_sources": len(data_results),
             },
@@ -315,23 +338,33 @@ class AnalystAgent:
         results = []
         query_lower = query.lower()
 
-        # Look for stock symbols
-        import re
-        symbols = re.findall(r'\b[A-Z]{1,5}\b', query)
-
-        for symbol in symbols[:3]:
-            data = self.data_download_agent.fetch_stock_data(symbol, period="3mo")
-            if data.get("success"):
-                results.append(data)
+        # Listed symbols, aliases and company names (no lookups for ESG, GDP, CEO, ...)
+        symbols = find_symbols(query, limit=3)
+        wants_treasury = any(word in query_lower for word in ["yield", "treasury", "bond", "rate", "interest"])
+        wants_fx = any(word in query_lower for word in ["currency", "dollar", "euro", "forex", "fx"])
+
+        # One bulk download for everything below; the fetches are then served from the store
+        batch = list(symbols)
+        if wants_treasury:
+            batch.append(TREASURY_SYMBOLS["10Y"])
+        if wants_fx:
+            batch.append(fx_symbol("USD", "EUR"))
+        if batch:
+            self.data_download_agent.prefetch(batch, period="3mo")
+
+        if symbols:
+            for data in self.data_download_agent.fetch_stock_data_many(symbols, period="3mo"):
+                if data.get("success"):
+                    results.append(data)
 
         # Fetch treasury data if relevant
-        if any(word in query_lower for word in ["yield", "treasury", "bond", "rate", "interest"]):
+        if wants_treasury:
             treasury = self.data_download_agent.fetch_treasury_yields("10Y", period="3mo")
             if treasury.get("success"):
                 results.append(treasury)
 
         # Fetch FX data if relevant
-        if any(word in query_lower for word in ["currency", "dollar", "euro", "forex", "fx"]):
+        if wants_fx:
             fx = self.data_download_agent.fetch_fx_rate("USD", "EUR", period="3mo")
             if fx.get("success"):
                 results.append(fx)
@@ -363,6 +396,52 @@ class AnalystAgent:
         Returns:
             Synthesized article content in markdown
         """
+        system_prompt, prompt, context = self._build_synthesis_prompt(
+            query, articles, resources, web_results, data_results, user_context, conversation_history
+        )
+
+        try:
+            response = self.llm.invoke([
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=prompt),
+            ])
+            return response.content
+        except Exception as e:
+            # Fallback content if LLM fails
+            return f"""# Research: {query}
+
+## Executive Summary
+
+This article analyzes {query} in the context of {self.topic}.
+
+## Key Findings
+
+{context}
+
+## Conclusion
+
+Further analysis is recommended based on the available data.
+
+---
+*Generated by AnalystAgent*
+"""
+
+    def _build_synthesis_prompt(
+        self,
+        query: str,
+        articles: List[Dict],
+        resources: List[Dict],
+        web_results: List[Dict],
+        data_results: List[Dict],
+        user_context: Optional[UserContext] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+    ) -> Tuple[str, str, str]:
+        """
+        Build the system prompt, user prompt and research context for article synthesis.
+
+        Returns:
+            Tuple of (system_prompt, prompt, context)
+        """
         # Build context for LLM
         context_parts = []
 
@@ -434,31 +513,55 @@ Write a well-structured article with:
 Use markdown formatting. Include relevant data points from the research.
 Keep the article professional and suitable for financial analysts."""
 
-        try:
-            response = self.llm.invoke([
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=prompt),
-            ])
-            return response.content
-        except Exception as e:
-            # Fallback content if LLM fails
-            return f"""# Research: {query}
-
-## Executive Summary
-
-This article analyzes {query} in the context of {self.topic}.
-
-## Key Findings
+        return system_prompt, prompt, context
 
-{context}
+    def _synthesize_article(
+        self,
+        query: str,
+        articles: List[Dict],
+        resources: List[Dict],
+        web_results: List[Dict],
+        data_results: List[Dict],
+        user_context: Optional[UserContext] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+    ) -> Tuple[str, str, str]:
+        """
+        Write content, headline and keywords for a new article.
 
-## Conclusion
+        With analyst_structured_article enabled this is one structured-output
+        call (ArticleDraft). If that call fails or returns an incomplete
+        draft, falls back to separate content, headline and keyword calls.
 
-Further analysis is recommended based on the available data.
+        Returns:
+            Tuple of (content, headline, comma-separated keywords)
+        """
+        if settings.analyst_structured_article:
+            system_prompt, prompt, _ = self._build_synthesis_prompt(
+                query, articles, resources, web_results, data_results, user_context, conversation_history
+            )
+            prompt += (
+                "\n\nAlso provide a concise, professional headline (max 100 chars) "
+                "and 5-8 relevant keywords for the article."
+            )
+            try:
+                draft = self.llm.with_structured_output(ArticleDraft).invoke([
+                    SystemMessage(content=system_prompt),
+                    HumanMessage(content=prompt),
+                ])
+                headline = draft.headline.strip().strip('"\'')[:100]
+                keywords = ", ".join(k.strip() for k in draft.keywords if k.strip())
+                if draft.content.strip() and headline:
+                    return draft.content, headline, keywords or self.topic
+                logger.warning("Structured article draft incomplete, using separate calls")
+            except Exception as e:
+                logger.warning(f"Structured article draft failed, using separate calls: {e}")
 
----
-*Generated by AnalystAgent*
-"""
+        content = self._synthesize_content(
+            query, articles, resources, web_results, data_results, user_context, conversation_history
+        )
+        headline = self._generate_headline(query)
+        keywords = self._generate_keywords(headline, content)
+        return content, headline, keywords
 
     def _generate_headline(self, query: str) -> str:
         """
@@ -471,7 +574,7 @@ Further analysis is recommended based on the available data.
             Generated headline
         """
         try:
-            response = self.llm.invoke([
+            response = self.headline_llm.invoke([
                 SystemMessage(content="Generate a concise, professional headline for a financial research article."),
                 HumanMessage(content=f"Query: {query}\nTopic: {self.topic}\n\nGenerate a headline (max 100 chars):"),
             ])
@@ -496,7 +599,7 @@ Further analysis is recommended based on the available data.
             # Use first 1500 chars of content for keyword extraction
             content_excerpt = content[:1500] if len(content) > 1500 else content
 
-            response = self.llm.invoke([
+            response = self.keywords_llm.invoke([
                 SystemMessage(content="Extract 5-8 relevant keywords from the article content. Return only comma-separated keywords, no explanation."),
                 HumanMessage(content=f"Article headline: {headline}\n\nContent excerpt: {content_excerpt}\n\nKeywords:"),
             ])
@@ -1,12 +1,14 @@
 """Base class for content creation agents."""
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_openai import ChatOpenAI
 from sqlalchemy.orm import Session
 from services.prompt_service import PromptService
 from services.content_service import ContentService
+from services.retrieval_service import RetrievalService
 from services.google_search_service import GoogleSearchService
+from metrics import AGENT_STEP_SECONDS, Timer
 import logging
 
 logger = logging.getLogger("uvicorn")
@@ -54,23 +56,32 @@ class ContentAgent:
         Returns:
             Response text (existing article or newly created)
         """
-        import time
-        start_time = time.time()
+        with Timer(AGENT_STEP_SECONDS, agent="content", step="query") as timer:
+            response, outcome = self._answer(user_query)
+        logger.info(f"✓ {self.topic.upper()} AGENT COMPLETE: {timer.elapsed:.2f}s ({outcome})")
+        return response
 
+    def _answer(self, user_query: str) -> Tuple[str, str]:
+        """
+        Answer a query from existing content, a new article, or a fallback.
+
+        Returns:
+            Tuple of (response text, outcome label for logging)
+        """
         logger.info(f"📚 {self.topic.upper()} CONTENT AGENT: Started")
         logger.info(f"   Query: '{user_query[:80]}{'...' if len(user_query) > 80 else ''}'")
 
         # Step 1: Search existing content in database
         logger.info(f"🔍 {self.topic.upper()}: Searching database for existing content...")
-        search_start = time.time()
-        articles = ContentService.search_articles(
-            self.db,
-            topic=self.topic,
-            query=user_query,
-            limit=3
-        )
-        search_time = time.time() - search_start
-        logger.info(f"   Database search: {search_time:.2f}s, found {len(articles)} article(s)")
+        with Timer(AGENT_STEP_SECONDS, agent="content", step="search") as search_timer:
+            articles = RetrievalService.retrieve(
+                self.db,
+                user_query,
+                topic=self.topic,
+                article_limit=3,
+                resource_limit=0
+            ).articles
+        logger.info(f"   Database search: {search_timer.elapsed:.2f}s, found {len(articles)} article(s)")
 
         if articles:
             # Found existing content - return the most relevant
@@ -88,11 +99,8 @@ class ContentAgent:
                 increment_readership=True
             )
 
-            total_time = time.time() - start_time
-            logger.info(f"✓ {self.topic.upper()} AGENT COMPLETE: {total_time:.2f}s (cached content)")
-
             # Format response with article
-            return self._format_existing_article_response(best_article, user_query)
+            return self._format_existing_article_response(best_article, user_query), "cached content"
 
         # Step 2: No existing content - create new article
         logger.info(f"📝 {self.topic.upper()}: No existing content found")
@@ -100,16 +108,11 @@ class ContentAgent:
 
         if self.google_search.is_available():
             logger.info(f"🌐 {self.topic.upper()}: Google Search is available")
-            result = self._create_new_article(user_query)
-            total_time = time.time() - start_time
-            logger.info(f"✓ {self.topic.upper()} AGENT COMPLETE: {total_time:.2f}s (new article created)")
-            return result
+            return self._create_new_article(user_query), "new article created"
         else:
             logger.warning(f"⚠️  {self.topic.upper()}: Google Search unavailable")
             logger.warning(f"   Returning fallback response")
-            total_time = time.time() - start_time
-            logger.info(f"✓ {self.topic.upper()} AGENT COMPLETE: {total_time:.2f}s (fallback)")
-            return self._fallback_response(user_query)
+            return self._fallback_response(user_query), "fallback"
 
     def _format_existing_article_response(self, article: Dict, query: str) -> str:
         """
@@ -142,19 +145,17 @@ class ContentAgent:
         Returns:
             Newly created article content
         """
-        import time
-
         # Step 1: Research using Google Search
         logger.info(f"🔬 {self.topic.upper()}: STEP 1 - Conducting research")
-        search_start = time.time()
+        search_timer = Timer(AGENT_STEP_SECONDS, agent="content", step="web_search")
         try:
-            search_results = self.google_search.search_by_topic(
-                topic=self.topic,
-                query_term=query,
-                num_results=5
-            )
-            search_time = time.time() - search_start
-            logger.info(f"   Google Search: {search_time:.2f}s, {len(search_results)} results")
+            with search_timer:
+                search_results = self.google_search.search_by_topic(
+                    topic=self.topic,
+                    query_term=query,
+                    num_results=5
+                )
+            logger.info(f"   Google Search: {search_timer.elapsed:.2f}s, {len(search_results)} results")
 
             # Log search result titles
             for i, result in enumerate(search_results[:3], 1):
@@ -164,13 +165,11 @@ class ContentAgent:
             search_context = self._format_search_results(search_results)
 
         except Exception as e:
-            search_time = time.time() - search_start
-            logger.error(f"   Google Search error after {search_time:.2f}s: {e}")
+            logger.error(f"   Google Search error after {search_timer.elapsed:.2f}s: {e}")
             search_context = "No search results available."
 
         # Step 2: Generate article using LLM
         logger.info(f"✍️  {self.topic.upper()}: STEP 2 - Generating article with LLM")
-        llm_start = time.time()
         messages = [
             SystemMessage(content=self.system_prompt),
             HumanMessage(content=f"""Create an article about: {query}
@@ -193,28 +192,27 @@ CONTENT:
 """)
         ]
 
-        response = self.llm.invoke(messages)
+        with Timer(AGENT_STEP_SECONDS, agent="content", step="llm") as llm_timer:
+            response = self.llm.invoke(messages)
         article_text = response.content
-        llm_time = time.time() - llm_start
-        logger.info(f"   LLM generation: {llm_time:.2f}s")
+        logger.info(f"   LLM generation: {llm_timer.elapsed:.2f}s")
 
         # Step 3: Parse and save article
         logger.info(f"💾 {self.topic.upper()}: STEP 3 - Parsing and saving article")
         parsed_article = self._parse_article_response(article_text)
 
         # Save to database
-        db_start = time.time()
-        created_article = ContentService.create_article(
-            db=self.db,
-            topic=self.topic,
-            headline=parsed_article['headline'],
-            content=parsed_article['content'],
-            keywords=parsed_article['keywords'],
-            agent_name=self.topic
-        )
-        db_time = time.time() - db_start
-
-        logger.info(f"   Database save: {db_time:.2f}s")
+        with Timer(AGENT_STEP_SECONDS, agent="content", step="save") as db_timer:
+            created_article = ContentService.create_article(
+                db=self.db,
+                topic=self.topic,
+                headline=parsed_article['headline'],
+                content=parsed_article['content'],
+                keywords=parsed_article['keywords'],
+                agent_name=self.topic
+            )
+
+        logger.info(f"   Database save: {db_timer.elapsed:.2f}s")
         logger.info(f"✅ {self.topic.upper()}: Article created successfully")
         logger.info(f"   Article ID: {created_article['id']}")
         logger.info(f"   Headline: {created_article['headline'][:70]}{'...' if len(created_article['headline']) > 70 else ''}")
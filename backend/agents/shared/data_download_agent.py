@@ -6,15 +6,41 @@ This agent handles data retrieval operations:
 - Economic indicators
 - Foreign exchange rates
 - Treasury yields
+
+Price history and company info are read through the local market-data
+store (services.market_data); several symbols are downloaded with one bulk
+call (fetch_stock_data_many, prefetch). Stock symbols are resolved against
+the ticker universe (services.ticker_universe) before any download.
 """
 
 from typing import Dict, Any, Optional, List
+import logging
 from datetime import datetime, timedelta
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage
 from sqlalchemy.orm import Session
 
-from agents.builds.v1.state import AgentState, UserContext
+from agents.builds.v2.state import AgentState, UserContext
+from services.market_data import MarketData, PRICE_COLUMNS, history_records
+from services.ticker_universe import resolve_symbol
+
+logger = logging.getLogger("uvicorn")
+
+# Treasury symbols on Yahoo Finance
+TREASURY_SYMBOLS = {
+    "3M": "^IRX",   # 13 Week Treasury Bill
+    "6M": "^IRX",   # Use 3M as proxy
+    "1Y": "^IRX",   # Use 3M as proxy
+    "2Y": "^FVX",   # 5 Year Treasury Note (proxy)
+    "5Y": "^FVX",   # 5 Year Treasury Note
+    "10Y": "^TNX",  # 10 Year Treasury Note
+    "30Y": "^TYX",  # 30 Year Treasury Bond
+}
+
+
+def fx_symbol(base: str, target: str) -> str:
+    """Yahoo Finance FX symbol (format like "EURUSD=X")."""
+    return f"{base}{target}=X"
 
 
 class DataDownloadAgent:
@@ -61,10 +87,12 @@ class DataDownloadAgent:
             Dict with stock data
         """
         try:
-            import yfinance as yf
+            resolved = resolve_symbol(symbol)
+            if resolved is None:
+                return {"success": False, "error": f"Unknown symbol: {symbol}", "symbol": symbol}
+            symbol = resolved
 
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period, interval=interval)
+            hist = MarketData.history(symbol, period=period, interval=interval)
 
             if hist.empty:
                 return {
@@ -74,31 +102,9 @@ class DataDownloadAgent:
                 }
 
             # Get company info
-            info = ticker.info
-
-            # Convert DataFrame to list of dicts
-            data = []
-            for idx, row in hist.iterrows():
-                data.append({
-                    "date": idx.strftime("%Y-%m-%d"),
-                    "open": round(row.get("Open", 0), 2),
-                    "high": round(row.get("High", 0), 2),
-                    "low": round(row.get("Low", 0), 2),
-                    "close": round(row.get("Close", 0), 2),
-                    "volume": int(row.get("Volume", 0)),
-                })
+            info = MarketData.info(symbol)
 
-            return {
-                "success": True,
-                "symbol": symbol,
-                "period": period,
-                "interval": interval,
-                "company_name": info.get("longName", symbol),
-                "currency": info.get("currency", "USD"),
-                "data": data,
-                "latest_price": data[-1]["close"] if data else None,
-                "data_points": len(data),
-            }
+            return self._stock_result(symbol, hist, info, period, interval)
 
         except Exception as e:
             return {
@@ -107,6 +113,89 @@ class DataDownloadAgent:
                 "symbol": symbol,
             }
 
+    def fetch_stock_data_many(
+        self,
+        symbols: List[str],
+        period: str = "1mo",
+        interval: str = "1d",
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch stock price data for several symbols with one bulk download.
+
+        Args:
+            symbols: Stock ticker symbols
+            period: Data period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+            interval: Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)
+
+        Returns:
+            List of dicts shaped like fetch_stock_data() results, one per symbol
+        """
+        results = []
+        resolved = []
+        for symbol in symbols:
+            match = resolve_symbol(symbol)
+            if match is None:
+                results.append({"success": False, "error": f"Unknown symbol: {symbol}", "symbol": symbol})
+            else:
+                resolved.append(match)
+
+        try:
+            histories = MarketData.history_many(resolved, period=period, interval=interval)
+            infos = MarketData.info_many([s for s, hist in histories.items() if not hist.empty])
+        except Exception as e:
+            return results + [{"success": False, "error": str(e), "symbol": symbol} for symbol in resolved]
+
+        for symbol, hist in histories.items():
+            if hist.empty:
+                results.append({
+                    "success": False,
+                    "error": f"No data found for symbol {symbol}",
+                    "symbol": symbol,
+                })
+                continue
+            results.append(self._stock_result(symbol, hist, infos.get(symbol, {}), period, interval))
+        return results
+
+    def prefetch(
+        self,
+        symbols: List[str],
+        period: str = "1mo",
+        interval: str = "1d",
+    ) -> None:
+        """
+        Download the history of several symbols (stocks, ^TNX, EURUSD=X, ...) into
+        the market-data store with one bulk call, so the single-symbol fetches that
+        follow are served locally.
+        """
+        try:
+            MarketData.history_many(symbols, period=period, interval=interval)
+        except Exception as e:
+            logger.warning(f"Market data prefetch failed for {symbols}: {e}")
+
+    @staticmethod
+    def _stock_result(
+        symbol: str,
+        hist,
+        info: Dict[str, Any],
+        period: str,
+        interval: str,
+    ) -> Dict[str, Any]:
+        """Result dict of fetch_stock_data() for a non-empty history frame."""
+        # Convert DataFrame to list of dicts
+        data = history_records(hist, PRICE_COLUMNS)
+
+        return {
+            "success": True,
+            "symbol": symbol,
+            "period": period,
+            "interval": interval,
+            "company_name": info.get("longName", symbol),
+            "currency": info.get("currency", "USD"),
+            "data": data,
+            "latest_price": data[-1]["close"] if data else None,
+            "data_points": len(data),
+        }
+
     def fetch_stock_info(
         self,
         symbol: str,
@@ -121,10 +210,12 @@ class DataDownloadAgent:
             Dict with stock information
         """
         try:
-            import yfinance as yf
+            resolved = resolve_symbol(symbol)
+            if resolved is None:
+                return {"success": False, "error": f"Unknown symbol: {symbol}", "symbol": symbol}
+            symbol = resolved
 
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = MarketData.info(symbol)
 
             return {
                 "success": True,
@@ -140,7 +231,7 @@ class DataDownloadAgent:
                     "52_week_high": info.get("fiftyTwoWeekHigh"),
                     "52_week_low": info.get("fiftyTwoWeekLow"),
                     "avg_volume": info.get("averageVolume"),
-                    "description": info.get("longBusinessSummary", "")[:500],
+                    "description": (info.get("longBusinessSummary") or "")[:500],
                 },
             }
 
@@ -231,12 +322,8 @@ class DataDownloadAgent:
             Dict with FX rate data
         """
         try:
-            import yfinance as yf
-
-            # Yahoo Finance uses format like "EURUSD=X"
-            symbol = f"{base}{target}=X"
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
+            symbol = fx_symbol(base, target)
+            hist = MarketData.history(symbol, period=period)
 
             if hist.empty:
                 return {
@@ -244,12 +331,7 @@ class DataDownloadAgent:
                     "error": f"No FX data for {base}/{target}",
                 }
 
-            data = []
-            for idx, row in hist.iterrows():
-                data.append({
-                    "date": idx.strftime("%Y-%m-%d"),
-                    "rate": round(row.get("Close", 0), 4),
-                })
+            data = history_records(hist, {"rate": ("Close", 4)})
 
             return {
                 "success": True,
@@ -284,22 +366,8 @@ class DataDownloadAgent:
             Dict with Treasury yield data
         """
         try:
-            import yfinance as yf
-
-            # Treasury symbols on Yahoo Finance
-            treasury_symbols = {
-                "3M": "^IRX",   # 13 Week Treasury Bill
-                "6M": "^IRX",   # Use 3M as proxy
-                "1Y": "^IRX",   # Use 3M as proxy
-                "2Y": "^FVX",   # 5 Year Treasury Note (proxy)
-                "5Y": "^FVX",   # 5 Year Treasury Note
-                "10Y": "^TNX",  # 10 Year Treasury Note
-                "30Y": "^TYX",  # 30 Year Treasury Bond
-            }
-
-            symbol = treasury_symbols.get(maturity, "^TNX")
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
+            symbol = TREASURY_SYMBOLS.get(maturity, "^TNX")
+            hist = MarketData.history(symbol, period=period)
 
             if hist.empty:
                 return {
@@ -307,12 +375,7 @@ class DataDownloadAgent:
                     "error": f"No Treasury data for {maturity}",
                 }
 
-            data = []
-            for idx, row in hist.iterrows():
-                data.append({
-                    "date": idx.strftime("%Y-%m-%d"),
-                    "yield": round(row.get("Close", 0), 3),
-                })
+            data = history_records(hist, {"yield": ("Close", 3)})
 
             return {
                 "success": True,
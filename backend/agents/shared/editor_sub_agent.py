@@ -10,13 +10,18 @@ This agent handles the editorial review and publishing workflow:
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
+import logging
+
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage
 from sqlalchemy.orm import Session
 
-from agents.builds.v1.state import AgentState, UserContext
+from agents.builds.v2.state import AgentState, UserContext
+from config import settings
 from services.permission_service import PermissionService
 
+logger = logging.getLogger("uvicorn")
+
 
 class EditorSubAgent:
     """
@@ -94,8 +99,8 @@ class EditorSubAgent:
             }
 
         # Get content
-        from services.vector_service import VectorService
-        content = VectorService.get_article_content(article_id)
+        from services.content_store import ContentStore
+        content = ContentStore.get_content(article_id, self.db)
 
         # Generate AI review
         review = self._generate_review(article.headline, content, conversation_history)
@@ -123,13 +128,17 @@ class EditorSubAgent:
         """
         Generate an AI-powered review of the article.
 
+        Articles longer than editor_review_sectioned_min_chars are reviewed
+        section by section (services/article_review.py); shorter ones, or
+        when that fails, in one call on the first 3000 characters.
+
         Args:
             headline: Article headline
             content: Article content
             conversation_history: Previous messages for context
 
         Returns:
-            Dict with review findings
+            Dict with review findings (and per-section findings for sectioned reviews)
         """
         try:
             from langchain_core.messages import SystemMessage, HumanMessage
@@ -144,6 +153,23 @@ class EditorSubAgent:
                     context_parts.append(f"- **{role}**: {msg_content}")
                 context_section = "\n".join(context_parts) + "\n\n"
 
+            # Long articles: review sections concurrently and merge the findings
+            if settings.editor_review_sectioned and len(content or "") > settings.editor_review_sectioned_min_chars:
+                from services.article_review import ArticleReviewer
+
+                try:
+                    review = ArticleReviewer(self.llm).review(headline, content, context_section)
+                    return {
+                        "generated": True,
+                        "review": review.text,
+                        "sections": [
+                            {"title": section.title, "findings": section.findings, "cached": section.cached}
+                            for section in review.sections
+                        ],
+                    }
+                except Exception as e:
+                    logger.warning(f"Sectioned review failed, reviewing the article in one call: {e}")
+
             prompt = f"""{context_section}Review this financial research article for quality and accuracy.
 
 Headline: {headline}
@@ -5,8 +5,10 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_openai import ChatOpenAI
 from sqlalchemy.orm import Session
 from services.resource_service import ResourceService
+from services.resource_enrichment import ResourceEnricher, table_summary
 from models import ResourceType, ResourceStatus
 from agents.tools.resource_tools import get_resource_processing_tools
+from metrics import AGENT_STEP_SECONDS, Timer
 import logging
 import json
 import os
@@ -75,8 +77,7 @@ Always provide structured metadata that helps other agents find and use these re
         Returns:
             Dict with generated metadata
         """
-        import time
-        start_time = time.time()
+        timer = Timer(AGENT_STEP_SECONDS, agent="resource_processing", step="generate_metadata").begin()
 
         logger.info(f"📝 RESOURCE PROCESSING AGENT: Generating metadata for resource {resource_id}")
 
@@ -135,7 +136,7 @@ ENTITIES: [entity1, entity2, ...]
                     entities_str = line.replace('ENTITIES:', '').strip()
                     metadata["entities"] = [e.strip() for e in entities_str.split(',')]
 
-            elapsed = time.time() - start_time
+            elapsed = timer.end()
             logger.info(f"✓ RESOURCE PROCESSING AGENT: Metadata generated in {elapsed:.2f}s")
             logger.info(f"   Keywords: {', '.join(metadata['keywords'][:5])}...")
 
@@ -256,15 +257,7 @@ ENTITIES: [entity1, entity2, ...]
             }
 
         # Create text representation for analysis
-        columns = data.get("columns", [])
-        rows = data.get("data", [])
-
-        text_repr = f"Table with columns: {', '.join(columns)}\n"
-        text_repr += f"Number of rows: {len(rows)}\n"
-        if rows:
-            text_repr += "Sample data (first 5 rows):\n"
-            for i, row in enumerate(rows[:5]):
-                text_repr += f"  Row {i+1}: {dict(zip(columns, row))}\n"
+        text_repr = table_summary(data.get("columns", []), data.get("data", []))
 
         # Generate metadata
         result = self.generate_metadata(resource_id, text_repr, "table")
@@ -310,8 +303,7 @@ ENTITIES: [entity1, entity2, ...]
         Returns:
             Dict with created child resources
         """
-        import time
-        start_time = time.time()
+        timer = Timer(AGENT_STEP_SECONDS, agent="resource_processing", step="process_pdf").begin()
 
         logger.info(f"📄 RESOURCE PROCESSING AGENT: Processing PDF resource {resource_id}")
 
@@ -399,7 +391,7 @@ ENTITIES: [entity1, entity2, ...]
             except Exception as e:
                 logger.error(f"   Error extracting tables: {e}")
 
-        elapsed = time.time() - start_time
+        elapsed = timer.end()
         logger.info(f"✓ RESOURCE PROCESSING AGENT: PDF processed in {elapsed:.2f}s")
         logger.info(f"   Created {len(created_resources)} child resources")
 
@@ -495,54 +487,62 @@ ENTITIES: [entity1, entity2, ...]
     def batch_process_resources(
         self,
         resource_ids: List[int],
-        generate_metadata: bool = True
+        generate_metadata: bool = True,
+        user_id: Optional[int] = None,
+        job_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process multiple resources in batch.
 
+        Text and table resources are enriched concurrently with batched
+        database and ChromaDB writes; PDFs are decomposed one at a time.
+        Progress is checkpointed, so calling this again with the same
+        resource ids (or job_id) after an interruption resumes the batch.
+        See services/resource_enrichment.py.
+
         Args:
             resource_ids: List of resource IDs to process
-            generate_metadata: Whether to generate metadata for each
+            generate_metadata: Whether to update each resource with its metadata
+            user_id: User to notify of progress over the websocket
+            job_id: Checkpoint key (default: derived from resource_ids)
 
         Returns:
             Dict with processing results for each resource
         """
         logger.info(f"🔄 RESOURCE PROCESSING AGENT: Batch processing {len(resource_ids)} resources")
 
-        results = []
-        for rid in resource_ids:
-            resource = ResourceService.get_resource(self.db, rid)
-            if not resource:
-                results.append({
-                    "resource_id": rid,
-                    "success": False,
-                    "error": "Resource not found"
-                })
-                continue
-
-            resource_type = resource.get("resource_type")
-
-            if resource_type == "text":
-                result = self.analyze_text_resource(rid, update_resource=generate_metadata)
-            elif resource_type == "table":
-                result = self.analyze_table_resource(rid, update_resource=generate_metadata)
-            elif resource_type == "pdf":
-                result = self.process_pdf_resource(rid, resource.get("created_by", 1))
-            else:
-                result = {
-                    "success": False,
-                    "error": f"Unsupported resource type: {resource_type}"
-                }
-
-            result["resource_id"] = rid
-            results.append(result)
-
-        success_count = sum(1 for r in results if r.get("success"))
-        logger.info(f"✓ RESOURCE PROCESSING AGENT: Batch complete, {success_count}/{len(resource_ids)} succeeded")
+        enricher = ResourceEnricher(
+            self.generate_metadata,
+            self.db,
+            user_id=user_id,
+            process_other=self._process_other_resource,
+        )
+        report = enricher.run(resource_ids, update_resources=generate_metadata, job_id=job_id)
+
+        logger.info(
+            f"✓ RESOURCE PROCESSING AGENT: Batch complete, "
+            f"{report['succeeded'] + report['skipped']}/{report['total']} succeeded"
+        )
 
         return {
             "success": True,
-            "total": len(resource_ids),
-            "succeeded": success_count,
-            "results": results
+            "job_id": report["job_id"],
+            "total": report["total"],
+            "succeeded": report["succeeded"] + report["skipped"],
+            "skipped": report["skipped"],
+            "results": report["results"]
+        }
+
+    def _process_other_resource(
+        self,
+        resource_id: int,
+        resource_type: str,
+        created_by: Optional[int]
+    ) -> Dict[str, Any]:
+        """Batch handler for resources other than text and tables."""
+        if resource_type == "pdf":
+            return self.process_pdf_resource(resource_id, created_by or 1)
+        return {
+            "success": False,
+            "error": f"Unsupported resource type: {resource_type}"
         }
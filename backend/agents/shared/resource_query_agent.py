@@ -5,7 +5,9 @@ from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 from langchain_openai import ChatOpenAI
 from sqlalchemy.orm import Session
 from services.resource_service import ResourceService
+from services.retrieval_service import RetrievalService
 from agents.tools.resource_tools import get_resource_query_tools, get_resource_content
+from metrics import AGENT_STEP_SECONDS, Timer
 import logging
 import json
 
@@ -95,8 +97,7 @@ Always return your findings in a structured format with:
         Returns:
             Dict with found resources and their details
         """
-        import time
-        start_time = time.time()
+        timer = Timer(AGENT_STEP_SECONDS, agent="resource_query", step="query").begin()
 
         # Use instance values if not overridden
         effective_topic = topic if topic is not None else self.topic
@@ -111,75 +112,34 @@ Always return your findings in a structured format with:
         if effective_article_id:
             logger.info(f"   Article filter: {effective_article_id}")
 
-        all_results = []
-
-        # If topic or article_id is specified, use scoped search
+        # Scope to the topic's group and/or the article's resources
+        resource_ids = None
         if effective_topic or effective_article_id:
-            try:
-                # Determine which types to search
-                search_types = [self.resource_type] if self.resource_type else ["text", "table"]
-
-                for resource_type in search_types:
-                    results = ResourceService.semantic_search_for_content(
-                        db=self.db,
-                        query=search_query,
-                        topic=effective_topic,
-                        article_id=effective_article_id,
-                        resource_type=resource_type,
-                        limit=limit
-                    )
-
-                    for r in results:
-                        all_results.append({
-                            "resource_id": r.get("resource_id"),
-                            "name": r.get("name"),
-                            "type": r.get("type", resource_type),
-                            "similarity_score": r.get("similarity_score", 0),
-                            "content_preview": r.get("content_preview", "")
-                        })
-
-                    logger.info(f"   Found {len(results)} {resource_type} resources (scoped)")
-
-            except Exception as e:
-                logger.error(f"   Error in scoped resource search: {e}")
-        else:
-            # No scoping - search all resources
-            search_types = [self.resource_type] if self.resource_type else ["text", "table"]
-
-            for resource_type in search_types:
-                try:
-                    results = ResourceService.semantic_search_resources(
-                        query=search_query,
-                        resource_type=resource_type,
-                        limit=limit
-                    )
-
-                    for r in results:
-                        all_results.append({
-                            "resource_id": r.get("resource_id"),
-                            "name": r.get("name"),
-                            "type": r.get("type", resource_type),
-                            "similarity_score": r.get("similarity_score", 0),
-                            "content_preview": r.get("content_preview", "")
-                        })
-
-                    logger.info(f"   Found {len(results)} {resource_type} resources")
-
-                except Exception as e:
-                    logger.error(f"   Error searching {resource_type} resources: {e}")
-
-        # Sort by similarity score and deduplicate
-        seen_ids = set()
-        unique_results = []
-        for r in sorted(all_results, key=lambda x: x.get("similarity_score", 0), reverse=True):
-            if r.get("resource_id") not in seen_ids:
-                seen_ids.add(r.get("resource_id"))
-                unique_results.append(r)
-
-        # Limit total results
-        unique_results = unique_results[:limit]
-
-        elapsed = time.time() - start_time
+            scoped_ids = set()
+            if effective_topic:
+                scoped_ids.update(ResourceService.get_resource_ids_for_topic(self.db, effective_topic))
+            if effective_article_id:
+                scoped_ids.update(ResourceService.get_resource_ids_by_article(self.db, effective_article_id))
+            resource_ids = list(scoped_ids)
+
+        # One embedding, one concurrent query per resource type, fused by rank
+        search_types = [self.resource_type] if self.resource_type else ["text", "table"]
+        try:
+            unique_results = RetrievalService.retrieve(
+                self.db,
+                search_query,
+                article_limit=0,
+                resource_types=search_types,
+                resource_limit=limit,
+                resource_ids=resource_ids,
+            ).resources
+        except Exception as e:
+            logger.error(f"   Error in resource search: {e}")
+            unique_results = []
+
+        logger.info(f"   Found {len(unique_results)} resources{' (scoped)' if resource_ids is not None else ''}")
+
+        elapsed = timer.end()
         logger.info(f"✓ RESOURCE QUERY AGENT: {elapsed:.2f}s, {len(unique_results)} total results")
 
         return {
@@ -241,8 +201,7 @@ Always return your findings in a structured format with:
         Returns:
             Dict with found resources and LLM analysis
         """
-        import time
-        start_time = time.time()
+        timer = Timer(AGENT_STEP_SECONDS, agent="resource_query", step="query_with_llm").begin()
 
         logger.info(f"🤖 RESOURCE QUERY AGENT (LLM): Started")
         logger.info(f"   Query: '{search_query[:80]}{'...' if len(search_query) > 80 else ''}'")
@@ -313,7 +272,7 @@ REASONING: [Brief reasoning for each recommendation]
                         recommended_resources.append(r)
                         break
 
-            elapsed = time.time() - start_time
+            elapsed = timer.end()
             logger.info(f"✓ RESOURCE QUERY AGENT (LLM): {elapsed:.2f}s, {len(recommended_resources)} recommended")
 
             return {
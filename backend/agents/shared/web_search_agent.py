@@ -5,26 +5,69 @@ This agent handles web search operations:
 - General web search
 - News search
 - Financial news search
+
+Searches go through the web search cache (services.search_cache), so a
+repeated query is answered from Redis and result URLs are deduplicated.
+When Google Custom Search is configured, news searches query DuckDuckGo and
+Google concurrently and merge the results (duplicate pages dropped).
 """
 
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
 from typing import Dict, Any, Optional, List
+import logging
+
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage
 
-from agents.builds.v1.state import AgentState, UserContext
+from agents.builds.v2.state import AgentState, UserContext
+from services.google_search_service import GoogleSearchService, get_google_search_service
+from services.search_cache import cached_search, dedupe_results
+
+logger = logging.getLogger("uvicorn")
+
+# DuckDuckGo news timelimit -> Google dateRestrict
+GOOGLE_DATE_RESTRICT = {"d": "d1", "w": "w1", "m": "m1"}
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="web-search")
+
+
+def merge_provider_results(*provider_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge result lists of several providers, alternating between them.
+
+    Each provider's ranking is kept; a page found by several providers stays
+    at its best position (see dedupe_results).
+    """
+    interleaved = [r for group in zip_longest(*provider_results) for r in group if r is not None]
+    return dedupe_results(interleaved)
+
+
+def _from_google(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Google Custom Search result in the DuckDuckGo news shape."""
+    return {
+        "title": result.get("title", ""),
+        "url": result.get("link", ""),
+        "snippet": result.get("snippet", ""),
+        "source": result.get("displayLink", ""),
+        "date": "",
+    }
 
 
 class WebSearchAgent:
     """
     Agent for web search operations.
 
-    Uses DuckDuckGo for web searches. Requires analyst+ permissions.
+    Uses DuckDuckGo for web searches, and Google Custom Search as well for
+    news when it is configured. Requires analyst+ permissions.
     """
 
     def __init__(
         self,
         llm: BaseChatModel,
         topic: Optional[str] = None,
+        google_search: Optional[GoogleSearchService] = None,
     ):
         """
         Initialize the WebSearchAgent.
@@ -32,9 +75,12 @@ class WebSearchAgent:
         Args:
             llm: Language model for processing results
             topic: Optional topic for context
+            google_search: Google Search service for news (default: the shared
+                service if GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID are set)
         """
         self.llm = llm
         self.topic = topic
+        self.google_search = google_search or get_google_search_service()
 
     def web_search(
         self,
@@ -52,22 +98,14 @@ class WebSearchAgent:
             Dict with search results
         """
         try:
-            from duckduckgo_search import DDGS
-
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=max_results))
+            results = cached_search(
+                "ddg_text", query, lambda: self._ddg_text(query, max_results), max_results=max_results,
+            )
 
             return {
                 "success": True,
                 "query": query,
-                "results": [
-                    {
-                        "title": r.get("title", ""),
-                        "url": r.get("href", ""),
-                        "snippet": r.get("body", ""),
-                    }
-                    for r in results
-                ],
+                "results": results,
                 "count": len(results),
             }
 
@@ -89,47 +127,99 @@ class WebSearchAgent:
         """
         Search for news articles.
 
+        DuckDuckGo and (if configured) Google are searched concurrently; their
+        results are merged, duplicates dropped, and cut to max_results. The
+        search fails only if every provider fails.
+
         Args:
             query: Search query
             max_results: Maximum number of results
             timelimit: Time limit (d=day, w=week, m=month)
 
         Returns:
-            Dict with news results
+            Dict with news results and the providers that answered
         """
-        try:
-            from duckduckgo_search import DDGS
-
-            with DDGS() as ddgs:
-                results = list(ddgs.news(query, max_results=max_results, timelimit=timelimit))
-
-            return {
-                "success": True,
-                "query": query,
-                "type": "news",
-                "timelimit": timelimit,
-                "results": [
-                    {
-                        "title": r.get("title", ""),
-                        "url": r.get("url", ""),
-                        "snippet": r.get("body", ""),
-                        "source": r.get("source", ""),
-                        "date": r.get("date", ""),
-                    }
-                    for r in results
-                ],
-                "count": len(results),
-            }
-
-        except Exception as e:
+        searches = {
+            "ddg": lambda: cached_search(
+                "ddg_news", query, lambda: self._ddg_news(query, max_results, timelimit),
+                max_results=max_results, timelimit=timelimit,
+            ),
+        }
+        if self.google_search is not None:
+            searches["google"] = lambda: [
+                _from_google(r) for r in self.google_search.search(
+                    query, num_results=max_results, date_restrict=GOOGLE_DATE_RESTRICT.get(timelimit),
+                )
+            ]
+
+        futures = {
+            name: _executor.submit(contextvars.copy_context().run, search)
+            for name, search in searches.items()
+        }
+        provider_results, errors = {}, {}
+        for name, future in futures.items():
+            try:
+                provider_results[name] = future.result()
+            except Exception as e:
+                logger.warning(f"News search failed on {name}: {e}")
+                errors[name] = str(e)
+
+        if not provider_results:
             return {
                 "success": False,
-                "error": str(e),
+                "error": "; ".join(errors.values()),
                 "query": query,
                 "results": [],
                 "count": 0,
             }
 
+        results = merge_provider_results(*provider_results.values())[:max_results]
+        return {
+            "success": True,
+            "query": query,
+            "type": "news",
+            "timelimit": timelimit,
+            "providers": list(provider_results),
+            "results": results,
+            "count": len(results),
+        }
+
+    @staticmethod
+    def _ddg_text(query: str, max_results: int) -> List[Dict[str, Any]]:
+        """Run a DuckDuckGo text search."""
+        from duckduckgo_search import DDGS
+
+        with DDGS() as ddgs:
+            results = list(ddgs.text(query, max_results=max_results))
+
+        return [
+            {
+                "title": r.get("title", ""),
+                "url": r.get("href", ""),
+                "snippet": r.get("body", ""),
+            }
+            for r in results
+        ]
+
+    @staticmethod
+    def _ddg_news(query: str, max_results: int, timelimit: str) -> List[Dict[str, Any]]:
+        """Run a DuckDuckGo news search."""
+        from duckduckgo_search import DDGS
+
+        with DDGS() as ddgs:
+            results = list(ddgs.news(query, max_results=max_results, timelimit=timelimit))
+
+        return [
+            {
+                "title": r.get("title", ""),
+                "url": r.get("url", ""),
+                "snippet": r.get("body", ""),
+                "source": r.get("source", ""),
+                "date": r.get("date", ""),
+            }
+            for r in results
+        ]
+
     def search_financial_news(
         self,
         query: str,
@@ -186,8 +276,10 @@ class WebSearchAgent:
 
             if result.get("success"):
                 for r in result.get("results", []):
-                    r["aspect"] = aspect
-                    all_results.append(r)
+                    all_results.append({**r, "aspect": aspect})
+
+        # The same page often comes up for several aspects
+        all_results = dedupe_results(all_results)
 
         return {
             "success": True,
@@ -44,9 +44,11 @@ from agents.tools.editor_tools import (
 )
 from agents.tools.data_download_tools import (
     fetch_stock_price,
+    fetch_stock_prices,
     fetch_stock_info,
     fetch_financial_statement,
     fetch_fx_rate,
+    fetch_fx_rates,
     fetch_treasury_yields,
     fetch_economic_indicator,
     get_stock_data_tools,
@@ -257,9 +259,11 @@ __all__ = [
     "get_all_editor_tools",
     # Data download tools
     "fetch_stock_price",
+    "fetch_stock_prices",
     "fetch_stock_info",
     "fetch_financial_statement",
     "fetch_fx_rate",
+    "fetch_fx_rates",
     "fetch_treasury_yields",
     "fetch_economic_indicator",
     "get_stock_data_tools",
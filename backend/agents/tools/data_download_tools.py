@@ -2,7 +2,13 @@
 Data download tools for fetching financial data.
 
 These tools provide access to stock prices, financial statements,
-economic indicators, FX rates, and treasury yields.
+economic indicators, FX rates, and treasury yields. Price history and
+company info come from the local market-data store (services.market_data),
+which only asks Yahoo Finance for date ranges it does not have yet.
+Symbols are checked against the ticker universe (services.ticker_universe)
+first, so company names resolve and common abbreviations cost no lookup.
+The batch tools (fetch_stock_prices, fetch_fx_rates) download all symbols
+of a request with one bulk call.
 """
 
 from typing import Optional, List
@@ -10,8 +16,22 @@ from langchain_core.tools import tool
 import json
 import logging
 
+from services.market_data import MarketData, PRICE_COLUMNS, history_records
+from services.ticker_universe import resolve_symbol
+
 logger = logging.getLogger("uvicorn")
 
+# Largest number of symbols accepted by the batch tools
+MAX_BATCH_SYMBOLS = 20
+
+
+def _unknown_symbol(symbol: str) -> str:
+    return json.dumps({
+        "success": False,
+        "message": f"Unknown symbol: {symbol}. Use a listed ticker or company name.",
+        "symbol": symbol,
+    })
+
 
 # =============================================================================
 # Stock Data Tools (Analyst+)
@@ -38,10 +58,11 @@ def fetch_stock_price(
         JSON string with stock price data
     """
     try:
-        import yfinance as yf
-
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period, interval=interval)
+        resolved = resolve_symbol(symbol)
+        if resolved is None:
+            return _unknown_symbol(symbol)
+        symbol = resolved
+        hist = MarketData.history(symbol, period=period, interval=interval)
 
         if hist.empty:
             return json.dumps({
@@ -51,31 +72,22 @@ def fetch_stock_price(
             })
 
         # Get company info
-        info = ticker.info
-
-        # Convert to list of dicts
-        data = []
-        for idx, row in hist.iterrows():
-            data.append({
-                "date": idx.strftime("%Y-%m-%d"),
-                "open": round(row.get("Open", 0), 2),
-                "high": round(row.get("High", 0), 2),
-                "low": round(row.get("Low", 0), 2),
-                "close": round(row.get("Close", 0), 2),
-                "volume": int(row.get("Volume", 0)),
-            })
+        info = MarketData.info(symbol)
+
+        # Return last 30 entries to avoid large payloads
+        data = history_records(hist, PRICE_COLUMNS, tail=30)
 
         return json.dumps({
             "success": True,
-            "message": f"Fetched {len(data)} data points for {symbol}",
+            "message": f"Fetched {len(hist)} data points for {symbol}",
             "symbol": symbol,
             "company_name": info.get("longName", symbol),
             "currency": info.get("currency", "USD"),
             "period": period,
             "interval": interval,
-            "latest_price": data[-1]["close"] if data else None,
-            "data_points": len(data),
-            "data": data[-30:],  # Return last 30 entries to avoid large payloads
+            "latest_price": data[-1]["close"],
+            "data_points": len(hist),
+            "data": data,
         })
 
     except Exception as e:
@@ -87,6 +99,74 @@ def fetch_stock_price(
         })
 
 
+@tool
+def fetch_stock_prices(
+    symbols: List[str],
+    period: str = "1mo",
+    interval: str = "1d",
+) -> str:
+    """
+    Fetch stock price data for several symbols at once.
+
+    Use this tool instead of calling fetch_stock_price repeatedly when a
+    request mentions more than one ticker; all symbols are downloaded
+    together.
+
+    Args:
+        symbols: Stock ticker symbols (e.g., ["AAPL", "MSFT", "NVDA"], at most 20)
+        period: Data period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+        interval: Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo)
+
+    Returns:
+        JSON string with price data per symbol and errors for symbols without data
+    """
+    try:
+        errors = {}
+        resolved = []
+        for symbol in symbols[:MAX_BATCH_SYMBOLS]:
+            match = resolve_symbol(symbol)
+            if match is None:
+                errors[symbol] = f"Unknown symbol: {symbol}"
+            else:
+                resolved.append(match)
+
+        histories = MarketData.history_many(resolved, period=period, interval=interval)
+        infos = MarketData.info_many([s for s, hist in histories.items() if not hist.empty])
+
+        results = {}
+        for symbol, hist in histories.items():
+            if hist.empty:
+                errors[symbol] = f"No data found for symbol {symbol}"
+                continue
+
+            info = infos.get(symbol, {})
+            data = history_records(hist, PRICE_COLUMNS, tail=30)  # Last 30 entries
+            results[symbol] = {
+                "company_name": info.get("longName", symbol),
+                "currency": info.get("currency", "USD"),
+                "latest_price": data[-1]["close"],
+                "data_points": len(hist),
+                "data": data,
+            }
+
+        return json.dumps({
+            "success": bool(results),
+            "message": f"Fetched price data for {len(results)} of {len(results) + len(errors)} symbols",
+            "period": period,
+            "interval": interval,
+            "results": results,
+            "errors": errors,
+        })
+
+    except Exception as e:
+        logger.error(f"Error fetching stock data for {symbols}: {e}")
+        return json.dumps({
+            "success": False,
+            "message": f"Error fetching stock data: {str(e)}",
+            "symbols": symbols,
+        })
+
+
 @tool
 def fetch_stock_info(symbol: str) -> str:
     """
@@ -102,10 +182,11 @@ def fetch_stock_info(symbol: str) -> str:
         JSON string with stock information
     """
     try:
-        import yfinance as yf
-
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        resolved = resolve_symbol(symbol)
+        if resolved is None:
+            return _unknown_symbol(symbol)
+        symbol = resolved
+        info = MarketData.info(symbol)
 
         return json.dumps({
             "success": True,
@@ -123,7 +204,7 @@ def fetch_stock_info(symbol: str) -> str:
                 "52_week_low": info.get("fiftyTwoWeekLow"),
                 "avg_volume": info.get("averageVolume"),
                 "beta": info.get("beta"),
-                "description": info.get("longBusinessSummary", "")[:500],
+                "description": (info.get("longBusinessSummary") or "")[:500],
             },
         })
 
@@ -155,6 +236,10 @@ def fetch_financial_statement(
         JSON string with financial statement data
     """
     try:
+        resolved = resolve_symbol(symbol)
+        if resolved is None:
+            return _unknown_symbol(symbol)
+        symbol = resolved
         import yfinance as yf
 
         ticker = yf.Ticker(symbol)
@@ -228,12 +313,9 @@ def fetch_fx_rate(
         JSON string with FX rate data
     """
     try:
-        import yfinance as yf
-
         # Yahoo Finance uses format like "EURUSD=X"
         symbol = f"{base}{target}=X"
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period)
+        hist = MarketData.history(symbol, period=period)
 
         if hist.empty:
             return json.dumps({
@@ -241,21 +323,16 @@ def fetch_fx_rate(
                 "message": f"No FX data for {base}/{target}",
             })
 
-        data = []
-        for idx, row in hist.iterrows():
-            data.append({
-                "date": idx.strftime("%Y-%m-%d"),
-                "rate": round(row.get("Close", 0), 4),
-            })
+        data = history_records(hist, {"rate": ("Close", 4)}, tail=30)  # Last 30 entries
 
         return json.dumps({
             "success": True,
-            "message": f"Fetched {len(data)} FX data points for {base}/{target}",
+            "message": f"Fetched {len(hist)} FX data points for {base}/{target}",
             "base": base,
             "target": target,
             "period": period,
-            "latest_rate": data[-1]["rate"] if data else None,
-            "data": data[-30:],  # Last 30 entries
+            "latest_rate": data[-1]["rate"],
+            "data": data,
         })
 
     except Exception as e:
@@ -268,6 +345,67 @@ def fetch_fx_rate(
         })
 
 
+@tool
+def fetch_fx_rates(
+    pairs: List[str],
+    period: str = "1mo",
+) -> str:
+    """
+    Fetch foreign exchange rate data for several currency pairs at once.
+
+    Use this tool instead of calling fetch_fx_rate repeatedly; all pairs
+    are downloaded together.
+
+    Args:
+        pairs: Currency pairs as "BASE/TARGET" or "BASETARGET" (e.g., ["EUR/USD", "USDJPY"], at most 20)
+        period: Data period (1d, 5d, 1mo, 3mo, 6mo, 1y)
+
+    Returns:
+        JSON string with FX rate data per pair and errors for invalid pairs or pairs without data
+    """
+    try:
+        symbols = {}
+        errors = {}
+        for pair in pairs[:MAX_BATCH_SYMBOLS]:
+            code = pair.replace("/", "").strip().upper()
+            if len(code) != 6 or not code.isalpha():
+                errors[pair] = f"Invalid currency pair: {pair}"
+                continue
+            # Yahoo Finance uses format like "EURUSD=X"
+            symbols[f"{code[:3]}/{code[3:]}"] = f"{code}=X"
+
+        histories = MarketData.history_many(symbols.values(), period=period)
+
+        results = {}
+        for pair, symbol in symbols.items():
+            hist = histories.get(symbol)
+            if hist is None or hist.empty:
+                errors[pair] = f"No FX data for {pair}"
+                continue
+
+            data = history_records(hist, {"rate": ("Close", 4)}, tail=30)  # Last 30 entries
+            results[pair] = {
+                "latest_rate": data[-1]["rate"],
+                "data": data,
+            }
+
+        return json.dumps({
+            "success": bool(results),
+            "message": f"Fetched FX data for {len(results)} of {len(symbols)} pairs",
+            "period": period,
+            "results": results,
+            "errors": errors,
+        })
+
+    except Exception as e:
+        logger.error(f"Error fetching FX rates for {pairs}: {e}")
+        return json.dumps({
+            "success": False,
+            "message": f"Error fetching FX rates: {str(e)}",
+            "pairs": pairs,
+        })
+
+
 @tool
 def fetch_treasury_yields(
     maturity: str = "10Y",
@@ -287,8 +425,6 @@ def fetch_treasury_yields(
         JSON string with Treasury yield data
     """
     try:
-        import yfinance as yf
-
         # Treasury symbols on Yahoo Finance
         treasury_symbols = {
             "3M": "^IRX",   # 13 Week Treasury Bill
@@ -298,8 +434,7 @@ def fetch_treasury_yields(
         }
 
         symbol = treasury_symbols.get(maturity, "^TNX")
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period)
+        hist = MarketData.history(symbol, period=period)
 
         if hist.empty:
             return json.dumps({
@@ -307,20 +442,15 @@ def fetch_treasury_yields(
                 "message": f"No Treasury data for {maturity}",
             })
 
-        data = []
-        for idx, row in hist.iterrows():
-            data.append({
-                "date": idx.strftime("%Y-%m-%d"),
-                "yield": round(row.get("Close", 0), 3),
-            })
+        data = history_records(hist, {"yield": ("Close", 3)}, tail=30)  # Last 30 entries
 
         return json.dumps({
             "success": True,
-            "message": f"Fetched {len(data)} Treasury yield data points for {maturity}",
+            "message": f"Fetched {len(hist)} Treasury yield data points for {maturity}",
             "maturity": maturity,
             "period": period,
-            "latest_yield": data[-1]["yield"] if data else None,
-            "data": data[-30:],  # Last 30 entries
+            "latest_yield": data[-1]["yield"],
+            "data": data,
         })
 
     except Exception as e:
@@ -355,8 +485,6 @@ def fetch_economic_indicator(
         JSON string with economic indicator data
     """
     try:
-        import yfinance as yf
-
         # Map indicators to Yahoo Finance symbols (proxies)
         indicator_map = {
             "GDP": "^GSPC",  # Use S&P 500 as proxy for economic activity
@@ -372,8 +500,7 @@ def fetch_economic_indicator(
                 "message": f"Unknown indicator: {indicator}. Available: GDP, CPI, UNEMPLOYMENT, INFLATION",
             })
 
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period)
+        hist = MarketData.history(symbol, period=period)
 
         if hist.empty:
             return json.dumps({
@@ -381,22 +508,17 @@ def fetch_economic_indicator(
                 "message": f"No data for indicator {indicator}",
             })
 
-        data = []
-        for idx, row in hist.iterrows():
-            data.append({
-                "date": idx.strftime("%Y-%m-%d"),
-                "value": round(row.get("Close", 0), 2),
-            })
+        data = history_records(hist, {"value": ("Close", 2)}, tail=60)  # Last 60 entries
 
         return json.dumps({
             "success": True,
-            "message": f"Fetched {len(data)} data points for {indicator}",
+            "message": f"Fetched {len(hist)} data points for {indicator}",
             "indicator": indicator,
             "proxy_symbol": symbol,
             "period": period,
-            "latest_value": data[-1]["value"] if data else None,
+            "latest_value": data[-1]["value"],
             "note": "Values are proxy indicators from financial instruments",
-            "data": data[-60:],  # Last 60 entries
+            "data": data,
         })
 
     except Exception as e:
@@ -416,6 +538,7 @@ def get_stock_data_tools() -> List:
     """Get stock data tools (Analyst+)."""
     return [
         fetch_stock_price,
+        fetch_stock_prices,
         fetch_stock_info,
         fetch_financial_statement,
     ]
@@ -425,6 +548,7 @@ def get_macro_data_tools() -> List:
     """Get macro/economic data tools (Analyst+)."""
     return [
         fetch_fx_rate,
+        fetch_fx_rates,
         fetch_treasury_yields,
         fetch_economic_indicator,
     ]
@@ -58,8 +58,8 @@ def review_article(article_id: int) -> str:
                 })
 
             # Get content
-            from services.vector_service import VectorService
-            content = VectorService.get_article_content(article_id)
+            from services.content_store import ContentStore
+            content = ContentStore.get_content(article_id, db)
 
             return json.dumps({
                 "success": True,
@@ -6,12 +6,17 @@ import json
 
 
 def get_stock_info(ticker: str) -> str:
-    """Get stock information using yfinance."""
+    """Get stock information using yfinance (through the local market-data store)."""
     try:
-        import yfinance as yf
+        from services.market_data import MarketData
+        from services.ticker_universe import resolve_symbol
+
+        symbol = resolve_symbol(ticker)
+        if symbol is None:
+            return f"Error: unknown ticker symbol '{ticker}'"
+        ticker = symbol
 
-        stock = yf.Ticker(ticker.strip().upper())
-        info = stock.info
+        info = MarketData.info(ticker)
 
         # Extract key metrics
         result = {
@@ -30,6 +30,21 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Database objects managed by migrations only (not mapped in models.py);
+# excluded so autogenerate does not propose dropping them
+UNMAPPED_COLUMNS = {"search_vector"}
+UNMAPPED_INDEX_SUFFIXES = ("_search_vector", "_trgm")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if reflected and compare_to is None:
+        if type_ == "column" and name in UNMAPPED_COLUMNS:
+            return False
+        if type_ == "index" and name.endswith(UNMAPPED_INDEX_SUFFIXES):
+            return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -51,6 +66,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=database_url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -73,7 +89,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,125 @@
+"""Add full-text and trigram search to content_articles and resources
+
+Revision ID: 027_add_text_search
+Revises: 026_remove_redundant_hash_ids
+Create Date: 2026-10-18
+
+Replaces LIKE '%q%' scans (see services/text_search.py):
+- search_vector tsvector columns, maintained by BEFORE INSERT/UPDATE triggers
+- GIN indexes on search_vector
+- pg_trgm GIN indexes on the text columns (ILIKE, word similarity)
+- batched backfill of search_vector for existing rows, each batch committed
+  on its own (rows added meanwhile are filled by the trigger)
+
+PostgreSQL only; other databases are left unchanged.
+"""
+from typing import Sequence, Union
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+logger = logging.getLogger("alembic")
+
+# revision identifiers, used by Alembic.
+revision: str = '027_add_text_search'
+down_revision: Union[str, Sequence[str], None] = '026_remove_redundant_hash_ids'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# table -> (tsvector expression over NEW.*, columns that trigger a refresh, trigram columns)
+SEARCH_TABLES = {
+    'content_articles': (
+        "setweight(to_tsvector('english', coalesce({row}headline, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce({row}keywords, '')), 'B') || "
+        "setweight(to_tsvector('simple', coalesce({row}author, '')), 'C')",
+        ['headline', 'keywords', 'author'],
+        ['headline', 'keywords', 'author'],
+    ),
+    'resources': (
+        "setweight(to_tsvector('english', coalesce({row}name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce({row}description, '')), 'B')",
+        ['name', 'description'],
+        ['name', 'description'],
+    ),
+}
+
+
+def _backfill(table: str, expression: str) -> None:
+    """
+    Populate search_vector for existing rows in batches.
+
+    Runs in an autocommit block: the schema changes so far are committed first
+    and every batch commits on its own, so row locks are held for one batch
+    only.
+    """
+    bind = op.get_bind()
+    total = 0
+    with op.get_context().autocommit_block():
+        while True:
+            result = bind.execute(sa.text(f"""
+                UPDATE {table} SET search_vector = {expression.format(row='')}
+                WHERE id IN (
+                    SELECT id FROM {table} WHERE search_vector IS NULL
+                    ORDER BY id LIMIT {BACKFILL_BATCH_SIZE}
+                )
+            """))
+            if result.rowcount == 0:
+                break
+            total += result.rowcount
+    logger.info(f"Backfilled search_vector for {total} rows in {table}")
+
+
+def upgrade() -> None:
+    """Add tsvector columns, triggers, GIN/trigram indexes and backfill."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, (expression, trigger_columns, trigram_columns) in SEARCH_TABLES.items():
+        op.add_column(table, sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := {expression.format(row='NEW.')};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF {', '.join(trigger_columns)} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()
+        """)
+
+        _backfill(table, expression)
+
+        op.create_index(
+            f'ix_{table}_search_vector', table, ['search_vector'],
+            postgresql_using='gin',
+        )
+        for column in trigram_columns:
+            op.create_index(
+                f'ix_{table}_{column}_trgm', table, [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+
+
+def downgrade() -> None:
+    """Drop search indexes, triggers and tsvector columns (pg_trgm is kept)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, (_, _, trigram_columns) in SEARCH_TABLES.items():
+        for column in trigram_columns:
+            op.drop_index(f'ix_{table}_{column}_trgm', table)
+        op.drop_index(f'ix_{table}_search_vector', table)
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_search_vector_update()")
+        op.drop_column(table, 'search_vector')
@@ -0,0 +1,42 @@
+"""Add article_contents (compressed article content store)
+
+Revision ID: 028_add_article_contents
+Revises: 027_add_text_search
+Create Date: 2026-10-18
+
+Article content has lived only in ChromaDB since migration 007. This table
+keeps a zstd-compressed copy keyed by article id with a SHA-256 content hash
+(see services/content_store.py), so article reads no longer need ChromaDB.
+
+Existing articles are copied on first read, or in bulk with:
+    python backfill_content_store.py
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '028_add_article_contents'
+down_revision: Union[str, Sequence[str], None] = '027_add_text_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the article_contents table."""
+    op.create_table(
+        'article_contents',
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('content', sa.LargeBinary(), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['article_id'], ['content_articles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('article_id'),
+    )
+
+
+def downgrade() -> None:
+    """Drop the article_contents table."""
+    op.drop_table('article_contents')
@@ -0,0 +1,33 @@
+"""Add excerpt to content_articles
+
+Revision ID: 029_add_article_excerpt
+Revises: 028_add_article_contents
+Create Date: 2026-10-18
+
+Article lists can be served as summaries built from content_articles alone
+(no content store or ChromaDB reads). The excerpt is the plain-text start of
+the content, written by ContentService when content is saved.
+
+Existing articles get their excerpt with:
+    python backfill_content_store.py
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '029_add_article_excerpt'
+down_revision: Union[str, Sequence[str], None] = '028_add_article_contents'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the excerpt column."""
+    op.add_column('content_articles', sa.Column('excerpt', sa.String(length=300), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the excerpt column."""
+    op.drop_column('content_articles', 'excerpt')
@@ -5,13 +5,15 @@ This module provides two routers:
 - global_router: /api/admin/global/... - Requires global:admin only
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from database import get_db
 from models import ContentArticle, User
 from services.content_service import ContentService
+from services.content_store import ContentStore
+from services.llm_client import BULK, llm_priority
 from services.vector_service import VectorService
 from services.article_resource_service import ArticleResourceService
 from services.resource_service import ResourceService
@@ -20,6 +22,7 @@ from dependencies import (
     require_admin_for_topic,
     validate_article_topic,
     get_valid_topics,
+    paginated_articles,
 )
 from services.content_cache import ContentCache
 import logging
@@ -93,6 +96,12 @@ class BulkArticleSyncRequest(BaseModel):
     articles: List[ArticleSyncRequest]
 
 
+class ResourceEnrichRequest(BaseModel):
+    """Request model for generating resource descriptions and keywords."""
+    resource_ids: List[int]
+    job_id: Optional[str] = None
+
+
 # =============================================================================
 # Topic-Specific Admin Endpoints
 # Require: global:admin OR {topic}:admin
@@ -101,9 +110,11 @@ class BulkArticleSyncRequest(BaseModel):
 
 @topic_router.get("/articles", response_model=List[ArticleResponse])
 async def get_all_articles(
+    response: Response,
     topic: str,
     offset: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     user_topic: Tuple[dict, str] = Depends(require_admin_for_topic),
     db: Session = Depends(get_db)
 ):
@@ -114,13 +125,16 @@ async def get_all_articles(
         topic: Topic slug from URL path
         offset: Number of articles to skip (default: 0)
         limit: Maximum number of articles to return (default: 20, max: 100)
+        cursor: X-Next-Cursor header of the previous page (replaces offset)
 
     Returns:
         List of articles including inactive ones
     """
     user, validated_topic = user_topic
     limit = min(limit, 100)
-    articles = ContentService.get_all_articles_admin(db, validated_topic, offset, limit)
+    articles = paginated_articles(
+        response, lambda: ContentService.get_all_articles_admin(db, validated_topic, offset, limit, cursor=cursor)
+    )
     return articles
 
 
@@ -263,8 +277,8 @@ async def regenerate_article_resources(
     # Delete existing ARTICLE resources first
     ArticleResourceService.delete_article_resources(db, article_id)
 
-    # Get article content from ChromaDB
-    content = VectorService.get_article_content(article_id)
+    # Get article content (content store, ChromaDB for articles not stored yet)
+    content = ContentStore.get_content(article_id, db)
     if not content:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -386,8 +400,8 @@ async def regenerate_all_published_resources(
             })
             continue
 
-        # Get article content from ChromaDB
-        content = VectorService.get_article_content(article_id)
+        # Get article content (content store, ChromaDB for articles not stored yet)
+        content = ContentStore.get_content(article_id, db)
         if not content:
             results.append({
                 "article_id": article_id,
@@ -398,7 +412,8 @@ async def regenerate_all_published_resources(
             continue
 
         try:
-            ArticleResourceService.create_article_resources(db, article_model, content, admin_user.id)
+            with llm_priority(BULK):
+                ArticleResourceService.create_article_resources(db, article_model, content, admin_user.id)
             resources = ArticleResourceService.get_article_publication_resources(db, article_id)
             results.append({
                 "article_id": article_id,
@@ -424,6 +439,66 @@ async def regenerate_all_published_resources(
     }
 
 
+def _run_resource_enrichment(resource_ids: List[int], user_id: int, job_id: str):
+    """Background task: run an enrichment batch in its own database session."""
+    from agents.shared.resource_processing_agent import ResourceProcessingAgent
+    from database import SessionLocal
+    from services.model_router import routed_chat_model
+
+    db = SessionLocal()
+    try:
+        agent = ResourceProcessingAgent(routed_chat_model("resource_processing.metadata", temperature=0.3), db)
+        agent.batch_process_resources(resource_ids, user_id=user_id, job_id=job_id)
+    except Exception as e:
+        logger.error(f"Resource enrichment {job_id} failed: {e}")
+    finally:
+        db.close()
+
+
+@global_router.post("/resources/enrich", status_code=status.HTTP_202_ACCEPTED)
+def enrich_resources(
+    request: ResourceEnrichRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    admin: dict = Depends(require_admin)
+):
+    """
+    Start generating descriptions and keywords for resources in one batch.
+
+    The batch runs in the background: text and table resources are enriched
+    concurrently and PDFs decomposed (ResourceProcessingAgent.batch_process_resources).
+    Progress and the final counts are sent to the admin's websocket
+    notifications under the returned job_id; calling again with the same
+    resource ids (or job_id) resumes an interrupted batch.
+
+    Returns:
+        job_id and number of resources of the started batch
+    """
+    from services.resource_enrichment import job_id_for
+
+    admin_email = admin.get("email", "")
+    admin_user = db.query(User).filter(User.email == admin_email).first()
+    if not admin_user:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Admin user not found"
+        )
+    resource_ids = list(dict.fromkeys(request.resource_ids))
+    if not resource_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No resource ids given"
+        )
+
+    job_id = request.job_id or job_id_for(resource_ids)
+    background_tasks.add_task(_run_resource_enrichment, resource_ids, admin_user.id, job_id)
+    return {
+        "message": f"Enrichment of {len(resource_ids)} resources started",
+        "job_id": job_id,
+        "total": len(resource_ids)
+    }
+
+
 @global_router.post("/sync-article")
 async def sync_article_to_chromadb(
     request: ArticleSyncRequest,
@@ -454,6 +529,16 @@ async def sync_article_to_chromadb(
         "updated_at": datetime.now().isoformat()
     }
 
+    article = db.query(ContentArticle).filter(ContentArticle.id == request.article_id).first()
+    if article is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Article {request.article_id} not found"
+        )
+
+    # Store the content (reads prefer the content store over ChromaDB)
+    ContentService.store_content(db, article, request.content)
+
     success = VectorService.add_article(
         article_id=request.article_id,
         headline=request.headline,
@@ -488,6 +573,11 @@ async def sync_articles_bulk(
     """
     from datetime import datetime
 
+    article_ids = [article.article_id for article in request.articles]
+    existing = {
+        row.id: row for row in db.query(ContentArticle).filter(ContentArticle.id.in_(article_ids))
+    }
+
     results = []
     for article in request.articles:
         metadata = {
@@ -501,6 +591,17 @@ async def sync_articles_bulk(
             "updated_at": datetime.now().isoformat()
         }
 
+        if article.article_id not in existing:
+            results.append({
+                "article_id": article.article_id,
+                "headline": article.headline[:50],
+                "success": False,
+                "error": "Article not found"
+            })
+            continue
+
+        ContentService.store_content(db, existing[article.article_id], article.content)
+
         success = VectorService.add_article(
             article_id=article.article_id,
             headline=article.headline,
@@ -4,7 +4,7 @@ These endpoints require analyst, editor, or admin role for the specified topic.
 URL pattern: /api/analyst/{topic}/...
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
@@ -14,6 +14,7 @@ from dependencies import (
     get_current_user,
     require_analyst_for_topic,
     validate_article_topic,
+    paginated_articles,
 )
 import logging
 
@@ -77,9 +78,11 @@ class ContentAgentChatRequest(BaseModel):
 
 @router.get("/articles", response_model=List[ArticleResponse])
 async def get_draft_articles(
+    response: Response,
     topic: str,
     offset: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     user_topic: Tuple[dict, str] = Depends(require_analyst_for_topic),
     db: Session = Depends(get_db)
 ):
@@ -90,13 +93,16 @@ async def get_draft_articles(
         topic: Topic slug from URL path
         offset: Number of articles to skip (default: 0)
         limit: Maximum number of articles to return (default: 20, max: 100)
+        cursor: X-Next-Cursor header of the previous page (replaces offset)
 
     Returns:
         List of draft articles for the topic
     """
     user, validated_topic = user_topic
     limit = min(limit, 100)
-    articles = ContentService.get_articles_by_status(db, validated_topic, "draft", offset, limit)
+    articles = paginated_articles(
+        response, lambda: ContentService.get_articles_by_status(db, validated_topic, "draft", offset, limit, cursor=cursor)
+    )
     return articles
 
 
@@ -249,25 +255,17 @@ async def chat_with_content_agent(
     article_model = validate_article_topic(validated_topic, article_id, db)
 
     try:
-        from langchain_openai import ChatOpenAI
+        from services.model_router import routed_chat_model
         from langchain_core.messages import SystemMessage, HumanMessage
         from services.prompt_service import PromptService
         from agents.web_search_agent import WebSearchAgent
         from agents.data_download_agent import DataDownloadAgent
         from agents.article_query_agent import ArticleQueryAgent
         from services.user_context_service import UserContextService
-        import os
         import re
 
         # Initialize LLM
-        openai_api_key = os.getenv("OPENAI_API_KEY", "")
-        openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-
-        llm = ChatOpenAI(
-            api_key=openai_api_key,
-            model=openai_model,
-            temperature=0.7
-        )
+        llm = routed_chat_model("content_agent.chat", topic=validated_topic, temperature=0.7)
 
         # Initialize subagents for research
         web_search_agent = WebSearchAgent(llm=llm, topic=validated_topic)
@@ -465,10 +463,10 @@ async def get_all_articles_for_analyst(
 
     if status_filter:
         # Filter by specific status
-        articles = ContentService.get_articles_by_status(db, validated_topic, status_filter, offset, limit)
+        articles, _ = ContentService.get_articles_by_status(db, validated_topic, status_filter, offset, limit)
     else:
         # Get all articles regardless of status
-        articles = ContentService.get_all_articles_admin(db, validated_topic, offset, limit)
+        articles, _ = ContentService.get_all_articles_admin(db, validated_topic, offset, limit)
 
     return articles
 
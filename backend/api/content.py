@@ -1,6 +1,6 @@
 """API endpoints for content article management."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
@@ -10,8 +10,12 @@ from services.content_service import ContentService
 from services.content_cache import ContentCache
 from services.pdf_service import PDFService
 from services.article_resource_service import ArticleResourceService
-from services.vector_service import VectorService
-from dependencies import get_current_user, require_admin, require_analyst, get_valid_topics
+from services.content_store import ContentStore
+from services.llm_client import BULK, llm_priority
+from dependencies import (
+    get_current_user, require_admin, require_analyst, get_valid_topics,
+    ArticleProjection, article_projection, cached_article_list, paginated_articles,
+)
 from models import ContentArticle, User
 import logging
 
@@ -28,7 +32,8 @@ class ArticleResponse(BaseModel):
     headline: str
     author: Optional[str]
     editor: Optional[str]
-    content: str
+    content: Optional[str] = None  # left out of summaries (include_content=false)
+    excerpt: Optional[str] = None
     readership_count: int
     rating: Optional[int]
     rating_count: int
@@ -75,12 +80,14 @@ class ContentAgentChatRequest(BaseModel):
 # Dependencies are now imported from dependencies.py - no more monkey-patching!
 
 
-@router.get("/articles/{topic}", response_model=List[ArticleResponse])
+@router.get("/articles/{topic}", response_model=List[ArticleResponse], response_model_exclude_unset=True)
 async def get_topic_articles(
+    request: Request,
     topic: str,
     limit: int = 10,
     db: Session = Depends(get_db),
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    projection: ArticleProjection = Depends(article_projection)
 ):
     """
     Get recent articles for a specific topic.
@@ -88,6 +95,8 @@ async def get_topic_articles(
     Args:
         topic: Topic name (macro, equity, fixed_income, esg)
         limit: Maximum number of articles to return (default: 10, max: 50)
+        include_content: false returns summaries (excerpt, no content)
+        fields: Comma-separated fields to return (e.g. id,headline,excerpt)
         db: Database session
         user: Current authenticated user
 
@@ -106,17 +115,20 @@ async def get_topic_articles(
     limit = min(limit, 50)
 
     # Get articles
-    articles = ContentService.get_recent_articles(db, topic, limit)
-
-    return articles
+    return await cached_article_list(
+        request, topic, projection, ArticleResponse, limit,
+        lambda: ContentService.aget_recent_articles(db, topic, limit, include_content=projection.include_content)
+    )
 
 
-@router.get("/articles/{topic}/top-rated", response_model=List[ArticleResponse])
+@router.get("/articles/{topic}/top-rated", response_model=List[ArticleResponse], response_model_exclude_unset=True)
 async def get_top_rated_articles(
+    request: Request,
     topic: str,
     limit: int = 10,
     db: Session = Depends(get_db),
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    projection: ArticleProjection = Depends(article_projection)
 ):
     """
     Get top-rated articles for a specific topic.
@@ -124,6 +136,8 @@ async def get_top_rated_articles(
     Args:
         topic: Topic name (macro, equity, fixed_income, esg)
         limit: Maximum number of articles to return (default: 10, max: 50)
+        include_content: false returns summaries (excerpt, no content)
+        fields: Comma-separated fields to return (e.g. id,headline,excerpt)
         db: Database session
         user: Current authenticated user
 
@@ -142,17 +156,20 @@ async def get_top_rated_articles(
     limit = min(limit, 50)
 
     # Get articles
-    articles = ContentService.get_top_rated_articles(db, topic, limit)
-
-    return articles
+    return await cached_article_list(
+        request, topic, projection, ArticleResponse, limit,
+        lambda: ContentService.aget_top_rated_articles(db, topic, limit, include_content=projection.include_content)
+    )
 
 
-@router.get("/articles/{topic}/most-read", response_model=List[ArticleResponse])
+@router.get("/articles/{topic}/most-read", response_model=List[ArticleResponse], response_model_exclude_unset=True)
 async def get_most_read_articles(
+    request: Request,
     topic: str,
     limit: int = 10,
     db: Session = Depends(get_db),
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    projection: ArticleProjection = Depends(article_projection)
 ):
     """
     Get most-read articles for a specific topic.
@@ -160,6 +177,8 @@ async def get_most_read_articles(
     Args:
         topic: Topic name (macro, equity, fixed_income, esg)
         limit: Maximum number of articles to return (default: 10, max: 50)
+        include_content: false returns summaries (excerpt, no content)
+        fields: Comma-separated fields to return (e.g. id,headline,excerpt)
         db: Database session
         user: Current authenticated user
 
@@ -178,9 +197,10 @@ async def get_most_read_articles(
     limit = min(limit, 50)
 
     # Get articles
-    articles = ContentService.get_most_read_articles(db, topic, limit)
-
-    return articles
+    return await cached_article_list(
+        request, topic, projection, ArticleResponse, limit,
+        lambda: ContentService.aget_most_read_articles(db, topic, limit, include_content=projection.include_content)
+    )
 
 
 @router.get("/article/{article_id}", response_model=ArticleResponse)
@@ -201,7 +221,7 @@ async def get_article(
     Returns:
         Article details
     """
-    article = ContentService.get_article(db, article_id, increment_readership=True)
+    article = await ContentService.aget_article(db, article_id, increment_readership=True)
 
     if not article:
         raise HTTPException(
@@ -296,7 +316,7 @@ async def search_articles(
     search_topic = None if topic == "all" else topic
 
     # Search articles with all criteria
-    articles = ContentService.search_articles(
+    articles = await ContentService.asearch_articles(
         db=db,
         topic=search_topic,
         query=q,
@@ -316,9 +336,11 @@ async def search_articles(
 
 @router.get("/admin/articles/{topic}", response_model=List[ArticleResponse])
 async def admin_get_all_articles(
+    response: Response,
     topic: str,
     offset: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     admin: dict = Depends(require_admin)
 ):
@@ -329,11 +351,12 @@ async def admin_get_all_articles(
         topic: Topic name (macro, equity, fixed_income, esg)
         offset: Number of articles to skip (default: 0)
         limit: Maximum number of articles to return (default: 20, max: 100)
+        cursor: X-Next-Cursor header of the previous page (replaces offset)
         db: Database session
         admin: Current admin user
 
     Returns:
-        List of articles
+        List of articles (X-Next-Cursor header set when more may follow)
     """
     # Validate topic against database
     valid_topics = get_valid_topics(db)
@@ -347,7 +370,9 @@ async def admin_get_all_articles(
     limit = min(limit, 100)
 
     # Get all articles (including inactive ones for admin)
-    articles = ContentService.get_all_articles_admin(db, topic, offset, limit)
+    articles = paginated_articles(
+        response, lambda: ContentService.get_all_articles_admin(db, topic, offset, limit, cursor=cursor)
+    )
 
     return articles
 
@@ -607,28 +632,20 @@ async def chat_with_content_agent(
 
     # Chat with content agent
     try:
-        from langchain_openai import ChatOpenAI
+        from services.model_router import routed_chat_model
         from langchain_core.messages import SystemMessage, HumanMessage
         from services.prompt_service import PromptService
         from agents.web_search_agent import WebSearchAgent
         from agents.data_download_agent import DataDownloadAgent
         from agents.article_query_agent import ArticleQueryAgent
         from services.user_context_service import UserContextService
-        import os
         import re
         import logging
 
         logger = logging.getLogger("uvicorn")
 
         # Initialize LLM
-        openai_api_key = os.getenv("OPENAI_API_KEY", "")
-        openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-
-        llm = ChatOpenAI(
-            api_key=openai_api_key,
-            model=openai_model,
-            temperature=0.7
-        )
+        llm = routed_chat_model("content_agent.chat", topic=topic, temperature=0.7)
 
         # Initialize subagents for research
         web_search_agent = WebSearchAgent(llm=llm, topic=topic)
@@ -836,9 +853,11 @@ async def download_article_pdf(
 
 @router.get("/analyst/articles/{topic}", response_model=List[ArticleResponse])
 async def get_analyst_draft_articles(
+    response: Response,
     topic: str,
     offset: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
@@ -857,15 +876,19 @@ async def get_analyst_draft_articles(
     analyst_check(user)
     
     limit = min(limit, 100)
-    articles = ContentService.get_articles_by_status(db, topic, "draft", offset, limit)
+    articles = paginated_articles(
+        response, lambda: ContentService.get_articles_by_status(db, topic, "draft", offset, limit, cursor=cursor)
+    )
     return articles
 
 
 @router.get("/editor/articles/{topic}", response_model=List[ArticleResponse])
 async def get_editor_articles(
+    response: Response,
     topic: str,
     offset: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
@@ -886,16 +909,20 @@ async def get_editor_articles(
     editor_check(user)
     
     limit = min(limit, 100)
-    articles = ContentService.get_articles_by_status(db, topic, "editor", offset, limit)
+    articles = paginated_articles(
+        response, lambda: ContentService.get_articles_by_status(db, topic, "editor", offset, limit, cursor=cursor)
+    )
     return articles
 
 
-@router.get("/published/articles/{topic}", response_model=List[ArticleResponse])
+@router.get("/published/articles/{topic}", response_model=List[ArticleResponse], response_model_exclude_unset=True)
 async def get_published_articles(
+    request: Request,
     topic: str,
     limit: int = 10,
     db: Session = Depends(get_db),
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    projection: ArticleProjection = Depends(article_projection)
 ):
     """
     Get published articles for a topic. Available to all authenticated users.
@@ -908,8 +935,10 @@ async def get_published_articles(
         )
     
     limit = min(limit, 50)
-    articles = ContentService.get_published_articles(db, topic, limit)
-    return articles
+    return await cached_article_list(
+        request, topic, projection, ArticleResponse, limit,
+        lambda: ContentService.aget_published_articles(db, topic, limit, include_content=projection.include_content)
+    )
 
 
 @router.post("/article/{article_id}/approve")
@@ -1032,7 +1061,7 @@ async def publish_article(
         resources_warning = None
 
         if article_model:
-            content = VectorService.get_article_content(article_id)
+            content = ContentStore.get_content(article_id, db)
             if content:
                 parent, html_res, pdf_res = ArticleResourceService.create_article_resources(
                     db=db,
@@ -1130,9 +1159,8 @@ async def admin_regenerate_article_resources(
     # Delete existing ARTICLE resources first
     ArticleResourceService.delete_article_resources(db, article_id)
 
-    # Get article content from ChromaDB
-    from services.vector_service import VectorService
-    content = VectorService.get_article_content(article_id)
+    # Get article content (content store, ChromaDB for articles not stored yet)
+    content = ContentStore.get_content(article_id, db)
     if not content:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1190,9 +1218,8 @@ async def admin_regenerate_all_published_resources(
             })
             continue
 
-        # Get article content from ChromaDB
-        from services.vector_service import VectorService
-        content = VectorService.get_article_content(article_id)
+        # Get article content (content store, ChromaDB for articles not stored yet)
+        content = ContentStore.get_content(article_id, db)
         if not content:
             results.append({
                 "article_id": article_id,
@@ -1203,7 +1230,8 @@ async def admin_regenerate_all_published_resources(
             continue
 
         try:
-            ArticleResourceService.create_article_resources(db, article_model, content, admin_user.id)
+            with llm_priority(BULK):
+                ArticleResourceService.create_article_resources(db, article_model, content, admin_user.id)
             resources = ArticleResourceService.get_article_publication_resources(db, article_id)
             results.append({
                 "article_id": article_id,
@@ -1352,6 +1380,16 @@ async def admin_sync_article_to_chromadb(
         "updated_at": datetime.now().isoformat()
     }
 
+    article = db.query(ContentArticle).filter(ContentArticle.id == request.article_id).first()
+    if article is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Article {request.article_id} not found"
+        )
+
+    # Store the content (reads prefer the content store over ChromaDB)
+    ContentService.store_content(db, article, request.content)
+
     # Add/update article in ChromaDB
     success = VectorService.add_article(
         article_id=request.article_id,
@@ -1387,6 +1425,11 @@ async def admin_sync_articles_bulk(
     from services.vector_service import VectorService
     from datetime import datetime
 
+    article_ids = [article.article_id for article in request.articles]
+    existing = {
+        row.id: row for row in db.query(ContentArticle).filter(ContentArticle.id.in_(article_ids))
+    }
+
     results = []
     for article in request.articles:
         metadata = {
@@ -1400,6 +1443,17 @@ async def admin_sync_articles_bulk(
             "updated_at": datetime.now().isoformat()
         }
 
+        if article.article_id not in existing:
+            results.append({
+                "article_id": article.article_id,
+                "headline": article.headline[:50],
+                "success": False,
+                "error": "Article not found"
+            })
+            continue
+
+        ContentService.store_content(db, existing[article.article_id], article.content)
+
         success = VectorService.add_article(
             article_id=article.article_id,
             headline=article.headline,
@@ -4,18 +4,19 @@ These endpoints require editor or admin role for the specified topic.
 URL pattern: /api/editor/{topic}/...
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from database import get_db
 from models import ContentArticle
 from services.content_service import ContentService
-from services.vector_service import VectorService
+from services.content_store import ContentStore
 from dependencies import (
     get_current_user,
     require_editor_for_topic,
     validate_article_topic,
+    paginated_articles,
 )
 import logging
 
@@ -57,9 +58,11 @@ class RejectArticleRequest(BaseModel):
 
 @router.get("/articles", response_model=List[ArticleResponse])
 async def get_pending_articles(
+    response: Response,
     topic: str,
     offset: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     user_topic: Tuple[dict, str] = Depends(require_editor_for_topic),
     db: Session = Depends(get_db)
 ):
@@ -70,13 +73,16 @@ async def get_pending_articles(
         topic: Topic slug from URL path
         offset: Number of articles to skip (default: 0)
         limit: Maximum number of articles to return (default: 20, max: 100)
+        cursor: X-Next-Cursor header of the previous page (replaces offset)
 
     Returns:
         List of articles in 'editor' status for the topic
     """
     user, validated_topic = user_topic
     limit = min(limit, 100)
-    articles = ContentService.get_articles_by_status(db, validated_topic, "editor", offset, limit)
+    articles = paginated_articles(
+        response, lambda: ContentService.get_articles_by_status(db, validated_topic, "editor", offset, limit, cursor=cursor)
+    )
     return articles
 
 
@@ -192,7 +198,7 @@ async def publish_article(
         resources_warning = None
 
         if article_model:
-            content = VectorService.get_article_content(article_id)
+            content = ContentStore.get_content(article_id, db)
             if content:
                 parent, html_res, pdf_res = ArticleResourceService.create_article_resources(
                     db=db,
@@ -291,7 +297,7 @@ async def get_all_articles_for_editor(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid status filter. Editors can only view: {', '.join(allowed_statuses)}"
             )
-        articles = ContentService.get_articles_by_status(db, validated_topic, status_filter, offset, limit)
+        articles, _ = ContentService.get_articles_by_status(db, validated_topic, status_filter, offset, limit)
     else:
         # Get both editor and published articles
         # Use search_articles with statuses filter
@@ -6,7 +6,7 @@ URL pattern: /api/reader/{topic}/...
 Permission: global:reader+ OR {topic}:reader+
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Tuple
@@ -17,6 +17,9 @@ from services.pdf_service import PDFService
 from dependencies import (
     require_reader_for_topic,
     validate_article_topic,
+    ArticleProjection,
+    article_projection,
+    cached_article_list,
 )
 import logging
 
@@ -33,7 +36,8 @@ class ArticleResponse(BaseModel):
     headline: str
     author: Optional[str]
     editor: Optional[str]
-    content: str
+    content: Optional[str] = None  # left out of summaries (include_content=false)
+    excerpt: Optional[str] = None
     readership_count: int
     rating: Optional[int]
     rating_count: int
@@ -56,12 +60,14 @@ class RateArticleRequest(BaseModel):
 # =============================================================================
 
 
-@router.get("/articles", response_model=List[ArticleResponse])
+@router.get("/articles", response_model=List[ArticleResponse], response_model_exclude_unset=True)
 async def get_topic_articles(
+    request: Request,
     topic: str,
     limit: int = 10,
     user_topic: Tuple[dict, str] = Depends(require_reader_for_topic),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    projection: ArticleProjection = Depends(article_projection)
 ):
     """
     Get published articles for a specific topic.
@@ -70,6 +76,8 @@ async def get_topic_articles(
     Args:
         topic: Topic slug from URL path
         limit: Maximum number of articles to return (default: 10, max: 50)
+        include_content: false returns summaries (excerpt, no content)
+        fields: Comma-separated fields to return (e.g. id,headline,excerpt)
 
     Returns:
         List of published articles for the topic
@@ -77,16 +85,20 @@ async def get_topic_articles(
     user, validated_topic = user_topic
     limit = min(limit, 50)
     # Readers can only see published articles
-    articles = ContentService.get_published_articles(db, validated_topic, limit)
-    return articles
+    return await cached_article_list(
+        request, validated_topic, projection, ArticleResponse, limit,
+        lambda: ContentService.aget_published_articles(db, validated_topic, limit, include_content=projection.include_content)
+    )
 
 
-@router.get("/articles/top-rated", response_model=List[ArticleResponse])
+@router.get("/articles/top-rated", response_model=List[ArticleResponse], response_model_exclude_unset=True)
 async def get_top_rated_articles(
+    request: Request,
     topic: str,
     limit: int = 10,
     user_topic: Tuple[dict, str] = Depends(require_reader_for_topic),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    projection: ArticleProjection = Depends(article_projection)
 ):
     """
     Get top-rated published articles for a specific topic.
@@ -95,6 +107,8 @@ async def get_top_rated_articles(
     Args:
         topic: Topic slug from URL path
         limit: Maximum number of articles to return (default: 10, max: 50)
+        include_content: false returns summaries (excerpt, no content)
+        fields: Comma-separated fields to return (e.g. id,headline,excerpt)
 
     Returns:
         List of top-rated published articles
@@ -102,16 +116,20 @@ async def get_top_rated_articles(
     user, validated_topic = user_topic
     limit = min(limit, 50)
     # Readers can only see published articles
-    articles = ContentService.get_top_rated_articles(db, validated_topic, limit, status="published")
-    return articles
+    return await cached_article_list(
+        request, validated_topic, projection, ArticleResponse, limit,
+        lambda: ContentService.aget_top_rated_articles(db, validated_topic, limit, status="published", include_content=projection.include_content)
+    )
 
 
-@router.get("/articles/most-read", response_model=List[ArticleResponse])
+@router.get("/articles/most-read", response_model=List[ArticleResponse], response_model_exclude_unset=True)
 async def get_most_read_articles(
+    request: Request,
     topic: str,
     limit: int = 10,
     user_topic: Tuple[dict, str] = Depends(require_reader_for_topic),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    projection: ArticleProjection = Depends(article_projection)
 ):
     """
     Get most-read published articles for a specific topic.
@@ -120,6 +138,8 @@ async def get_most_read_articles(
     Args:
         topic: Topic slug from URL path
         limit: Maximum number of articles to return (default: 10, max: 50)
+        include_content: false returns summaries (excerpt, no content)
+        fields: Comma-separated fields to return (e.g. id,headline,excerpt)
 
     Returns:
         List of most-read published articles
@@ -127,8 +147,10 @@ async def get_most_read_articles(
     user, validated_topic = user_topic
     limit = min(limit, 50)
     # Readers can only see published articles
-    articles = ContentService.get_most_read_articles(db, validated_topic, limit, status="published")
-    return articles
+    return await cached_article_list(
+        request, validated_topic, projection, ArticleResponse, limit,
+        lambda: ContentService.aget_most_read_articles(db, validated_topic, limit, status="published", include_content=projection.include_content)
+    )
 
 
 @router.get("/article/{article_id}", response_model=ArticleResponse)
@@ -156,7 +178,7 @@ async def get_article(
     # Validate article belongs to this topic
     validate_article_topic(validated_topic, article_id, db)
 
-    article = ContentService.get_article(db, article_id, increment_readership=True)
+    article = await ContentService.aget_article(db, article_id, increment_readership=True)
 
     if not article:
         raise HTTPException(
@@ -268,7 +290,7 @@ async def search_articles(
     search_topic = None if validated_topic == "all" else validated_topic
 
     # Readers can only search published articles
-    articles = ContentService.search_articles(
+    articles = await ContentService.asearch_articles(
         db=db,
         topic=search_topic,
         query=q,
@@ -284,12 +306,14 @@ async def search_articles(
     return articles
 
 
-@router.get("/published", response_model=List[ArticleResponse])
+@router.get("/published", response_model=List[ArticleResponse], response_model_exclude_unset=True)
 async def get_published_articles(
+    request: Request,
     topic: str,
     limit: int = 10,
     user_topic: Tuple[dict, str] = Depends(require_reader_for_topic),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    projection: ArticleProjection = Depends(article_projection)
 ):
     """
     Get published articles for a topic.
@@ -297,14 +321,18 @@ async def get_published_articles(
     Args:
         topic: Topic slug from URL path
         limit: Maximum number of articles (default: 10, max: 50)
+        include_content: false returns summaries (excerpt, no content)
+        fields: Comma-separated fields to return (e.g. id,headline,excerpt)
 
     Returns:
         List of published articles
     """
     user, validated_topic = user_topic
     limit = min(limit, 50)
-    articles = ContentService.get_published_articles(db, validated_topic, limit)
-    return articles
+    return await cached_article_list(
+        request, validated_topic, projection, ArticleResponse, limit,
+        lambda: ContentService.aget_published_articles(db, validated_topic, limit, include_content=projection.include_content)
+    )
 
 
 @router.get("/article/{article_id}/pdf")
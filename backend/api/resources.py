@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from database import get_db
 from models import Resource, ResourceType, ResourceStatus, TimeseriesFrequency, TimeseriesDataType, Group, ContentArticle, article_resources
 from services.resource_service import ResourceService
+from services.pagination import InvalidCursorError, Page
 from services.article_resource_service import ArticleResourceService
 from services.table_resource_service import TableResourceService
 from services.storage_service import get_storage, StorageService
@@ -93,6 +94,8 @@ class ResourceListResponse(BaseModel):
     total: int
     offset: int
     limit: int
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page (None on the last page)
+    total_exact: bool = True  # False: cached total being recounted (use exact_total=true to count now)
 
 
 class CreateTextResourceRequest(BaseModel):
@@ -236,6 +239,24 @@ def resolve_group_id(db: Session, group_id: Optional[int], group_name: Optional[
 # List and Get Endpoints
 # =============================================================================
 
+def _list_page(list_method, *args, **kwargs) -> Page:
+    """Call a ResourceService list method, mapping a bad cursor to 400."""
+    try:
+        return list_method(*args, **kwargs)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _list_response(page: Page, offset: int, limit: int) -> ResourceListResponse:
+    return ResourceListResponse(
+        resources=[ResourceResponse(**r) for r in page.items],
+        total=page.total,
+        offset=offset,
+        limit=limit,
+        next_cursor=page.next_cursor,
+        total_exact=page.total_exact
+    )
+
 @router.get("/", response_model=ResourceListResponse)
 async def list_resources(
     resource_type: Optional[str] = None,
@@ -243,6 +264,8 @@ async def list_resources(
     search: Optional[str] = None,
     offset: int = 0,
     limit: int = 50,
+    cursor: Optional[str] = None,
+    exact_total: bool = False,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -252,6 +275,8 @@ async def list_resources(
     - Global admin sees all resources
     - Topic admin sees resources in their group
     - Pass group_id=0 to get global resources (no group)
+    - Page with cursor=<next_cursor of the previous page> (offset is still accepted)
+    - total is cached briefly; pass exact_total=true to count now
     """
     scopes = current_user.get("scopes", [])
 
@@ -284,16 +309,11 @@ async def list_resources(
                 detail="You don't have permission to view these resources"
             )
 
-    resources, total = ResourceService.list_resources(
-        db, rt, actual_group_id, None, search, offset, limit
-    )
-
-    return ResourceListResponse(
-        resources=[ResourceResponse(**r) for r in resources],
-        total=total,
-        offset=offset,
-        limit=limit
+    page = _list_page(
+        ResourceService.list_resources,
+        db, rt, actual_group_id, None, search, offset, limit, cursor=cursor, exact_total=exact_total
     )
+    return _list_response(page, offset, limit)
 
 
 @router.get("/group/{topic}", response_model=ResourceListResponse)
@@ -303,6 +323,8 @@ async def list_group_resources(
     search: Optional[str] = None,
     offset: int = 0,
     limit: int = 50,
+    cursor: Optional[str] = None,
+    exact_total: bool = False,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -352,16 +374,11 @@ async def list_group_resources(
             )
 
     # Use the method that handles both group resources AND article resources for this topic
-    resources, total = ResourceService.list_topic_resources(
-        db, topic, rt, group_ids, search, offset, limit
-    )
-
-    return ResourceListResponse(
-        resources=[ResourceResponse(**r) for r in resources],
-        total=total,
-        offset=offset,
-        limit=limit
+    page = _list_page(
+        ResourceService.list_topic_resources,
+        db, topic, rt, group_ids, search, offset, limit, cursor=cursor, exact_total=exact_total
     )
+    return _list_response(page, offset, limit)
 
 
 @router.get("/global", response_model=ResourceListResponse)
@@ -371,6 +388,8 @@ async def list_global_resources(
     offset: int = 0,
     limit: int = 50,
     include_linked: bool = False,
+    cursor: Optional[str] = None,
+    exact_total: bool = False,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -396,16 +415,12 @@ async def list_global_resources(
 
     # Get resources with no group (group_id = NULL)
     # exclude_article_linked is the opposite of include_linked
-    resources, total = ResourceService.list_resources(
-        db, rt, None, None, search, offset, limit, global_only=True, exclude_article_linked=not include_linked
-    )
-
-    return ResourceListResponse(
-        resources=[ResourceResponse(**r) for r in resources],
-        total=total,
-        offset=offset,
-        limit=limit
+    page = _list_page(
+        ResourceService.list_resources,
+        db, rt, None, None, search, offset, limit, global_only=True, exclude_article_linked=not include_linked,
+        cursor=cursor, exact_total=exact_total
     )
+    return _list_response(page, offset, limit)
 
 
 @router.get("/{resource_id}", response_model=ResourceDetailResponse)
@@ -12,6 +12,7 @@ from database import get_db
 RESERVED_SLUGS = {"content", "edit"}
 from models import Topic, Group, ContentArticle
 from dependencies import get_current_user, require_admin
+from services import model_router
 import logging
 
 logger = logging.getLogger("uvicorn")
@@ -422,6 +423,7 @@ async def update_topic(
 
     db.commit()
     db.refresh(topic)
+    model_router.clear_topic_cache()
 
     logger.info(f"Updated topic '{topic.slug}'")
 
@@ -493,6 +495,7 @@ async def delete_topic(
     topic_id = topic.id
     db.delete(topic)
     db.commit()
+    model_router.clear_topic_cache()
 
     logger.info(f"Deleted topic '{slug}' (id={topic_id})")
 
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Copy article content from ChromaDB into the content store (article_contents).
+
+Articles are also copied on first read, so this is only needed to warm the
+store after migration 028 (e.g. before taking ChromaDB offline). Afterwards
+the list excerpt (migration 029) is filled in for articles that have none.
+
+Run with: uv run python backfill_content_store.py
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database import SessionLocal
+from models import ArticleContent, ContentArticle
+from services.content_store import ContentStore, make_excerpt
+from services.vector_service import VectorService, _get_chroma_client
+
+BATCH_SIZE = 100
+
+
+def main():
+    _, collection = _get_chroma_client()
+    if collection is None:
+        print("ERROR: ChromaDB unavailable")
+        return
+
+    db = SessionLocal()
+    try:
+        stored_ids = {row.article_id for row in db.query(ArticleContent.article_id)}
+        article_ids = [row.id for row in db.query(ContentArticle.id).order_by(ContentArticle.id)
+                       if row.id not in stored_ids]
+        print(f"Found {len(article_ids)} articles without stored content")
+
+        copied = 0
+        for start in range(0, len(article_ids), BATCH_SIZE):
+            batch = article_ids[start:start + BATCH_SIZE]
+            result = collection.get(
+                ids=[VectorService._make_document_id(article_id) for article_id in batch],
+                include=["documents"]
+            )
+            for doc_id, document in zip(result["ids"], result["documents"]):
+                if document is not None:
+                    copied += ContentStore.put(db, int(doc_id.replace("article_", "")), document)
+            db.commit()
+            print(f"  {min(start + BATCH_SIZE, len(article_ids))}/{len(article_ids)} checked, {copied} copied")
+
+        print(f"\n=== Done: {copied} articles copied, {len(article_ids) - copied} not found in ChromaDB ===")
+
+        fill_excerpts(db)
+
+    finally:
+        db.close()
+
+
+def fill_excerpts(db):
+    """Set ContentArticle.excerpt from stored content where it is missing."""
+    article_ids = [row.id for row in db.query(ContentArticle.id).filter(ContentArticle.excerpt.is_(None))]
+    print(f"\nFound {len(article_ids)} articles without excerpt")
+
+    filled = 0
+    for start in range(0, len(article_ids), BATCH_SIZE):
+        batch = article_ids[start:start + BATCH_SIZE]
+        contents = ContentStore.get_many(db, batch)
+        for article in db.query(ContentArticle).filter(ContentArticle.id.in_(list(contents))):
+            article.excerpt = make_excerpt(contents[article.id])
+            filled += 1
+        db.commit()
+
+    print(f"=== Done: {filled} excerpts set ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for hot backend paths.
+
+Runs offline against local stand-ins (fake OpenAI server, in-memory Chroma,
+SQLite) or against the docker-compose.test.yml services. See README.md.
+"""
@@ -0,0 +1,272 @@
+"""
+Benchmark cases for hot backend paths.
+
+Each case opens its own DB session in setup() and closes it in teardown(),
+so only the call under test is timed.
+"""
+
+import itertools
+from typing import Dict
+
+from benchmarks.environment import SeedData
+from benchmarks.harness import Benchmark, BenchmarkSkipped
+
+INTENT_MESSAGES = [
+    ("go to the analyst dashboard", {"section": "home"}),
+    ("show me the latest macro articles", {"section": "reader_topic", "topic": "macro"}),
+    ("publish this article", {"section": "editor_dashboard", "topic": "macro"}),
+    ("write an article about rate cuts", {"section": "analyst_dashboard", "topic": "macro"}),
+    ("what is the outlook for inflation?", {"section": "reader_topic", "topic": "macro"}),
+]
+INTENT_SCOPES = ["global:admin"]
+
+
+def _require_weasyprint():
+    """Skip PDF cases when weasyprint's system libraries (pango) are missing."""
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError) as e:
+        raise BenchmarkSkipped(f"weasyprint unavailable: {str(e).splitlines()[0]}")
+
+
+class _SessionCase:
+    """Holds one DB session for a benchmark case (and undoes its setting changes)."""
+
+    def __init__(self):
+        self.db = None
+        self.restore = None
+
+    def open(self):
+        from database import SessionLocal
+        self.db = SessionLocal()
+        return self.db
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+        if self.restore is not None:
+            self.restore()
+            self.restore = None
+
+
+def build_benchmarks(seed: SeedData) -> Dict[str, Benchmark]:
+    """Build the benchmark registry for the seeded fixtures."""
+    session = _SessionCase()
+    benchmarks = []
+
+    # -------------------------------------------------------------------------
+    # ContentService
+    # -------------------------------------------------------------------------
+
+    def setup_recent_articles():
+        from services.content_service import ContentService
+        db = session.open()
+        return lambda: ContentService.get_recent_articles(db, seed.topic, limit=10)
+
+    benchmarks.append(Benchmark(
+        name="content.get_recent_articles",
+        description="Topic article list (10 articles, content from Chroma)",
+        setup=setup_recent_articles,
+        teardown=session.close,
+        tags=["content"],
+    ))
+
+    def setup_search_articles():
+        from services.content_service import ContentService
+        db = session.open()
+        return lambda: ContentService.search_articles(
+            db, topic=seed.topic, query="inflation outlook", limit=10
+        )
+
+    benchmarks.append(Benchmark(
+        name="content.search_articles",
+        description="Semantic + filter search within a topic",
+        setup=setup_search_articles,
+        teardown=session.close,
+        tags=["content", "search"],
+    ))
+
+    def setup_article_to_dict():
+        from models import ContentArticle
+        from services.content_service import ContentService
+        db = session.open()
+        article = db.query(ContentArticle).filter(ContentArticle.id == seed.article_ids[0]).first()
+        return lambda: ContentService._article_to_dict(article)
+
+    benchmarks.append(Benchmark(
+        name="content.article_to_dict",
+        description="Single article serialization with content fetch",
+        setup=setup_article_to_dict,
+        teardown=session.close,
+        iterations=200,
+        tags=["content"],
+    ))
+
+    # -------------------------------------------------------------------------
+    # ResourceService / PDF / publishing
+    # -------------------------------------------------------------------------
+
+    def setup_timeseries():
+        from services.resource_service import ResourceService
+        if seed.timeseries_id is None:
+            raise BenchmarkSkipped("timeseries fixture not seeded")
+        db = session.open()
+        return lambda: ResourceService.get_timeseries_data(db, seed.timeseries_id)
+
+    benchmarks.append(Benchmark(
+        name="resources.get_timeseries_data",
+        description="Full daily OHLCV series (2 years x 5 columns)",
+        setup=setup_timeseries,
+        teardown=session.close,
+        iterations=20,
+        tags=["resources"],
+    ))
+
+    def setup_pdf():
+        _require_weasyprint()
+        from services.pdf_service import PDFService
+        from services.vector_service import VectorService
+        db = session.open()
+        content = VectorService.get_article_content(seed.article_ids[0]) or ""
+        return lambda: PDFService.generate_article_pdf(
+            headline="Macro outlook",
+            content=content,
+            topic=seed.topic,
+            created_at="2025-01-01T00:00:00",
+            keywords="inflation, rates",
+            base_url="http://localhost:8000",
+            db=db,
+        )
+
+    benchmarks.append(Benchmark(
+        name="pdf.generate_article_pdf",
+        description="Markdown to PDF including resource link processing",
+        setup=setup_pdf,
+        teardown=session.close,
+        iterations=10,
+        warmup=1,
+        tags=["pdf"],
+    ))
+
+    def setup_publish():
+        _require_weasyprint()
+        from models import ContentArticle
+        from services.article_resource_service import ArticleResourceService
+        from services.vector_service import VectorService
+        db = session.open()
+        article = db.query(ContentArticle).filter(ContentArticle.id == seed.article_ids[-1]).first()
+        content = VectorService.get_article_content(article.id) or ""
+
+        def publish():
+            parent, _, _ = ArticleResourceService.create_article_resources(
+                db, article, content, seed.user_id
+            )
+            if parent is None:
+                raise RuntimeError("create_article_resources returned no resources")
+
+        return publish
+
+    benchmarks.append(Benchmark(
+        name="article_resources.create_article_resources",
+        description="Publish: popup HTML, HTML and PDF children (re-publish each run)",
+        setup=setup_publish,
+        teardown=session.close,
+        iterations=5,
+        warmup=1,
+        tags=["pdf", "publish"],
+    ))
+
+    # -------------------------------------------------------------------------
+    # Agents
+    # -------------------------------------------------------------------------
+
+    def setup_classify_intent():
+        from agents.builds.v2.intent_classifier import classify_intent
+        messages = itertools.cycle(INTENT_MESSAGES)
+
+        def classify():
+            message, nav = next(messages)
+            return classify_intent(message, nav, INTENT_SCOPES, use_llm=False)
+
+        return classify
+
+    benchmarks.append(Benchmark(
+        name="agents.classify_intent_rules",
+        description="Rule-based intent classification (no LLM)",
+        setup=setup_classify_intent,
+        iterations=500,
+        tags=["agents"],
+    ))
+
+    def setup_invoke_chat():
+        from agents.builds.v2.graph import invoke_chat
+        from agents.builds.v2.state import UserContextModel
+
+        user_context = UserContextModel.from_scopes(
+            user_id=seed.user_id,
+            email="bench@example.com",
+            name="Bench",
+            scopes=[f"{seed.topic}:reader"],
+        ).model_dump()
+        nav = {"section": "reader_topic", "topic": seed.topic}
+
+        def chat():
+            response = invoke_chat("What is the outlook for inflation?", user_context, nav)
+            if response.agent_type == "error":
+                raise RuntimeError(response.response)
+            return response
+
+        return chat
+
+    benchmarks.append(Benchmark(
+        name="chat.invoke_chat",
+        description="End-to-end reader chat turn (router, reader node, fake LLM)",
+        setup=setup_invoke_chat,
+        iterations=20,
+        warmup=2,
+        tags=["agents", "e2e"],
+    ))
+
+    def make_article_draft_setup(structured: bool):
+        def setup():
+            try:
+                from agents.shared.analyst_agent import AnalystAgent
+            except ImportError as e:
+                raise BenchmarkSkipped(f"AnalystAgent unavailable: {e}")
+            from config import settings
+            from services.model_router import routed_chat_model
+
+            db = session.open()
+            previous = settings.analyst_structured_article
+            settings.analyst_structured_article = structured
+            session.restore = lambda: setattr(settings, "analyst_structured_article", previous)
+            agent = AnalystAgent(
+                topic=seed.topic,
+                llm=routed_chat_model("article_content.content", topic=seed.topic, temperature=0.7),
+                db=db,
+                headline_llm=routed_chat_model("analyst.headline", topic=seed.topic, temperature=0.7),
+                keywords_llm=routed_chat_model("analyst.keywords", topic=seed.topic, temperature=0.3),
+            )
+            return lambda: agent._synthesize_article(
+                query="What is the outlook for inflation?",
+                articles=[], resources=[], web_results=[], data_results=[],
+            )
+
+        return setup
+
+    for structured, description in [
+        (False, "New article content, headline and keywords as three LLM calls"),
+        (True, "New article content, headline and keywords as one structured-output call"),
+    ]:
+        benchmarks.append(Benchmark(
+            name=f"agents.article_draft_{'structured' if structured else 'separate'}",
+            description=description,
+            setup=make_article_draft_setup(structured),
+            teardown=session.close,
+            iterations=20,
+            warmup=2,
+            tags=["agents", "llm"],
+        ))
+
+    return {b.name: b for b in benchmarks}
@@ -0,0 +1,218 @@
+"""
+Timing, result storage and baseline comparison for the benchmark suite.
+
+Results are plain JSON so they can be committed as baselines and diffed
+in CI:
+
+    {
+        "meta": {"created_at": ..., "git_commit": ..., "mode": ..., ...},
+        "benchmarks": {
+            "content.get_recent_articles": {"iterations": 50, "median_ms": 1.2, ...},
+            "pdf.generate_article_pdf": {"status": "skipped", "reason": "..."}
+        }
+    }
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark setup when a dependency is unavailable."""
+
+
+@dataclass
+class Benchmark:
+    """
+    A single benchmark case.
+
+    setup() runs once and returns the callable to time (so fixtures, DB seeding
+    and imports are not measured). teardown() runs once afterwards.
+    """
+    name: str
+    description: str
+    setup: Callable[[], Callable[[], Any]]
+    teardown: Optional[Callable[[], None]] = None
+    iterations: int = 50
+    warmup: int = 3
+    tags: List[str] = field(default_factory=list)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """Summary statistics (milliseconds) for a list of samples."""
+    ordered = sorted(samples_ms)
+    return {
+        "iterations": len(ordered),
+        "min_ms": round(ordered[0], 4),
+        "max_ms": round(ordered[-1], 4),
+        "mean_ms": round(statistics.fmean(ordered), 4),
+        "median_ms": round(statistics.median(ordered), 4),
+        "p95_ms": round(_percentile(ordered, 95), 4),
+        "stdev_ms": round(statistics.stdev(ordered), 4) if len(ordered) > 1 else 0.0,
+    }
+
+
+def measure(fn: Callable[[], Any], iterations: int, warmup: int = 0) -> List[float]:
+    """
+    Time fn() repeatedly.
+
+    Args:
+        fn: Zero-argument callable to time
+        iterations: Number of timed calls
+        warmup: Untimed calls made first (JIT-free, but warms caches and pools)
+
+    Returns:
+        Per-call wall time in milliseconds
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def run_benchmark(benchmark: Benchmark, iterations: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run one benchmark case.
+
+    Returns:
+        Summary dict, or {"status": "skipped"/"error", "reason": ...}
+    """
+    try:
+        fn = benchmark.setup()
+    except BenchmarkSkipped as e:
+        return {"status": "skipped", "reason": str(e)}
+
+    try:
+        samples = measure(fn, iterations or benchmark.iterations, benchmark.warmup)
+        result = summarize(samples)
+        result["status"] = "ok"
+        return result
+    except Exception as e:
+        return {"status": "error", "reason": f"{type(e).__name__}: {e}"}
+    finally:
+        if benchmark.teardown:
+            benchmark.teardown()
+
+
+# =============================================================================
+# RESULT FILES
+# =============================================================================
+
+def _git_commit() -> Optional[str]:
+    """Short commit hash of the working tree, if available."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except Exception:
+        return None
+
+
+def build_results(benchmarks: Dict[str, Dict[str, Any]], mode: str) -> Dict[str, Any]:
+    """Wrap benchmark summaries with run metadata."""
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "mode": mode,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def save_results(results: Dict[str, Any], path: str) -> str:
+    """Write results JSON, creating the directory if needed."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    return path
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Read a results JSON file."""
+    with open(path) as f:
+        return json.load(f)
+
+
+# =============================================================================
+# BASELINE COMPARISON
+# =============================================================================
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.10,
+    metric: str = "median_ms",
+) -> List[Dict[str, Any]]:
+    """
+    Compare two result files benchmark by benchmark.
+
+    Args:
+        baseline: Results loaded from the baseline file
+        current: Results from the run being checked
+        threshold: Relative change treated as significant (0.10 = 10%)
+        metric: Summary field to compare
+
+    Returns:
+        One row per benchmark with baseline/current values, relative change and
+        a verdict: "regression", "improvement", "unchanged", "new", "missing"
+        or "not comparable" (skipped/errored on either side).
+    """
+    base_benchmarks = baseline.get("benchmarks", {})
+    current_benchmarks = current.get("benchmarks", {})
+    rows = []
+
+    for name in sorted(set(base_benchmarks) | set(current_benchmarks)):
+        base = base_benchmarks.get(name)
+        cur = current_benchmarks.get(name)
+        row = {"name": name, "baseline": None, "current": None, "change": None}
+
+        if base is None:
+            row["verdict"] = "new"
+        elif cur is None:
+            row["verdict"] = "missing"
+        elif base.get("status") != "ok" or cur.get("status") != "ok":
+            row["verdict"] = "not comparable"
+        else:
+            row["baseline"] = base[metric]
+            row["current"] = cur[metric]
+            change = (cur[metric] - base[metric]) / base[metric] if base[metric] else 0.0
+            row["change"] = round(change, 4)
+            if change > threshold:
+                row["verdict"] = "regression"
+            elif change < -threshold:
+                row["verdict"] = "improvement"
+            else:
+                row["verdict"] = "unchanged"
+
+        if cur is not None and row["current"] is None and cur.get("status") == "ok":
+            row["current"] = cur[metric]
+        rows.append(row)
+
+    return rows
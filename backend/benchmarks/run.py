@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner.
+
+Usage (from backend/):
+    python -m benchmarks.run run                          # offline stand-ins
+    python -m benchmarks.run run --mode compose           # docker-compose.test.yml services
+    python -m benchmarks.run run --only content --output benchmarks/results/baseline.json
+    python -m benchmarks.run compare benchmarks/results/baseline.json benchmarks/results/latest.json
+    python -m benchmarks.run list
+"""
+
+import logging
+import os
+import sys
+from typing import List, Optional
+
+# Add backend directory to path so app modules import as in the server
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.harness import (
+    build_results,
+    compare_results,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+
+RESULTS_DIR = os.path.join(backend_dir, "benchmarks", "results")
+
+app = typer.Typer(help="Benchmarks for hot backend paths")
+console = Console()
+
+
+def _select(names: List[str], only: Optional[List[str]]) -> List[str]:
+    """Filter benchmark names by substring (e.g. --only content --only pdf)."""
+    if not only:
+        return names
+    return [n for n in names if any(pattern in n for pattern in only)]
+
+
+@app.command("list")
+def list_cmd():
+    """List available benchmarks."""
+    from benchmarks.cases import build_benchmarks
+    from benchmarks.environment import SeedData
+
+    table = Table(title="Benchmarks")
+    table.add_column("Name", style="cyan")
+    table.add_column("Iterations", justify="right")
+    table.add_column("Description")
+    for name, bench in build_benchmarks(SeedData(user_id=0, topic="")).items():
+        table.add_row(name, str(bench.iterations), bench.description)
+    console.print(table)
+
+
+@app.command()
+def run(
+    mode: str = typer.Option("offline", "--mode", "-m", help="offline or compose"),
+    only: Optional[List[str]] = typer.Option(None, "--only", "-k", help="Run benchmarks whose name contains this"),
+    iterations: Optional[int] = typer.Option(None, "--iterations", "-n", help="Override iterations per benchmark"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Results JSON path"),
+    baseline: Optional[str] = typer.Option(None, "--baseline", "-b", help="Compare against this results file"),
+    threshold: float = typer.Option(0.10, "--threshold", help="Relative change flagged as regression"),
+    openai_latency_ms: float = typer.Option(0.0, "--openai-latency-ms", help="Simulated fake OpenAI latency"),
+):
+    """Run benchmarks and save results as JSON."""
+    from benchmarks.environment import BenchmarkEnvironment
+
+    env = BenchmarkEnvironment(mode=mode, openai_latency_ms=openai_latency_ms)
+    env.configure()
+    # App modules log at INFO on every call; keep the timing loop quiet
+    logging.getLogger("uvicorn").setLevel(logging.WARNING)
+
+    try:
+        seed = env.start()
+
+        from benchmarks.cases import build_benchmarks
+        benchmarks = build_benchmarks(seed)
+        selected = _select(list(benchmarks), only)
+
+        summaries = {}
+        for name in selected:
+            console.print(f"[dim]Running {name}...[/]")
+            summaries[name] = run_benchmark(benchmarks[name], iterations)
+
+        summaries_meta = build_results(summaries, mode)
+        summaries_meta["meta"]["openai_calls"] = env.openai.calls
+    finally:
+        env.stop()
+
+    _print_results(summaries_meta)
+
+    path = output or os.path.join(RESULTS_DIR, "latest.json")
+    save_results(summaries_meta, path)
+    console.print(f"\n[green]Results saved to {path}[/]")
+
+    if baseline:
+        _print_comparison(load_results(baseline), summaries_meta, threshold)
+
+
+@app.command()
+def compare(
+    baseline: str = typer.Argument(..., help="Baseline results JSON"),
+    current: str = typer.Argument(..., help="Current results JSON"),
+    threshold: float = typer.Option(0.10, "--threshold", help="Relative change flagged as regression"),
+    fail_on_regression: bool = typer.Option(False, "--fail-on-regression", help="Exit 1 if any benchmark regressed"),
+):
+    """Compare two results files."""
+    regressions = _print_comparison(load_results(baseline), load_results(current), threshold)
+    if fail_on_regression and regressions:
+        raise typer.Exit(code=1)
+
+
+def _print_results(results: dict):
+    table = Table(title=f"Results ({results['meta']['mode']}, {results['meta'].get('git_commit') or 'no git'})")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("n", justify="right")
+    table.add_column("median ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("min ms", justify="right")
+    table.add_column("Status")
+
+    for name, summary in results["benchmarks"].items():
+        if summary.get("status") != "ok":
+            reason = summary.get("reason", "")[:60]
+            table.add_row(name, "", "", "", "", f"[yellow]{summary['status']}[/] {reason}")
+            continue
+        table.add_row(
+            name,
+            str(summary["iterations"]),
+            f"{summary['median_ms']:.2f}",
+            f"{summary['p95_ms']:.2f}",
+            f"{summary['min_ms']:.2f}",
+            "[green]ok[/]",
+        )
+    console.print(table)
+
+
+def _print_comparison(baseline: dict, current: dict, threshold: float) -> int:
+    """Print a comparison table and return the number of regressions."""
+    rows = compare_results(baseline, current, threshold)
+    colors = {"regression": "red", "improvement": "green", "unchanged": "dim"}
+
+    table = Table(title=f"Median vs baseline (threshold {threshold:.0%})")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Baseline ms", justify="right")
+    table.add_column("Current ms", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Verdict")
+
+    for row in rows:
+        color = colors.get(row["verdict"], "yellow")
+        table.add_row(
+            row["name"],
+            f"{row['baseline']:.2f}" if row["baseline"] is not None else "-",
+            f"{row['current']:.2f}" if row["current"] is not None else "-",
+            f"{row['change']:+.1%}" if row["change"] is not None else "-",
+            f"[{color}]{row['verdict']}[/]",
+        )
+    console.print(table)
+    return sum(1 for row in rows if row["verdict"] == "regression")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,182 @@
+"""
+Local stand-ins for external services used by the benchmarks.
+
+- FakeOpenAIServer: an OpenAI-compatible HTTP server on localhost that answers
+  /v1/embeddings and /v1/chat/completions with deterministic payloads (JSON
+  matching the schema for structured-output requests). The real
+  OpenAI/ChatOpenAI clients talk to it via OPENAI_BASE_URL, so client-side
+  serialization and HTTP overhead are still measured.
+- attach_local_chroma: points VectorService at an in-memory Chroma client.
+"""
+
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional
+
+EMBEDDING_DIMENSIONS = 1536
+
+STUB_COMPLETION = (
+    "Based on the latest research, inflation is easing while growth remains "
+    "resilient. See the referenced articles for details."
+)
+
+
+def fake_embedding(text: str, dimensions: int = EMBEDDING_DIMENSIONS) -> List[float]:
+    """Deterministic unit-length pseudo-embedding derived from the text."""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+    rng = random.Random(seed)
+    vector = [rng.uniform(-1.0, 1.0) for _ in range(dimensions)]
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def stub_for_schema(schema: dict) -> Any:
+    """Deterministic value matching a JSON schema (structured-output responses)."""
+    kind = schema.get("type")
+    if kind == "object":
+        return {name: stub_for_schema(prop) for name, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [stub_for_schema(schema.get("items", {})) for _ in range(3)]
+    if kind in ("number", "integer"):
+        return 1
+    if kind == "boolean":
+        return True
+    if "enum" in schema:
+        return schema["enum"][0]
+    return STUB_COMPLETION
+
+
+class _OpenAIHandler(BaseHTTPRequestHandler):
+    """Request handler for the fake OpenAI API."""
+
+    server_version = "FakeOpenAI/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload: dict, status: int = 200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.server.latency_s:
+            time.sleep(self.server.latency_s)
+
+        if self.path.endswith("/embeddings"):
+            self.server.calls["embeddings"] += 1
+            inputs = request.get("input", "")
+            if isinstance(inputs, str):
+                inputs = [inputs]
+            data = [
+                {"object": "embedding", "index": i, "embedding": fake_embedding(str(text))}
+                for i, text in enumerate(inputs)
+            ]
+            self._send_json({
+                "object": "list",
+                "data": data,
+                "model": request.get("model", "text-embedding-3-small"),
+                "usage": {"prompt_tokens": 8 * len(inputs), "total_tokens": 8 * len(inputs)},
+            })
+        elif self.path.endswith("/chat/completions"):
+            self.server.calls["chat"] += 1
+            content = STUB_COMPLETION
+            response_format = request.get("response_format") or {}
+            if response_format.get("type") == "json_schema":
+                content = json.dumps(stub_for_schema(response_format["json_schema"]["schema"]))
+            self._send_json({
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "gpt-4o-mini"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 100, "completion_tokens": 30, "total_tokens": 130},
+            })
+        else:
+            self._send_json({"error": {"message": f"Unsupported path {self.path}"}}, status=404)
+
+
+class FakeOpenAIServer:
+    """
+    OpenAI-compatible server running in a background thread.
+
+    Usage:
+        server = FakeOpenAIServer(latency_ms=0).start()
+        os.environ["OPENAI_BASE_URL"] = server.base_url
+        ...
+        server.stop()
+    """
+
+    def __init__(self, latency_ms: float = 0.0):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _OpenAIHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.latency_s = latency_ms / 1000.0
+        self._httpd.calls = {"embeddings": 0, "chat": 0}
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def calls(self) -> dict:
+        """Number of embedding and chat requests served."""
+        return dict(self._httpd.calls)
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def attach_local_chroma():
+    """
+    Point VectorService at an in-memory Chroma client.
+
+    Uses the same lazy-init globals as services.vector_service, so every caller
+    (ContentService, ResourceService, agents) shares the local collection.
+    """
+    import chromadb
+    from chromadb.config import Settings as ChromaSettings
+
+    from config import settings
+    import services.vector_service as vector_service
+
+    client = chromadb.EphemeralClient(settings=ChromaSettings(anonymized_telemetry=False))
+    collection = client.get_or_create_collection(
+        name=settings.chroma_collection_name,
+        metadata={"hnsw:space": "cosine"},
+    )
+
+    vector_service._chroma_client = client
+    vector_service._collection = collection
+    vector_service._vectordb_initialized = True
+    return client, collection
+
+
+def disable_content_cache():
+    """Mark the Redis content cache unavailable (the service's own fallback path)."""
+    import services.content_cache as content_cache
+
+    content_cache._content_cache = None
+    content_cache._cache_initialized = True
@@ -584,3 +584,151 @@ def validate_article_topic(topic: str, article_id: int, db: Session):
         )
 
     return article
+
+
+# =============================================================================
+# Article List Projection
+# =============================================================================
+# List endpoints accept ?include_content=false (summaries: PostgreSQL columns
+# plus excerpt, no content store or ChromaDB reads) and ?fields=id,headline,...
+# (only the named fields; content is loaded only if it is one of them).
+#
+# Full and summary lists are cached in Redis as the final JSON body and sent
+# back without parsing (with an ETag, gzip-compressed if the client accepts it).
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional, Type
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from services.content_cache import CachedResponse, ContentCache
+
+ARTICLE_FIELDS = {
+    "id", "topic", "headline", "author", "editor", "content", "excerpt",
+    "readership_count", "rating", "rating_count", "keywords", "status",
+    "priority", "is_sticky", "created_at", "updated_at", "created_by_agent", "is_active",
+}
+
+
+class ArticleProjection:
+    """Requested fields of an article list response."""
+
+    def __init__(self, include_content: bool = True, fields: Optional[List[str]] = None):
+        self.fields = fields
+        self.include_content = include_content and (fields is None or "content" in fields)
+
+    def render(self, articles: List[Dict]):
+        """Articles as returned by the endpoint (a JSONResponse when fields are selected)."""
+        if self.fields is None:
+            return articles
+        return JSONResponse([{name: a[name] for name in self.fields if name in a} for a in articles])
+
+
+def article_projection(include_content: bool = True, fields: Optional[str] = None) -> ArticleProjection:
+    """
+    Parse the include_content / fields query parameters of article list endpoints.
+
+    Raises:
+        HTTPException 400: Unknown field name
+    """
+    if fields is None:
+        return ArticleProjection(include_content)
+
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in ARTICLE_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {unknown}. Must be among: {sorted(ARTICLE_FIELDS)}"
+        )
+    return ArticleProjection(include_content, names)
+
+
+def cached_json_response(request: Request, cached: CachedResponse) -> Response:
+    """Send a serialized body (304 if the client's ETag matches)."""
+    headers = {"ETag": cached.etag, "Cache-Control": "private, no-cache", "Vary": "Accept-Encoding"}
+    if cached.etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = cached.body
+    if cached.gzipped:
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+        else:
+            body = cached.decoded_body()
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def cached_article_list(
+    request: Request,
+    topic: str,
+    projection: ArticleProjection,
+    response_model: Type[BaseModel],
+    limit: int,
+    load: Callable[[], Awaitable[List[Dict]]],
+    cursor: Optional[str] = None,
+) -> Response:
+    """
+    Article list endpoint response through the Redis response cache.
+
+    The cache key is built from the validated inputs (route, clamped limit,
+    include_content, cursor) within the topic, so topic changes invalidate it
+    and unknown or reordered query parameters share one entry. On a miss the
+    articles are validated through response_model once and cached serialized;
+    on a hit the stored bytes are returned as they are. Field selections
+    (?fields=) are not cached. Redis is called from a worker thread.
+
+    Args:
+        request: Current request
+        topic: Topic slug (cache namespace)
+        projection: Requested fields
+        response_model: Pydantic model of one article in the response
+        limit: Number of articles, after clamping
+        load: Coroutine function returning the article dicts
+        cursor: Page cursor, if the endpoint takes one
+
+    Returns:
+        JSON response
+    """
+    if projection.fields is not None:
+        return projection.render(await load())
+
+    route = request.scope.get("route")
+    name = f"{getattr(route, 'path', request.url.path)}?limit={limit}&content={int(projection.include_content)}"
+    if cursor:
+        name += f"&cursor={cursor}"
+    cached = await asyncio.to_thread(ContentCache.get_response, topic, name)
+    if cached is None:
+        articles = await load()
+        cached = CachedResponse.encode(
+            [response_model(**article).model_dump(exclude_unset=True) for article in articles]
+        )
+        await asyncio.to_thread(ContentCache.set_response, topic, name, cached)
+    return cached_json_response(request, cached)
+
+
+# =============================================================================
+# Cursor Pagination
+# =============================================================================
+
+def paginated_articles(response: Response, load: Callable[[], Tuple[List[Dict], Optional[str]]]) -> List[Dict]:
+    """
+    Load a page of articles, setting the X-Next-Cursor header unless it is the last page.
+
+    Args:
+        response: Response to set the header on
+        load: Returns (articles, next cursor or None), e.g. ContentService.get_articles_by_status
+
+    Raises:
+        HTTPException 400: Malformed cursor
+    """
+    from services.pagination import InvalidCursorError
+
+    try:
+        articles, cursor = load()
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if cursor:
+        response.headers["X-Next-Cursor"] = cursor
+    return articles
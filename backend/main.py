@@ -11,9 +11,14 @@ from typing import Optional, List
 from sqlalchemy.orm import Session
 from datetime import datetime
 import os
+import threading
+import uuid
 
 from database import get_db
 from models import User, Group
+from metrics import CONTENT_TYPE, HTTP_REQUEST_SECONDS, REGISTRY, Timer, install_llm_metrics, is_enabled
+from tracing import configure_tracing, shutdown_tracing
+from services import vector_index
 from auth import create_access_token, create_refresh_token, verify_access_token, verify_refresh_token, revoke_access_token, revoke_refresh_token
 
 # Import shared state models for API (from v2 build)
@@ -114,6 +119,30 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware to record request latency per route template.
+
+    Uses the matched route path (e.g. /api/content/article/{article_id}) rather
+    than the raw URL so label cardinality stays bounded. Requests that match no
+    route are recorded as "unmatched".
+    """
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if not is_enabled() or request.url.path == "/metrics":
+            return await call_next(request)
+
+        timer = Timer(HTTP_REQUEST_SECONDS, method=request.method, status="500")
+        with timer:
+            try:
+                response = await call_next(request)
+                timer.labels["status"] = str(response.status_code)
+            finally:
+                route = request.scope.get("route")
+                timer.labels["route"] = getattr(route, "path", "unmatched")
+        return response
+
+
 app = FastAPI(title="Chatbot API")
 
 # Log configuration on startup
@@ -136,8 +165,25 @@ async def startup_event():
     configure_langsmith()
     log_langsmith_status()
 
+    # Record LLM latency and token usage for /metrics
+    install_llm_metrics()
+
+    # OpenTelemetry spans (TRACING_ENABLED)
+    configure_tracing()
+
+    # Local vector index (VECTOR_INDEX_ENABLED); ChromaDB serves queries until it is loaded
+    if vector_index.is_enabled():
+        threading.Thread(target=vector_index.initialize, name="vector-index", daemon=True).start()
+
     logger.info("=" * 60)
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush pending trace spans and snapshot the local vector index."""
+    shutdown_tracing()
+    vector_index.save_snapshots()
+
 # Security headers middleware (must be added before CORS to wrap responses)
 app.add_middleware(SecurityHeadersMiddleware)
 
@@ -148,8 +194,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type", "Accept", "X-Requested-With"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Request latency metrics (added last so it wraps CORS and security headers)
+app.add_middleware(MetricsMiddleware)
+
 security = HTTPBearer()
 
 
@@ -308,13 +358,31 @@ async def health():
 
 @app.get("/api/health/vectordb")
 async def vectordb_health():
-    """Check ChromaDB health and statistics."""
+    """Check ChromaDB health and statistics, with dependency circuit breaker states."""
+    from resilience import breaker_states
     from services.vector_service import VectorService
 
     stats = VectorService.get_collection_stats()
+    stats["circuit_breakers"] = breaker_states()
     return stats
 
 
+@app.get("/api/health/checkpoints")
+async def checkpoint_health():
+    """Check LangGraph checkpoint storage (count and bytes)."""
+    from agents.builds.v2.checkpoints import get_checkpoint_manager
+
+    return get_checkpoint_manager().get_stats()
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus metrics in the text exposition format."""
+    if not is_enabled():
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 @app.get("/debug/settings")
 async def debug_settings():
     """Debug endpoint to check if settings are loaded (without exposing secrets)"""
@@ -594,12 +662,16 @@ async def logout(
 @app.post("/api/chat", response_model=ChatResponse)
 async def chat(
     chat_message: ChatMessage,
+    request: Request,
     user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Chat endpoint with multi-agent financial analyst system.
     Routes to specialized agents based on query content.
+
+    An X-Request-ID header is used as the chat request ID (one is generated
+    otherwise); it identifies the run in traces, logs and LangSmith.
     """
     try:
         # Get user ID from JWT token
@@ -621,7 +693,12 @@ async def chat(
         agent_service = AgentService(user_id, db, user_context=user_context)
 
         # Process message with routing to content agents
-        result = agent_service.chat(chat_message.message, navigation_context=nav_context)
+        request_id = request.headers.get("X-Request-ID", "")[:64] or uuid.uuid4().hex
+        result = agent_service.chat(
+            chat_message.message,
+            navigation_context=nav_context,
+            request_id=request_id,
+        )
 
         # Format response with article references
         response_text = result["response"]
@@ -0,0 +1,517 @@
+"""
+Prometheus metrics for the backend.
+
+A small in-process registry that renders the Prometheus text exposition
+format, so no extra dependency is needed. Metrics are per worker process;
+scrape each worker (or run a single worker per container).
+
+Covered:
+    http_request_duration_seconds        per route template, method and status
+    langgraph_node_duration_seconds      per graph node (wrapped in _build_graph)
+    llm_request_duration_seconds         per model (LangChain callback hook)
+    llm_tokens_total                     prompt/completion tokens per model
+    dependency_operation_duration_seconds  ChromaDB, Redis, SQL, OpenAI embeddings
+    cache_requests_total                 hit/miss per cache (hit ratio in PromQL)
+    agent_step_duration_seconds          timed steps inside shared agents
+
+Usage:
+    from metrics import Timer, DEPENDENCY_SECONDS, observed
+
+    with Timer(DEPENDENCY_SECONDS, system="redis", operation="get"):
+        cache.get(key)
+
+    @observed("chromadb", "semantic_search")
+    def semantic_search(...): ...
+
+Set METRICS_ENABLED=false to turn everything into no-ops (no timers are
+recorded, no callback hook, no SQL listeners, and no graph wrappers unless
+tracing is enabled).
+"""
+
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+import tracing
+from config import settings
+
+logger = logging.getLogger("uvicorn")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_enabled = settings.metrics_enabled
+
+
+def is_enabled() -> bool:
+    """Check if metrics collection is enabled."""
+    return _enabled
+
+
+def set_enabled(enabled: bool):
+    """Enable or disable collection at runtime (used by tests)."""
+    global _enabled
+    _enabled = enabled
+
+
+# =============================================================================
+# METRIC TYPES
+# =============================================================================
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> List[Tuple[str, str]]:
+        return list(zip(self.labelnames, key))
+
+    def samples(self) -> Iterable[Tuple[str, List[Tuple[str, str]], float]]:
+        raise NotImplementedError
+
+    def reset(self):
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        if not _enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, self._labels(key), value
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets (seconds)."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [bucket counts..., +Inf count], sum
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels):
+        if not _enabled:
+            return
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[key] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def sum(self, **labels) -> float:
+        series = self._series.get(self._key(labels))
+        return series[1][0] if series else 0.0
+
+    def samples(self):
+        with self._lock:
+            items = [(key, (list(counts), total[0])) for key, (counts, total) in self._series.items()]
+        for key, (counts, total) in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", labels + [("le", _format_value(bound))], cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together on /metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+HTTP_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+))
+
+GRAPH_NODE_SECONDS = REGISTRY.register(Histogram(
+    "langgraph_node_duration_seconds",
+    "LangGraph node latency",
+    ["graph", "node", "status"],
+))
+
+LLM_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "llm_request_duration_seconds",
+    "LLM call latency by model",
+    ["model", "status"],
+))
+
+LLM_TOKENS = REGISTRY.register(Counter(
+    "llm_tokens_total",
+    "LLM tokens by model and kind (prompt, completion)",
+    ["model", "kind"],
+))
+
+LLM_GOVERNOR_WAIT_SECONDS = REGISTRY.register(Histogram(
+    "llm_governor_wait_seconds",
+    "Time LLM calls waited for rate-limit capacity by model and priority class",
+    ["model", "priority", "status"],
+))
+
+LLM_COALESCED_REQUESTS = REGISTRY.register(Counter(
+    "llm_coalesced_requests_total",
+    "LLM and embedding requests that waited for an identical in-flight request, by scope (process, redis)",
+    ["kind", "scope"],
+))
+
+LLM_ROUTE_SECONDS = REGISTRY.register(Histogram(
+    "llm_route_duration_seconds",
+    "LLM call latency by route (node.task) and model",
+    ["route", "model", "status"],
+))
+
+LLM_ROUTE_TOKENS = REGISTRY.register(Counter(
+    "llm_route_tokens_total",
+    "LLM tokens by route (node.task), model and kind (prompt, completion)",
+    ["route", "model", "kind"],
+))
+
+LLM_ROUTE_COST_USD = REGISTRY.register(Counter(
+    "llm_route_cost_usd_total",
+    "Estimated LLM cost in USD by route (node.task) and model (LLM_MODEL_PRICES)",
+    ["route", "model"],
+))
+
+DEPENDENCY_SECONDS = REGISTRY.register(Histogram(
+    "dependency_operation_duration_seconds",
+    "Latency of ChromaDB, Redis, SQL and embedding operations",
+    ["system", "operation", "status"],
+    buckets=FAST_BUCKETS,
+))
+
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit, miss)",
+    ["cache", "result"],
+))
+
+CIRCUIT_TRANSITIONS = REGISTRY.register(Counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker state changes by dependency and new state",
+    ["dependency", "state"],
+))
+
+AGENT_STEP_SECONDS = REGISTRY.register(Histogram(
+    "agent_step_duration_seconds",
+    "Timed steps inside shared agents",
+    ["agent", "step"],
+))
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+class Timer:
+    """
+    Context manager that times a block and records it on a histogram.
+
+    elapsed is always measured (callers use it for log lines); the observation
+    is skipped when metrics are disabled. A "status" label is filled in
+    automatically if the histogram has one.
+    """
+
+    __slots__ = ("histogram", "labels", "start", "elapsed")
+
+    def __init__(self, histogram: Histogram, **labels):
+        self.histogram = histogram
+        self.labels = labels
+        self.start = 0.0
+        self.elapsed = 0.0
+
+    def begin(self) -> "Timer":
+        """Start timing (for code paths that cannot use a with block)."""
+        self.start = time.perf_counter()
+        return self
+
+    def end(self, error: bool = False) -> float:
+        """Stop timing, record the observation and return elapsed seconds."""
+        self.elapsed = time.perf_counter() - self.start
+        if _enabled:
+            if "status" in self.histogram.labelnames and "status" not in self.labels:
+                self.labels["status"] = "error" if error else "ok"
+            self.histogram.observe(self.elapsed, **self.labels)
+        return self.elapsed
+
+    def __enter__(self) -> "Timer":
+        return self.begin()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end(error=exc_type is not None)
+        return False
+
+
+def observed(system: str, operation: str):
+    """
+    Decorator recording a function's latency as a dependency operation.
+
+    Also opens a "<system>.<operation>" trace span when tracing is active.
+    Coroutine functions are timed until the awaited result is ready.
+    """
+    span_name = f"{system}.{operation}"
+
+    def decorator(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled and not tracing.is_active():
+                    return await fn(*args, **kwargs)
+                with tracing.span(span_name), Timer(DEPENDENCY_SECONDS, system=system, operation=operation):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled and not tracing.is_active():
+                return fn(*args, **kwargs)
+            with tracing.span(span_name), Timer(DEPENDENCY_SECONDS, system=system, operation=operation):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    """Count a cache hit or miss."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def instrument_node(node: str, fn: Callable, graph: str = "main") -> Callable:
+    """
+    Wrap a LangGraph node function to record its latency.
+
+    Also opens a "<graph>.<node>" trace span when tracing is active. Returns
+    fn unchanged when both metrics and tracing are disabled.
+    """
+    if not _enabled and not tracing.is_enabled():
+        return fn
+
+    span_name = f"{graph}.{node}"
+    span_attributes = {"langgraph.graph": graph, "langgraph.node": node}
+
+    @wraps(fn)
+    def wrapper(state, *args, **kwargs):
+        with tracing.span(span_name, span_attributes), Timer(GRAPH_NODE_SECONDS, graph=graph, node=node):
+            return fn(state, *args, **kwargs)
+
+    return wrapper
+
+
+# =============================================================================
+# SQLALCHEMY
+# =============================================================================
+
+def instrument_engine(engine):
+    """Record SQL statement latency by verb (SELECT, INSERT, ...) on an engine."""
+    if not _enabled:
+        return
+
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("metrics_query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement else "UNKNOWN"
+        DEPENDENCY_SECONDS.observe(elapsed, system="sql", operation=verb, status="ok")
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        starts = context.connection.info.get("metrics_query_start") if context.connection else None
+        if starts:
+            elapsed = time.perf_counter() - starts.pop()
+            DEPENDENCY_SECONDS.observe(elapsed, system="sql", operation="ERROR", status="error")
+
+
+# =============================================================================
+# LLM CALLBACKS
+# =============================================================================
+
+_llm_callback_var: ContextVar[Optional[Any]] = ContextVar("llm_metrics_callback", default=None)
+
+
+def _model_name(serialized: Optional[Dict], kwargs: Dict) -> str:
+    params = kwargs.get("invocation_params") or {}
+    model = params.get("model") or params.get("model_name")
+    if not model and serialized:
+        model = (serialized.get("kwargs") or {}).get("model_name") or (serialized.get("kwargs") or {}).get("model")
+    return model or "unknown"
+
+
+def _build_llm_callback():
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class LLMMetricsCallbackHandler(BaseCallbackHandler):
+        """Records latency and token usage of every LangChain LLM call."""
+
+        def __init__(self):
+            self._runs: Dict[Any, Tuple[float, str]] = {}
+
+        def _start(self, serialized, run_id, kwargs):
+            self._runs[run_id] = (time.perf_counter(), _model_name(serialized, kwargs))
+
+        def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+            self._start(serialized, run_id, kwargs)
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+            self._start(serialized, run_id, kwargs)
+
+        def on_llm_end(self, response, *, run_id, **kwargs):
+            start, model = self._runs.pop(run_id, (None, "unknown"))
+            llm_output = response.llm_output or {}
+            model = llm_output.get("model_name") or model
+            if start is not None:
+                LLM_REQUEST_SECONDS.observe(time.perf_counter() - start, model=model, status="ok")
+
+            usage = llm_output.get("token_usage") or {}
+            if not usage:
+                # Fall back to per-message usage metadata
+                for generations in response.generations:
+                    for generation in generations:
+                        meta = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                        usage = {
+                            "prompt_tokens": usage.get("prompt_tokens", 0) + meta.get("input_tokens", 0),
+                            "completion_tokens": usage.get("completion_tokens", 0) + meta.get("output_tokens", 0),
+                        }
+            if usage.get("prompt_tokens"):
+                LLM_TOKENS.inc(usage["prompt_tokens"], model=model, kind="prompt")
+            if usage.get("completion_tokens"):
+                LLM_TOKENS.inc(usage["completion_tokens"], model=model, kind="completion")
+
+        def on_llm_error(self, error, *, run_id, **kwargs):
+            start, model = self._runs.pop(run_id, (None, "unknown"))
+            if start is not None:
+                LLM_REQUEST_SECONDS.observe(time.perf_counter() - start, model=model, status="error")
+
+    return LLMMetricsCallbackHandler()
+
+
+def install_llm_metrics():
+    """
+    Attach the LLM metrics callback to every LangChain run in this process.
+
+    Uses LangChain's configure hook with a context variable default, so calls
+    made anywhere (graph nodes, shared agents, services) are recorded.
+    """
+    global _llm_callback_var
+    if not _enabled or _llm_callback_var.get() is not None:
+        return
+
+    from langchain_core.tracers.context import register_configure_hook
+
+    _llm_callback_var = ContextVar("llm_metrics_callback", default=_build_llm_callback())
+    register_configure_hook(_llm_callback_var, inheritable=True)
+    logger.info("Metrics: LLM callback hook installed")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Table, ForeignKey, UniqueConstraint, Text, Enum, Float, Index, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Table, ForeignKey, UniqueConstraint, Text, Enum, Float, Index, JSON, LargeBinary
 from sqlalchemy.orm import DeclarativeBase, relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -348,7 +348,8 @@ class ContentArticle(Base):
     Reusable content articles created by content agents.
     Each article is topic-specific and available to all users.
 
-    NOTE: Article content (1000-2000 words) is stored in ChromaDB vector database.
+    NOTE: Article content (1000-2000 words) is stored compressed in article_contents
+    (see ArticleContent) and, for semantic search, in the ChromaDB vector database.
     This table only contains metadata for linking with users and tracking stats.
     """
     __tablename__ = 'content_articles'
@@ -378,7 +379,10 @@ class ContentArticle(Base):
         index=True
     )
 
-    # Article content is stored in ChromaDB (not in PostgreSQL)
+    # Article content is stored in article_contents (ArticleContent) and ChromaDB
+
+    # Plain-text start of the content for article lists (set when content is saved)
+    excerpt = Column(String(300), nullable=True)
 
     # Readership counter - incremented each time article is accessed
     readership_count = Column(Integer, default=0, nullable=False, index=True)
@@ -408,6 +412,9 @@ class ContentArticle(Base):
     # Active status (can be deactivated by admin)
     is_active = Column(Boolean, default=True, nullable=False, index=True)
 
+    # Full-text search: on PostgreSQL a trigger-maintained `search_vector` tsvector
+    # column (migration 027) backs services/text_search.py. It is not mapped here.
+
     # Publication resource hash_id - persists across republish cycles
     # Generated on first publish and reused on subsequent publishes
     # HTML and PDF children are derived from parent via parent_id relationship
@@ -427,6 +434,31 @@ class ContentArticle(Base):
         return f"<ContentArticle(id={self.id}, topic='{self.topic_slug}', headline='{self.headline[:50]}...')>"
 
 
+class ArticleContent(Base):
+    """
+    Article body, zstd-compressed (services/content_store.py).
+
+    Read path for article content; ChromaDB keeps its own copy for similarity search.
+    """
+    __tablename__ = 'article_contents'
+
+    article_id = Column(Integer, ForeignKey('content_articles.id', ondelete='CASCADE'), primary_key=True)
+
+    # SHA-256 of the UTF-8 content (detects unchanged text on update)
+    content_hash = Column(String(64), nullable=False)
+
+    # zstd frame of the UTF-8 content
+    content = Column(LargeBinary, nullable=False)
+
+    # Uncompressed size in bytes
+    size = Column(Integer, nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<ArticleContent(article_id={self.article_id}, size={self.size})>"
+
+
 class ContentRating(Base):
     """
     User ratings for content articles.
@@ -593,6 +625,8 @@ class Resource(Base):
     # Active status
     is_active = Column(Boolean, default=True, nullable=False, index=True)
 
+    # Full-text search: unmapped `search_vector` tsvector column on PostgreSQL (migration 027)
+
     # Relationships
     group = relationship('Group', backref='resources')
     creator = relationship('User', foreign_keys=[created_by], backref='created_resources')
@@ -13,7 +13,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from database import SessionLocal
 from models import ContentArticle, User
 from services.article_resource_service import ArticleResourceService
-from services.vector_service import VectorService
+from services.content_store import ContentStore
+from services.llm_client import BULK, llm_priority
 
 
 def main():
@@ -48,14 +49,15 @@ def main():
                 print(f"  SKIPPED: Resources already exist")
                 continue
 
-            # Get article content from ChromaDB
-            content = VectorService.get_article_content(article_id)
+            # Get article content (content store, ChromaDB for articles not stored yet)
+            content = ContentStore.get_content(article_id, db)
             if not content:
                 print(f"  ERROR: Could not retrieve content from vector database")
                 continue
 
             try:
-                ArticleResourceService.create_article_resources(db, article_model, content, admin_user.id)
+                with llm_priority(BULK):
+                    ArticleResourceService.create_article_resources(db, article_model, content, admin_user.id)
                 resources = ArticleResourceService.get_article_publication_resources(db, article_id)
                 print(f"  SUCCESS: HTML={resources.get('html')}, PDF={resources.get('pdf')}")
             except Exception as e:
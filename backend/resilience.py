@@ -0,0 +1,238 @@
+"""
+Circuit breakers for external dependencies (ChromaDB, Redis, OpenAI).
+
+Each dependency has one breaker:
+    closed     calls go through; `failure_threshold` consecutive failures open it
+    open       calls fail fast (callers take their fallback path) until the
+               recovery delay has passed
+    half_open  one probe call is let through; success closes the breaker,
+               failure re-opens it with the delay doubled (up to a maximum)
+
+Clients wrapped with guard() check the breaker before every call and record
+the outcome (async clients are awaited inside the breaker), so a dependency that goes away is skipped after a few errors
+instead of each request waiting for its timeout, and one that comes back is
+picked up again without a restart.
+
+Usage:
+    from resilience import CHROMADB, guard
+
+    collection = guard(collection, CHROMADB)   # raises CircuitOpenError while open
+
+    if not OPENAI.allow():
+        return None
+    try:
+        ...
+        OPENAI.record_success()
+    except Exception:
+        OPENAI.record_failure()
+"""
+
+import inspect
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+import logging
+
+import httpx
+import openai
+import redis
+
+from config import settings
+from metrics import CIRCUIT_TRANSITIONS
+
+logger = logging.getLogger("uvicorn")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose breaker is open."""
+
+    def __init__(self, name: str):
+        super().__init__(f"{name} circuit is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with exponential half-open probes."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        recovery_seconds: float = 1.0,
+        max_recovery_seconds: float = 60.0,
+        failure_types: Tuple[Type[BaseException], ...] = (Exception,),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_types = failure_types
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.max_recovery_seconds = max_recovery_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._delay = recovery_seconds
+        self._retry_at = 0.0
+        self._probe_in_flight = False
+        self._last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def _transition(self, state: str):
+        if state != self._state:
+            logger.info(f"Circuit {self.name}: {self._state} -> {state}")
+            CIRCUIT_TRANSITIONS.inc(dependency=self.name, state=state)
+        self._state = state
+
+    def available(self) -> bool:
+        """Check if a call would be allowed (without claiming the half-open probe)."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                return self._clock() >= self._retry_at
+            return not self._probe_in_flight
+
+    def allow(self) -> bool:
+        """Claim permission for one call; False means fail fast."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if self._clock() < self._retry_at:
+                    return False
+                self._transition(HALF_OPEN)
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._delay = self.recovery_seconds
+            self._probe_in_flight = False
+            self._transition(CLOSED)
+
+    def record_failure(self, error: Optional[BaseException] = None):
+        with self._lock:
+            self._last_error = str(error) if error else None
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN:
+                self._delay = min(self._delay * 2, self.max_recovery_seconds)
+            else:
+                self._failures += 1
+                if self._state == CLOSED and self._failures < self.failure_threshold:
+                    return
+            self._retry_at = self._clock() + self._delay
+            self._transition(OPEN)
+            logger.warning(f"Circuit {self.name}: open for {self._delay:.1f}s ({self._last_error})")
+
+    def call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Call fn through the breaker (raises CircuitOpenError while open)."""
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            # Errors the dependency answered with (bad request, not found) are not outages
+            if isinstance(e, self.failure_types):
+                self.record_failure(e)
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+        return result
+
+    async def acall(self, fn: Callable[..., Awaitable], *args, **kwargs) -> Any:
+        """Await fn through the breaker (raises CircuitOpenError while open)."""
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            if isinstance(e, self.failure_types):
+                self.record_failure(e)
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Breaker state for health endpoints."""
+        with self._lock:
+            retry_in = max(0.0, self._retry_at - self._clock()) if self._state == OPEN else 0.0
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "retry_in_seconds": round(retry_in, 2),
+                "last_error": self._last_error,
+            }
+
+    def reset(self):
+        """Close the breaker and forget failures (used by tests)."""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._delay = self.recovery_seconds
+            self._retry_at = 0.0
+            self._probe_in_flight = False
+            self._last_error = None
+
+
+class _Guarded:
+    """Proxy running every method call of a client through a breaker."""
+
+    def __init__(self, target: Any, breaker: CircuitBreaker):
+        self._target = target
+        self._breaker = breaker
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        if inspect.iscoroutinefunction(attr):
+            async def acall(*args, **kwargs):
+                return await self._breaker.acall(attr, *args, **kwargs)
+            return acall
+
+        def call(*args, **kwargs):
+            return self._breaker.call(attr, *args, **kwargs)
+        return call
+
+
+def guard(target: Any, breaker: CircuitBreaker) -> Any:
+    """Wrap a client so each method call goes through the breaker."""
+    return _Guarded(target, breaker)
+
+
+def _make_breaker(name: str, failure_types: Tuple[Type[BaseException], ...]) -> CircuitBreaker:
+    return CircuitBreaker(
+        name,
+        failure_threshold=settings.circuit_failure_threshold,
+        recovery_seconds=settings.circuit_recovery_seconds,
+        max_recovery_seconds=settings.circuit_max_recovery_seconds,
+        failure_types=failure_types,
+    )
+
+
+# Connection errors and timeouts count as failures
+CHROMADB = _make_breaker("chromadb", (httpx.TransportError, ConnectionError, TimeoutError))
+REDIS = _make_breaker("redis", (redis.ConnectionError, redis.TimeoutError))
+OPENAI = _make_breaker("openai", (openai.APIConnectionError, openai.InternalServerError))
+
+BREAKERS = {breaker.name: breaker for breaker in (CHROMADB, REDIS, OPENAI)}
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every breaker, keyed by dependency name."""
+    return {name: breaker.snapshot() for name, breaker in BREAKERS.items()}
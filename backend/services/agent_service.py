@@ -6,7 +6,7 @@ and other agent workflows.
 """
 
 from typing import Dict, Optional, List, Any
-from langchain_openai import ChatOpenAI
+from services.model_router import routed_chat_model
 from sqlalchemy.orm import Session
 from dependencies import get_valid_topics
 import os
@@ -38,16 +38,14 @@ class AgentService:
         self.user_context = user_context
 
         # Initialize OpenAI LLM (for content generation workflows)
-        openai_api_key = os.getenv("OPENAI_API_KEY", "")
-        openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.llm = routed_chat_model("agent_service.content", temperature=0.7)
 
-        self.llm = ChatOpenAI(
-            api_key=openai_api_key,
-            model=openai_model,
-            temperature=0.7
-        )
-
-    def chat(self, message: str, navigation_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def chat(
+        self,
+        message: str,
+        navigation_context: Optional[Dict[str, Any]] = None,
+        request_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Process a chat message through the LangGraph multi-agent system.
 
@@ -57,6 +55,7 @@ class AgentService:
         Args:
             message: User's message
             navigation_context: Optional navigation context from frontend
+            request_id: Chat request ID, used as trace/thread identifier (optional)
 
         Returns:
             Dictionary containing:
@@ -77,15 +76,13 @@ class AgentService:
                 "routing_reason": "No user context"
             }
 
-        logger.info("")
-        logger.info("╔" + "═" * 78 + "╗")
-        logger.info("║" + " AGENT SERVICE: Processing Chat Request".ljust(78) + "║")
-        logger.info("║" + f" User: {self.user_context.get('name', 'Unknown')}".ljust(78) + "║")
-        if navigation_context:
-            section = navigation_context.get('section', 'home')
-            topic = navigation_context.get('topic', '-')
-            logger.info("║" + f" Navigation: section={section}, topic={topic}".ljust(78) + "║")
-        logger.info("╚" + "═" * 78 + "╝")
+        nav = navigation_context or {}
+        logger.info(
+            "AgentService.chat: user=%s section=%s topic=%s",
+            self.user_context.get("name", "Unknown"),
+            nav.get("section", "home"),
+            nav.get("topic", "-"),
+        )
 
         # Convert dict to NavigationContext TypedDict if needed
         nav_ctx: Optional[NavigationContext] = None
@@ -111,22 +108,19 @@ class AgentService:
             message=message,
             user_context=self.user_context,
             navigation_context=nav_ctx,
+            request_id=request_id,
         )
 
         # Convert Pydantic model to dict for API response
         result = response.model_dump()
 
-        logger.info("")
-        logger.info("╔" + "═" * 78 + "╗")
-        logger.info("║" + " REQUEST COMPLETE".ljust(78) + "║")
-        logger.info("║" + f" Agent Type: {result.get('agent_type', 'N/A')}".ljust(78) + "║")
-        logger.info("║" + f" Response Length: {len(result.get('response', ''))} chars".ljust(78) + "║")
-        if result.get('ui_action'):
-            logger.info("║" + f" UI Action: {result.get('ui_action', {}).get('type', 'N/A')}".ljust(78) + "║")
-        if result.get('confirmation'):
-            logger.info("║" + f" HITL Confirmation: {result.get('confirmation', {}).get('type', 'N/A')}".ljust(78) + "║")
-        logger.info("╚" + "═" * 78 + "╝")
-        logger.info("")
+        logger.info(
+            "AgentService.chat complete: agent=%s response_chars=%d ui_action=%s confirmation=%s",
+            result.get("agent_type", "N/A"),
+            len(result.get("response") or ""),
+            (result.get("ui_action") or {}).get("type", "-"),
+            (result.get("confirmation") or {}).get("type", "-"),
+        )
 
         return result
 
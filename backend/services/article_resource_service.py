@@ -12,30 +12,18 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_
 import logging
 
-import re
 
 from models import (
     Resource, ResourceType, ResourceStatus, FileResource, TextResource,
     ContentArticle, article_resources
 )
 from services.pdf_service import PDFService
+from services.resource_link_resolver import ResourceLinkResolver, ResolvedResourceLinks
 from services.storage_service import get_storage
 
 logger = logging.getLogger("uvicorn")
 
 
-def _get_resource_by_hash_id_simple(db: Session, hash_id: str) -> Optional[Dict[str, Any]]:
-    """Get basic resource info by hash_id for resource link processing."""
-    resource = db.query(Resource).filter(Resource.hash_id == hash_id).first()
-    if resource:
-        return {
-            'hash_id': resource.hash_id,
-            'name': resource.name,
-            'resource_type': resource.resource_type.value if resource.resource_type else 'unknown'
-        }
-    return None
-
-
 class ArticleResourceService:
     """
     Service for creating, deleting, and managing article publication resources.
@@ -50,7 +38,8 @@ class ArticleResourceService:
         name: str,
         resource_type: str,
         base_url: str,
-        db: Session = None
+        db: Session = None,
+        resource: Optional[Resource] = None
     ) -> str:
         """
         Generate HTML embed for a resource based on its type.
@@ -61,6 +50,7 @@ class ArticleResourceService:
             resource_type: Type of resource (image, pdf, text, table, etc.)
             base_url: Base URL for resource content
             db: Database session (needed for table embeds to find HTML child)
+            resource: Preloaded resource (skips the table lookup when given)
 
         Returns:
             HTML string for embedding the resource
@@ -78,12 +68,13 @@ class ArticleResourceService:
 
         elif resource_type == 'table':
             # For tables, embed as simple HTML table (no interactivity)
-            if db:
+            table_resource = resource
+            if table_resource is None and db:
                 table_resource = db.query(Resource).filter(Resource.hash_id == hash_id).first()
-                if table_resource and table_resource.table_resource:
-                    columns = table_resource.table_resource.columns or []
-                    data = table_resource.table_resource.data or []
-                    return ArticleResourceService._generate_simple_table_html(safe_name, columns, data)
+            if table_resource and table_resource.table_resource:
+                columns = table_resource.table_resource.columns or []
+                data = table_resource.table_resource.data or []
+                return ArticleResourceService._generate_simple_table_html(safe_name, columns, data)
 
             # Fallback: link to table resource
             return f'''<div style="border:1px solid #e5e7eb;border-radius:8px;padding:1rem;margin:1rem 0;background:#f9fafb;">
@@ -157,7 +148,12 @@ class ArticleResourceService:
         </div>'''
 
     @staticmethod
-    def _process_resource_links(content: str, db: Session, base_url: str = "") -> str:
+    def _process_resource_links(
+        content: str,
+        db: Session,
+        base_url: str = "",
+        links: Optional[ResolvedResourceLinks] = None
+    ) -> str:
         """
         Process [name](resource:hash_id) links in markdown content.
 
@@ -167,31 +163,28 @@ class ArticleResourceService:
             content: Markdown content with resource links
             db: Database session for looking up resources
             base_url: Base URL for resource content (e.g., https://api.example.com)
+            links: Preloaded resources (resolved from content when not given)
 
         Returns:
             Content with resource links replaced by HTML embeds
         """
-        # Pattern: [name](resource:hash_id)
-        pattern = r'\[([^\]]+)\]\(resource:([a-zA-Z0-9]+)\)'
+        if links is None:
+            links = ResourceLinkResolver.resolve(db, content)
 
-        def replace_resource(match):
-            name = match.group(1)
-            hash_id = match.group(2)
+        def replace_resource(name: str, hash_id: str) -> str:
+            resource = links.get(hash_id)
 
-            # Look up resource to get type
-            resource_data = _get_resource_by_hash_id_simple(db, hash_id)
-
-            if not resource_data:
+            if not resource:
                 # Resource not found - leave as simple text link
                 safe_name = html.escape(name)
                 return f'<a href="{base_url}/api/r/{hash_id}" target="_blank">{safe_name}</a>'
 
-            resource_type = resource_data.get('resource_type', 'unknown')
+            resource_type = links.resource_type(hash_id) or 'unknown'
             return ArticleResourceService._get_resource_embed_html(
-                hash_id, name, resource_type, base_url, db
+                hash_id, name, resource_type, base_url, db, resource=resource
             )
 
-        return re.sub(pattern, replace_resource, content)
+        return ResourceLinkResolver.substitute(content, replace_resource)
 
     @staticmethod
     def _generate_article_html(
@@ -201,7 +194,8 @@ class ArticleResourceService:
         created_at: str,
         keywords: Optional[str] = None,
         db: Session = None,
-        base_url: str = ""
+        base_url: str = "",
+        links: Optional[ResolvedResourceLinks] = None
     ) -> str:
         """
         Convert markdown article to embeddable HTML.
@@ -214,13 +208,14 @@ class ArticleResourceService:
             keywords: Optional comma-separated keywords
             db: Database session for resolving resource links
             base_url: Base URL for resource content
+            links: Preloaded resource links (shared across renderers)
 
         Returns:
             Embeddable HTML document
         """
         # Process resource links before markdown conversion
-        if db:
-            content = ArticleResourceService._process_resource_links(content, db, base_url)
+        if db or links is not None:
+            content = ArticleResourceService._process_resource_links(content, db, base_url, links)
 
         # Convert markdown to HTML using markdown2
         html_content = markdown2.markdown(
@@ -390,7 +385,8 @@ class ArticleResourceService:
         pdf_hash_id: Optional[str] = None,
         html_hash_id: Optional[str] = None,
         db: Session = None,
-        base_url: str = ""
+        base_url: str = "",
+        links: Optional[ResolvedResourceLinks] = None
     ) -> str:
         """
         Generate a complete popup HTML that matches the frontend article popup.
@@ -414,14 +410,17 @@ class ArticleResourceService:
             html_hash_id: Hash ID of HTML resource for view link
             db: Database session for resolving resource links
             base_url: Base URL for resource content
+            links: Preloaded resource links (shared across renderers)
 
         Returns:
             Complete popup HTML document
         """
         # Process resource links before markdown conversion
         processed_content = content
-        if db:
-            processed_content = ArticleResourceService._process_resource_links(content, db, base_url)
+        if db or links is not None:
+            processed_content = ArticleResourceService._process_resource_links(
+                content, db, base_url, links
+            )
 
         # Convert markdown to HTML
         html_content = markdown2.markdown(
@@ -930,6 +929,9 @@ class ArticleResourceService:
                 db.add(parent_resource)
                 db.flush()  # Get parent ID and hash_id
 
+            # Resolve resource links once for HTML, PDF and popup rendering
+            links = ResourceLinkResolver.resolve(db, content)
+
             # 2. Create HTML child resource (for "View as HTML" button)
             html_content = ArticleResourceService._generate_article_html(
                 headline=article.headline,
@@ -938,7 +940,8 @@ class ArticleResourceService:
                 created_at=created_at_str,
                 keywords=article.keywords,
                 db=db,
-                base_url=base_url
+                base_url=base_url,
+                links=links
             )
 
             # Save HTML to file storage
@@ -1028,7 +1031,8 @@ class ArticleResourceService:
                 rating=article.rating,
                 rating_count=article.rating_count or 0,
                 base_url=base_url,
-                db=db
+                db=db,
+                links=links
             )
 
             pdf_bytes = pdf_buffer.getvalue()
@@ -1127,7 +1131,8 @@ class ArticleResourceService:
                 pdf_hash_id=pdf_resource.hash_id,
                 html_hash_id=html_resource.hash_id,
                 db=db,
-                base_url=base_url
+                base_url=base_url,
+                links=links
             )
 
             # 5. Save popup HTML to storage
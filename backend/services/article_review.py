@@ -0,0 +1,243 @@
+"""
+Sectioned editorial review for long articles.
+
+Articles longer than EDITOR_REVIEW_SECTIONED_MIN_CHARS are split at their
+markdown headings (sections over EDITOR_REVIEW_SECTION_MAX_CHARS at paragraph
+breaks). Each section is reviewed in its own LLM call, up to
+EDITOR_REVIEW_CONCURRENCY at a time; the calls go through the LLM governor
+like any other chat call. One final call merges the section findings into
+the consolidated review (quality score, strengths, improvements, factual
+concerns, recommendation), followed by the findings per section.
+
+Section reviews are cached in Redis (content cache) by a hash of the model,
+headline, section title and text, so after a small edit only the changed
+sections are reviewed again. The editor's conversation context only goes
+into the merge call, which keeps section reviews reusable.
+
+Usage:
+    review = ArticleReviewer(llm).review(headline, content, context_section)
+    review.text      # consolidated review followed by per-section findings
+    review.sections  # [SectionReview(title, findings, cached), ...]
+"""
+
+import contextvars
+import hashlib
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from config import settings
+from services.content_cache import ContentCache
+
+logger = logging.getLogger("uvicorn")
+
+# Bump when the section prompt changes, so cached section reviews are not reused
+REVIEW_PROMPT_VERSION = 1
+
+# Sections shorter than this are reviewed together with the section before them
+SECTION_MIN_CHARS = 200
+
+EDITOR_SYSTEM_PROMPT = "You are a senior editor reviewing financial research articles."
+
+_HEADING = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+_executor = ThreadPoolExecutor(max_workers=settings.editor_review_concurrency, thread_name_prefix="article-review")
+
+
+@dataclass
+class Section:
+    """A part of an article reviewed on its own."""
+    title: str
+    text: str
+
+
+@dataclass
+class SectionReview:
+    """Findings for one section."""
+    title: str
+    findings: str
+    cached: bool = False
+
+
+@dataclass
+class ArticleReview:
+    """Consolidated review of a sectioned article."""
+    text: str
+    sections: List[SectionReview] = field(default_factory=list)
+
+
+def _split_long(section: Section, max_chars: int) -> List[Section]:
+    """Split a section at paragraph breaks into parts of at most max_chars (where possible)."""
+    if len(section.text) <= max_chars:
+        return [section]
+    parts, current = [], ""
+    for paragraph in section.text.split("\n\n"):
+        if current and len(current) + len(paragraph) + 2 > max_chars:
+            parts.append(current)
+            current = paragraph
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        parts.append(current)
+    if len(parts) == 1:
+        return [section]
+    return [Section(f"{section.title} (part {i})", part) for i, part in enumerate(parts, start=1)]
+
+
+def split_sections(content: str, max_chars: Optional[int] = None) -> List[Section]:
+    """
+    Split markdown at its headings.
+
+    Text before the first heading becomes "Introduction". Headings inside
+    code fences are ignored, short sections are merged into the section
+    before them and long ones are split at paragraph breaks.
+
+    Args:
+        content: Article markdown
+        max_chars: Longest section (default: editor_review_section_max_chars)
+
+    Returns:
+        Sections in article order
+    """
+    max_chars = max_chars or settings.editor_review_section_max_chars
+    sections: List[Section] = []
+    title, lines, in_fence = "Introduction", [], False
+
+    for line in content.splitlines():
+        if _FENCE.match(line):
+            in_fence = not in_fence
+        heading = None if in_fence else _HEADING.match(line)
+        if heading:
+            if "\n".join(lines).strip():
+                sections.append(Section(title, "\n".join(lines).strip()))
+            title, lines = heading.group(1), [line]
+        else:
+            lines.append(line)
+    if "\n".join(lines).strip():
+        sections.append(Section(title, "\n".join(lines).strip()))
+
+    merged: List[Section] = []
+    for section in sections:
+        if merged and len(section.text) < SECTION_MIN_CHARS:
+            merged[-1] = Section(merged[-1].title, f"{merged[-1].text}\n\n{section.text}")
+        else:
+            merged.append(section)
+
+    return [part for section in merged for part in _split_long(section, max_chars)]
+
+
+class ArticleReviewer:
+    """Map-reduce review: one call per section, one call to merge the findings."""
+
+    def __init__(self, llm: BaseChatModel):
+        """
+        Args:
+            llm: Chat model for section reviews and the merged review
+        """
+        self.llm = llm
+
+    def _section_hash(self, headline: str, section: Section) -> str:
+        model = getattr(self.llm, "model_name", None) or type(self.llm).__name__
+        raw = "\x00".join([str(REVIEW_PROMPT_VERSION), model, headline, section.title, section.text])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _review_section(self, headline: str, section: Section, position: str) -> SectionReview:
+        key = self._section_hash(headline, section)
+        cached = ContentCache.get_section_review(key)
+        if cached is not None:
+            return SectionReview(section.title, cached, cached=True)
+
+        prompt = f"""Review one section ({position}) of a financial research article for quality and accuracy.
+
+Article headline: {headline}
+Section: {section.title}
+
+{section.text}
+
+List concisely:
+- Strengths of this section
+- Issues (clarity, structure, unsupported claims, missing data)
+- Factual concerns (if any)
+
+Only comment on this section."""
+
+        response = self.llm.invoke([
+            SystemMessage(content=EDITOR_SYSTEM_PROMPT),
+            HumanMessage(content=prompt),
+        ])
+        findings = response.content.strip()
+        ContentCache.set_section_review(key, findings, settings.editor_review_cache_ttl_seconds)
+        return SectionReview(section.title, findings)
+
+    def _merge(self, headline: str, reviews: List[SectionReview], context_section: str) -> str:
+        findings = "\n\n".join(f"### {review.title}\n{review.findings}" for review in reviews)
+        prompt = f"""{context_section}Combine these section-by-section findings into one review of the whole financial research article.
+
+Headline: {headline}
+
+{findings}
+
+Provide a structured review with:
+1. Quality score (1-10)
+2. Key strengths (2-3 points)
+3. Areas for improvement (2-3 points)
+4. Factual concerns (if any)
+5. Recommendation (approve, request changes, or reject)
+
+Be concise and professional."""
+
+        response = self.llm.invoke([
+            SystemMessage(content=EDITOR_SYSTEM_PROMPT),
+            HumanMessage(content=prompt),
+        ])
+        return response.content.strip()
+
+    def review(self, headline: str, content: str, context_section: str = "") -> ArticleReview:
+        """
+        Review an article section by section and merge the findings.
+
+        A section whose review fails is reported as such; the review fails
+        only if every section does.
+
+        Args:
+            headline: Article headline
+            content: Article markdown
+            context_section: Editor's conversation context (merge call only)
+
+        Returns:
+            ArticleReview with the consolidated text and per-section findings
+        """
+        sections = split_sections(content)
+        futures = [
+            _executor.submit(
+                contextvars.copy_context().run,
+                self._review_section, headline, section, f"{i} of {len(sections)}",
+            )
+            for i, section in enumerate(sections, start=1)
+        ]
+
+        reviews: List[SectionReview] = []
+        failures = 0
+        for section, future in zip(sections, futures):
+            try:
+                reviews.append(future.result())
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Section review failed for '{section.title}': {e}")
+                reviews.append(SectionReview(section.title, f"Review unavailable: {e}"))
+        if failures and failures == len(sections):
+            raise RuntimeError("All section reviews failed")
+
+        logger.info(
+            f"Sectioned review: {len(sections)} sections, "
+            f"{sum(review.cached for review in reviews)} cached, {failures} failed"
+        )
+        summary = self._merge(headline, reviews, context_section)
+        per_section = "\n\n".join(f"### {review.title}\n{review.findings}" for review in reviews)
+        return ArticleReview(text=f"{summary}\n\n## Section Findings\n\n{per_section}", sections=reviews)
@@ -1,13 +1,22 @@
 """Redis caching service for content articles."""
 
 import redis
+import gzip
+import hashlib
 import json
 import os
-from typing import Optional, List, Dict
+from dataclasses import dataclass
+from typing import Any, Optional, List, Dict
+
+import orjson
 from pydantic_settings import BaseSettings
 from urllib.parse import urlparse
 import logging
 
+from config import settings
+from metrics import DEPENDENCY_SECONDS, Timer, record_cache_lookup
+from resilience import REDIS, guard
+
 logger = logging.getLogger("uvicorn")
 
 
@@ -56,20 +65,24 @@ cache_settings = CacheSettings()
 # Redis client - initialized lazily on first use
 _content_cache = None
 _cache_initialized = False
-_cache_failed = False
+
+# Second client on the same server returning bytes (cached response bodies)
+_raw_cache = None
 
 
 def _get_cache():
     """
     Lazy initialization of Redis client.
-    Returns None if Redis is unavailable.
+    Returns None if Redis is unavailable or its circuit is open.
     """
-    global _content_cache, _cache_initialized, _cache_failed
+    global _content_cache, _cache_initialized
 
     if _cache_initialized:
+        if not REDIS.available():
+            return None
         return _content_cache
 
-    if _cache_failed:
+    if not REDIS.allow():
         return None
 
     try:
@@ -78,27 +91,76 @@ def _get_cache():
         logger.info(f"  Port: {cache_settings.redis_port}")
         logger.info(f"  DB: {cache_settings.redis_db}")
 
-        _content_cache = redis.Redis(
+        client = redis.Redis(
             host=cache_settings.redis_host,
             port=cache_settings.redis_port,
             db=cache_settings.redis_db,
             password=cache_settings.redis_password,
             decode_responses=True,
-            socket_connect_timeout=5
+            socket_connect_timeout=settings.redis_timeout_seconds,
+            socket_timeout=settings.redis_timeout_seconds
         )
         # Test connection
-        _content_cache.ping()
+        client.ping()
+        _content_cache = guard(client, REDIS)
         _cache_initialized = True
+        REDIS.record_success()
         logger.info(f"✓ Content Cache: Redis connected successfully")
         return _content_cache
     except Exception as e:
+        REDIS.record_failure(e)
         logger.error(f"✗ Content Cache: Redis connection failed: {e}")
-        logger.warning(f"  Content caching will be disabled")
-        _cache_failed = True
-        _cache_initialized = True
+        logger.warning(f"  Content caching unavailable until the next reconnect attempt")
         return None
 
 
+def _get_raw_cache():
+    """Bytes-valued Redis client (None whenever the content cache is unavailable)."""
+    global _raw_cache
+
+    if _get_cache() is None:
+        return None
+    if _raw_cache is None:
+        _raw_cache = guard(redis.Redis(
+            host=cache_settings.redis_host,
+            port=cache_settings.redis_port,
+            db=cache_settings.redis_db,
+            password=cache_settings.redis_password,
+            socket_connect_timeout=settings.redis_timeout_seconds,
+            socket_timeout=settings.redis_timeout_seconds
+        ), REDIS)
+    return _raw_cache
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized JSON response body, as stored in Redis."""
+    body: bytes
+    etag: str
+    gzipped: bool = False
+
+    @staticmethod
+    def encode(payload: Any) -> "CachedResponse":
+        """Serialize with orjson; bodies above the size threshold are gzip-compressed."""
+        body = orjson.dumps(payload)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        if len(body) >= settings.response_cache_compress_min_bytes:
+            return CachedResponse(gzip.compress(body, compresslevel=5), etag, gzipped=True)
+        return CachedResponse(body, etag)
+
+    def to_bytes(self) -> bytes:
+        return self.etag.encode("ascii") + (b"\ng" if self.gzipped else b"\nj") + self.body
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "CachedResponse":
+        etag, _, rest = data.partition(b"\n")
+        return CachedResponse(rest[1:], etag.decode("ascii"), gzipped=rest[:1] == b"g")
+
+    def decoded_body(self) -> bytes:
+        """Uncompressed JSON body."""
+        return gzip.decompress(self.body) if self.gzipped else self.body
+
+
 class ContentCache:
     """
     Redis caching layer for content articles.
@@ -126,7 +188,9 @@ class ContentCache:
             return None
         try:
             key = ContentCache._make_key("article", str(article_id))
-            cached = cache.get(key)
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="get"):
+                cached = cache.get(key)
+            record_cache_lookup("article", bool(cached))
             if cached:
                 return json.loads(cached)
         except Exception as e:
@@ -149,18 +213,26 @@ class ContentCache:
         try:
             key = ContentCache._make_key("article", str(article_id))
             ttl = ttl or cache_settings.cache_ttl
-            cache.setex(key, ttl, json.dumps(article_data))
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="setex"):
+                cache.setex(key, ttl, json.dumps(article_data))
         except Exception as e:
             logger.warning(f"Cache set error: {e}")
 
     @staticmethod
-    def get_topic_articles(topic: str, limit: int = 10) -> Optional[List[Dict]]:
+    def _topic_key(topic: str, limit: int, summary: bool) -> str:
+        """Topic list key; summaries (no content) and full articles are cached separately."""
+        suffix = ":summary" if summary else ""
+        return ContentCache._make_key("topic", f"{topic}:{limit}{suffix}")
+
+    @staticmethod
+    def get_topic_articles(topic: str, limit: int = 10, summary: bool = False) -> Optional[List[Dict]]:
         """
         Get cached articles for a specific topic.
 
         Args:
             topic: Topic name (macro, equity, fixed_income, esg)
             limit: Maximum number of articles to return
+            summary: Get the cached summaries instead of the full articles
 
         Returns:
             List of article dicts or None if not cached
@@ -169,8 +241,10 @@ class ContentCache:
         if cache is None:
             return None
         try:
-            key = ContentCache._make_key("topic", f"{topic}:{limit}")
-            cached = cache.get(key)
+            key = ContentCache._topic_key(topic, limit, summary)
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="get"):
+                cached = cache.get(key)
+            record_cache_lookup("topic_summary" if summary else "topic", bool(cached))
             if cached:
                 return json.loads(cached)
         except Exception as e:
@@ -178,7 +252,13 @@ class ContentCache:
         return None
 
     @staticmethod
-    def set_topic_articles(topic: str, articles: List[Dict], limit: int = 10, ttl: Optional[int] = None):
+    def set_topic_articles(
+        topic: str,
+        articles: List[Dict],
+        limit: int = 10,
+        ttl: Optional[int] = None,
+        summary: bool = False
+    ):
         """
         Cache articles for a specific topic.
 
@@ -187,14 +267,16 @@ class ContentCache:
             articles: List of article data dictionaries
             limit: Number of articles (for cache key)
             ttl: Time to live in seconds (default: from settings)
+            summary: The articles are summaries (cached under their own key)
         """
         cache = _get_cache()
         if cache is None:
             return
         try:
-            key = ContentCache._make_key("topic", f"{topic}:{limit}")
+            key = ContentCache._topic_key(topic, limit, summary)
             ttl = ttl or cache_settings.cache_ttl
-            cache.setex(key, ttl, json.dumps(articles))
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="setex"):
+                cache.setex(key, ttl, json.dumps(articles))
         except Exception as e:
             logger.warning(f"Cache set error: {e}")
 
@@ -217,7 +299,9 @@ class ContentCache:
             # Normalize query for cache key
             query_key = query.lower().strip()
             key = ContentCache._make_key("search", f"{topic}:{query_key}")
-            cached = cache.get(key)
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="get"):
+                cached = cache.get(key)
+            record_cache_lookup("search", bool(cached))
             if cached:
                 return json.loads(cached)
         except Exception as e:
@@ -242,7 +326,146 @@ class ContentCache:
             query_key = query.lower().strip()
             key = ContentCache._make_key("search", f"{topic}:{query_key}")
             ttl = ttl or cache_settings.cache_ttl
-            cache.setex(key, ttl, json.dumps(results))
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="setex"):
+                cache.setex(key, ttl, json.dumps(results))
+        except Exception as e:
+            logger.warning(f"Cache set error: {e}")
+
+    @staticmethod
+    def _response_key(topic: str, name: str) -> str:
+        """Response keys live under the topic prefix, so invalidate_topic() drops them too."""
+        return ContentCache._make_key("topic", f"{topic}:response:{name}")
+
+    @staticmethod
+    def get_response(topic: str, name: str) -> Optional[CachedResponse]:
+        """
+        Get a cached response body (returned to the client as is, without parsing).
+
+        Args:
+            topic: Topic name
+            name: Response name within the topic (e.g. route path and query)
+
+        Returns:
+            CachedResponse or None if not cached
+        """
+        cache = _get_raw_cache()
+        if cache is None:
+            return None
+        try:
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="get"):
+                cached = cache.get(ContentCache._response_key(topic, name))
+            record_cache_lookup("response", cached is not None)
+            if cached is not None:
+                return CachedResponse.from_bytes(cached)
+        except Exception as e:
+            logger.warning(f"Cache get error: {e}")
+        return None
+
+    @staticmethod
+    def set_response(topic: str, name: str, response: CachedResponse, ttl: Optional[int] = None):
+        """
+        Cache a serialized response body.
+
+        Args:
+            topic: Topic name
+            name: Response name within the topic
+            response: Serialized body (see CachedResponse.encode)
+            ttl: Time to live in seconds (default: RESPONSE_CACHE_TTL_SECONDS)
+        """
+        cache = _get_raw_cache()
+        if cache is None:
+            return
+        try:
+            ttl = ttl or settings.response_cache_ttl_seconds
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="setex"):
+                cache.setex(ContentCache._response_key(topic, name), ttl, response.to_bytes())
+        except Exception as e:
+            logger.warning(f"Cache set error: {e}")
+
+    @staticmethod
+    def get_section_review(section_hash: str) -> Optional[str]:
+        """
+        Get a cached editorial review of one article section.
+
+        Args:
+            section_hash: Hash of the section text and review inputs
+
+        Returns:
+            Review text or None if not cached
+        """
+        cache = _get_cache()
+        if cache is None:
+            return None
+        try:
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="get"):
+                cached = cache.get(ContentCache._make_key("review", section_hash))
+            record_cache_lookup("section_review", bool(cached))
+            return cached or None
+        except Exception as e:
+            logger.warning(f"Cache get error: {e}")
+        return None
+
+    @staticmethod
+    def set_section_review(section_hash: str, review: str, ttl: int):
+        """
+        Cache the editorial review of one article section.
+
+        Args:
+            section_hash: Hash of the section text and review inputs
+            review: Review text
+            ttl: Time to live in seconds
+        """
+        cache = _get_cache()
+        if cache is None:
+            return
+        try:
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="setex"):
+                cache.setex(ContentCache._make_key("review", section_hash), ttl, review)
+        except Exception as e:
+            logger.warning(f"Cache set error: {e}")
+
+    @staticmethod
+    def get_enrichment_checkpoint(job_id: str) -> set:
+        """
+        Get the resource ids a batch enrichment job has completed.
+
+        Args:
+            job_id: Enrichment job ID
+
+        Returns:
+            Set of completed resource ids (empty if none or Redis is unavailable)
+        """
+        cache = _get_cache()
+        if cache is None:
+            return set()
+        try:
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="smembers"):
+                members = cache.smembers(ContentCache._make_key("enrichment", job_id))
+            return {int(member) for member in members}
+        except Exception as e:
+            logger.warning(f"Cache get error: {e}")
+        return set()
+
+    @staticmethod
+    def add_enrichment_checkpoint(job_id: str, resource_ids: List[int], ttl: int):
+        """
+        Record resource ids completed by a batch enrichment job.
+
+        Args:
+            job_id: Enrichment job ID
+            resource_ids: Resource ids completed since the last checkpoint
+            ttl: Time to live in seconds (renewed on every checkpoint)
+        """
+        cache = _get_cache()
+        if cache is None or not resource_ids:
+            return
+        try:
+            key = ContentCache._make_key("enrichment", job_id)
+            with Timer(DEPENDENCY_SECONDS, system="redis", operation="sadd"):
+                pipe = cache.pipeline()
+                pipe.sadd(key, *resource_ids)
+                pipe.expire(key, ttl)
+                pipe.execute()
         except Exception as e:
             logger.warning(f"Cache set error: {e}")
 
@@ -258,7 +481,7 @@ class ContentCache:
         if cache is None:
             return
         try:
-            # Find and delete all keys matching the topic
+            # Find and delete all keys matching the topic (full and summary lists, responses)
             pattern = ContentCache._make_key("topic", f"{topic}:*")
             for key in cache.scan_iter(match=pattern):
                 cache.delete(key)
@@ -1,10 +1,15 @@
 """Service for managing content articles with Redis caching."""
 
-from typing import List, Optional, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, func, or_, case
+import asyncio
+from typing import List, Optional, Dict, Tuple
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy import desc, asc, case
 from models import ContentArticle, ContentRating, User, Topic
+from resilience import CHROMADB, CLOSED
+from services import text_search
 from services.content_cache import ContentCache
+from services.content_store import ContentStore, make_excerpt
+from services.pagination import keyset_page
 from services.vector_service import VectorService
 from services.article_resource_service import ArticleResourceService
 import logging
@@ -19,15 +24,22 @@ class ContentService:
     """
 
     @staticmethod
-    def _article_to_dict(article: ContentArticle, include_content: bool = True) -> Dict:
+    def _article_to_dict(
+        article: ContentArticle,
+        include_content: bool = True,
+        chroma_data: Optional[Dict] = None
+    ) -> Dict:
         """
         Convert article model to dictionary.
-        Fetches content and metadata from ChromaDB (source of truth).
-        PostgreSQL data is used as fallback for metadata.
+        Content comes from the content store (ChromaDB for articles not stored
+        yet); metadata from ChromaDB when it is given, PostgreSQL otherwise.
 
         Args:
             article: ContentArticle model from PostgreSQL (used for relationships/counters)
-            include_content: Whether to fetch content from ChromaDB
+            include_content: Whether to include the article content (without it
+                the dict is a summary built from PostgreSQL only, with the excerpt)
+            chroma_data: Content and metadata already retrieved from ChromaDB
+                (e.g. returned by a query); skips the per-article fetch
 
         Returns:
             Article dictionary with metadata and optionally content
@@ -45,12 +57,14 @@ class ContentService:
             "updated_at": article.updated_at.isoformat(),
             "created_by_agent": article.created_by_agent,
             "is_active": article.is_active,
-            "status": article.status.value if hasattr(article.status, 'value') else article.status
+            "status": article.status.value if hasattr(article.status, 'value') else article.status,
+            "excerpt": article.excerpt or ""
         }
 
-        # Fetch full article data from ChromaDB (source of truth for content + metadata)
+        # Fetch article content (content store, ChromaDB fallback)
         if include_content:
-            chroma_data = VectorService.get_article_data(article.id)
+            if chroma_data is None:
+                chroma_data = ContentService._stored_article_data(article)
             if chroma_data:
                 # Use ChromaDB metadata as primary source
                 metadata = chroma_data.get("metadata", {})
@@ -65,8 +79,9 @@ class ContentService:
                 if "status" in metadata:
                     article_dict["status"] = metadata["status"]
             else:
-                # Fallback to PostgreSQL if ChromaDB unavailable
-                logger.warning(f"ChromaDB data unavailable for article {article.id}, using PostgreSQL fallback")
+                # Fallback to PostgreSQL if ChromaDB unavailable (an open circuit is logged once by the breaker)
+                if CHROMADB.state == CLOSED:
+                    logger.warning(f"ChromaDB data unavailable for article {article.id}, using PostgreSQL fallback")
                 article_dict.update({
                     "content": "",
                     "headline": article.headline or "",
@@ -85,6 +100,49 @@ class ContentService:
 
         return article_dict
 
+    @staticmethod
+    def _stored_article_data(article: ContentArticle) -> Optional[Dict]:
+        """
+        Article content from the content store; for articles not stored yet,
+        content and metadata from ChromaDB (the content is copied into the store).
+        """
+        db = object_session(article)
+        content = ContentStore.get(db, article.id) if db is not None else None
+        if content is not None:
+            return {"content": content, "metadata": {}}
+
+        chroma_data = VectorService.get_article_data(article.id)
+        if chroma_data and chroma_data.get("content") is not None:
+            ContentStore.backfill({article.id: chroma_data["content"]})
+        return chroma_data
+
+    @staticmethod
+    async def _aarticles_to_dicts(articles: List[ContentArticle], include_content: bool = True) -> List[Dict]:
+        """
+        Convert article models to dictionaries without blocking the event loop.
+        Reads stored content with one query; articles not in the content store
+        yet are fetched from ChromaDB in one async request. Summaries
+        (include_content=False) need neither.
+        """
+        if not include_content:
+            return [ContentService._article_to_dict(a, include_content=False) for a in articles]
+
+        db = object_session(articles[0]) if articles else None
+        stored = ContentStore.get_many(db, [a.id for a in articles]) if db is not None else {}
+        article_data = {article_id: {"content": content, "metadata": {}} for article_id, content in stored.items()}
+
+        missing = [a.id for a in articles if a.id not in article_data]
+        if missing:
+            chroma_data = await VectorService.aget_articles_data(missing)
+            backfill = {article_id: data["content"] for article_id, data in chroma_data.items()
+                        if data.get("content") is not None}
+            if backfill:
+                ContentStore.backfill(backfill)
+            article_data.update(chroma_data)
+
+        # {} means looked up but not found, so _article_to_dict() does not fetch again
+        return [ContentService._article_to_dict(a, chroma_data=article_data.get(a.id, {})) for a in articles]
+
     @staticmethod
     def get_article(db: Session, article_id: int, increment_readership: bool = True) -> Optional[Dict]:
         """
@@ -99,41 +157,78 @@ class ContentService:
             Article dict or None if not found
         """
         # Try cache first
-        cached = ContentCache.get_article(article_id)
+        cached = ContentService._get_cached_article(db, article_id, increment_readership)
         if cached:
-            if increment_readership:
-                # Still need to increment in DB
-                article = db.query(ContentArticle).filter(
-                    ContentArticle.id == article_id,
-                    ContentArticle.is_active == True
-                ).first()
-                if article:
-                    article.readership_count += 1
-                    db.commit()
-                    # Invalidate cache since readership changed
-                    ContentCache.invalidate_article(article_id)
             return cached
 
         # Cache miss - query database
+        article = ContentService._load_article(db, article_id, increment_readership)
+        if not article:
+            return None
+
+        # Convert to dict and cache
+        article_dict = ContentService._article_to_dict(article)
+        ContentCache.set_article(article_id, article_dict)
+
+        return article_dict
+
+    @staticmethod
+    async def aget_article(db: Session, article_id: int, increment_readership: bool = True) -> Optional[Dict]:
+        """
+        Async variant of get_article() (the ChromaDB read does not block the event loop).
+
+        Args:
+            db: Database session
+            article_id: Article ID
+            increment_readership: Whether to increment the readership counter
+
+        Returns:
+            Article dict or None if not found
+        """
+        cached = ContentService._get_cached_article(db, article_id, increment_readership)
+        if cached:
+            return cached
+
+        article = ContentService._load_article(db, article_id, increment_readership)
+        if not article:
+            return None
+
+        article_dict = (await ContentService._aarticles_to_dicts([article]))[0]
+        ContentCache.set_article(article_id, article_dict)
+
+        return article_dict
+
+    @staticmethod
+    def _get_cached_article(db: Session, article_id: int, increment_readership: bool) -> Optional[Dict]:
+        """Cached article dict, counting the read in the database on a hit."""
+        cached = ContentCache.get_article(article_id)
+        if cached and increment_readership:
+            # Still need to increment in DB
+            article = db.query(ContentArticle).filter(
+                ContentArticle.id == article_id,
+                ContentArticle.is_active == True
+            ).first()
+            if article:
+                article.readership_count += 1
+                db.commit()
+                # Invalidate cache since readership changed
+                ContentCache.invalidate_article(article_id)
+        return cached
+
+    @staticmethod
+    def _load_article(db: Session, article_id: int, increment_readership: bool) -> Optional[ContentArticle]:
+        """Active article from the database, incrementing readership if requested."""
         article = db.query(ContentArticle).filter(
             ContentArticle.id == article_id,
             ContentArticle.is_active == True
         ).first()
 
-        if not article:
-            return None
-
-        # Increment readership if requested
-        if increment_readership:
+        if article and increment_readership:
             article.readership_count += 1
             db.commit()
             db.refresh(article)
 
-        # Convert to dict and cache
-        article_dict = ContentService._article_to_dict(article)
-        ContentCache.set_article(article_id, article_dict)
-
-        return article_dict
+        return article
 
     @staticmethod
     def _get_article_ordering(db: Session, topic_slug: str):
@@ -164,7 +259,7 @@ class ContentService:
         return order_clauses
 
     @staticmethod
-    def get_recent_articles(db: Session, topic: str, limit: int = 10) -> List[Dict]:
+    def get_recent_articles(db: Session, topic: str, limit: int = 10, include_content: bool = True) -> List[Dict]:
         """
         Get recent articles for a topic with caching.
         Respects the topic's article_order setting.
@@ -173,30 +268,55 @@ class ContentService:
             db: Database session
             topic: Topic name (macro, equity, fixed_income, esg)
             limit: Maximum number of articles to return
+            include_content: False returns summaries (PostgreSQL columns and
+                excerpt, cached under their own key)
 
         Returns:
             List of article dicts
         """
         # Try cache first
-        cached = ContentCache.get_topic_articles(topic, limit)
+        cached = ContentCache.get_topic_articles(topic, limit, summary=not include_content)
+        if cached:
+            return cached
+
+        # Cache miss - query database
+        articles = ContentService._query_recent_articles(db, topic, limit)
+
+        # Convert to dicts and cache
+        article_dicts = [ContentService._article_to_dict(a, include_content=include_content) for a in articles]
+        ContentCache.set_topic_articles(topic, article_dicts, limit, summary=not include_content)
+
+        return article_dicts
+
+    @staticmethod
+    async def aget_recent_articles(
+        db: Session,
+        topic: str,
+        limit: int = 10,
+        include_content: bool = True
+    ) -> List[Dict]:
+        """Async variant of get_recent_articles() (one async ChromaDB request for all articles)."""
+        cached = ContentCache.get_topic_articles(topic, limit, summary=not include_content)
         if cached:
             return cached
 
+        articles = ContentService._query_recent_articles(db, topic, limit)
+        article_dicts = await ContentService._aarticles_to_dicts(articles, include_content)
+        ContentCache.set_topic_articles(topic, article_dicts, limit, summary=not include_content)
+
+        return article_dicts
+
+    @staticmethod
+    def _query_recent_articles(db: Session, topic: str, limit: int) -> List[ContentArticle]:
+        """Active articles for a topic in the topic's article order."""
         # Get ordering based on topic settings
         order_clauses = ContentService._get_article_ordering(db, topic)
 
-        # Cache miss - query database
-        articles = db.query(ContentArticle).filter(
+        return db.query(ContentArticle).filter(
             ContentArticle.topic == topic,
             ContentArticle.is_active == True
         ).order_by(*order_clauses).limit(limit).all()
 
-        # Convert to dicts and cache
-        article_dicts = [ContentService._article_to_dict(a) for a in articles]
-        ContentCache.set_topic_articles(topic, article_dicts, limit)
-
-        return article_dicts
-
     @staticmethod
     def search_articles(
         db: Session,
@@ -231,18 +351,124 @@ class ContentService:
         Returns:
             List of matching article dicts
         """
-        # Build cache key from all parameters
-        cache_key_parts = [topic or "all", query or "", headline or "", keywords or "", author or "",
-                          created_after or "", created_before or "", str(limit),
-                          status or "", ",".join(statuses) if statuses else ""]
-        cache_key = ":".join(cache_key_parts)
-
         # Try cache first (simplified - can enhance with proper cache key)
         if topic and query and not any([headline, keywords, author, created_after, created_before, status, statuses]):
             cached = ContentCache.search_cached_content(topic, query)
             if cached:
                 return cached
 
+        rows = ContentService._keyword_search_rows(
+            db, topic, query, headline, keywords, author, created_after, created_before, limit, status, statuses
+        )
+        keyword_dicts = ContentService._with_text_rank(
+            rows, [ContentService._article_to_dict(article) for article, _ in rows]
+        )
+
+        # Try hybrid search if vector DB available
+        try:
+            # Embed the query once; the same results rank and extend the keyword hits
+            semantic_results = VectorService.semantic_search(query, topic, limit * 2) if query else []
+            ranked_results = ContentService._rank_hybrid(query, topic, limit, keyword_dicts, semantic_results)
+
+            # Get full article data for ranked results
+            if ranked_results:
+                # Map article IDs to articles
+                article_map = {a['id']: a for a in keyword_dicts}
+
+                # Add semantic results not in keyword results
+                for article in ContentService._semantic_only_articles(
+                    db, semantic_results[:limit], article_map, status, statuses
+                ):
+                    article_map[article.id] = ContentService._article_to_dict(article)
+
+                return ContentService._finish_search(topic, query, ranked_results, article_map)
+        except Exception as e:
+            logger.warning(f"Hybrid search failed, using keyword-only: {e}")
+
+        # Fallback to keyword-only results
+        article_dicts = keyword_dicts[:limit]
+        if topic and query:
+            ContentCache.set_search_results(topic, query, article_dicts)
+        return article_dicts
+
+    @staticmethod
+    async def asearch_articles(
+        db: Session,
+        topic: Optional[str] = None,
+        query: Optional[str] = None,
+        headline: Optional[str] = None,
+        keywords: Optional[str] = None,
+        author: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        limit: int = 10,
+        status: Optional[str] = None,
+        statuses: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        Async variant of search_articles().
+
+        Fetches ChromaDB data for the keyword hits and runs the semantic search
+        concurrently, without blocking the event loop. Same arguments and results
+        as search_articles().
+        """
+        if topic and query and not any([headline, keywords, author, created_after, created_before, status, statuses]):
+            cached = ContentCache.search_cached_content(topic, query)
+            if cached:
+                return cached
+
+        rows = ContentService._keyword_search_rows(
+            db, topic, query, headline, keywords, author, created_after, created_before, limit, status, statuses
+        )
+
+        # Both calls return empty results (never raise) when the vector DB is unavailable
+        keyword_dicts, semantic_results = await asyncio.gather(
+            ContentService._aarticles_to_dicts([article for article, _ in rows]),
+            VectorService.asemantic_search(query, topic, limit * 2) if query else asyncio.sleep(0, result=[])
+        )
+        keyword_dicts = ContentService._with_text_rank(rows, keyword_dicts)
+
+        try:
+            ranked_results = ContentService._rank_hybrid(query, topic, limit, keyword_dicts, semantic_results)
+
+            if ranked_results:
+                article_map = {a['id']: a for a in keyword_dicts}
+                semantic_only = ContentService._semantic_only_articles(
+                    db, semantic_results[:limit], article_map, status, statuses
+                )
+                for article_dict in await ContentService._aarticles_to_dicts(semantic_only):
+                    article_map[article_dict['id']] = article_dict
+
+                return ContentService._finish_search(topic, query, ranked_results, article_map)
+        except Exception as e:
+            logger.warning(f"Hybrid search failed, using keyword-only: {e}")
+
+        article_dicts = keyword_dicts[:limit]
+        if topic and query:
+            ContentCache.set_search_results(topic, query, article_dicts)
+        return article_dicts
+
+    @staticmethod
+    def _keyword_search_rows(
+        db: Session,
+        topic: Optional[str],
+        query: Optional[str],
+        headline: Optional[str],
+        keywords: Optional[str],
+        author: Optional[str],
+        created_after: Optional[str],
+        created_before: Optional[str],
+        limit: int,
+        status: Optional[str],
+        statuses: Optional[List[str]]
+    ) -> List[Tuple[ContentArticle, Optional[float]]]:
+        """
+        Keyword part of search_articles(): matching articles with their text rank.
+
+        Returns:
+            Up to limit * 2 (article, text_rank) pairs; text_rank is None when
+            the database cannot score matches
+        """
         # Build filter conditions
         filters = [
             ContentArticle.is_active == True
@@ -259,14 +485,15 @@ class ContentService:
             filters.append(ContentArticle.topic == topic)
 
         # Add specific field filters
+        # ILIKE is served by the pg_trgm indexes on PostgreSQL
         if headline:
-            filters.append(func.lower(ContentArticle.headline).like(f"%{headline.lower()}%"))
+            filters.append(ContentArticle.headline.ilike(f"%{headline}%"))
 
         if keywords:
-            filters.append(func.lower(ContentArticle.keywords).like(f"%{keywords.lower()}%"))
+            filters.append(ContentArticle.keywords.ilike(f"%{keywords}%"))
 
         if author:
-            filters.append(func.lower(ContentArticle.author).like(f"%{author.lower()}%"))
+            filters.append(ContentArticle.author.ilike(f"%{author}%"))
 
         if created_after:
             from datetime import datetime
@@ -278,76 +505,90 @@ class ContentService:
             date_before = datetime.fromisoformat(created_before.replace('Z', '+00:00'))
             filters.append(ContentArticle.created_at <= date_before)
 
-        # Add general query search (headline and keywords)
+        # Add general query search (full-text + trigram on PostgreSQL, substring elsewhere)
+        rank = None
         if query:
-            search_term = f"%{query.lower()}%"
-            filters.append(
-                or_(
-                    func.lower(ContentArticle.headline).like(search_term),
-                    func.lower(ContentArticle.keywords).like(search_term)
-                )
-            )
+            filters.append(text_search.match_condition(db, text_search.ARTICLE_SEARCH, query))
+            rank = text_search.rank_expression(db, text_search.ARTICLE_SEARCH, query)
+
+        # Perform database query, best text rank first when the database can score
+        if rank is not None:
+            rows = db.query(ContentArticle, rank.label("text_rank")).filter(
+                *filters
+            ).order_by(desc("text_rank"), desc(ContentArticle.created_at)).limit(limit * 2).all()
+            return [(article, float(text_rank or 0.0)) for article, text_rank in rows]
 
-        # Perform database query
         keyword_articles = db.query(ContentArticle).filter(
             *filters
         ).order_by(desc(ContentArticle.created_at)).limit(limit * 2).all()
+        return [(article, None) for article in keyword_articles]
 
-        keyword_dicts = [ContentService._article_to_dict(a) for a in keyword_articles]
+    @staticmethod
+    def _with_text_rank(
+        rows: List[Tuple[ContentArticle, Optional[float]]],
+        article_dicts: List[Dict]
+    ) -> List[Dict]:
+        """Add each row's text rank (if scored) to its article dict."""
+        for (_, text_rank), article_dict in zip(rows, article_dicts):
+            if text_rank is not None:
+                article_dict["text_rank"] = text_rank
+        return article_dicts
 
-        # Try hybrid search if vector DB available
-        try:
-            ranked_results = VectorService.hybrid_search(
-                query=query,
-                keyword_results=keyword_dicts,
-                topic=topic,  # Can be None for all topics
-                limit=limit,
-                semantic_weight=0.6  # 60% semantic, 40% keyword
-            )
+    @staticmethod
+    def _rank_hybrid(
+        query: Optional[str],
+        topic: Optional[str],
+        limit: int,
+        keyword_dicts: List[Dict],
+        semantic_results: List[Dict]
+    ) -> List[Dict]:
+        """Combine keyword and semantic results (60% semantic, 40% keyword)."""
+        return VectorService.hybrid_search(
+            query=query,
+            keyword_results=keyword_dicts,
+            topic=topic,  # Can be None for all topics
+            limit=limit,
+            semantic_weight=0.6,  # 60% semantic, 40% keyword
+            semantic_results=semantic_results
+        )
 
-            # Get full article data for ranked results
-            if ranked_results:
-                # Map article IDs to articles
-                article_map = {a['id']: a for a in keyword_dicts}
+    @staticmethod
+    def _semantic_only_articles(
+        db: Session,
+        semantic_results: List[Dict],
+        article_map: Dict[int, Dict],
+        status: Optional[str],
+        statuses: Optional[List[str]]
+    ) -> List[ContentArticle]:
+        """Articles found only by semantic search, with the keyword search's status filter."""
+        semantic_only = [r['article_id'] for r in semantic_results if r['article_id'] not in article_map]
+        if not semantic_only:
+            return []
+
+        semantic_filters = [
+            ContentArticle.id.in_(semantic_only),
+            ContentArticle.is_active == True
+        ]
+        if status:
+            semantic_filters.append(ContentArticle.status == status)
+        elif statuses:
+            semantic_filters.append(ContentArticle.status.in_(statuses))
 
-                # Add semantic results not in keyword results
-                # Apply same status filter as keyword search
-                semantic_only = VectorService.semantic_search(query, topic, limit)
-                for sem_result in semantic_only:
-                    aid = sem_result['article_id']
-                    if aid not in article_map:
-                        # Build filter with same status constraints
-                        semantic_filters = [
-                            ContentArticle.id == aid,
-                            ContentArticle.is_active == True
-                        ]
-                        if status:
-                            semantic_filters.append(ContentArticle.status == status)
-                        elif statuses:
-                            semantic_filters.append(ContentArticle.status.in_(statuses))
-
-                        article = db.query(ContentArticle).filter(*semantic_filters).first()
-                        if article:
-                            article_map[aid] = ContentService._article_to_dict(article)
-
-                # Build final result list
-                final_results = []
-                for ranked in ranked_results:
-                    if ranked['article_id'] in article_map:
-                        final_results.append(article_map[ranked['article_id']])
-
-                # Cache and return (only cache if topic-specific)
-                if topic and query:
-                    ContentCache.set_search_results(topic, query, final_results)
-                return final_results
-        except Exception as e:
-            logger.warning(f"Hybrid search failed, using keyword-only: {e}")
+        return db.query(ContentArticle).filter(*semantic_filters).all()
+
+    @staticmethod
+    def _finish_search(
+        topic: Optional[str],
+        query: Optional[str],
+        ranked_results: List[Dict],
+        article_map: Dict[int, Dict]
+    ) -> List[Dict]:
+        """Ranked article dicts; cached when the search is topic-specific."""
+        final_results = [article_map[r['article_id']] for r in ranked_results if r['article_id'] in article_map]
 
-        # Fallback to keyword-only results
-        article_dicts = keyword_dicts[:limit]
         if topic and query:
-            ContentCache.set_search_results(topic, query, article_dicts)
-        return article_dicts
+            ContentCache.set_search_results(topic, query, final_results)
+        return final_results
 
     @staticmethod
     def create_article(
@@ -362,13 +603,14 @@ class ContentService:
         status: str = "draft"
     ) -> Dict:
         """
-        Create a new article. Metadata stored in PostgreSQL, content in ChromaDB.
+        Create a new article. Metadata and compressed content are stored in
+        PostgreSQL; content is also indexed in ChromaDB for semantic search.
 
         Args:
             db: Database session
             topic: Topic name
             headline: Article headline
-            content: Article content (1000-2000 words) - stored in ChromaDB only
+            content: Article content (1000-2000 words) - content store and ChromaDB
             keywords: Comma-separated keywords
             agent_name: Name of the agent creating the article
             author: Author name
@@ -405,17 +647,22 @@ class ContentService:
             created_by_agent=agent_name,
             author=author,
             editor=editor,
-            status=ArticleStatus(status)
+            status=ArticleStatus(status),
+            excerpt=make_excerpt(content)
         )
 
         db.add(article)
+        db.flush()
+
+        # Write content through to the content store in the same transaction
+        ContentStore.put(db, article.id, content)
         db.commit()
         db.refresh(article)
 
         # Invalidate topic cache since new article was added
         ContentCache.invalidate_topic(topic)
 
-        # Store content in ChromaDB (source of truth for content and metadata)
+        # Index content in ChromaDB for semantic search
         success = VectorService.add_article(
             article_id=article.id,
             headline=headline,
@@ -435,7 +682,7 @@ class ContentService:
             logger.error(f"Failed to store content in ChromaDB for article {article.id}")
             # Could optionally rollback or handle error differently
 
-        # Return article dict with content from ChromaDB
+        # Return article dict with content from the content store
         article_dict = ContentService._article_to_dict(article, include_content=True)
         return article_dict
 
@@ -515,7 +762,8 @@ class ContentService:
         topic: str,
         limit: int = 10,
         status: Optional[str] = None,
-        statuses: Optional[List[str]] = None
+        statuses: Optional[List[str]] = None,
+        include_content: bool = True
     ) -> List[Dict]:
         """
         Get top-rated articles for a topic.
@@ -526,10 +774,36 @@ class ContentService:
             limit: Maximum number of articles
             status: Filter by single status (e.g., 'published')
             statuses: Filter by multiple statuses (e.g., ['published', 'editor'])
+            include_content: False returns summaries (PostgreSQL columns and excerpt)
 
         Returns:
             List of top-rated article dicts
         """
+        articles = ContentService._query_top_rated_articles(db, topic, limit, status, statuses)
+        return [ContentService._article_to_dict(a, include_content=include_content) for a in articles]
+
+    @staticmethod
+    async def aget_top_rated_articles(
+        db: Session,
+        topic: str,
+        limit: int = 10,
+        status: Optional[str] = None,
+        statuses: Optional[List[str]] = None,
+        include_content: bool = True
+    ) -> List[Dict]:
+        """Async variant of get_top_rated_articles() (one async ChromaDB request for all articles)."""
+        articles = ContentService._query_top_rated_articles(db, topic, limit, status, statuses)
+        return await ContentService._aarticles_to_dicts(articles, include_content)
+
+    @staticmethod
+    def _query_top_rated_articles(
+        db: Session,
+        topic: str,
+        limit: int,
+        status: Optional[str],
+        statuses: Optional[List[str]]
+    ) -> List[ContentArticle]:
+        """Rated active articles for a topic, best rated first."""
         filters = [
             ContentArticle.topic == topic,
             ContentArticle.is_active == True,
@@ -541,22 +815,21 @@ class ContentService:
         elif statuses:
             filters.append(ContentArticle.status.in_(statuses))
 
-        articles = db.query(ContentArticle).filter(
+        return db.query(ContentArticle).filter(
             *filters
         ).order_by(
             desc(ContentArticle.rating),
             desc(ContentArticle.rating_count)
         ).limit(limit).all()
 
-        return [ContentService._article_to_dict(a) for a in articles]
-
     @staticmethod
     def get_most_read_articles(
         db: Session,
         topic: str,
         limit: int = 10,
         status: Optional[str] = None,
-        statuses: Optional[List[str]] = None
+        statuses: Optional[List[str]] = None,
+        include_content: bool = True
     ) -> List[Dict]:
         """
         Get most-read articles for a topic.
@@ -567,10 +840,36 @@ class ContentService:
             limit: Maximum number of articles
             status: Filter by single status (e.g., 'published')
             statuses: Filter by multiple statuses (e.g., ['published', 'editor'])
+            include_content: False returns summaries (PostgreSQL columns and excerpt)
 
         Returns:
             List of most-read article dicts
         """
+        articles = ContentService._query_most_read_articles(db, topic, limit, status, statuses)
+        return [ContentService._article_to_dict(a, include_content=include_content) for a in articles]
+
+    @staticmethod
+    async def aget_most_read_articles(
+        db: Session,
+        topic: str,
+        limit: int = 10,
+        status: Optional[str] = None,
+        statuses: Optional[List[str]] = None,
+        include_content: bool = True
+    ) -> List[Dict]:
+        """Async variant of get_most_read_articles() (one async ChromaDB request for all articles)."""
+        articles = ContentService._query_most_read_articles(db, topic, limit, status, statuses)
+        return await ContentService._aarticles_to_dicts(articles, include_content)
+
+    @staticmethod
+    def _query_most_read_articles(
+        db: Session,
+        topic: str,
+        limit: int,
+        status: Optional[str],
+        statuses: Optional[List[str]]
+    ) -> List[ContentArticle]:
+        """Active articles for a topic, most read first."""
         filters = [
             ContentArticle.topic == topic,
             ContentArticle.is_active == True
@@ -581,33 +880,40 @@ class ContentService:
         elif statuses:
             filters.append(ContentArticle.status.in_(statuses))
 
-        articles = db.query(ContentArticle).filter(
+        return db.query(ContentArticle).filter(
             *filters
         ).order_by(
             desc(ContentArticle.readership_count)
         ).limit(limit).all()
 
-        return [ContentService._article_to_dict(a) for a in articles]
-
     @staticmethod
-    def get_all_articles_admin(db: Session, topic: str, offset: int = 0, limit: int = 20) -> List[Dict]:
+    def get_all_articles_admin(
+        db: Session,
+        topic: str,
+        offset: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
         """
         Admin-only: Get all articles for a topic with pagination (includes inactive).
 
         Args:
             db: Database session
             topic: Topic name
-            offset: Number of articles to skip
+            offset: Number of articles to skip (ignored with a cursor)
             limit: Maximum number of articles
+            cursor: Keyset cursor after the previous page (see services.pagination)
 
         Returns:
-            List of article dicts
+            Tuple of (article dicts, cursor of the next page or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
-        articles = db.query(ContentArticle).filter(
-            ContentArticle.topic == topic
-        ).order_by(desc(ContentArticle.created_at)).offset(offset).limit(limit).all()
+        query = db.query(ContentArticle).filter(ContentArticle.topic == topic)
+        articles, next_cursor = keyset_page(query, ContentArticle.created_at, ContentArticle.id, cursor, limit, offset)
 
-        return [ContentService._article_to_dict(a) for a in articles]
+        return [ContentService._article_to_dict(a) for a in articles], next_cursor
 
     @staticmethod
     def delete_article(db: Session, article_id: int) -> None:
@@ -678,13 +984,13 @@ class ContentService:
         is_sticky: Optional[bool] = None
     ) -> Dict:
         """
-        Update an article. Metadata in PostgreSQL, content in ChromaDB.
+        Update an article. Metadata and content in PostgreSQL, re-indexed in ChromaDB.
 
         Args:
             db: Database session
             article_id: Article ID to update
             headline: New headline (optional) - updates PostgreSQL
-            content: New content (optional) - updates ChromaDB only
+            content: New content (optional) - updates the content store and ChromaDB
             keywords: New keywords (optional) - updates PostgreSQL
             author: New author (optional) - updates PostgreSQL
             editor: New editor (optional) - updates PostgreSQL
@@ -736,7 +1042,12 @@ class ContentService:
             article.is_sticky = is_sticky
             metadata_updated = True
 
-        if metadata_updated:
+        # Write content through to the content store (committed with the metadata)
+        content_updated = content is not None and ContentStore.put(db, article.id, content)
+        if content_updated:
+            article.excerpt = make_excerpt(content)
+
+        if metadata_updated or content_updated:
             db.commit()
             db.refresh(article)
 
@@ -744,13 +1055,24 @@ class ContentService:
         ContentCache.invalidate_article(article_id)
         ContentCache.invalidate_topic(article.topic)
 
-        # Update ChromaDB if content or headline changed
-        if content is not None or headline is not None:
-            # Get current content from ChromaDB if not updating it
+        vector_metadata = {
+            "topic": article.topic,
+            "author": article.author,
+            "editor": article.editor,
+            "keywords": article.keywords,
+            "status": article.status.value if hasattr(article.status, 'value') else article.status,
+            "created_at": article.created_at,
+            "updated_at": article.updated_at
+        }
+
+        # Re-embed only if the embedded text (headline + content) may have changed;
+        # VectorService skips the embedding when its stored hash still matches
+        if content_updated or headline is not None:
+            # Get current content if not updating it
             if content is None:
-                existing_content = VectorService.get_article_content(article_id)
+                existing_content = ContentStore.get_content(article_id, db)
                 if existing_content is None:
-                    logger.warning(f"No existing content found in ChromaDB for article {article_id}")
+                    logger.warning(f"No existing content found for article {article_id}")
                     content = ""
                 else:
                     content = existing_content
@@ -760,22 +1082,16 @@ class ContentService:
                 article_id=article.id,
                 headline=article.headline,
                 content=content,
-                metadata={
-                    "topic": article.topic,
-                    "author": article.author,
-                    "editor": article.editor,
-                    "keywords": article.keywords,
-                    "status": article.status.value if hasattr(article.status, 'value') else article.status,
-                    "created_at": article.created_at,
-                    "updated_at": article.updated_at
-                }
+                metadata=vector_metadata
             )
             if success:
                 logger.info(f"✓ Article {article_id} synced to ChromaDB successfully")
             else:
                 logger.error(f"✗ Failed to sync article {article_id} to ChromaDB")
+        elif keywords is not None or author is not None or editor is not None:
+            VectorService.update_article_metadata(article.id, article.headline, vector_metadata)
 
-        # Return article dict with content from ChromaDB
+        # Return article dict with content from the content store
         article_dict = ContentService._article_to_dict(article, include_content=True)
         return article_dict
 
@@ -785,8 +1101,9 @@ class ContentService:
         topic: str,
         status: str,
         offset: int = 0,
-        limit: int = 20
-    ) -> List[Dict]:
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
         """
         Get articles for a topic filtered by status.
         Includes inactive (deleted) articles so they can be shown grayed out.
@@ -795,21 +1112,52 @@ class ContentService:
             db: Database session
             topic: Topic name (macro, equity, fixed_income, esg)
             status: Article status (draft, editor, published)
-            offset: Number of articles to skip
+            offset: Number of articles to skip (ignored with a cursor)
             limit: Maximum number of articles
+            cursor: Keyset cursor after the previous page (see services.pagination)
 
         Returns:
-            List of article dicts (both active and inactive)
+            Tuple of (article dicts, both active and inactive; cursor of the
+            next page or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
         from models import ArticleStatus
         
         # Include both active and inactive articles - inactive will be shown grayed out
-        articles = db.query(ContentArticle).filter(
+        query = db.query(ContentArticle).filter(
             ContentArticle.topic == topic,
             ContentArticle.status == ArticleStatus(status)
-        ).order_by(desc(ContentArticle.created_at)).offset(offset).limit(limit).all()
+        )
+        articles, next_cursor = keyset_page(query, ContentArticle.created_at, ContentArticle.id, cursor, limit, offset)
 
-        return [ContentService._article_to_dict(a) for a in articles]
+        return [ContentService._article_to_dict(a) for a in articles], next_cursor
+
+    @staticmethod
+    def store_content(db: Session, article: ContentArticle, content: str) -> bool:
+        """
+        Store an article's content without re-embedding it (ChromaDB sync endpoints).
+
+        Like update_article, refreshes the excerpt, commits and invalidates the
+        article and topic caches so reads see the new content.
+
+        Args:
+            db: Database session
+            article: Article to store the content of
+            content: Article content
+
+        Returns:
+            True if the content changed
+        """
+        content_updated = ContentStore.put(db, article.id, content)
+        if content_updated:
+            article.excerpt = make_excerpt(content)
+        db.commit()
+
+        ContentCache.invalidate_article(article.id)
+        ContentCache.invalidate_topic(article.topic)
+        return content_updated
 
     @staticmethod
     def update_article_status(db: Session, article_id: int, new_status: str) -> Dict:
@@ -848,7 +1196,7 @@ class ContentService:
         return ContentService._article_to_dict(article)
 
     @staticmethod
-    def get_published_articles(db: Session, topic: str, limit: int = 10) -> List[Dict]:
+    def get_published_articles(db: Session, topic: str, limit: int = 10, include_content: bool = True) -> List[Dict]:
         """
         Get only published articles for a topic (for public display).
         Respects the topic's article_order setting.
@@ -857,23 +1205,39 @@ class ContentService:
             db: Database session
             topic: Topic name
             limit: Maximum number of articles
+            include_content: False returns summaries (PostgreSQL columns and excerpt)
 
         Returns:
             List of published article dicts
         """
+        articles = ContentService._query_published_articles(db, topic, limit)
+        return [ContentService._article_to_dict(a, include_content=include_content) for a in articles]
+
+    @staticmethod
+    async def aget_published_articles(
+        db: Session,
+        topic: str,
+        limit: int = 10,
+        include_content: bool = True
+    ) -> List[Dict]:
+        """Async variant of get_published_articles() (one async ChromaDB request for all articles)."""
+        articles = ContentService._query_published_articles(db, topic, limit)
+        return await ContentService._aarticles_to_dicts(articles, include_content)
+
+    @staticmethod
+    def _query_published_articles(db: Session, topic: str, limit: int) -> List[ContentArticle]:
+        """Published active articles for a topic in the topic's article order."""
         from models import ArticleStatus
 
         # Get ordering based on topic settings
         order_clauses = ContentService._get_article_ordering(db, topic)
 
-        articles = db.query(ContentArticle).filter(
+        return db.query(ContentArticle).filter(
             ContentArticle.topic == topic,
             ContentArticle.is_active == True,
             ContentArticle.status == ArticleStatus.PUBLISHED
         ).order_by(*order_clauses).limit(limit).all()
 
-        return [ContentService._article_to_dict(a) for a in articles]
-
     @staticmethod
     def recall_article(db: Session, article_id: int) -> Dict:
         """
@@ -922,8 +1286,8 @@ class ContentService:
     def purge_article(db: Session, article_id: int) -> None:
         """
         Permanently delete an article and all related data.
-        This removes the article from PostgreSQL, ChromaDB, all ratings,
-        and all publication resources (HTML and PDF versions).
+        This removes the article from PostgreSQL, ChromaDB, the content store,
+        all ratings and all publication resources (HTML and PDF versions).
 
         Args:
             db: Database session
@@ -949,6 +1313,9 @@ class ContentService:
         # Delete ratings (foreign key constraint)
         db.query(ContentRating).filter(ContentRating.article_id == article_id).delete()
 
+        # Delete stored content (foreign key constraint)
+        ContentStore.delete(db, article_id)
+
         # Delete from PostgreSQL
         db.delete(article)
         db.commit()
@@ -998,23 +1365,20 @@ class ContentService:
         db.commit()
         db.refresh(article)
 
-        # Update ChromaDB metadata
-        content = VectorService.get_article_content(article_id)
-        if content:
-            VectorService.update_article(
-                article_id=article.id,
-                headline=article.headline,
-                content=content,
-                metadata={
-                    "topic": article.topic,
-                    "author": article.author,
-                    "editor": article.editor,
-                    "keywords": article.keywords,
-                    "status": article.status.value,
-                    "created_at": article.created_at,
-                    "updated_at": article.updated_at
-                }
-            )
+        # Update ChromaDB metadata (content is unchanged, so no re-embedding)
+        VectorService.update_article_metadata(
+            article.id,
+            article.headline,
+            {
+                "topic": article.topic,
+                "author": article.author,
+                "editor": article.editor,
+                "keywords": article.keywords,
+                "status": article.status.value,
+                "created_at": article.created_at,
+                "updated_at": article.updated_at
+            }
+        )
 
         # Invalidate cache
         ContentCache.invalidate_article(article_id)
@@ -1060,23 +1424,20 @@ class ContentService:
         db.commit()
         db.refresh(article)
 
-        # Update ChromaDB metadata
-        content = VectorService.get_article_content(article_id)
-        if content:
-            VectorService.update_article(
-                article_id=article.id,
-                headline=article.headline,
-                content=content,
-                metadata={
-                    "topic": article.topic,
-                    "author": article.author,
-                    "editor": article.editor,
-                    "keywords": article.keywords,
-                    "status": article.status.value,
-                    "created_at": article.created_at,
-                    "updated_at": article.updated_at
-                }
-            )
+        # Update ChromaDB metadata (content is unchanged, so no re-embedding)
+        VectorService.update_article_metadata(
+            article.id,
+            article.headline,
+            {
+                "topic": article.topic,
+                "author": article.author,
+                "editor": article.editor,
+                "keywords": article.keywords,
+                "status": article.status.value,
+                "created_at": article.created_at,
+                "updated_at": article.updated_at
+            }
+        )
 
         # Invalidate cache
         ContentCache.invalidate_article(article_id)
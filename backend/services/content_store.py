@@ -0,0 +1,186 @@
+"""
+Compressed article content store.
+
+Article bodies are kept in PostgreSQL (article_contents), zstd-compressed and
+keyed by article id together with a SHA-256 hash of the text. Content is
+written through by ContentService.create_article/update_article and read from
+here by article views, edits, publishing and PDF/HTML rendering, so ChromaDB
+only has to serve similarity search.
+
+Articles written before the store existed are read through from ChromaDB once
+and then kept here (see backfill_content_store.py for a bulk copy).
+
+make_excerpt() derives ContentArticle.excerpt, the short plain-text preview
+used by article list summaries.
+"""
+
+import hashlib
+import logging
+import re
+from typing import Dict, Iterable, Optional
+
+import zstandard
+from sqlalchemy.orm import Session
+
+from config import settings
+from metrics import record_cache_lookup
+from models import ArticleContent
+
+logger = logging.getLogger("uvicorn")
+
+# Length of ContentArticle.excerpt (column is String(300), room for the ellipsis)
+EXCERPT_LENGTH = 280
+
+_MARKDOWN_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_MARKDOWN_SYNTAX = re.compile(r"^\s{0,3}(#{1,6}|>|[-*+]|\d+\.)\s+|[*_`~]+", re.MULTILINE)
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 hex digest of the UTF-8 encoded content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def compress(content: str) -> bytes:
+    """zstd-compress content (compressor objects are not shared between threads)."""
+    return zstandard.ZstdCompressor(level=settings.content_store_compression_level).compress(
+        content.encode("utf-8")
+    )
+
+
+def decompress(data: bytes) -> str:
+    """Inverse of compress()."""
+    return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+
+
+def make_excerpt(content: str, length: int = EXCERPT_LENGTH) -> str:
+    """Plain-text start of markdown content, cut at a word boundary."""
+    text = _MARKDOWN_SYNTAX.sub("", _MARKDOWN_LINK.sub(r"\1", content or ""))
+    text = " ".join(text.split())
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(" ", 1)[0] or text[:length]
+    return cut.rstrip(",.;:-") + "…"
+
+
+class ContentStore:
+    """Read/write access to stored article content."""
+
+    @staticmethod
+    def put(db: Session, article_id: int, content: str) -> bool:
+        """
+        Store an article's content (flushed, committed with the caller's transaction).
+
+        Args:
+            db: Database session
+            article_id: Article ID
+            content: Article content
+
+        Returns:
+            True if the content changed, False if the stored hash already matches
+        """
+        digest = content_hash(content)
+        row = db.get(ArticleContent, article_id)
+        if row is not None and row.content_hash == digest:
+            return False
+
+        if row is None:
+            row = ArticleContent(article_id=article_id)
+            db.add(row)
+        row.content_hash = digest
+        row.content = compress(content)
+        row.size = len(content.encode("utf-8"))
+        db.flush()
+        return True
+
+    @staticmethod
+    def get(db: Session, article_id: int) -> Optional[str]:
+        """Stored content of an article, or None if it is not in the store."""
+        row = db.get(ArticleContent, article_id)
+        record_cache_lookup("content_store", row is not None)
+        return decompress(row.content) if row is not None else None
+
+    @staticmethod
+    def get_many(db: Session, article_ids: Iterable[int]) -> Dict[int, str]:
+        """Stored content for several articles in one query (missing ids are left out)."""
+        article_ids = list(article_ids)
+        if not article_ids:
+            return {}
+
+        rows = db.query(ArticleContent.article_id, ArticleContent.content).filter(
+            ArticleContent.article_id.in_(article_ids)
+        ).all()
+        contents = {article_id: decompress(data) for article_id, data in rows}
+        for article_id in article_ids:
+            record_cache_lookup("content_store", article_id in contents)
+        return contents
+
+    @staticmethod
+    def get_hash(db: Session, article_id: int) -> Optional[str]:
+        """Hash of the stored content, or None if it is not in the store."""
+        return db.query(ArticleContent.content_hash).filter(
+            ArticleContent.article_id == article_id
+        ).scalar()
+
+    @staticmethod
+    def delete(db: Session, article_id: int) -> None:
+        """Remove an article's stored content (committed with the caller's transaction)."""
+        db.query(ArticleContent).filter(ArticleContent.article_id == article_id).delete()
+
+    @staticmethod
+    def get_content(article_id: int, db: Optional[Session] = None) -> Optional[str]:
+        """
+        Article content: the store first, ChromaDB for articles not stored yet.
+
+        Content found only in ChromaDB is copied into the store (in its own
+        session, so the caller's transaction is untouched).
+
+        Args:
+            article_id: Article ID
+            db: Database session (a short-lived one is opened if omitted)
+
+        Returns:
+            Article content, or None if neither the store nor ChromaDB has it
+        """
+        from database import SessionLocal
+        from services.vector_service import VectorService
+
+        if db is not None:
+            content = ContentStore.get(db, article_id)
+        else:
+            session = SessionLocal()
+            try:
+                content = ContentStore.get(session, article_id)
+            except Exception as e:
+                logger.warning(f"Content store unavailable for article {article_id}: {e}")
+                content = None
+            finally:
+                session.close()
+        if content is not None:
+            return content
+
+        content = VectorService.get_article_content(article_id)
+        if content is not None:
+            ContentStore.backfill({article_id: content})
+        return content
+
+    @staticmethod
+    def backfill(contents: Dict[int, str]) -> int:
+        """
+        Copy content read from ChromaDB into the store (own session, best effort).
+
+        Returns:
+            Number of articles stored
+        """
+        from database import SessionLocal
+
+        session = SessionLocal()
+        try:
+            stored = sum(ContentStore.put(session, article_id, content) for article_id, content in contents.items())
+            session.commit()
+            return stored
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Content store backfill failed for {len(contents)} articles: {e}")
+            return 0
+        finally:
+            session.close()
@@ -1,10 +1,18 @@
-"""Google Custom Search API service for content research."""
+"""Google Custom Search API service for content research.
 
+Results are cached (services.search_cache), so repeated queries do not use
+Custom Search quota.
+"""
+
+from functools import lru_cache
 from typing import List, Dict, Optional
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import os
 
+from config import settings
+from services.search_cache import cached_search
+
 
 class GoogleSearchService:
     """
@@ -70,12 +78,27 @@ class GoogleSearchService:
         if not self.is_available():
             raise RuntimeError("Google Search service is not initialized. Check API credentials.")
 
+        num_results = min(num_results, 10)  # API max is 10 per request
+        return cached_search(
+            "google", query,
+            lambda: self._search(query, num_results, date_restrict, sort_by),
+            cx=self.search_engine_id, num=num_results, date_restrict=date_restrict, sort=sort_by,
+        )
+
+    def _search(
+        self,
+        query: str,
+        num_results: int,
+        date_restrict: Optional[str],
+        sort_by: Optional[str]
+    ) -> List[Dict]:
+        """Run a Custom Search request (see search())."""
         try:
             # Build search parameters
             params = {
                 'q': query,
                 'cx': self.search_engine_id,
-                'num': min(num_results, 10)  # API max is 10 per request
+                'num': num_results
             }
 
             if date_restrict:
@@ -179,3 +202,12 @@ class GoogleSearchService:
             num_results=num_results,
             recent_only=True
         )
+
+
+@lru_cache(maxsize=1)
+def get_google_search_service() -> Optional[GoogleSearchService]:
+    """Shared Google Search service, or None if Google Search is not configured."""
+    if not settings.google_search_enabled:
+        return None
+    service = GoogleSearchService(settings.google_api_key, settings.google_search_engine_id)
+    return service if service.is_available() else None
@@ -0,0 +1,617 @@
+"""
+Shared rate limits for OpenAI chat and embedding calls.
+
+Every worker draws from the same per-model token buckets in Redis (the content
+cache server): requests per minute and tokens per minute
+(LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE, per-model overrides in
+LLM_MODEL_LIMITS). A call takes one request and its estimated tokens (prompt
+characters / 4 plus the completion limit) before it is sent, and the estimate
+is corrected with the usage OpenAI reports. A 429 empties the model's buckets,
+so all workers back off together instead of each retrying into the limit.
+While Redis is unavailable each process keeps its own buckets.
+
+Priority classes (llm_priority()):
+    interactive  chat and editing requests (default); may empty the buckets
+    background   resource indexing; leaves 20% of each bucket
+    bulk         regeneration and backfill jobs; leaves 50% of each bucket
+
+A call that has to wait joins a bounded per-process queue for its class
+(LLM_QUEUE_*), and waiting calls of a lower class let waiting calls of a
+higher class go first. A call that finds its queue full, or cannot start
+before its class deadline (LLM_DEADLINE_*_SECONDS), raises LLMOverloadedError.
+
+GovernedChatOpenAI also coalesces identical requests in flight at the same
+time (same model, messages and parameters) into one call (services/single_flight.py),
+and retries routed calls on their fallback models (services/model_router.py).
+
+Usage:
+    llm = GovernedChatOpenAI(model=settings.openai_model, temperature=0.7)
+
+    with llm_priority(BULK):
+        regenerate_all()
+
+    with governor.slot(model, estimate_tokens(text)) as lease:
+        response = client.embeddings.create(input=text, model=model)
+        lease.settle(response.usage.total_tokens)
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import openai
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_openai import ChatOpenAI
+from pydantic import Field
+
+from config import settings
+from metrics import LLM_GOVERNOR_WAIT_SECONDS, is_enabled as metrics_enabled
+from services import content_cache, model_router
+from services.single_flight import request_key, single_flight
+
+logger = logging.getLogger("uvicorn")
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+BULK = "bulk"
+
+# Highest first
+PRIORITIES = (INTERACTIVE, BACKGROUND, BULK)
+
+# Share of each bucket a class leaves to the classes above it
+RESERVE = {INTERACTIVE: 0.0, BACKGROUND: 0.2, BULK: 0.5}
+
+# Completion tokens assumed for calls without max_tokens
+DEFAULT_COMPLETION_TOKENS = 512
+
+# Longest sleep between attempts, so freed capacity is noticed quickly
+MAX_POLL_SECONDS = 1.0
+OUTRANKED_POLL_SECONDS = 0.05
+
+BUCKET_TTL_SECONDS = 120
+
+# KEYS[1] bucket hash; ARGV: requests/min, tokens/min, tokens, reserve share, ttl.
+# Returns the seconds to wait (as a string, Lua numbers become integers), "0" when taken.
+_TAKE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local req_cap = tonumber(ARGV[1])
+local tok_cap = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local reserve = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'req', 'tok', 'ts')
+local req = tonumber(state[1]) or req_cap
+local tok = tonumber(state[2]) or tok_cap
+local elapsed = math.max(0, now - (tonumber(state[3]) or now))
+req = math.min(req_cap, req + elapsed * req_cap / 60)
+tok = math.min(tok_cap, tok + elapsed * tok_cap / 60)
+local wait = 0
+local req_need = 1 + reserve * req_cap
+if req < req_need then wait = (req_need - req) * 60 / req_cap end
+local tok_need = cost + reserve * tok_cap
+if tok < tok_need then wait = math.max(wait, (tok_need - tok) * 60 / tok_cap) end
+if wait == 0 then
+    req = req - 1
+    tok = tok - cost
+end
+redis.call('HSET', KEYS[1], 'req', tostring(req), 'tok', tostring(tok), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[5]))
+return tostring(wait)
+"""
+
+# KEYS[1] bucket hash; ARGV: requests/min, tokens/min, token delta, drain (1/0), ttl.
+_ADJUST_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local req_cap = tonumber(ARGV[1])
+local tok_cap = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'req', 'tok', 'ts')
+local req = tonumber(state[1]) or req_cap
+local tok = tonumber(state[2]) or tok_cap
+local elapsed = math.max(0, now - (tonumber(state[3]) or now))
+req = math.min(req_cap, req + elapsed * req_cap / 60)
+tok = math.min(tok_cap, tok + elapsed * tok_cap / 60)
+if ARGV[4] == '1' then
+    req = 0
+    tok = 0
+else
+    tok = math.max(-tok_cap, math.min(tok_cap, tok + tonumber(ARGV[3])))
+end
+redis.call('HSET', KEYS[1], 'req', tostring(req), 'tok', tostring(tok), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[5]))
+return 1
+"""
+
+_priority: ContextVar[str] = ContextVar("llm_priority", default=INTERACTIVE)
+
+
+class LLMOverloadedError(Exception):
+    """Raised when an LLM call gets no capacity (queue full or deadline passed)."""
+
+    def __init__(self, model: str, priority: str, reason: str):
+        super().__init__(f"No LLM capacity for {model} ({priority}): {reason}")
+        self.model = model
+        self.priority = priority
+        self.reason = reason
+
+
+# Errors after which a routed chat call moves on to its next fallback model
+FALLBACK_ERRORS = (
+    LLMOverloadedError,
+    openai.RateLimitError,
+    openai.NotFoundError,
+    openai.InternalServerError,
+    openai.APIConnectionError,
+)
+
+
+@contextmanager
+def llm_priority(priority: str) -> Iterator[None]:
+    """
+    Run the LLM and embedding calls of a block in a priority class.
+
+    Nested blocks never raise the priority, so background work started by a
+    bulk job stays bulk.
+
+    Raises:
+        ValueError: Unknown priority class
+    """
+    if priority not in RESERVE:
+        raise ValueError(f"Unknown LLM priority: {priority}")
+    token = _priority.set(max(_priority.get(), priority, key=PRIORITIES.index))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    """Priority class of LLM calls made here."""
+    return _priority.get()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of text (4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def model_limits(model: str) -> Tuple[int, int]:
+    """(requests per minute, tokens per minute) for a model."""
+    for entry in settings.llm_model_limits.split(","):
+        name, _, limits = entry.strip().partition("=")
+        if name == model and limits:
+            requests, _, tokens = limits.partition(":")
+            return int(requests), int(tokens)
+    return settings.llm_requests_per_minute, settings.llm_tokens_per_minute
+
+
+def _refill(state: Optional[Tuple[float, float, float]], now: float, req_cap: int, tok_cap: int) -> Tuple[float, float]:
+    if state is None:
+        return float(req_cap), float(tok_cap)
+    req, tok, ts = state
+    elapsed = max(0.0, now - ts)
+    return min(req_cap, req + elapsed * req_cap / 60), min(tok_cap, tok + elapsed * tok_cap / 60)
+
+
+def _wait_seconds(req: float, tok: float, req_cap: int, tok_cap: int, cost: int, reserve: float) -> float:
+    wait = 0.0
+    req_need = 1 + reserve * req_cap
+    if req < req_need:
+        wait = (req_need - req) * 60 / req_cap
+    tok_need = cost + reserve * tok_cap
+    if tok < tok_need:
+        wait = max(wait, (tok_need - tok) * 60 / tok_cap)
+    return wait
+
+
+class _LocalBuckets:
+    """Per-process buckets used while Redis is unavailable (same arithmetic as the scripts)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Dict[str, Tuple[float, float, float]] = {}  # model -> (requests, tokens, time)
+
+    def take(self, model: str, req_cap: int, tok_cap: int, cost: int, reserve: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            req, tok = _refill(self._state.get(model), now, req_cap, tok_cap)
+            wait = _wait_seconds(req, tok, req_cap, tok_cap, cost, reserve)
+            if wait == 0:
+                req -= 1
+                tok -= cost
+            self._state[model] = (req, tok, now)
+            return wait
+
+    def adjust(self, model: str, req_cap: int, tok_cap: int, delta: int, drain: bool = False):
+        with self._lock:
+            now = time.monotonic()
+            req, tok = _refill(self._state.get(model), now, req_cap, tok_cap)
+            if drain:
+                req = tok = 0.0
+            else:
+                tok = max(-tok_cap, min(tok_cap, tok + delta))
+            self._state[model] = (req, tok, now)
+
+    def clear(self):
+        with self._lock:
+            self._state.clear()
+
+
+@dataclass
+class Lease:
+    """Capacity taken for one call; settle() corrects the token estimate."""
+
+    governor: "LLMGovernor"
+    model: str
+    tokens: int = 0
+
+    def settle(self, used_tokens: Optional[int]):
+        """Return unused estimated tokens to the bucket, or take the extra ones used."""
+        if self.tokens and used_tokens is not None and used_tokens != self.tokens:
+            self.governor._adjust(self.model, self.tokens - used_tokens)
+
+    async def asettle(self, used_tokens: Optional[int]):
+        """Async variant of settle() (the Redis update runs in a worker thread)."""
+        if self.tokens and used_tokens is not None and used_tokens != self.tokens:
+            await asyncio.to_thread(self.governor._adjust, self.model, self.tokens - used_tokens)
+
+
+class LLMGovernor:
+    """Cross-worker token buckets with priority classes and bounded wait queues."""
+
+    def __init__(self):
+        self._local = _LocalBuckets()
+        self._lock = threading.Lock()
+        self._waiting: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+
+    @staticmethod
+    def _key(model: str) -> str:
+        return f"llm:bucket:{model}"
+
+    @staticmethod
+    def _queue_limit(priority: str) -> int:
+        return {
+            INTERACTIVE: settings.llm_queue_interactive,
+            BACKGROUND: settings.llm_queue_background,
+            BULK: settings.llm_queue_bulk,
+        }[priority]
+
+    @staticmethod
+    def _deadline_seconds(priority: str) -> float:
+        return {
+            INTERACTIVE: settings.llm_deadline_interactive_seconds,
+            BACKGROUND: settings.llm_deadline_background_seconds,
+            BULK: settings.llm_deadline_bulk_seconds,
+        }[priority]
+
+    def _take(self, model: str, cost: int, priority: str) -> float:
+        """Take one request and `cost` tokens; seconds to wait if there is not enough capacity."""
+        # A call waiting in a higher class goes first
+        rank = PRIORITIES.index(priority)
+        with self._lock:
+            if any(self._waiting[p] for p in PRIORITIES[:rank]):
+                return OUTRANKED_POLL_SECONDS
+
+        req_cap, tok_cap = model_limits(model)
+        reserve = RESERVE[priority]
+        cache = content_cache._get_cache()
+        if cache is not None:
+            try:
+                return float(cache.eval(
+                    _TAKE_SCRIPT, 1, self._key(model), req_cap, tok_cap, cost, reserve, BUCKET_TTL_SECONDS
+                ))
+            except Exception as e:
+                logger.warning(f"LLM governor Redis error: {e}")
+        return self._local.take(model, req_cap, tok_cap, cost, reserve)
+
+    def _adjust(self, model: str, delta: int, drain: bool = False):
+        req_cap, tok_cap = model_limits(model)
+        cache = content_cache._get_cache()
+        if cache is not None:
+            try:
+                cache.eval(
+                    _ADJUST_SCRIPT, 1, self._key(model), req_cap, tok_cap, delta, "1" if drain else "0",
+                    BUCKET_TTL_SECONDS
+                )
+                return
+            except Exception as e:
+                logger.warning(f"LLM governor Redis error: {e}")
+        self._local.adjust(model, req_cap, tok_cap, delta, drain)
+
+    def _cost(self, model: str, tokens: int, priority: str) -> int:
+        # A call larger than the class's share of the bucket waits for the whole share
+        _, tok_cap = model_limits(model)
+        return max(1, min(int(tokens), int(tok_cap * (1 - RESERVE[priority]))))
+
+    def _enqueue(self, model: str, priority: str):
+        with self._lock:
+            if self._waiting[priority] >= self._queue_limit(priority):
+                raise LLMOverloadedError(model, priority, "queue full")
+            self._waiting[priority] += 1
+
+    def _dequeue(self, priority: str):
+        with self._lock:
+            self._waiting[priority] -= 1
+
+    @staticmethod
+    def _check_deadline(model: str, priority: str, wait: float, deadline: float) -> float:
+        """Sleep before the next attempt; raises when the call cannot start before the deadline."""
+        remaining = deadline - time.monotonic()
+        if wait > remaining:
+            raise LLMOverloadedError(model, priority, "deadline passed")
+        return min(wait, MAX_POLL_SECONDS) + random.uniform(0, 0.01)
+
+    @staticmethod
+    def _observe(model: str, priority: str, start: float, status: str):
+        if metrics_enabled():
+            LLM_GOVERNOR_WAIT_SECONDS.observe(time.monotonic() - start, model=model, priority=priority, status=status)
+
+    def acquire(self, model: str, tokens: int, priority: Optional[str] = None) -> Lease:
+        """
+        Wait for capacity for one call.
+
+        Args:
+            model: OpenAI model the call goes to
+            tokens: Estimated prompt plus completion tokens
+            priority: Priority class (default: the current llm_priority())
+
+        Returns:
+            Lease to settle with the tokens the call used
+
+        Raises:
+            LLMOverloadedError: Queue full or no capacity before the class deadline
+        """
+        priority = priority or _priority.get()
+        if not settings.llm_governor_enabled:
+            return Lease(self, model)
+
+        cost = self._cost(model, tokens, priority)
+        wait = self._take(model, cost, priority)
+        if wait:
+            start = time.monotonic()
+            deadline = start + self._deadline_seconds(priority)
+            self._enqueue(model, priority)
+            try:
+                while wait:
+                    time.sleep(self._check_deadline(model, priority, wait, deadline))
+                    wait = self._take(model, cost, priority)
+            except LLMOverloadedError:
+                self._observe(model, priority, start, "rejected")
+                raise
+            finally:
+                self._dequeue(priority)
+            self._observe(model, priority, start, "ok")
+        return Lease(self, model, cost)
+
+    async def aacquire(self, model: str, tokens: int, priority: Optional[str] = None) -> Lease:
+        """
+        Async variant of acquire(): waits without blocking the event loop, and
+        runs the (synchronous) Redis bucket script in a worker thread.
+        """
+        priority = priority or _priority.get()
+        if not settings.llm_governor_enabled:
+            return Lease(self, model)
+
+        cost = self._cost(model, tokens, priority)
+        wait = await asyncio.to_thread(self._take, model, cost, priority)
+        if wait:
+            start = time.monotonic()
+            deadline = start + self._deadline_seconds(priority)
+            self._enqueue(model, priority)
+            try:
+                while wait:
+                    await asyncio.sleep(self._check_deadline(model, priority, wait, deadline))
+                    wait = await asyncio.to_thread(self._take, model, cost, priority)
+            except LLMOverloadedError:
+                self._observe(model, priority, start, "rejected")
+                raise
+            finally:
+                self._dequeue(priority)
+            self._observe(model, priority, start, "ok")
+        return Lease(self, model, cost)
+
+    def throttled(self, model: str):
+        """Empty a model's buckets after a 429 so every worker backs off."""
+        if settings.llm_governor_enabled:
+            logger.warning(f"LLM governor: rate limited by OpenAI ({model}), pausing calls")
+            self._adjust(model, 0, drain=True)
+
+    @contextmanager
+    def slot(self, model: str, tokens: int, priority: Optional[str] = None) -> Iterator[Lease]:
+        """acquire() as a context manager that reports 429s from the block."""
+        lease = self.acquire(model, tokens, priority)
+        try:
+            yield lease
+        except openai.RateLimitError:
+            self.throttled(model)
+            raise
+
+    @asynccontextmanager
+    async def aslot(self, model: str, tokens: int, priority: Optional[str] = None) -> AsyncIterator[Lease]:
+        """Async variant of slot()."""
+        lease = await self.aacquire(model, tokens, priority)
+        try:
+            yield lease
+        except openai.RateLimitError:
+            await asyncio.to_thread(self.throttled, model)
+            raise
+
+    def queued(self) -> Dict[str, int]:
+        """Calls of this process waiting per priority class."""
+        with self._lock:
+            return dict(self._waiting)
+
+    def clear_local(self):
+        """Forget the per-process buckets."""
+        self._local.clear()
+
+
+governor = LLMGovernor()
+
+
+def _used_tokens(result: ChatResult) -> Optional[int]:
+    """Total tokens reported for a chat result (None when the response had no usage)."""
+    usage = (result.llm_output or {}).get("token_usage") or {}
+    if usage.get("total_tokens"):
+        return usage["total_tokens"]
+    total = sum(
+        (getattr(generation.message, "usage_metadata", None) or {}).get("total_tokens", 0)
+        for generation in result.generations
+    )
+    return total or None
+
+
+def _usage(result: ChatResult) -> Tuple[int, int]:
+    """(prompt, completion) tokens reported for a chat result."""
+    usage = (result.llm_output or {}).get("token_usage") or {}
+    if usage.get("total_tokens"):
+        return usage.get("prompt_tokens") or 0, usage.get("completion_tokens") or 0
+    prompt = completion = 0
+    for generation in result.generations:
+        metadata = getattr(generation.message, "usage_metadata", None) or {}
+        prompt += metadata.get("input_tokens", 0)
+        completion += metadata.get("output_tokens", 0)
+    return prompt, completion
+
+
+def _dump_result(result: ChatResult) -> Dict[str, Any]:
+    """JSON data of a chat result, for workers waiting on the same request."""
+    return {
+        "generations": [
+            {"message": message_to_dict(generation.message), "generation_info": generation.generation_info}
+            for generation in result.generations
+        ],
+        "llm_output": result.llm_output,
+    }
+
+
+def _load_result(data: Dict[str, Any]) -> ChatResult:
+    messages = messages_from_dict([generation["message"] for generation in data["generations"]])
+    return ChatResult(
+        generations=[
+            ChatGeneration(message=message, generation_info=generation["generation_info"])
+            for message, generation in zip(messages, data["generations"])
+        ],
+        llm_output=data["llm_output"],
+    )
+
+
+class GovernedChatOpenAI(ChatOpenAI):
+    """
+    ChatOpenAI whose requests go through the governor.
+
+    The priority class comes from llm_priority() at call time unless set on
+    the instance. Identical non-streaming requests in flight share one call.
+    Models built by routed_chat_model() (services/model_router.py) also carry
+    a route name, recorded with each call, and fallback models tried in order
+    when a non-streaming call fails with one of FALLBACK_ERRORS.
+    """
+
+    priority: Optional[str] = None
+    route: Optional[str] = None
+    fallback_models: List[str] = Field(default_factory=list)
+
+    def _estimate(self, messages: List[Any]) -> int:
+        prompt = sum(len(str(message.content)) for message in messages)
+        return prompt // 4 + 1 + (self.max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+    def _request_key(self, messages, stop, kwargs) -> str:
+        return request_key("chat", self._get_request_payload(messages, stop=stop, **kwargs))
+
+    def _models(self) -> List[str]:
+        return list(dict.fromkeys([self.model_name, *self.fallback_models]))
+
+    def _model_kwargs(self, model: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return kwargs if model == self.model_name else {**kwargs, "model": model}
+
+    def _record(self, model: str, start: float, status: str, result: Optional[ChatResult] = None):
+        if self.route:
+            prompt, completion = _usage(result) if result is not None else (0, 0)
+            model_router.record_call(self.route, model, time.perf_counter() - start, status, prompt, completion)
+
+    def _fall_back(self, models: List[str], index: int, error: Exception):
+        if index == len(models) - 1:
+            raise error
+        logger.warning(
+            f"LLM route {self.route or self.model_name}: {models[index]} failed "
+            f"({type(error).__name__}), falling back to {models[index + 1]}"
+        )
+
+    def _call_model(self, model, messages, stop, run_manager, kwargs) -> ChatResult:
+        with governor.slot(model, self._estimate(messages), self.priority) as lease:
+            start = time.perf_counter()
+            try:
+                result = super()._generate(
+                    messages, stop=stop, run_manager=run_manager, **self._model_kwargs(model, kwargs)
+                )
+            except Exception:
+                self._record(model, start, "error")
+                raise
+            lease.settle(_used_tokens(result))
+        self._record(model, start, "ok", result)
+        return result
+
+    async def _acall_model(self, model, messages, stop, run_manager, kwargs) -> ChatResult:
+        async with governor.aslot(model, self._estimate(messages), self.priority) as lease:
+            start = time.perf_counter()
+            try:
+                result = await super()._agenerate(
+                    messages, stop=stop, run_manager=run_manager, **self._model_kwargs(model, kwargs)
+                )
+            except Exception:
+                self._record(model, start, "error")
+                raise
+            await lease.asettle(_used_tokens(result))
+        self._record(model, start, "ok", result)
+        return result
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        def call():
+            models = self._models()
+            for index, model in enumerate(models):
+                try:
+                    return self._call_model(model, messages, stop, run_manager, kwargs)
+                except FALLBACK_ERRORS as e:
+                    self._fall_back(models, index, e)
+
+        key = self._request_key(messages, stop, kwargs)
+        return single_flight.do("chat", key, call, encode=_dump_result, decode=_load_result)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        async def call():
+            models = self._models()
+            for index, model in enumerate(models):
+                try:
+                    return await self._acall_model(model, messages, stop, run_manager, kwargs)
+                except FALLBACK_ERRORS as e:
+                    self._fall_back(models, index, e)
+
+        key = self._request_key(messages, stop, kwargs)
+        return await single_flight.ado("chat", key, call, encode=_dump_result, decode=_load_result)
+
+    def _stream(self, messages, *args, **kwargs):
+        used = None
+        with governor.slot(self.model_name, self._estimate(messages), self.priority) as lease:
+            for chunk in super()._stream(messages, *args, **kwargs):
+                usage = getattr(chunk.message, "usage_metadata", None)
+                if usage:
+                    used = usage.get("total_tokens")
+                yield chunk
+            lease.settle(used)
+
+    async def _astream(self, messages, *args, **kwargs):
+        used = None
+        async with governor.aslot(self.model_name, self._estimate(messages), self.priority) as lease:
+            async for chunk in super()._astream(messages, *args, **kwargs):
+                usage = getattr(chunk.message, "usage_metadata", None)
+                if usage:
+                    used = usage.get("total_tokens")
+                yield chunk
+            await lease.asettle(used)
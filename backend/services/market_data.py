@@ -0,0 +1,570 @@
+"""
+Local market-data store for the yfinance-backed agent tools.
+
+Price history is kept on disk as one Parquet file per (symbol, interval)
+under MARKET_DATA_DIR. A request for a period reads the file and asks the
+provider only for what is missing:
+    tail  bars from the last stored one onwards, once the file is older than
+          the interval's TTL (the last bar is re-fetched, it may be partial)
+    head  bars before the stored range, when a longer period is asked for
+Company info (ticker.info, the slowest yfinance call) is stored as JSON with
+its own TTL. If a top-up fails, the stored data is served.
+
+Several symbols are read with history_many()/info_many(): the missing
+ranges of all symbols are fetched with one bulk provider call per distinct
+range (usually a single yf.download), and missing company info is fetched
+on a thread pool.
+
+Stored bars are indexed by local exchange date (tz-naive) for daily and
+longer intervals and by UTC timestamp for intraday intervals, whichever
+provider call returned them.
+
+Providers are pluggable (MarketDataProvider). YFinanceProvider is the
+default; tests install a fixture provider with set_provider().
+
+Usage:
+    hist = MarketData.history("AAPL", period="1mo", interval="1d")
+    rows = history_records(hist, PRICE_COLUMNS, tail=30)
+    info = MarketData.info("AAPL")
+    frames = MarketData.history_many(["AAPL", "MSFT", "^TNX"], period="3mo")
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config import settings
+from metrics import record_cache_lookup
+
+logger = logging.getLogger("uvicorn")
+
+INTRADAY_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
+DAILY_INTERVALS = {"1d", "5d"}
+
+# Calendar days covered by a period; "1d"/"5d" count trading sessions instead
+_PERIOD_DAYS = {"1mo": 31, "3mo": 92, "6mo": 183, "1y": 366, "2y": 731, "5y": 1827, "10y": 3653}
+_PERIOD_SESSIONS = {"1d": 1, "5d": 5}
+
+_METADATA_KEY = b"market_data"
+
+# Concurrent ticker.info requests in info_many()
+INFO_WORKERS = 8
+
+# Output key -> (history column, decimals; None for integers)
+PRICE_COLUMNS = {
+    "open": ("Open", 2),
+    "high": ("High", 2),
+    "low": ("Low", 2),
+    "close": ("Close", 2),
+    "volume": ("Volume", None),
+}
+
+
+class MarketDataProvider(ABC):
+    """Source of price history and company info."""
+
+    @abstractmethod
+    def history(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[datetime],
+        end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """OHLCV bars indexed by timestamp, from start (None: all history) to end (exclusive)."""
+
+    @abstractmethod
+    def info(self, symbol: str) -> Dict[str, Any]:
+        """Company/instrument info (yfinance ticker.info keys)."""
+
+    def history_many(
+        self,
+        symbols: List[str],
+        interval: str,
+        start: Optional[datetime],
+        end: Optional[datetime] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """Bars of several symbols for one range (providers with a bulk API override this)."""
+        return {symbol: self.history(symbol, interval, start, end) for symbol in symbols}
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Yahoo Finance via yfinance."""
+
+    def history(self, symbol, interval, start, end=None):
+        import yfinance as yf
+
+        ticker = yf.Ticker(symbol)
+        if start is None:
+            return ticker.history(period="max", interval=interval)
+        return ticker.history(start=start, end=end, interval=interval)
+
+    def info(self, symbol):
+        import yfinance as yf
+
+        return yf.Ticker(symbol).info or {}
+
+    def history_many(self, symbols, interval, start, end=None):
+        import yfinance as yf
+
+        # One request round for all symbols (yfinance downloads them on a thread pool)
+        range_args = {"period": "max"} if start is None else {"start": start, "end": end}
+        frame = yf.download(
+            symbols, interval=interval, group_by="ticker", auto_adjust=True,
+            threads=True, progress=False, **range_args,
+        )
+        if frame is None or frame.empty:
+            return {symbol: pd.DataFrame() for symbol in symbols}
+        if not isinstance(frame.columns, pd.MultiIndex):
+            return {symbols[0]: frame.dropna(how="all")}
+
+        tickers = set(frame.columns.get_level_values(0))
+        return {
+            symbol: frame[symbol].dropna(how="all") if symbol in tickers else pd.DataFrame()
+            for symbol in symbols
+        }
+
+
+_provider: MarketDataProvider = YFinanceProvider()
+_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def get_provider() -> MarketDataProvider:
+    return _provider
+
+
+def set_provider(provider: MarketDataProvider) -> MarketDataProvider:
+    """Install a provider; returns the previous one."""
+    global _provider
+    previous, _provider = _provider, provider
+    return previous
+
+
+def _lock(symbol: str, kind: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault((symbol, kind), threading.Lock())
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def ttl_seconds(interval: str) -> float:
+    """How long stored bars of an interval are served before the tail is topped up."""
+    if interval in INTRADAY_INTERVALS:
+        return settings.market_data_intraday_ttl_seconds
+    if interval in DAILY_INTERVALS:
+        return settings.market_data_daily_ttl_seconds
+    return settings.market_data_weekly_ttl_seconds
+
+
+def period_start(period: str, now: datetime) -> Optional[datetime]:
+    """
+    Earliest time a period needs (None for "max").
+
+    Session-counted periods ("1d", "5d") start early enough to span weekends
+    and holidays; history() trims them to the last sessions.
+
+    Raises:
+        ValueError: For an unknown period
+    """
+    if period == "max":
+        return None
+    if period == "ytd":
+        return datetime(now.year, 1, 1, tzinfo=timezone.utc)
+    if period in _PERIOD_SESSIONS:
+        return now - timedelta(days=_PERIOD_SESSIONS[period] * 2 + 4)
+    if period in _PERIOD_DAYS:
+        return now - timedelta(days=_PERIOD_DAYS[period])
+    raise ValueError(f"Unsupported period: {period}")
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[pd.Timestamp]:
+    return pd.Timestamp(value) if value is not None else None
+
+
+def _after(index: pd.Index, start: pd.Timestamp) -> Any:
+    """Boolean mask of index >= start (naive indexes are taken as UTC)."""
+    if index.tz is None:
+        start = start.tz_convert(None)
+    return index >= start
+
+
+def _normalize(hist: Optional[pd.DataFrame], interval: str) -> pd.DataFrame:
+    """
+    Index bars the same way for every provider call.
+
+    Daily and longer bars are keyed by local exchange date (tz-naive), so
+    Ticker.history (exchange timezone) and yf.download (naive dates) agree;
+    intraday bars are keyed by UTC timestamp.
+    """
+    if hist is None or hist.empty or not isinstance(hist.index, pd.DatetimeIndex):
+        return hist if hist is not None else pd.DataFrame()
+    index = hist.index
+    if interval in INTRADAY_INTERVALS:
+        index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+    elif index.tz is not None:
+        index = index.tz_localize(None)
+    return hist.set_axis(index)
+
+
+def _merge(frames: List[Optional[pd.DataFrame]]) -> pd.DataFrame:
+    """Concatenate history frames; a re-fetched bar replaces the stored one."""
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    merged = pd.concat(frames) if len(frames) > 1 else frames[0]
+    return merged[~merged.index.duplicated(keep="last")].sort_index()
+
+
+def history_records(
+    hist: pd.DataFrame,
+    columns: Dict[str, Tuple[str, Optional[int]]],
+    tail: Optional[int] = None,
+    date_format: str = "%Y-%m-%d"
+) -> List[Dict[str, Any]]:
+    """
+    Rows of a history frame as JSON-ready dicts (one vectorized pass, no iterrows).
+
+    Args:
+        hist: Frame returned by MarketData.history()
+        columns: Output key -> (frame column, decimals; None for integers)
+        tail: Keep only the last rows
+        date_format: strftime format of the "date" key
+
+    Returns:
+        List of {"date": ..., <key>: value} dicts (missing values become 0)
+    """
+    if tail is not None:
+        hist = hist.tail(tail)
+    out = pd.DataFrame({"date": hist.index.strftime(date_format)})
+    for key, (column, decimals) in columns.items():
+        values = hist[column].fillna(0) if column in hist else pd.Series(0, index=hist.index)
+        if decimals is None:
+            out[key] = values.astype("int64").to_numpy()
+        else:
+            out[key] = values.astype("float64").round(decimals).to_numpy()
+    return out.to_dict("records")
+
+
+class MarketDataStore:
+    """Parquet files per (symbol, interval) and JSON info files under one directory."""
+
+    def __init__(self, base_dir: Optional[str] = None):
+        self._base_dir = base_dir
+
+    @property
+    def base_dir(self) -> str:
+        return self._base_dir or settings.market_data_dir
+
+    @staticmethod
+    def _file_name(symbol: str) -> str:
+        return re.sub(r"[^A-Za-z0-9^=._-]", "_", symbol)
+
+    def history_path(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.base_dir, "history", interval, f"{self._file_name(symbol)}.parquet")
+
+    def info_path(self, symbol: str) -> str:
+        return os.path.join(self.base_dir, "info", f"{self._file_name(symbol)}.json")
+
+    @staticmethod
+    def _write_atomic(path: str, write) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def read_history(self, symbol: str, interval: str) -> Tuple[Optional[pd.DataFrame], Dict[str, Any]]:
+        """Stored bars and their metadata ({"fetched_at", "covered_from"}), or (None, {})."""
+        path = self.history_path(symbol, interval)
+        if not os.path.exists(path):
+            return None, {}
+        try:
+            table = pq.read_table(path)
+            metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b"{}"))
+            return table.to_pandas(), metadata
+        except Exception as e:
+            logger.warning(f"Unreadable market data file {path}: {e}")
+            return None, {}
+
+    def write_history(self, symbol: str, interval: str, hist: pd.DataFrame, metadata: Dict[str, Any]) -> None:
+        table = pa.Table.from_pandas(hist, preserve_index=True)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            _METADATA_KEY: json.dumps(metadata).encode(),
+        })
+        self._write_atomic(self.history_path(symbol, interval), lambda p: pq.write_table(table, p))
+
+    def read_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Stored {"fetched_at", "info"} for a symbol, or None."""
+        try:
+            with open(self.info_path(symbol)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def write_info(self, symbol: str, info: Dict[str, Any]) -> None:
+        payload = json.dumps({"fetched_at": time.time(), "info": info}, default=str)
+
+        def write(path):
+            with open(path, "w") as f:
+                f.write(payload)
+
+        self._write_atomic(self.info_path(symbol), write)
+
+
+store = MarketDataStore()
+
+
+@dataclass
+class _TopUp:
+    """What one symbol needs from the provider to cover a period."""
+    symbol: str
+    stored: Optional[pd.DataFrame]
+    metadata: Dict[str, Any]
+    covered_from: Optional[datetime]
+    fetches: List[Tuple[Optional[datetime], Optional[datetime]]] = field(default_factory=list)
+    refresh: bool = False
+
+
+class MarketData:
+    """Price history and company info, served from the local store when possible."""
+
+    @staticmethod
+    def history(symbol: str, period: str = "1mo", interval: str = "1d") -> pd.DataFrame:
+        """
+        OHLCV bars of a symbol for a period (same columns as yfinance's Ticker.history).
+
+        Args:
+            symbol: Ticker symbol (e.g. "AAPL", "^TNX", "EURUSD=X")
+            period: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
+            interval: 1m ... 1h, 1d, 5d, 1wk, 1mo, 3mo
+
+        Returns:
+            DataFrame indexed by bar date/timestamp (empty if the symbol has no data)
+
+        Raises:
+            ValueError: For an unknown period
+            Exception: Provider errors when nothing is stored for the symbol
+        """
+        symbol = symbol.strip().upper()
+        now = _now()
+        start = period_start(period, now)
+
+        if not settings.market_data_enabled:
+            hist = _normalize(_provider.history(symbol, interval, start), interval)
+            return MarketData._slice(hist, period, start)
+
+        with _lock(symbol, interval):
+            plan = MarketData._plan(symbol, interval, start, now)
+            try:
+                fetched = [_provider.history(symbol, interval, s, e) for s, e in plan.fetches]
+            except Exception as e:
+                if plan.stored is None:
+                    raise
+                logger.warning(f"Market data top-up failed for {symbol} ({interval}), serving stored bars: {e}")
+                fetched = None
+            hist = MarketData._apply(plan, interval, start, now, fetched)
+        return MarketData._slice(hist, period, start)
+
+    @staticmethod
+    def history_many(symbols: Iterable[str], period: str = "1mo", interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """
+        Bars of several symbols for a period, with one bulk provider call per missing range.
+
+        Symbols whose download fails get their stored bars, or an empty frame
+        if nothing is stored (history() would raise instead).
+
+        Returns:
+            Dict of normalized symbol -> DataFrame, in the order given
+
+        Raises:
+            ValueError: For an unknown period
+        """
+        symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+        now = _now()
+        start = period_start(period, now)
+        if not symbols:
+            return {}
+
+        if not settings.market_data_enabled:
+            frames = MarketData._download(symbols, interval, start, None) or {}
+            return {s: MarketData._slice(_normalize(frames.get(s), interval), period, start) for s in symbols}
+
+        with ExitStack() as stack:
+            for symbol in sorted(symbols):
+                stack.enter_context(_lock(symbol, interval))
+
+            plans = {symbol: MarketData._plan(symbol, interval, start, now) for symbol in symbols}
+
+            # Symbols needing the same range share one bulk call
+            ranges: Dict[Tuple[Optional[datetime], Optional[datetime]], List[str]] = {}
+            for plan in plans.values():
+                for fetch_range in plan.fetches:
+                    ranges.setdefault(fetch_range, []).append(plan.symbol)
+
+            fetched: Dict[str, List[pd.DataFrame]] = {symbol: [] for symbol in symbols}
+            failed = set()
+            for (range_start, range_end), range_symbols in ranges.items():
+                frames = MarketData._download(range_symbols, interval, range_start, range_end)
+                if frames is None:
+                    failed.update(range_symbols)
+                    continue
+                for symbol in range_symbols:
+                    fetched[symbol].append(frames.get(symbol))
+
+            result = {}
+            for symbol, plan in plans.items():
+                if symbol in failed and plan.stored is None:
+                    result[symbol] = pd.DataFrame()
+                    continue
+                hist = MarketData._apply(plan, interval, start, now, None if symbol in failed else fetched[symbol])
+                result[symbol] = MarketData._slice(hist, period, start)
+        return result
+
+    @staticmethod
+    def _download(
+        symbols: List[str],
+        interval: str,
+        start: Optional[datetime],
+        end: Optional[datetime]
+    ) -> Optional[Dict[str, pd.DataFrame]]:
+        """One bulk provider call (None if it failed)."""
+        try:
+            return _provider.history_many(symbols, interval, start, end)
+        except Exception as e:
+            logger.warning(f"Market data download failed for {', '.join(symbols)} ({interval}): {e}")
+            return None
+
+    @staticmethod
+    def _plan(symbol: str, interval: str, start: Optional[datetime], now: datetime) -> _TopUp:
+        """Ranges to fetch so the stored bars of symbol/interval cover start up to now."""
+        stored, metadata = store.read_history(symbol, interval)
+        if stored is None:
+            record_cache_lookup("market_data", False)
+            return _TopUp(symbol, None, {}, start, fetches=[(start, None)], refresh=True)
+
+        stored = _normalize(stored, interval)
+        covered_from = metadata.get("covered_from")
+        covered_from = datetime.fromisoformat(covered_from) if covered_from else None
+        plan = _TopUp(symbol, stored, metadata, covered_from)
+
+        if covered_from is not None and (start is None or start < covered_from):
+            plan.fetches.append((start, covered_from))
+            plan.covered_from = start
+        if now.timestamp() - metadata.get("fetched_at", 0) >= ttl_seconds(interval):
+            plan.fetches.append((MarketData._tail_start(stored, interval, covered_from), None))
+            plan.refresh = True
+        record_cache_lookup("market_data", not plan.fetches)
+        return plan
+
+    @staticmethod
+    def _tail_start(stored: pd.DataFrame, interval: str, covered_from: Optional[datetime]) -> Optional[datetime]:
+        """Start of a tail top-up: the last stored bar (a day earlier for daily bars, whose dates are local)."""
+        if stored.empty:
+            return covered_from
+        last = stored.index[-1]
+        if interval in INTRADAY_INTERVALS:
+            return last.to_pydatetime()
+        return (last - pd.Timedelta(days=1)).to_pydatetime().replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def _apply(
+        plan: _TopUp,
+        interval: str,
+        start: Optional[datetime],
+        now: datetime,
+        fetched: Optional[List[pd.DataFrame]]
+    ) -> pd.DataFrame:
+        """Merge fetched bars into the stored ones and write them back (fetched None: top-up failed)."""
+        if fetched is None or not plan.fetches:
+            return plan.stored
+
+        hist = _merge([plan.stored] + [_normalize(f, interval) for f in fetched])
+        store.write_history(plan.symbol, interval, hist, {
+            "fetched_at": now.timestamp() if plan.refresh else plan.metadata.get("fetched_at", 0),
+            "covered_from": plan.covered_from.isoformat() if plan.covered_from else None,
+        })
+        return hist
+
+    @staticmethod
+    def _slice(hist: pd.DataFrame, period: str, start: Optional[datetime]) -> pd.DataFrame:
+        """Bars of the requested period out of the stored range."""
+        if hist.empty:
+            return hist
+        if period in _PERIOD_SESSIONS:
+            sessions = pd.Index(hist.index.normalize()).unique()[-_PERIOD_SESSIONS[period]:]
+            return hist[hist.index.normalize().isin(sessions)]
+        if start is None:
+            return hist
+        return hist[_after(hist.index, _timestamp(start))]
+
+    @staticmethod
+    def info(symbol: str) -> Dict[str, Any]:
+        """
+        Company/instrument info (yfinance ticker.info), stored for MARKET_DATA_INFO_TTL_SECONDS.
+
+        Raises:
+            Exception: Provider errors when nothing is stored for the symbol
+        """
+        symbol = symbol.strip().upper()
+        if not settings.market_data_enabled:
+            return _provider.info(symbol)
+
+        with _lock(symbol, "info"):
+            stored = store.read_info(symbol)
+            fresh = stored is not None and time.time() - stored["fetched_at"] < settings.market_data_info_ttl_seconds
+            record_cache_lookup("market_data_info", fresh)
+            if fresh:
+                return stored["info"]
+            try:
+                info = _provider.info(symbol)
+            except Exception as e:
+                if stored is None:
+                    raise
+                logger.warning(f"Market data info refresh failed for {symbol}, serving stored info: {e}")
+                return stored["info"]
+            store.write_info(symbol, info)
+            return info
+
+    @staticmethod
+    def info_many(symbols: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Info of several symbols, fetching those not stored concurrently.
+
+        Returns:
+            Dict of normalized symbol -> info ({} for symbols whose info could not be fetched)
+        """
+        symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+        if not symbols:
+            return {}
+
+        def fetch(symbol: str) -> Dict[str, Any]:
+            try:
+                return MarketData.info(symbol)
+            except Exception as e:
+                logger.warning(f"Market data info failed for {symbol}: {e}")
+                return {}
+
+        with ThreadPoolExecutor(max_workers=min(INFO_WORKERS, len(symbols))) as executor:
+            return dict(zip(symbols, executor.map(fetch, symbols)))
@@ -0,0 +1,183 @@
+"""
+Chat model routing by node and task.
+
+Every LLM call site names a route "<node>.<task>" (content_gen.headline,
+analyst.keywords, reader.answer, ...). Short, cheap tasks (FAST_ROUTES:
+headlines, keywords, intent classification) run on LLM_FAST_MODEL;
+everything else on OPENAI_MODEL. LLM_ROUTES overrides this with
+comma-separated entries:
+
+    route=model[|fallback...]      content_gen.content=gpt-4o|gpt-4o-mini
+    node=model                     reader=gpt-4o-mini (every reader.* task)
+    agent_type:route=model         equity:content_gen.content=gpt-4o
+
+agent_type entries apply to topics whose Topic.agent_type matches, so a topic
+can be moved to another model by giving it its own agent type. Lookup order:
+agent_type:route, agent_type:node, route, node, built-in default.
+
+When a routed model is overloaded, rate limited or unavailable the call is
+retried on its fallbacks in order (by default fast routes fall back to
+OPENAI_MODEL). Latency, tokens and estimated cost (LLM_MODEL_PRICES) are
+recorded per route and model in the llm_route_* metrics.
+
+Usage:
+    llm = routed_chat_model("content_gen.headline", topic=topic, temperature=0.7)
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from config import settings
+from metrics import LLM_ROUTE_COST_USD, LLM_ROUTE_SECONDS, LLM_ROUTE_TOKENS
+
+logger = logging.getLogger("uvicorn")
+
+# Routes served by LLM_FAST_MODEL unless overridden
+FAST_ROUTES = frozenset({
+    "intent.classify",
+    "content_gen.headline",
+    "content_gen.keywords",
+    "article_content.headline",
+    "article_content.keywords",
+    "analyst.headline",
+    "analyst.keywords",
+})
+
+# Topic agent types are re-read at least this often (other workers' edits)
+TOPIC_CACHE_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class Route:
+    """Resolved route: the model to call and the models to fall back to."""
+
+    name: str
+    model: str
+    fallbacks: Tuple[str, ...] = ()
+
+
+def _overrides() -> Dict[str, Tuple[str, ...]]:
+    """LLM_ROUTES as {key: (model, fallback, ...)}."""
+    overrides = {}
+    for entry in settings.llm_routes.split(","):
+        key, _, models = entry.strip().partition("=")
+        chain = tuple(model.strip() for model in models.split("|") if model.strip())
+        if key and chain:
+            overrides[key.strip()] = chain
+    return overrides
+
+
+def _default(route: str) -> Tuple[str, ...]:
+    if route == "intent.classify" and settings.intent_classifier_model:
+        return (settings.intent_classifier_model,)
+    if route in FAST_ROUTES:
+        return (settings.llm_fast_model, settings.openai_model)
+    return (settings.openai_model,)
+
+
+def resolve(route: str, agent_type: Optional[str] = None) -> Route:
+    """
+    Resolve the model chain for a route.
+
+    Args:
+        route: "<node>.<task>" name of the call site
+        agent_type: Topic.agent_type of the topic the call is for, if any
+
+    Returns:
+        Route with the model and its fallbacks (duplicates removed)
+    """
+    node = route.partition(".")[0]
+    keys = [route, node]
+    if agent_type:
+        keys = [f"{agent_type}:{route}", f"{agent_type}:{node}"] + keys
+
+    overrides = _overrides()
+    chain = next((overrides[key] for key in keys if key in overrides), None) or _default(route)
+    chain = tuple(dict.fromkeys(chain))
+    return Route(name=route, model=chain[0], fallbacks=chain[1:])
+
+
+@lru_cache(maxsize=256)
+def _topic_agent_type(topic: str, epoch: int) -> Optional[str]:
+    from database import SessionLocal
+    from models import Topic
+
+    db = SessionLocal()
+    try:
+        row = db.query(Topic.agent_type).filter(Topic.slug == topic).first()
+        return row[0] if row else None
+    finally:
+        db.close()
+
+
+def topic_agent_type(topic: Optional[str]) -> Optional[str]:
+    """Topic.agent_type for a topic slug (cached; None when unknown or the DB is unavailable)."""
+    if not topic:
+        return None
+    try:
+        return _topic_agent_type(topic, int(time.time() // TOPIC_CACHE_SECONDS))
+    except Exception as e:
+        logger.warning(f"Could not load agent type for topic '{topic}': {e}")
+        return None
+
+
+def clear_topic_cache():
+    """Forget cached topic agent types (after a topic is changed)."""
+    _topic_agent_type.cache_clear()
+
+
+def routed_chat_model(route: str, topic: Optional[str] = None, **kwargs):
+    """
+    Chat model for a route, with fallbacks and per-route accounting.
+
+    Args:
+        route: "<node>.<task>" name of the call site
+        topic: Topic slug the call is for (selects agent_type overrides)
+        **kwargs: Further GovernedChatOpenAI arguments (temperature, max_tokens, ...)
+
+    Returns:
+        GovernedChatOpenAI for the route's model
+    """
+    from services.llm_client import GovernedChatOpenAI
+
+    resolved = resolve(route, topic_agent_type(topic))
+    kwargs.setdefault("api_key", settings.openai_api_key)
+    return GovernedChatOpenAI(
+        model=resolved.model,
+        route=resolved.name,
+        fallback_models=list(resolved.fallbacks),
+        **kwargs,
+    )
+
+
+def model_prices(model: str) -> Optional[Tuple[float, float]]:
+    """(USD per 1M prompt tokens, USD per 1M completion tokens) for a model, None if unpriced."""
+    for entry in settings.llm_model_prices.split(","):
+        name, _, prices = entry.strip().partition("=")
+        if name == model and prices:
+            prompt, _, completion = prices.partition(":")
+            return float(prompt), float(completion or prompt)
+    return None
+
+
+def record_call(
+    route: str,
+    model: str,
+    seconds: float,
+    status: str,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+):
+    """Record latency, tokens and estimated cost of one call on a route."""
+    LLM_ROUTE_SECONDS.observe(seconds, route=route, model=model, status=status)
+    if prompt_tokens:
+        LLM_ROUTE_TOKENS.inc(prompt_tokens, route=route, model=model, kind="prompt")
+    if completion_tokens:
+        LLM_ROUTE_TOKENS.inc(completion_tokens, route=route, model=model, kind="completion")
+    prices = model_prices(model)
+    if prices and (prompt_tokens or completion_tokens):
+        cost = (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1_000_000
+        LLM_ROUTE_COST_USD.inc(cost, route=route, model=model)
@@ -0,0 +1,215 @@
+"""
+Cursor (keyset) pagination and cached listing totals.
+
+Listings ordered newest first page on (created_at, id): the cursor holds the
+last row's values and the next page is `WHERE (created_at, id) < cursor`, so
+a deep page costs the same as the first one (no OFFSET scan). Rank-ordered
+listings (free-text search) carry a plain offset in the cursor instead.
+Cursors are opaque URL-safe strings; clients pass back `next_cursor`.
+
+Totals are kept per process for LISTING_COUNT_REFRESH_SECONDS. Older totals are still
+returned (marked as not exact) while a background thread recounts them with
+its own session; `exact=True` always counts.
+
+Usage:
+    rows, next_cursor = keyset_page(query, Resource.created_at, Resource.id, cursor, limit)
+    total, exact = counts.total(("resources", group_id), lambda s: build_query(s).count(), db)
+"""
+
+import base64
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import and_, desc, or_
+from sqlalchemy.orm import Query, Session
+
+from config import settings
+
+logger = logging.getLogger("uvicorn")
+
+
+class InvalidCursorError(ValueError):
+    """Raised for a cursor that was not produced by encode_cursor()."""
+
+
+@dataclass
+class Page:
+    """One page of a listing."""
+    items: List[Any]
+    total: int
+    total_exact: bool = True
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: Optional[Any] = None, row_id: Optional[int] = None, offset: Optional[int] = None) -> str:
+    """Opaque cursor for a keyset position (created_at, id) or a plain offset."""
+    if offset is not None:
+        payload = {"o": offset}
+    else:
+        if isinstance(created_at, datetime):
+            created_at = created_at.isoformat()
+        payload = {"c": created_at, "i": row_id}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor into {"created_at": datetime, "id": int} or {"offset": int}.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if "o" in payload:
+            return {"offset": max(0, int(payload["o"]))}
+        return {"created_at": datetime.fromisoformat(payload["c"]), "id": int(payload["i"])}
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def keyset_page(
+    query: Query,
+    created_column,
+    id_column,
+    cursor: Optional[str],
+    limit: int,
+    offset: int = 0
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    One page of a query ordered newest first by (created_at, id).
+
+    Args:
+        query: Filtered query (without order_by/offset/limit)
+        created_column: Creation timestamp column
+        id_column: Primary key column (tie breaker)
+        cursor: Cursor of the previous page, None for the first page
+        limit: Page size
+        offset: Plain offset, used only without a cursor (older clients)
+
+    Returns:
+        Tuple of (rows, cursor of the next page or None on the last page)
+    """
+    if cursor:
+        position = decode_cursor(cursor)
+        if "offset" in position:
+            offset = position["offset"]
+        else:
+            offset = 0
+            query = query.filter(or_(
+                created_column < position["created_at"],
+                and_(created_column == position["created_at"], id_column < position["id"]),
+            ))
+
+    rows = query.order_by(desc(created_column), desc(id_column)).offset(offset).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, created_column.key), getattr(last, id_column.key))
+
+
+def offset_page(query: Query, offset: int, limit: int) -> Tuple[List[Any], Optional[str]]:
+    """One page of an already ordered query (rank order) with an offset cursor."""
+    rows = query.offset(offset).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], encode_cursor(offset=offset + limit)
+
+
+def page_offset(cursor: Optional[str], offset: int = 0) -> int:
+    """Offset for rank-ordered listings (an offset cursor wins over the offset parameter)."""
+    if cursor:
+        position = decode_cursor(cursor)
+        if "offset" not in position:
+            raise InvalidCursorError("Cursor does not belong to a ranked listing")
+        return position["offset"]
+    return offset
+
+
+class CountCache:
+    """Per-process listing totals, recounted in the background once stale."""
+
+    def __init__(self, refresh_seconds: Optional[float] = None, max_entries: int = 1024):
+        self._refresh_seconds = refresh_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[int, float]] = {}
+        self._refreshing: set = set()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="count-refresh")
+
+    @property
+    def refresh_seconds(self) -> float:
+        if self._refresh_seconds is not None:
+            return self._refresh_seconds
+        return settings.listing_count_refresh_seconds
+
+    def total(self, key: Hashable, count: Callable[[Session], int], db: Session, exact: bool = False) -> Tuple[int, bool]:
+        """
+        Total number of rows of a listing.
+
+        Args:
+            key: Listing identity (name and filters)
+            count: Runs the count query on the given session
+            db: Request session (used when counting inline)
+            exact: Always count now
+
+        Returns:
+            Tuple of (total, True if it was counted now or within the refresh interval)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and not exact:
+            value, counted_at = entry
+            if time.monotonic() - counted_at < self.refresh_seconds:
+                return value, True
+            self._schedule_refresh(key, count)
+            return value, False
+
+        value = count(db)
+        self._store(key, value)
+        return value, True
+
+    def _store(self, key: Hashable, value: int):
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (value, time.monotonic())
+
+    def _schedule_refresh(self, key: Hashable, count: Callable[[Session], int]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._executor.submit(self._refresh, key, count)
+
+    def _refresh(self, key: Hashable, count: Callable[[Session], int]):
+        from database import SessionLocal
+
+        session = SessionLocal()
+        try:
+            self._store(key, count(session))
+        except Exception as e:
+            logger.warning(f"Count refresh failed for {key}: {e}")
+        finally:
+            session.close()
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, prefix: Optional[str] = None):
+        """Forget totals (all, or those whose key starts with prefix); they are counted on next use."""
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if isinstance(k, tuple) and k and k[0] == prefix]:
+                    del self._entries[key]
+
+
+counts = CountCache()
@@ -4,7 +4,6 @@ from io import BytesIO
 from typing import Optional
 import markdown2
 from datetime import datetime
-import re
 import os
 import logging
 
@@ -15,41 +14,27 @@ class PDFService:
     """Service for generating PDF documents from articles."""
 
     @staticmethod
-    def _get_table_image_url(db, hash_id: str, base_url: str) -> Optional[str]:
+    def _get_table_image_url(links, hash_id: str, base_url: str) -> Optional[str]:
         """
         Get the image child resource URL for a table.
 
         Args:
-            db: Database session
+            links: Preloaded resource links (ResolvedResourceLinks)
             hash_id: Hash ID of the table resource
             base_url: Base URL for content
 
         Returns:
             Image URL or None if not found
         """
-        from models import Resource, ResourceType
-
-        if not db:
-            return None
-
-        # Find the table resource
-        table_resource = db.query(Resource).filter(Resource.hash_id == hash_id).first()
-        if not table_resource:
-            return None
-
-        # Find the IMAGE child resource
-        image_child = db.query(Resource).filter(
-            Resource.parent_id == table_resource.id,
-            Resource.resource_type == ResourceType.IMAGE,
-            Resource.is_active == True
-        ).first()
+        from models import ResourceType
 
+        image_child = links.child_of_type(hash_id, ResourceType.IMAGE, active_only=True)
         if image_child:
             return f"{base_url}/api/r/{image_child.hash_id}"
         return None
 
     @staticmethod
-    def process_resource_links(content: str, base_url: str = "", db=None) -> str:
+    def process_resource_links(content: str, base_url: str = "", db=None, links=None) -> str:
         """
         Process [name](resource:hash_id) links for PDF output.
 
@@ -60,29 +45,26 @@ class PDFService:
             content: Markdown content with resource links
             base_url: Base URL for resource content
             db: Optional database session for looking up resource types
+            links: Preloaded resource links (resolved from content when not given)
 
         Returns:
             Processed markdown content
         """
-        from models import Resource
+        from models import ResourceType
+        from services.resource_link_resolver import ResourceLinkResolver
 
-        pattern = r'\[([^\]]+)\]\(resource:([a-zA-Z0-9]+)\)'
+        if links is None:
+            links = ResourceLinkResolver.resolve(db, content)
 
-        def replace_resource(match):
-            name = match.group(1)
-            hash_id = match.group(2)
+        def replace_resource(name: str, hash_id: str) -> str:
             content_url = f"{base_url}/api/r/{hash_id}"
 
             # Check resource type
-            resource_type = None
-            if db:
-                resource = db.query(Resource).filter(Resource.hash_id == hash_id).first()
-                if resource:
-                    resource_type = resource.resource_type.value if resource.resource_type else None
+            resource_type = links.resource_type(hash_id)
 
             if resource_type == 'table':
                 # Try to get table image URL
-                image_url = PDFService._get_table_image_url(db, hash_id, base_url)
+                image_url = PDFService._get_table_image_url(links, hash_id, base_url)
                 if image_url:
                     return f'\n\n**{name}**\n\n![{name}]({image_url})\n\n'
                 else:
@@ -91,32 +73,24 @@ class PDFService:
                 return f'![{name}]({content_url})'
             elif resource_type == 'article':
                 # For ARTICLE resources (published article popup), include links to child resources
-                pdf_url = None
-                html_url = None
-                if db:
-                    article_resource = db.query(Resource).filter(Resource.hash_id == hash_id).first()
-                    if article_resource:
-                        for child in article_resource.children:
-                            if child.resource_type and child.resource_type.value == 'pdf':
-                                pdf_url = f"{base_url}/api/r/{child.hash_id}"
-                            elif child.resource_type and child.resource_type.value == 'html':
-                                html_url = f"{base_url}/api/r/{child.hash_id}"
+                pdf_child = links.child_of_type(hash_id, ResourceType.PDF)
+                html_child = links.child_of_type(hash_id, ResourceType.HTML)
 
                 # Build reference text with available links
-                links = [f"[View Article]({content_url})"]
-                if html_url:
-                    links.append(f"[HTML]({html_url})")
-                if pdf_url:
-                    links.append(f"[PDF]({pdf_url})")
+                refs = [f"[View Article]({content_url})"]
+                if html_child:
+                    refs.append(f"[HTML]({base_url}/api/r/{html_child.hash_id})")
+                if pdf_child:
+                    refs.append(f"[PDF]({base_url}/api/r/{pdf_child.hash_id})")
 
-                return f'\n\n> **{name}**\n> {" | ".join(links)}\n\n'
+                return f'\n\n> **{name}**\n> {" | ".join(refs)}\n\n'
             elif resource_type == 'html':
                 # For HTML resources, just show as link (can't embed iframe in PDF)
                 return f'[{name}]({content_url})'
             else:
                 return f'[{name}]({content_url})'
 
-        return re.sub(pattern, replace_resource, content)
+        return ResourceLinkResolver.substitute(content, replace_resource)
 
     @staticmethod
     def generate_article_pdf(
@@ -129,7 +103,8 @@ class PDFService:
         rating: int = None,
         rating_count: int = 0,
         base_url: str = "",
-        db=None
+        db=None,
+        links=None
     ) -> BytesIO:
         """
         Generate a PDF document for an article using weasyprint.
@@ -145,6 +120,7 @@ class PDFService:
             rating_count: Number of ratings
             base_url: Base URL for resource content links
             db: Optional database session for resource type lookup
+            links: Optional preloaded resource links (avoids per-link queries)
 
         Returns:
             BytesIO object containing the PDF
@@ -157,7 +133,7 @@ class PDFService:
 
         # Process resource links
         if base_url:
-            content = PDFService.process_resource_links(content, base_url, db)
+            content = PDFService.process_resource_links(content, base_url, db, links)
 
         # Convert markdown to HTML
         html_content = markdown2.markdown(
@@ -0,0 +1,322 @@
+"""
+Concurrent batch enrichment of resources.
+
+Generates descriptions and keywords for many text and table resources at
+once (ResourceProcessingAgent.batch_process_resources):
+
+- Resources are loaded in one query (text and table data joined in).
+- Metadata is generated by up to RESOURCE_ENRICHMENT_CONCURRENCY workers.
+  The calls run in the bulk LLM priority class, so the LLM governor's shared
+  rate limits keep half of each bucket for interactive and background calls.
+- Every RESOURCE_ENRICHMENT_BATCH_SIZE finished resources, descriptions are
+  committed in one transaction and written to ChromaDB in one request
+  (metadata merged into indexed documents; resources missing from ChromaDB
+  are embedded and upserted).
+- After each batch the completed resource ids are checkpointed in Redis
+  under the job ID (by default a hash of the resource ids), so running the
+  same batch again after a crash skips the resources already done.
+- If a user is given, progress is published on their websocket notification
+  channel ({"type": "resource_enrichment_progress", ...}).
+
+Other resource types (PDFs) are handed to a callback one at a time in the
+calling thread.
+
+Usage:
+    enricher = ResourceEnricher(agent.generate_metadata, db, user_id=user_id)
+    report = enricher.run(resource_ids)
+    report["succeeded"], report["failed"], report["skipped"]
+"""
+
+import contextvars
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session, joinedload
+
+from config import settings
+from models import Resource, ResourceType
+from services.content_cache import ContentCache
+from services.llm_client import BULK, llm_priority
+from services.resource_service import ResourceService
+from services.vector_service import VectorService
+
+logger = logging.getLogger("uvicorn")
+
+ENRICHED_TYPES = (ResourceType.TEXT.value, ResourceType.TABLE.value)
+
+# Prefix of the generated job IDs
+JOB_PREFIX = "resources"
+
+
+@dataclass
+class EnrichmentItem:
+    """A resource loaded for enrichment."""
+    resource_id: int
+    resource_type: str
+    name: str
+    content: str
+    created_by: Optional[int]
+    parent_id: Optional[int]
+    indexed: bool
+
+
+def table_summary(columns: List[str], rows: List[List[Any]]) -> str:
+    """Text representation of a table for metadata generation (columns, row count, first 5 rows)."""
+    text = f"Table with columns: {', '.join(columns)}\n"
+    text += f"Number of rows: {len(rows)}\n"
+    if rows:
+        text += "Sample data (first 5 rows):\n"
+        for i, row in enumerate(rows[:5]):
+            text += f"  Row {i+1}: {dict(zip(columns, row))}\n"
+    return text
+
+
+def job_id_for(resource_ids: List[int]) -> str:
+    """Job ID of a batch: the same resource ids always give the same ID."""
+    raw = ",".join(str(rid) for rid in sorted(set(resource_ids)))
+    return f"{JOB_PREFIX}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]}"
+
+
+def load_resources(db: Session, resource_ids: List[int]) -> Dict[int, EnrichmentItem]:
+    """
+    Load active resources with their text and table data in one query.
+
+    Returns:
+        {resource_id: EnrichmentItem}; unknown ids are left out and content is
+        empty for types other than text and table
+    """
+    rows = db.query(Resource).options(
+        joinedload(Resource.text_resource),
+        joinedload(Resource.table_resource),
+    ).filter(
+        Resource.id.in_(resource_ids),
+        Resource.is_active == True
+    ).all()
+
+    loaded: Dict[int, EnrichmentItem] = {}
+    for row in rows:
+        rt = row.resource_type.value if hasattr(row.resource_type, "value") else row.resource_type
+        content, indexed = "", False
+        if rt == ResourceType.TEXT.value and row.text_resource:
+            content, indexed = row.text_resource.content, bool(row.text_resource.chromadb_id)
+        elif rt == ResourceType.TABLE.value and row.table_resource:
+            data = json.loads(row.table_resource.table_data)
+            if data.get("data"):
+                content = table_summary(data.get("columns", []), data.get("data", []))
+            indexed = bool(row.table_resource.chromadb_id)
+        loaded[row.id] = EnrichmentItem(
+            resource_id=row.id,
+            resource_type=rt,
+            name=row.name,
+            content=content or "",
+            created_by=row.created_by,
+            parent_id=row.parent_id,
+            indexed=indexed,
+        )
+    return loaded
+
+
+class ResourceEnricher:
+    """Bounded worker pool generating metadata, with batched writes and checkpoints."""
+
+    def __init__(
+        self,
+        describe: Callable[[int, str, str], Dict[str, Any]],
+        db: Session,
+        user_id: Optional[int] = None,
+        process_other: Optional[Callable[[int, str, Optional[int]], Dict[str, Any]]] = None,
+        concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            describe: generate_metadata(resource_id, content, resource_type);
+                returns {"success", "metadata", ...} and must not use the session
+            db: Database session (used by the calling thread only)
+            user_id: User to notify of progress (also recorded as modifier)
+            process_other: Called with (resource_id, resource_type, created_by)
+                for resources that are neither text nor tables
+            concurrency: Workers (default: resource_enrichment_concurrency)
+            batch_size: Resources per write and checkpoint (default:
+                resource_enrichment_batch_size)
+        """
+        self.describe = describe
+        self.db = db
+        self.user_id = user_id
+        self.process_other = process_other
+        self.concurrency = concurrency or settings.resource_enrichment_concurrency
+        self.batch_size = batch_size or settings.resource_enrichment_batch_size
+
+    def _enrich(self, item: EnrichmentItem, update_resources: bool) -> Dict[str, Any]:
+        """Worker: generate metadata (and an embedding for resources missing from ChromaDB)."""
+        if not item.content:
+            return {"success": False, "error": f"Resource has no {item.resource_type} data"}
+        result = self.describe(item.resource_id, item.content, item.resource_type)
+        if result.get("success") and update_resources and not item.indexed:
+            result["embedding"] = VectorService._generate_embedding(item.content)
+        return result
+
+    def _write(self, batch: List[tuple]):
+        """Commit descriptions and write ChromaDB metadata for one batch of enriched resources."""
+        entries = []
+        for item, result in batch:
+            metadata = result["metadata"]
+            entry = {
+                "resource_id": item.resource_id,
+                "resource_type": item.resource_type,
+                "metadata": {
+                    "description": metadata.get("description"),
+                    "keywords": ", ".join(metadata.get("keywords") or []),
+                    "content_type": metadata.get("content_type"),
+                },
+            }
+            if result.get("embedding"):
+                entry["metadata"].update({
+                    "resource_id": item.resource_id,
+                    "name": item.name,
+                    "type": item.resource_type,
+                    "parent_id": item.parent_id or "",
+                })
+                entry["embedding"] = result["embedding"]
+                entry["content"] = item.content
+            entries.append(entry)
+
+        written = set(ResourceService._upsert_many_to_chromadb(entries))
+
+        items = {item.resource_id: (item, result) for item, result in batch}
+        rows = self.db.query(Resource).options(
+            joinedload(Resource.text_resource),
+            joinedload(Resource.table_resource),
+        ).filter(Resource.id.in_(list(items))).all()
+        for row in rows:
+            item, result = items[row.id]
+            row.description = result["metadata"].get("description")
+            row.modified_by = self.user_id or item.created_by
+            doc_id = ResourceService._make_resource_doc_id(item.resource_id, item.resource_type)
+            if result.get("embedding") and doc_id in written:
+                detail = row.text_resource if item.resource_type == ResourceType.TEXT.value else row.table_resource
+                detail.chromadb_id = doc_id
+        self.db.commit()
+
+    def _notify(self, job_id: str, report: Dict[str, Any], finished: bool = False):
+        if not self.user_id:
+            return
+        from api.websocket import send_notification_sync
+
+        send_notification_sync(str(self.user_id), {
+            "type": "resource_enrichment_progress",
+            "job_id": job_id,
+            "total": report["total"],
+            "done": report["succeeded"] + report["failed"] + report["skipped"],
+            "succeeded": report["succeeded"],
+            "failed": report["failed"],
+            "skipped": report["skipped"],
+            "finished": finished,
+        })
+
+    def run(
+        self,
+        resource_ids: List[int],
+        update_resources: bool = True,
+        job_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Enrich resources, resuming from the job's checkpoint.
+
+        Args:
+            resource_ids: Resources to enrich
+            update_resources: Write descriptions to the database and ChromaDB
+                (without, metadata is only generated and returned, and the
+                checkpoint is neither read nor written)
+            job_id: Checkpoint key (default: derived from resource_ids)
+
+        Returns:
+            Dict with job_id, total, succeeded, failed, skipped (completed by an
+            earlier run) and results per resource (in resource_ids order)
+        """
+        resource_ids = list(dict.fromkeys(resource_ids))
+        job_id = job_id or job_id_for(resource_ids)
+        # A dry run generates metadata for every resource, finished by an earlier job or not
+        done = ContentCache.get_enrichment_checkpoint(job_id) if update_resources else set()
+        pending = [rid for rid in resource_ids if rid not in done]
+        loaded = load_resources(self.db, pending) if pending else {}
+        ttl = settings.resource_enrichment_checkpoint_ttl_seconds
+
+        results: Dict[int, Dict[str, Any]] = {
+            rid: {"resource_id": rid, "success": True, "skipped": True} for rid in resource_ids if rid in done
+        }
+        report = {"job_id": job_id, "total": len(resource_ids), "succeeded": 0, "failed": 0, "skipped": len(results)}
+        if done:
+            logger.info(f"Resource enrichment {job_id}: resuming, {len(results)} of {len(resource_ids)} already done")
+
+        def finish(rid: int, result: Dict[str, Any]):
+            result.pop("embedding", None)
+            result["resource_id"] = rid
+            results[rid] = result
+            report["succeeded" if result.get("success") else "failed"] += 1
+
+        items, others = [], []
+        for rid in pending:
+            item = loaded.get(rid)
+            if item is None:
+                finish(rid, {"success": False, "error": "Resource not found"})
+            elif item.resource_type in ENRICHED_TYPES:
+                items.append(item)
+            else:
+                others.append(item)
+
+        batch: List[tuple] = []
+
+        def flush():
+            if not batch:
+                return
+            if update_resources:
+                self._write(batch)
+                ContentCache.add_enrichment_checkpoint(job_id, [item.resource_id for item, _ in batch], ttl)
+            for item, result in batch:
+                finish(item.resource_id, result)
+            batch.clear()
+            self._notify(job_id, report)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="resource-enrichment") as executor:
+            with llm_priority(BULK):
+                futures = {
+                    executor.submit(contextvars.copy_context().run, self._enrich, item, update_resources): item
+                    for item in items
+                }
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"Enrichment failed for resource {item.resource_id}: {e}")
+                    result = {"success": False, "error": str(e)}
+                if result.get("success") and result.get("metadata"):
+                    batch.append((item, result))
+                    if len(batch) >= self.batch_size:
+                        flush()
+                else:
+                    finish(item.resource_id, result)
+            flush()
+
+        for item in others:
+            if self.process_other is None:
+                finish(item.resource_id, {"success": False, "error": f"Unsupported resource type: {item.resource_type}"})
+                continue
+            result = self.process_other(item.resource_id, item.resource_type, item.created_by)
+            if result.get("success"):
+                ContentCache.add_enrichment_checkpoint(job_id, [item.resource_id], ttl)
+            finish(item.resource_id, result)
+            self._notify(job_id, report)
+
+        logger.info(
+            f"Resource enrichment {job_id}: {report['succeeded']} succeeded, "
+            f"{report['failed']} failed, {report['skipped']} skipped of {report['total']}"
+        )
+        self._notify(job_id, report, finished=True)
+        report["results"] = [results[rid] for rid in resource_ids]
+        return report
@@ -0,0 +1,116 @@
+"""Batch resolution of [name](resource:hash_id) links in article markdown."""
+
+import re
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from models import Resource, ResourceType
+
+import logging
+
+logger = logging.getLogger("uvicorn")
+
+
+# Pattern: [name](resource:hash_id)
+RESOURCE_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(resource:([a-zA-Z0-9]+)\)')
+
+
+class ResolvedResourceLinks:
+    """
+    Resources referenced by one piece of markdown, keyed by hash_id.
+
+    Built once by ResourceLinkResolver.resolve() and shared by every
+    renderer (HTML, popup, PDF) so lookups never hit the database again.
+    """
+
+    def __init__(self, resources: Optional[Dict[str, Resource]] = None):
+        self.resources = resources or {}
+
+    def get(self, hash_id: str) -> Optional[Resource]:
+        """Get the resource for a hash_id, or None if it does not exist."""
+        return self.resources.get(hash_id)
+
+    def resource_type(self, hash_id: str) -> Optional[str]:
+        """Get the resource type value (e.g. 'table') for a hash_id."""
+        resource = self.get(hash_id)
+        if resource and resource.resource_type:
+            return resource.resource_type.value
+        return None
+
+    def child_of_type(
+        self,
+        hash_id: str,
+        resource_type: ResourceType,
+        active_only: bool = False
+    ) -> Optional[Resource]:
+        """Get the first child of the given type (children are eager-loaded)."""
+        resource = self.get(hash_id)
+        if not resource:
+            return None
+        for child in resource.children:
+            if child.resource_type != resource_type:
+                continue
+            if active_only and not child.is_active:
+                continue
+            return child
+        return None
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+
+class ResourceLinkResolver:
+    """
+    Two-pass resolver for resource links.
+
+    Pass 1 collects every hash_id in the content and loads all matching
+    resources (with children, file rows and table data) in one batch.
+    Pass 2 substitutes each link using the preloaded resources.
+    """
+
+    @staticmethod
+    def collect_hash_ids(content: str) -> List[str]:
+        """Collect unique hash_ids from resource links, in order of appearance."""
+        if not content:
+            return []
+        return list(dict.fromkeys(m.group(2) for m in RESOURCE_LINK_PATTERN.finditer(content)))
+
+    @staticmethod
+    def resolve(db: Optional[Session], content: str) -> ResolvedResourceLinks:
+        """
+        Load all resources referenced by the content.
+
+        Args:
+            db: Database session (None yields an empty result)
+            content: Markdown content with resource links
+
+        Returns:
+            ResolvedResourceLinks keyed by hash_id
+        """
+        hash_ids = ResourceLinkResolver.collect_hash_ids(content)
+        if not db or not hash_ids:
+            return ResolvedResourceLinks()
+
+        resources = db.query(Resource).options(
+            joinedload(Resource.table_resource),
+            joinedload(Resource.file_resource),
+            selectinload(Resource.children).joinedload(Resource.file_resource),
+        ).filter(Resource.hash_id.in_(hash_ids)).all()
+
+        logger.debug(f"Resolved {len(resources)}/{len(hash_ids)} resource links")
+        return ResolvedResourceLinks({r.hash_id: r for r in resources})
+
+    @staticmethod
+    def substitute(content: str, replace: Callable[[str, str], str]) -> str:
+        """
+        Replace each resource link with replace(name, hash_id).
+
+        Args:
+            content: Markdown content with resource links
+            replace: Callable returning the replacement text for one link
+
+        Returns:
+            Content with all resource links substituted
+        """
+        return RESOURCE_LINK_PATTERN.sub(lambda m: replace(m.group(1), m.group(2)), content)
@@ -4,7 +4,7 @@ import json
 import hashlib
 import os
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Tuple
+from typing import Callable, List, Dict, Optional, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc
 import logging
@@ -14,13 +14,22 @@ from models import (
     TimeseriesMetadata, TimeseriesData, TimeseriesFrequency, TimeseriesDataType,
     ContentArticle, Group, article_resources
 )
-from services.vector_service import VectorService, _get_chroma_client
+from services import text_search, vector_index
+from services.llm_client import BACKGROUND, llm_priority
+from services.pagination import Page, counts, keyset_page, offset_page, page_offset
+from services.vector_service import VectorService, _aget_chroma_collection, _get_chroma_client
+from metrics import observed
+from resilience import CHROMADB, guard
 
 logger = logging.getLogger("uvicorn")
 
 
 # Resource collection name in ChromaDB
 RESOURCE_COLLECTION_NAME = "resources"
+RESOURCE_COLLECTION_METADATA = {
+    "description": "Resource embeddings for text and table content",
+    "hnsw:space": "cosine"
+}
 
 # Lazy initialization for resource collection
 _resource_collection = None
@@ -30,21 +39,19 @@ def _get_resource_collection():
     """Get or create the resources collection in ChromaDB."""
     global _resource_collection
 
-    if _resource_collection is not None:
-        return _resource_collection
-
+    # None while the ChromaDB circuit is open
     client, _ = _get_chroma_client()
     if client is None:
         return None
 
+    if _resource_collection is not None:
+        return _resource_collection
+
     try:
-        _resource_collection = client.get_or_create_collection(
+        _resource_collection = guard(client.get_or_create_collection(
             name=RESOURCE_COLLECTION_NAME,
-            metadata={
-                "description": "Resource embeddings for text and table content",
-                "hnsw:space": "cosine"
-            }
-        )
+            metadata=RESOURCE_COLLECTION_METADATA
+        ), CHROMADB)
         logger.info(f"✓ Resource collection initialized: {RESOURCE_COLLECTION_NAME}")
         return _resource_collection
     except Exception as e:
@@ -52,6 +59,11 @@ def _get_resource_collection():
         return None
 
 
+async def _aget_resource_collection():
+    """Async resources collection for the running event loop (None while ChromaDB is unavailable)."""
+    return await _aget_chroma_collection(RESOURCE_COLLECTION_NAME, RESOURCE_COLLECTION_METADATA)
+
+
 class ResourceService:
     """Service for managing resources of all types."""
 
@@ -65,6 +77,7 @@ class ResourceService:
         return f"resource_{resource_type}_{resource_id}"
 
     @staticmethod
+    @observed("chromadb", "add_resource")
     def _add_to_chromadb(
         resource_id: int,
         resource_type: str,
@@ -82,8 +95,9 @@ class ResourceService:
             return None
 
         try:
-            # Generate embedding
-            embedding = VectorService._generate_embedding(content)
+            # Generate embedding (indexing yields to interactive calls)
+            with llm_priority(BACKGROUND):
+                embedding = VectorService._generate_embedding(content)
             if not embedding:
                 logger.error(f"Failed to generate embedding for resource {resource_id}")
                 return None
@@ -106,6 +120,7 @@ class ResourceService:
                 documents=[content],
                 metadatas=[clean_metadata]
             )
+            vector_index.record_upsert(vector_index.RESOURCES, doc_id, embedding, clean_metadata, content)
 
             logger.info(f"✓ Added resource {resource_id} to ChromaDB")
             return doc_id
@@ -115,6 +130,7 @@ class ResourceService:
             return None
 
     @staticmethod
+    @observed("chromadb", "update_resource")
     def _update_in_chromadb(
         resource_id: int,
         resource_type: str,
@@ -130,6 +146,7 @@ class ResourceService:
             # Delete old and add new
             doc_id = ResourceService._make_resource_doc_id(resource_id, resource_type)
             collection.delete(ids=[doc_id])
+            vector_index.record_delete(vector_index.RESOURCES, doc_id)
             new_id = ResourceService._add_to_chromadb(
                 resource_id, resource_type, content, metadata
             )
@@ -139,6 +156,61 @@ class ResourceService:
             return False
 
     @staticmethod
+    @observed("chromadb", "upsert_resources")
+    def _upsert_many_to_chromadb(entries: List[Dict[str, Any]]) -> List[str]:
+        """
+        Write several resources to ChromaDB in at most two requests.
+
+        Entries with an "embedding" are upserted (document and metadata
+        replaced); entries without one only have their metadata merged into
+        the existing document, keeping its embedding.
+
+        Args:
+            entries: Dicts with resource_id, resource_type, metadata and
+                optionally embedding and content
+
+        Returns:
+            Document IDs written (empty while ChromaDB is unavailable)
+        """
+        collection = _get_resource_collection()
+        if collection is None or not entries:
+            return []
+
+        def clean(metadata: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                k: "" if v is None else v if isinstance(v, (str, int, float, bool)) else str(v)
+                for k, v in metadata.items()
+            }
+
+        upserts = [e for e in entries if e.get("embedding")]
+        updates = [e for e in entries if not e.get("embedding")]
+        written = []
+
+        try:
+            if upserts:
+                ids = [ResourceService._make_resource_doc_id(e["resource_id"], e["resource_type"]) for e in upserts]
+                metadatas = [clean(e["metadata"]) for e in upserts]
+                documents = [e.get("content", "") for e in upserts]
+                embeddings = [e["embedding"] for e in upserts]
+                collection.upsert(ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas)
+                for doc_id, embedding, metadata, document in zip(ids, embeddings, metadatas, documents):
+                    vector_index.record_upsert(vector_index.RESOURCES, doc_id, embedding, metadata, document)
+                written.extend(ids)
+
+            if updates:
+                ids = [ResourceService._make_resource_doc_id(e["resource_id"], e["resource_type"]) for e in updates]
+                metadatas = [clean(e["metadata"]) for e in updates]
+                collection.update(ids=ids, metadatas=metadatas)
+                for doc_id, metadata in zip(ids, metadatas):
+                    vector_index.record_metadata(vector_index.RESOURCES, doc_id, metadata)
+                written.extend(ids)
+        except Exception as e:
+            logger.error(f"Error writing {len(entries)} resources to ChromaDB: {e}")
+
+        return written
+
+    @staticmethod
+    @observed("chromadb", "delete_resource")
     def _delete_from_chromadb(resource_id: int, resource_type: str) -> bool:
         """Delete resource from ChromaDB."""
         collection = _get_resource_collection()
@@ -148,6 +220,7 @@ class ResourceService:
         try:
             doc_id = ResourceService._make_resource_doc_id(resource_id, resource_type)
             collection.delete(ids=[doc_id])
+            vector_index.record_delete(vector_index.RESOURCES, doc_id)
             logger.info(f"✓ Deleted resource {resource_id} from ChromaDB")
             return True
         except Exception as e:
@@ -188,6 +261,7 @@ class ResourceService:
         )
         db.add(resource)
         db.flush()  # Get the ID without committing
+        counts.invalidate("resources")
         return resource
 
     @staticmethod
@@ -784,6 +858,77 @@ class ResourceService:
             resource.file_resource.filename
         )
 
+    @staticmethod
+    def _apply_search(db: Session, query, search: Optional[str]):
+        """
+        Filter a resource query by a free-text search term.
+
+        Uses full-text/trigram matching on PostgreSQL (see services.text_search)
+        and orders by text rank; otherwise substring matching, newest first.
+
+        Returns tuple of (filtered query, order_by clauses).
+        """
+        if not search:
+            return query, [desc(Resource.created_at)]
+
+        query = query.filter(text_search.match_condition(db, text_search.RESOURCE_SEARCH, search))
+        rank = text_search.rank_expression(db, text_search.RESOURCE_SEARCH, search)
+        if rank is None:
+            return query, [desc(Resource.created_at)]
+        return query, [desc(rank), desc(Resource.created_at)]
+
+    @staticmethod
+    def _list_dict(r: Resource) -> Dict[str, Any]:
+        """Resource row as returned by the list methods."""
+        return {
+            "id": r.id,
+            "hash_id": r.hash_id,
+            "resource_type": r.resource_type.value if hasattr(r.resource_type, 'value') else r.resource_type,
+            "status": r.status.value if hasattr(r.status, 'value') else r.status,
+            "name": r.name,
+            "description": r.description,
+            "group_id": r.group_id,
+            "parent_id": r.parent_id,
+            "created_by": r.created_by,
+            "modified_by": r.modified_by,
+            "created_at": r.created_at.isoformat() if r.created_at else None,
+            "updated_at": r.updated_at.isoformat() if r.updated_at else None,
+            "is_active": r.is_active
+        }
+
+    @staticmethod
+    def _page_resources(
+        db: Session,
+        build_query: Callable[[Session], Any],
+        count_key: Tuple,
+        search: Optional[str],
+        cursor: Optional[str],
+        offset: int,
+        limit: int,
+        exact_total: bool
+    ) -> Page:
+        """
+        One page of a resource listing.
+
+        Newest-first listings use keyset pagination on (created_at, id); search
+        results are rank ordered and page by offset. The total comes from the
+        listing count cache (see services.pagination) unless exact_total is set.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        query, order_by = ResourceService._apply_search(db, build_query(db), search)
+        if search and len(order_by) > 1:
+            rows, next_cursor = offset_page(query.order_by(*order_by), page_offset(cursor, offset), limit)
+        else:
+            rows, next_cursor = keyset_page(query, Resource.created_at, Resource.id, cursor, limit, offset)
+
+        def count(session: Session) -> int:
+            return ResourceService._apply_search(session, build_query(session), search)[0].count()
+
+        total, total_exact = counts.total(count_key + (search,), count, db, exact=exact_total)
+        return Page([ResourceService._list_dict(r) for r in rows], total, total_exact, next_cursor)
+
     @staticmethod
     def list_resources(
         db: Session,
@@ -794,72 +939,52 @@ class ResourceService:
         offset: int = 0,
         limit: int = 50,
         global_only: bool = False,
-        exclude_article_linked: bool = False
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        exclude_article_linked: bool = False,
+        cursor: Optional[str] = None,
+        exact_total: bool = False
+    ) -> Page:
         """
         List resources with filtering.
 
         Args:
             global_only: If True, only return resources with group_id = NULL (global resources)
             exclude_article_linked: If True, exclude resources that are linked to any article
+            cursor: next_cursor of the previous page (takes precedence over offset)
+            exact_total: Count now instead of using the cached total
 
-        Returns tuple of (list of resource dicts, total count).
+        Returns Page of resource dicts (with total and next_cursor).
         """
-        query = db.query(Resource).filter(Resource.is_active == True)
-
-        if resource_type:
-            query = query.filter(Resource.resource_type == resource_type)
-        if global_only:
-            query = query.filter(Resource.group_id == None)
-        elif group_id:
-            query = query.filter(Resource.group_id == group_id)
-        if created_by:
-            query = query.filter(Resource.created_by == created_by)
-        if exclude_article_linked:
-            # Exclude resources that are linked to any article, EXCEPT for ARTICLE type resources
-            # ARTICLE resources represent published articles and should always be visible
-            from sqlalchemy import exists, select
-            linked_subquery = select(article_resources.c.resource_id).where(
-                article_resources.c.resource_id == Resource.id
-            ).exists()
-            # Include resource if: NOT linked to article OR is an ARTICLE type resource
-            query = query.filter(
-                or_(
-                    ~linked_subquery,
-                    Resource.resource_type == ResourceType.ARTICLE
-                )
-            )
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Resource.name.ilike(search_pattern),
-                    Resource.description.ilike(search_pattern)
+        def build_query(session: Session):
+            query = session.query(Resource).filter(Resource.is_active == True)
+
+            if resource_type:
+                query = query.filter(Resource.resource_type == resource_type)
+            if global_only:
+                query = query.filter(Resource.group_id == None)
+            elif group_id:
+                query = query.filter(Resource.group_id == group_id)
+            if created_by:
+                query = query.filter(Resource.created_by == created_by)
+            if exclude_article_linked:
+                # Exclude resources that are linked to any article, EXCEPT for ARTICLE type resources
+                # ARTICLE resources represent published articles and should always be visible
+                from sqlalchemy import select
+                linked_subquery = select(article_resources.c.resource_id).where(
+                    article_resources.c.resource_id == Resource.id
+                ).exists()
+                # Include resource if: NOT linked to article OR is an ARTICLE type resource
+                query = query.filter(
+                    or_(
+                        ~linked_subquery,
+                        Resource.resource_type == ResourceType.ARTICLE
+                    )
                 )
-            )
-
-        total = query.count()
-        resources = query.order_by(desc(Resource.created_at)).offset(offset).limit(limit).all()
-
-        results = []
-        for r in resources:
-            results.append({
-                "id": r.id,
-                "hash_id": r.hash_id,
-                "resource_type": r.resource_type.value if hasattr(r.resource_type, 'value') else r.resource_type,
-                "status": r.status.value if hasattr(r.status, 'value') else r.status,
-                "name": r.name,
-                "description": r.description,
-                "group_id": r.group_id,
-                "parent_id": r.parent_id,
-                "created_by": r.created_by,
-                "modified_by": r.modified_by,
-                "created_at": r.created_at.isoformat() if r.created_at else None,
-                "updated_at": r.updated_at.isoformat() if r.updated_at else None,
-                "is_active": r.is_active
-            })
+            return query
 
-        return results, total
+        count_key = ("resources", "list", resource_type, group_id, created_by, global_only, exclude_article_linked)
+        return ResourceService._page_resources(
+            db, build_query, count_key, search, cursor, offset, limit, exact_total
+        )
 
     @staticmethod
     def list_resources_by_group_ids(
@@ -868,8 +993,10 @@ class ResourceService:
         group_ids: List[int] = None,
         search: Optional[str] = None,
         offset: int = 0,
-        limit: int = 50
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        exact_total: bool = False
+    ) -> Page:
         """
         List resources belonging to any of the specified group IDs.
 
@@ -878,52 +1005,28 @@ class ResourceService:
 
         Args:
             group_ids: List of group IDs to filter by. If empty, returns no resources.
+            cursor: next_cursor of the previous page (takes precedence over offset)
+            exact_total: Count now instead of using the cached total
 
-        Returns tuple of (list of resource dicts, total count).
+        Returns Page of resource dicts (with total and next_cursor).
         """
         # If no group_ids provided, return empty result
         if not group_ids:
-            return [], 0
-
-        query = db.query(Resource).filter(Resource.is_active == True)
+            return Page([], 0)
 
-        if resource_type:
-            query = query.filter(Resource.resource_type == resource_type)
-
-        # Filter by any of the provided group IDs
-        query = query.filter(Resource.group_id.in_(group_ids))
+        def build_query(session: Session):
+            query = session.query(Resource).filter(Resource.is_active == True)
 
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Resource.name.ilike(search_pattern),
-                    Resource.description.ilike(search_pattern)
-                )
-            )
+            if resource_type:
+                query = query.filter(Resource.resource_type == resource_type)
 
-        total = query.count()
-        resources = query.order_by(desc(Resource.created_at)).offset(offset).limit(limit).all()
+            # Filter by any of the provided group IDs
+            return query.filter(Resource.group_id.in_(group_ids))
 
-        results = []
-        for r in resources:
-            results.append({
-                "id": r.id,
-                "hash_id": r.hash_id,
-                "resource_type": r.resource_type.value if hasattr(r.resource_type, 'value') else r.resource_type,
-                "status": r.status.value if hasattr(r.status, 'value') else r.status,
-                "name": r.name,
-                "description": r.description,
-                "group_id": r.group_id,
-                "parent_id": r.parent_id,
-                "created_by": r.created_by,
-                "modified_by": r.modified_by,
-                "created_at": r.created_at.isoformat() if r.created_at else None,
-                "updated_at": r.updated_at.isoformat() if r.updated_at else None,
-                "is_active": r.is_active
-            })
-
-        return results, total
+        count_key = ("resources", "groups", resource_type, tuple(group_ids))
+        return ResourceService._page_resources(
+            db, build_query, count_key, search, cursor, offset, limit, exact_total
+        )
 
     @staticmethod
     def list_topic_resources(
@@ -933,8 +1036,10 @@ class ResourceService:
         group_ids: List[int] = None,
         search: Optional[str] = None,
         offset: int = 0,
-        limit: int = 50
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        exact_total: bool = False
+    ) -> Page:
         """
         List all resources for a topic, including:
         1. Resources with group_id matching any of the topic's groups
@@ -945,82 +1050,54 @@ class ResourceService:
             resource_type: Optional filter by resource type
             group_ids: List of group IDs for this topic
             search: Optional search term
-            offset: Pagination offset
+            offset: Pagination offset (older clients; prefer cursor)
             limit: Pagination limit
+            cursor: next_cursor of the previous page
+            exact_total: Count now instead of using the cached total
 
-        Returns tuple of (list of resource dicts, total count).
+        Returns Page of resource dicts (with total and next_cursor).
         """
-        from sqlalchemy import select, exists
-
-        # Build the base query
-        query = db.query(Resource).filter(Resource.is_active == True)
-
-        if resource_type:
-            query = query.filter(Resource.resource_type == resource_type)
-
-        # Build conditions for topic resources:
-        # 1. Resources with group_id in the topic's groups
-        # 2. ARTICLE resources linked to articles with this topic
-        conditions = []
-
-        if group_ids:
-            conditions.append(Resource.group_id.in_(group_ids))
-
-        # Subquery to find ARTICLE resources linked to articles in this topic
-        # Join article_resources to find resource IDs, then join to articles to filter by topic
-        article_resource_subquery = (
-            select(article_resources.c.resource_id)
-            .join(ContentArticle, ContentArticle.id == article_resources.c.article_id)
-            .where(ContentArticle.topic == topic)
-            .where(ContentArticle.is_active == True)
-        )
-
-        # Include ARTICLE resources linked to articles in this topic
-        conditions.append(
-            and_(
-                Resource.resource_type == ResourceType.ARTICLE,
-                Resource.id.in_(article_resource_subquery)
+        from sqlalchemy import select
+
+        def build_query(session: Session):
+            # Build the base query
+            query = session.query(Resource).filter(Resource.is_active == True)
+
+            if resource_type:
+                query = query.filter(Resource.resource_type == resource_type)
+
+            # Build conditions for topic resources:
+            # 1. Resources with group_id in the topic's groups
+            # 2. ARTICLE resources linked to articles with this topic
+            conditions = []
+
+            if group_ids:
+                conditions.append(Resource.group_id.in_(group_ids))
+
+            # Subquery to find ARTICLE resources linked to articles in this topic
+            # Join article_resources to find resource IDs, then join to articles to filter by topic
+            article_resource_subquery = (
+                select(article_resources.c.resource_id)
+                .join(ContentArticle, ContentArticle.id == article_resources.c.article_id)
+                .where(ContentArticle.topic == topic)
+                .where(ContentArticle.is_active == True)
             )
-        )
 
-        # Apply the OR of all conditions
-        if conditions:
-            query = query.filter(or_(*conditions))
-        else:
-            # No conditions means no resources (shouldn't happen, but be safe)
-            return [], 0
-
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Resource.name.ilike(search_pattern),
-                    Resource.description.ilike(search_pattern)
+            # Include ARTICLE resources linked to articles in this topic
+            conditions.append(
+                and_(
+                    Resource.resource_type == ResourceType.ARTICLE,
+                    Resource.id.in_(article_resource_subquery)
                 )
             )
 
-        total = query.count()
-        resources = query.order_by(desc(Resource.created_at)).offset(offset).limit(limit).all()
+            # Apply the OR of all conditions
+            return query.filter(or_(*conditions))
 
-        results = []
-        for r in resources:
-            results.append({
-                "id": r.id,
-                "hash_id": r.hash_id,
-                "resource_type": r.resource_type.value if hasattr(r.resource_type, 'value') else r.resource_type,
-                "status": r.status.value if hasattr(r.status, 'value') else r.status,
-                "name": r.name,
-                "description": r.description,
-                "group_id": r.group_id,
-                "parent_id": r.parent_id,
-                "created_by": r.created_by,
-                "modified_by": r.modified_by,
-                "created_at": r.created_at.isoformat() if r.created_at else None,
-                "updated_at": r.updated_at.isoformat() if r.updated_at else None,
-                "is_active": r.is_active
-            })
-
-        return results, total
+        count_key = ("resources", "topic", topic, resource_type, tuple(group_ids or ()))
+        return ResourceService._page_resources(
+            db, build_query, count_key, search, cursor, offset, limit, exact_total
+        )
 
     # ==========================================================================
     # RESOURCE UPDATE/DELETE
@@ -1220,7 +1297,8 @@ class ResourceService:
             doc_id = ResourceService._make_resource_doc_id(resource_id, resource_type)
 
             # Generate new embedding
-            embedding = VectorService._generate_embedding(content)
+            with llm_priority(BACKGROUND):
+                embedding = VectorService._generate_embedding(content)
             if not embedding:
                 return False
 
@@ -1241,6 +1319,9 @@ class ResourceService:
                 documents=[content[:10000]],
                 metadatas=[clean_metadata]
             )
+            vector_index.record_upsert(
+                vector_index.RESOURCES, doc_id, embedding, clean_metadata, content[:10000]
+            )
 
             return True
         except Exception as e:
@@ -1273,6 +1354,7 @@ class ResourceService:
         resource.is_active = False
         resource.modified_by = user_id
         db.commit()
+        counts.invalidate("resources")
 
         return True
 
@@ -1457,6 +1539,7 @@ class ResourceService:
         # Hard delete from database (cascades to specialized tables)
         db.delete(resource)
         db.commit()
+        counts.invalidate("resources")
 
         logger.info(f"✓ Purged orphan resource {resource_id}")
         return True
@@ -1595,6 +1678,7 @@ class ResourceService:
         return ResourceService.get_resource_ids_by_group(db, group.id)
 
     @staticmethod
+    @observed("chromadb", "semantic_search_resources")
     def semantic_search_resources(
         query: str,
         resource_type: Optional[str] = None,
@@ -1613,7 +1697,10 @@ class ResourceService:
         Returns:
             List of matching resources with similarity scores
         """
-        collection = _get_resource_collection()
+        # Local index (VECTOR_INDEX_ENABLED) when loaded, ChromaDB otherwise
+        collection = vector_index.get_index(vector_index.RESOURCES)
+        if collection is None:
+            collection = _get_resource_collection()
         if collection is None:
             return []
 
@@ -1627,57 +1714,118 @@ class ResourceService:
             if not query_embedding:
                 return []
 
-            # Build where filter
-            where_filter = None
-            if resource_type and resource_ids:
-                # Both type and resource_ids filter
-                where_filter = {
-                    "$and": [
-                        {"type": resource_type},
-                        {"resource_id": {"$in": resource_ids}}
-                    ]
-                }
-            elif resource_type:
-                where_filter = {"type": resource_type}
-            elif resource_ids:
-                where_filter = {"resource_id": {"$in": resource_ids}}
-
             # Query collection - get more results if filtering by IDs
-            n_results = limit * 3 if resource_ids else limit
-
             results = collection.query(
                 query_embeddings=[query_embedding],
-                n_results=n_results,
-                where=where_filter
+                n_results=limit * 3 if resource_ids else limit,
+                where=ResourceService._resource_search_filter(resource_type, resource_ids)
             )
 
-            # Format results
-            resources = []
-            if results['ids'] and len(results['ids']) > 0:
-                for i, doc_id in enumerate(results['ids'][0]):
-                    resource_id = results['metadatas'][0][i].get('resource_id')
+            return ResourceService._format_resource_results(results, resource_ids, limit)
 
-                    # Additional filter check (belt and suspenders)
-                    if resource_ids and resource_id not in resource_ids:
-                        continue
+        except Exception as e:
+            logger.error(f"Resource semantic search error: {e}")
+            return []
 
-                    resources.append({
-                        'resource_id': resource_id,
-                        'name': results['metadatas'][0][i].get('name'),
-                        'type': results['metadatas'][0][i].get('type'),
-                        'similarity_score': 1 - results['distances'][0][i],
-                        'content_preview': results['documents'][0][i][:200] if results['documents'][0][i] else None
-                    })
+    @staticmethod
+    @observed("chromadb", "semantic_search_resources")
+    async def asemantic_search_resources(
+        query: str,
+        resource_type: Optional[str] = None,
+        limit: int = 10,
+        resource_ids: Optional[List[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of semantic_search_resources() (does not block the event loop).
+
+        Args:
+            query: Search query
+            resource_type: Filter to specific type (text or table)
+            limit: Max results
+            resource_ids: Optional list of resource IDs to filter by
+
+        Returns:
+            List of matching resources with similarity scores
+        """
+        if resource_ids is not None and len(resource_ids) == 0:
+            return []
+
+        # The local index is in-process and answers without I/O
+        local = vector_index.get_index(vector_index.RESOURCES)
+        collection = None if local is not None else await _aget_resource_collection()
+        if local is None and collection is None:
+            return []
 
-                    if len(resources) >= limit:
-                        break
+        try:
+            query_embedding = await VectorService._agenerate_embedding(query)
+            if not query_embedding:
+                return []
+
+            query_args = {
+                "query_embeddings": [query_embedding],
+                "n_results": limit * 3 if resource_ids else limit,
+                "where": ResourceService._resource_search_filter(resource_type, resource_ids),
+            }
+            if local is not None:
+                results = local.query(**query_args)
+            else:
+                results = await collection.query(**query_args)
 
-            return resources
+            return ResourceService._format_resource_results(results, resource_ids, limit)
 
         except Exception as e:
             logger.error(f"Resource semantic search error: {e}")
             return []
 
+    @staticmethod
+    def _resource_search_filter(
+        resource_type: Optional[str],
+        resource_ids: Optional[List[int]]
+    ) -> Optional[Dict[str, Any]]:
+        """Build the ChromaDB where filter for a resource search."""
+        if resource_type and resource_ids:
+            # Both type and resource_ids filter
+            return {
+                "$and": [
+                    {"type": resource_type},
+                    {"resource_id": {"$in": resource_ids}}
+                ]
+            }
+        if resource_type:
+            return {"type": resource_type}
+        if resource_ids:
+            return {"resource_id": {"$in": resource_ids}}
+        return None
+
+    @staticmethod
+    def _format_resource_results(
+        results: Dict[str, Any],
+        resource_ids: Optional[List[int]],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Convert a collection query result into resources with similarity scores."""
+        resources = []
+        if results['ids'] and len(results['ids']) > 0:
+            for i, doc_id in enumerate(results['ids'][0]):
+                resource_id = results['metadatas'][0][i].get('resource_id')
+
+                # Additional filter check (belt and suspenders)
+                if resource_ids and resource_id not in resource_ids:
+                    continue
+
+                resources.append({
+                    'resource_id': resource_id,
+                    'name': results['metadatas'][0][i].get('name'),
+                    'type': results['metadatas'][0][i].get('type'),
+                    'similarity_score': 1 - results['distances'][0][i],
+                    'content_preview': results['documents'][0][i][:200] if results['documents'][0][i] else None
+                })
+
+                if len(resources) >= limit:
+                    break
+
+        return resources
+
     @staticmethod
     def semantic_search_for_content(
         db: Session,
@@ -0,0 +1,402 @@
+"""
+Unified retrieval for chat nodes and agents.
+
+Hybrid search: embeds a query once and queries the article collection and
+the resource collection (one query per resource type) concurrently, while
+the keyword search (services.text_search) ranks matching articles and
+resources in PostgreSQL. For each of articles and resources, the semantic
+ranking (by similarity) and the keyword ranking are merged with reciprocal
+rank fusion (RRF), so exact names and tickers the embedding misses still
+surface, and items both searches agree on rank first.
+
+Usage:
+    from services.retrieval_service import RetrievalService
+
+    result = RetrievalService.retrieve(db, "inflation outlook", topic="macro")
+    result.articles   # article dicts (ContentService format) in fused order
+    result.resources  # resource dicts in fused order
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+from sqlalchemy import desc
+from sqlalchemy.orm import Session, joinedload
+
+from metrics import observed
+from models import ContentArticle, Resource, ResourceType
+from services import text_search, vector_index
+from services.vector_service import VectorService, _get_chroma_client
+
+logger = logging.getLogger("uvicorn")
+
+# Standard RRF constant; dampens the weight of top ranks in any single list
+RRF_K = 60
+
+# Candidates fetched per list, relative to the requested limit, so that SQL
+# status/visibility filtering still leaves enough results
+OVERFETCH = 2
+
+DEFAULT_RESOURCE_TYPES = ("text", "table")
+
+# Resource ids per ChromaDB $in filter; larger scopes are queried in chunks
+RESOURCE_ID_CHUNK = 500
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="retrieval")
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Iterable[Sequence[Hashable]],
+    k: int = RRF_K,
+) -> List[Tuple[Hashable, float]]:
+    """
+    Merge ranked lists with reciprocal rank fusion.
+
+    Each item scores sum(1 / (k + rank)) over the lists it appears in
+    (rank starting at 1). Ties keep first-seen order.
+
+    Args:
+        ranked_lists: Lists of item keys, best first
+        k: RRF constant
+
+    Returns:
+        List of (key, score) sorted by score, best first
+    """
+    scores: Dict[Hashable, float] = {}
+    for ranked in ranked_lists:
+        for rank, key in enumerate(ranked, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+@dataclass
+class RetrievalResult:
+    """Fused retrieval results for one query."""
+    query: str
+    articles: List[Dict[str, Any]] = field(default_factory=list)
+    resources: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class RetrievalService:
+    """Single-embedding, multi-collection retrieval."""
+
+    @staticmethod
+    def _query_collection(collection, embedding: List[float], n_results: int, where: Optional[Dict]) -> List[Dict]:
+        """Run one collection query and return hits (id, document, metadata, similarity)."""
+        if collection is None or n_results <= 0:
+            return []
+        try:
+            results = collection.query(
+                query_embeddings=[embedding],
+                n_results=n_results,
+                where=where,
+                include=["documents", "metadatas", "distances"],
+            )
+        except Exception as e:
+            logger.error(f"Retrieval query error: {e}")
+            return []
+
+        hits = []
+        if results["ids"] and len(results["ids"]) > 0:
+            for i, doc_id in enumerate(results["ids"][0]):
+                hits.append({
+                    "doc_id": doc_id,
+                    "document": results["documents"][0][i] if results.get("documents") else None,
+                    "metadata": results["metadatas"][0][i] or {},
+                    "similarity_score": 1 - results["distances"][0][i],
+                })
+        return hits
+
+    @staticmethod
+    def _article_where(topic: Optional[str], topics: Optional[List[str]]) -> Optional[Dict]:
+        if topic:
+            return {"topic": topic}
+        if topics:
+            return {"topic": {"$in": list(topics)}}
+        return None
+
+    @staticmethod
+    def _resource_wheres(resource_type: str, resource_ids: Optional[List[int]]) -> List[Dict]:
+        """Where filters for one resource type, one per RESOURCE_ID_CHUNK ids in scope."""
+        if not resource_ids:
+            return [{"type": resource_type}]
+        ids = list(dict.fromkeys(resource_ids))
+        return [
+            {"$and": [{"type": resource_type}, {"resource_id": {"$in": ids[i:i + RESOURCE_ID_CHUNK]}}]}
+            for i in range(0, len(ids), RESOURCE_ID_CHUNK)
+        ]
+
+    @staticmethod
+    def _keyword_articles(
+        db: Session,
+        query: str,
+        topic: Optional[str],
+        topics: Optional[List[str]],
+        statuses: Sequence[str],
+        limit: int,
+    ) -> List[int]:
+        """Article ids matching the query in the keyword search, best first."""
+        filters = [
+            ContentArticle.is_active == True,
+            text_search.match_condition(db, text_search.ARTICLE_SEARCH, query),
+        ]
+        if topic:
+            filters.append(ContentArticle.topic == topic)
+        elif topics:
+            filters.append(ContentArticle.topic.in_(list(topics)))
+        if statuses:
+            filters.append(ContentArticle.status.in_(list(statuses)))
+        order = [desc(ContentArticle.created_at)]
+        rank = text_search.rank_expression(db, text_search.ARTICLE_SEARCH, query)
+        if rank is not None:
+            order.insert(0, desc(rank))
+        try:
+            rows = db.query(ContentArticle.id).filter(*filters).order_by(*order).limit(limit).all()
+        except Exception as e:
+            logger.error(f"Retrieval keyword search error: {e}")
+            return []
+        return [article_id for (article_id,) in rows]
+
+    @staticmethod
+    def _keyword_resources(
+        db: Session,
+        query: str,
+        resource_types: Sequence[str],
+        resource_ids: Optional[List[int]],
+        limit: int,
+    ) -> List[int]:
+        """Resource ids matching the query in the keyword search, best first."""
+        filters = [
+            Resource.is_active == True,
+            Resource.resource_type.in_([ResourceType(t) for t in resource_types]),
+            text_search.match_condition(db, text_search.RESOURCE_SEARCH, query),
+        ]
+        if resource_ids:
+            filters.append(Resource.id.in_(list(resource_ids)))
+        order = [desc(Resource.created_at)]
+        rank = text_search.rank_expression(db, text_search.RESOURCE_SEARCH, query)
+        if rank is not None:
+            order.insert(0, desc(rank))
+        try:
+            rows = db.query(Resource.id).filter(*filters).order_by(*order).limit(limit).all()
+        except Exception as e:
+            logger.error(f"Retrieval keyword search error: {e}")
+            return []
+        return [resource_id for (resource_id,) in rows]
+
+    @staticmethod
+    @observed("chromadb", "retrieve")
+    def retrieve(
+        db: Session,
+        query: str,
+        topic: Optional[str] = None,
+        topics: Optional[List[str]] = None,
+        statuses: Sequence[str] = ("published",),
+        article_limit: int = 5,
+        resource_types: Sequence[str] = DEFAULT_RESOURCE_TYPES,
+        resource_limit: int = 5,
+        resource_ids: Optional[List[int]] = None,
+    ) -> RetrievalResult:
+        """
+        Retrieve articles and resources relevant to a query.
+
+        Args:
+            db: Database session (article status/visibility filtering)
+            query: Search query
+            topic: Restrict articles to one topic
+            topics: Restrict articles to these topics (ignored if topic is set)
+            statuses: Article statuses to include
+            article_limit: Maximum articles (0 skips the article collection)
+            resource_types: Resource types to query (one vector query each,
+                per RESOURCE_ID_CHUNK ids of resource_ids)
+            resource_limit: Maximum resources (0 skips the resource collection)
+            resource_ids: Restrict resources to these IDs (empty list means none)
+
+        Returns:
+            RetrievalResult with articles and resources in fused order
+            (similarity_score is None for keyword-only matches)
+        """
+        from services.resource_service import _get_resource_collection
+
+        result = RetrievalResult(query=query)
+        if not query:
+            return result
+
+        if topics is not None and not topics and not topic:
+            article_limit = 0
+        if resource_ids is not None and not resource_ids:
+            resource_limit = 0
+        if article_limit <= 0 and resource_limit <= 0:
+            return result
+
+        embedding = VectorService._generate_embedding(query)
+        if not embedding:
+            return result
+
+        # One ChromaDB query per collection, resource type and id chunk, all in flight at once
+        queries: Dict[str, Any] = {}
+        if article_limit > 0:
+            article_collection = vector_index.get_index(vector_index.ARTICLES)
+            if article_collection is None:
+                _, article_collection = _get_chroma_client()
+            queries["articles"] = (
+                article_collection,
+                article_limit * OVERFETCH,
+                RetrievalService._article_where(topic, topics),
+            )
+        if resource_limit > 0:
+            resource_collection = vector_index.get_index(vector_index.RESOURCES)
+            if resource_collection is None:
+                resource_collection = _get_resource_collection()
+            for resource_type in resource_types:
+                for n, where in enumerate(RetrievalService._resource_wheres(resource_type, resource_ids)):
+                    queries[f"resources:{resource_type}:{n}"] = (
+                        resource_collection,
+                        resource_limit * OVERFETCH,
+                        where,
+                    )
+
+        futures = {
+            name: _executor.submit(
+                contextvars.copy_context().run,
+                RetrievalService._query_collection, collection, embedding, n_results, where,
+            )
+            for name, (collection, n_results, where) in queries.items()
+        }
+
+        # Keyword rankings from PostgreSQL while the vector queries run
+        keyword_articles = RetrievalService._keyword_articles(
+            db, query, topic, topics, statuses, article_limit * OVERFETCH
+        ) if article_limit > 0 else []
+        keyword_resources = RetrievalService._keyword_resources(
+            db, query, resource_types, resource_ids, resource_limit * OVERFETCH
+        ) if resource_limit > 0 else []
+
+        hits_by_query = {name: future.result() for name, future in futures.items()}
+
+        # Semantic rankings: articles as returned, resources of all types and
+        # chunks by similarity
+        hit_map: Dict[Tuple[str, int], Dict] = {}
+        semantic: Dict[str, List[Dict]] = {"article": [], "resource": []}
+        for name, hits in hits_by_query.items():
+            kind = "article" if name == "articles" else "resource"
+            semantic[kind].extend(hits)
+        semantic["resource"].sort(key=lambda hit: hit["similarity_score"], reverse=True)
+
+        ranked: Dict[str, List[int]] = {"article": [], "resource": []}
+        for kind, hits in semantic.items():
+            for hit in hits:
+                item_id = hit["metadata"].get("article_id" if kind == "article" else "resource_id")
+                if item_id is None or (kind, int(item_id)) in hit_map:
+                    continue
+                hit_map[(kind, int(item_id))] = hit
+                ranked[kind].append(int(item_id))
+
+        article_keys = reciprocal_rank_fusion([ranked["article"], keyword_articles])
+        resource_keys = reciprocal_rank_fusion([ranked["resource"], keyword_resources])
+
+        result.articles = RetrievalService._hydrate_articles(
+            db, article_keys, hit_map, statuses, article_limit
+        )
+        result.resources = RetrievalService._hydrate_resources(
+            db, resource_keys[:resource_limit], hit_map
+        )
+
+        logger.info(
+            f"✓ Retrieval: {len(result.articles)} articles, {len(result.resources)} resources "
+            f"for '{query[:50]}' ({len(queries)} vector queries)"
+        )
+        return result
+
+    @staticmethod
+    def _hydrate_articles(
+        db: Session,
+        article_keys: List[Tuple[int, float]],
+        hit_map: Dict[Tuple[str, int], Dict],
+        statuses: Sequence[str],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Load visible articles in one query and build dicts from the retrieved documents."""
+        from services.content_service import ContentService
+        from services.content_store import ContentStore
+
+        if not article_keys or limit <= 0:
+            return []
+
+        ids = [article_id for article_id, _ in article_keys]
+        filters = [ContentArticle.id.in_(ids), ContentArticle.is_active == True]
+        if statuses:
+            filters.append(ContentArticle.status.in_(list(statuses)))
+        rows = {article.id: article for article in db.query(ContentArticle).filter(*filters).all()}
+
+        # Keyword-only matches have no retrieved document: read them from the store
+        missing = [article_id for article_id in rows if ("article", article_id) not in hit_map]
+        stored = ContentStore.get_many(db, missing)
+
+        articles = []
+        for article_id, score in article_keys:
+            article = rows.get(article_id)
+            if article is None:
+                continue
+            hit = hit_map.get(("article", article_id))
+            if hit is not None:
+                chroma_data = {"content": hit["document"] or "", "metadata": hit["metadata"]}
+            elif article_id in stored:
+                chroma_data = {"content": stored[article_id], "metadata": {}}
+            else:
+                chroma_data = None
+            article_dict = ContentService._article_to_dict(article, chroma_data=chroma_data)
+            article_dict["similarity_score"] = hit["similarity_score"] if hit else None
+            article_dict["relevance"] = score
+            articles.append(article_dict)
+            if len(articles) >= limit:
+                break
+        return articles
+
+    @staticmethod
+    def _hydrate_resources(
+        db: Session,
+        resource_keys: List[Tuple[int, float]],
+        hit_map: Dict[Tuple[str, int], Dict],
+    ) -> List[Dict[str, Any]]:
+        """Build resource dicts from the retrieved documents (one query for keyword-only matches)."""
+        missing = [resource_id for resource_id, _ in resource_keys if ("resource", resource_id) not in hit_map]
+        rows = {}
+        if missing:
+            rows = {
+                resource.id: resource
+                for resource in db.query(Resource).options(joinedload(Resource.text_resource)).filter(
+                    Resource.id.in_(missing)
+                ).all()
+            }
+
+        resources = []
+        for resource_id, score in resource_keys:
+            hit = hit_map.get(("resource", resource_id))
+            if hit is not None:
+                metadata = hit["metadata"]
+                resources.append({
+                    "resource_id": resource_id,
+                    "name": metadata.get("name"),
+                    "type": metadata.get("type"),
+                    "similarity_score": hit["similarity_score"],
+                    "relevance": score,
+                    "content_preview": hit["document"][:200] if hit["document"] else None,
+                })
+                continue
+            resource = rows.get(resource_id)
+            if resource is None:
+                continue
+            preview = resource.text_resource.content if resource.text_resource else resource.description
+            resources.append({
+                "resource_id": resource_id,
+                "name": resource.name,
+                "type": resource.resource_type.value if hasattr(resource.resource_type, "value") else resource.resource_type,
+                "similarity_score": None,
+                "relevance": score,
+                "content_preview": preview[:200] if preview else None,
+            })
+        return resources
@@ -0,0 +1,213 @@
+"""
+Cached web searches (DuckDuckGo, Google Custom Search).
+
+Results are cached in Redis (the content cache server; a per-process dict
+while Redis is unavailable) under the provider, the normalized query and the
+search parameters (recency window, result count):
+    fresh  younger than WEB_SEARCH_CACHE_FRESH_SECONDS: served as is
+    stale  up to WEB_SEARCH_CACHE_STALE_SECONDS older: served, and searched
+           again on a background thread
+    miss   searched inline
+A failed search is not cached; callers get the provider's error.
+
+Each provider has a concurrency limit (WEB_SEARCH_DDG_CONCURRENCY,
+WEB_SEARCH_GOOGLE_CONCURRENCY) shared by inline searches and background
+refreshes. Result URLs are canonicalized (host case, fragments, tracking
+parameters) and duplicates are dropped. dedupe_results() accepts both result
+shapes, so it also drops duplicates across providers;
+WebSearchAgent.search_news merges DuckDuckGo and Google news with it.
+
+Usage:
+    results = cached_search("ddg_news", query, lambda: run(query), timelimit="w", max_results=10)
+    unique = dedupe_results(ddg_results + google_results)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config import settings
+from metrics import record_cache_lookup
+from services import content_cache
+
+logger = logging.getLogger("uvicorn")
+
+# Query parameters that only track the click
+TRACKING_PARAMS = frozenset({
+    "cmpid", "fbclid", "gclid", "guccounter", "mc_cid", "mc_eid", "msclkid", "ocid", "ref", "ref_src",
+    "smid", "taid",
+})
+
+SearchResults = List[Dict[str, Any]]
+
+
+def canonical_url(url: str) -> str:
+    """URL without fragment and tracking parameters, lower-case host, sorted query."""
+    url = (url or "").strip()
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith("utm_")
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+
+
+def _url_key(url: str) -> str:
+    """Identity of a canonical URL (http/https, www. and a trailing slash ignored)."""
+    parts = urlsplit(url)
+    host = parts.netloc[4:] if parts.netloc.startswith("www.") else parts.netloc
+    return f"{host}{parts.path.rstrip('/')}?{parts.query}"
+
+
+def dedupe_results(results: SearchResults) -> SearchResults:
+    """
+    Results with canonical URLs, dropping later results for an already seen URL.
+
+    Handles both result shapes ("url" from DuckDuckGo, "link" from Google);
+    results without a URL are kept.
+    """
+    seen = set()
+    unique = []
+    for result in results:
+        field = "url" if "url" in result else "link"
+        url = result.get(field)
+        if url:
+            url = canonical_url(url)
+            key = _url_key(url)
+            if key in seen:
+                continue
+            seen.add(key)
+            result = {**result, field: url}
+        unique.append(result)
+    return unique
+
+
+class SearchCache:
+    """Stale-while-revalidate cache of search results with per-provider concurrency limits."""
+
+    def __init__(self, max_local_entries: int = 256):
+        self._max_local_entries = max_local_entries
+        self._lock = threading.Lock()
+        self._local: "OrderedDict[str, str]" = OrderedDict()  # key -> JSON entry
+        self._refreshing: set = set()
+        self._limiters: Dict[str, threading.BoundedSemaphore] = {}
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-refresh")
+
+    @staticmethod
+    def key(provider: str, query: str, params: Dict[str, Any]) -> str:
+        normalized = " ".join(query.lower().split())
+        raw = json.dumps([provider, normalized, sorted(params.items())], default=str)
+        return f"websearch:{provider}:{hashlib.sha256(raw.encode()).hexdigest()[:32]}"
+
+    def search(self, provider: str, query: str, search: Callable[[], SearchResults], **params) -> SearchResults:
+        """
+        Cached results of a search.
+
+        Args:
+            provider: Provider name ("ddg_text", "ddg_news", "google"); the part
+                before "_" selects the concurrency limit
+            query: Query string (normalized for the key)
+            search: Runs the search and returns the result dicts
+            **params: Other parameters that change the results (recency window, count)
+
+        Returns:
+            Deduplicated result dicts
+
+        Raises:
+            Exception: Errors of the search when nothing is cached
+        """
+        if not settings.web_search_cache_enabled:
+            return dedupe_results(self._limited(provider, search))
+
+        key = self.key(provider, query, params)
+        entry = self._read(key)
+        record_cache_lookup("web_search", entry is not None)
+        if entry is not None:
+            if time.time() - entry["fetched_at"] >= settings.web_search_cache_fresh_seconds:
+                self._schedule_refresh(key, provider, search)
+            return entry["results"]
+
+        results = dedupe_results(self._limited(provider, search))
+        self._write(key, results)
+        return results
+
+    def _limited(self, provider: str, search: Callable[[], SearchResults]) -> SearchResults:
+        group = provider.split("_")[0]
+        with self._lock:
+            limiter = self._limiters.get(group)
+            if limiter is None:
+                limit = settings.web_search_google_concurrency if group == "google" else settings.web_search_ddg_concurrency
+                limiter = self._limiters[group] = threading.BoundedSemaphore(max(1, limit))
+        with limiter:
+            return search()
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        cache = content_cache._get_cache()
+        if cache is not None:
+            try:
+                cached = cache.get(key)
+                return json.loads(cached) if cached else None
+            except Exception as e:
+                logger.warning(f"Search cache get error: {e}")
+        with self._lock:
+            cached = self._local.get(key)
+        entry = json.loads(cached) if cached else None
+        if entry is None or time.time() - entry["fetched_at"] >= self._max_age:
+            return None
+        return entry
+
+    def _write(self, key: str, results: SearchResults):
+        entry = json.dumps({"fetched_at": time.time(), "results": results})
+        cache = content_cache._get_cache()
+        if cache is not None:
+            try:
+                cache.setex(key, int(self._max_age), entry)
+                return
+            except Exception as e:
+                logger.warning(f"Search cache set error: {e}")
+        with self._lock:
+            self._local[key] = entry
+            self._local.move_to_end(key)
+            while len(self._local) > self._max_local_entries:
+                self._local.popitem(last=False)
+
+    @property
+    def _max_age(self) -> float:
+        return settings.web_search_cache_fresh_seconds + settings.web_search_cache_stale_seconds
+
+    def _schedule_refresh(self, key: str, provider: str, search: Callable[[], SearchResults]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._executor.submit(self._refresh, key, provider, search)
+
+    def _refresh(self, key: str, provider: str, search: Callable[[], SearchResults]):
+        try:
+            self._write(key, dedupe_results(self._limited(provider, search)))
+        except Exception as e:
+            logger.warning(f"Search refresh failed ({provider}): {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def clear_local(self):
+        """Forget the per-process entries."""
+        with self._lock:
+            self._local.clear()
+
+
+search_cache = SearchCache()
+
+
+def cached_search(provider: str, query: str, search: Callable[[], SearchResults], **params) -> SearchResults:
+    """Cached results of a search (see SearchCache.search)."""
+    return search_cache.search(provider, query, search, **params)
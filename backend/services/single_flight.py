@@ -0,0 +1,275 @@
+"""
+Coalescing of identical in-flight requests (single flight).
+
+Concurrent calls with the same key share one upstream call: the first caller
+(the leader) makes it, and later callers wait for its result, or its error,
+instead of sending the same request again. Used for chat completions and
+embeddings, keyed by a hash of the model, the messages or input text and the
+request parameters (request_key()).
+
+Within a process, threads and coroutines wait on the leader directly and get
+a copy of its result. With LLM_COALESCE_REDIS set, duplicates in other workers
+wait too: the leader holds a Redis lock (singleflight:lock:<key>) and publishes
+its result under singleflight:result:<key> for
+LLM_COALESCE_RESULT_TTL_SECONDS, and workers that find the lock poll for the
+result. A caller that waited LLM_COALESCE_WAIT_SECONDS, or whose leader in
+another worker failed, makes the call itself. Errors are only shared within
+a process.
+
+Usage:
+    key = request_key("embedding", model, text)
+    embedding = single_flight.do("embedding", key, lambda: embed(text), encode=list, decode=list)
+    result = await single_flight.ado("chat", key, lambda: acomplete(messages))
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from config import settings
+from metrics import LLM_COALESCED_REQUESTS
+from services import content_cache
+
+logger = logging.getLogger("uvicorn")
+
+POLL_SECONDS = 0.05
+
+# Deletes the lock only if this caller still holds it
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+LEADER = "leader"
+RESULT = "result"
+WAIT = "wait"
+
+
+def request_key(*parts: Any) -> str:
+    """Canonical hash of request parts (dict keys sorted, non-JSON values as str)."""
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    """An in-flight call that other threads wait on."""
+
+    __slots__ = ("event", "result", "error", "ok")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.ok = False
+
+
+class SingleFlight:
+    """In-process (and optionally cross-worker) coalescing of identical calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        # Futures are bound to the event loop that created them
+        self._futures: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def do(
+        self,
+        kind: str,
+        key: str,
+        fn: Callable[[], Any],
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Result of fn(), shared with identical calls in flight.
+
+        Args:
+            kind: Request kind for the counters ("chat", "embedding")
+            key: Canonical request hash (request_key())
+            fn: Makes the upstream call
+            encode: Converts the result to JSON data; results are only shared
+                across workers when given
+            decode: Converts JSON data published by another worker back
+
+        Returns:
+            The result of this call or of the identical call it waited for
+
+        Raises:
+            Exception: Errors of fn(), or of the in-process call waited for
+        """
+        if not settings.llm_coalesce_enabled:
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            LLM_COALESCED_REQUESTS.inc(kind=kind, scope="process")
+            if not call.event.wait(settings.llm_coalesce_wait_seconds) or not (call.ok or call.error):
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = self._shared(kind, key, fn, encode, decode)
+            call.ok = True
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    async def ado(
+        self,
+        kind: str,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Async variant of do() (coroutines of the running event loop share calls)."""
+        if not settings.llm_coalesce_enabled:
+            return await fn()
+
+        futures = self._futures.setdefault(asyncio.get_running_loop(), {})
+        future = futures.get(key)
+        if future is not None:
+            LLM_COALESCED_REQUESTS.inc(kind=kind, scope="process")
+            done, _ = await asyncio.wait({future}, timeout=settings.llm_coalesce_wait_seconds)
+            if not done or future.cancelled():
+                return await fn()
+            return copy.deepcopy(future.result())
+
+        future = futures[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await self._ashared(kind, key, fn, encode, decode)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here, so an unawaited future logs nothing
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            futures.pop(key, None)
+
+    # -------------------------------------------------------------------------
+    # Cross-worker coalescing
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _keys(key: str) -> Tuple[str, str]:
+        return f"singleflight:lock:{key}", f"singleflight:result:{key}"
+
+    @staticmethod
+    def _redis(encode: Optional[Callable]) -> Any:
+        if encode is None or not settings.llm_coalesce_redis:
+            return None
+        return content_cache._get_cache()
+
+    @staticmethod
+    def _poll(cache: Any, key: str, token: str, decode: Callable) -> Tuple[str, Any]:
+        """One look at the shared state: a published result, the lock taken by us, or wait."""
+        lock_key, result_key = SingleFlight._keys(key)
+        published = cache.get(result_key)
+        if published is not None:
+            return RESULT, decode(json.loads(published))
+        lock_ms = int(settings.llm_coalesce_wait_seconds * 1000)
+        if cache.set(lock_key, token, nx=True, px=lock_ms):
+            return LEADER, None
+        return WAIT, None
+
+    @staticmethod
+    def _publish(cache: Any, key: str, result: Any, encode: Callable):
+        try:
+            cache.setex(SingleFlight._keys(key)[1], settings.llm_coalesce_result_ttl_seconds, json.dumps(encode(result)))
+        except Exception as e:
+            logger.warning(f"Single flight: result not published: {e}")
+
+    @staticmethod
+    def _release(cache: Any, key: str, token: str):
+        try:
+            cache.eval(_RELEASE_SCRIPT, 1, SingleFlight._keys(key)[0], token)
+        except Exception as e:
+            logger.warning(f"Single flight: lock not released: {e}")
+
+    def _shared(self, kind: str, key: str, fn: Callable, encode: Optional[Callable], decode: Optional[Callable]) -> Any:
+        cache = self._redis(encode)
+        if cache is None:
+            return fn()
+
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + settings.llm_coalesce_wait_seconds
+        try:
+            state, result = self._poll(cache, key, token, decode)
+            while state == WAIT and time.monotonic() < deadline:
+                time.sleep(POLL_SECONDS)
+                state, result = self._poll(cache, key, token, decode)
+        except Exception as e:
+            logger.warning(f"Single flight Redis error: {e}")
+            return fn()
+
+        if state == RESULT:
+            LLM_COALESCED_REQUESTS.inc(kind=kind, scope="redis")
+            return result
+        if state == WAIT:
+            return fn()
+        try:
+            result = fn()
+            self._publish(cache, key, result, encode)
+            return result
+        finally:
+            self._release(cache, key, token)
+
+    async def _ashared(
+        self, kind: str, key: str, fn: Callable, encode: Optional[Callable], decode: Optional[Callable]
+    ) -> Any:
+        cache = self._redis(encode)
+        if cache is None:
+            return await fn()
+
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + settings.llm_coalesce_wait_seconds
+        try:
+            # Redis calls run in a worker thread, not on the event loop
+            state, result = await asyncio.to_thread(self._poll, cache, key, token, decode)
+            while state == WAIT and time.monotonic() < deadline:
+                await asyncio.sleep(POLL_SECONDS)
+                state, result = await asyncio.to_thread(self._poll, cache, key, token, decode)
+        except Exception as e:
+            logger.warning(f"Single flight Redis error: {e}")
+            return await fn()
+
+        if state == RESULT:
+            LLM_COALESCED_REQUESTS.inc(kind=kind, scope="redis")
+            return result
+        if state == WAIT:
+            return await fn()
+        try:
+            result = await fn()
+            await asyncio.to_thread(self._publish, cache, key, result, encode)
+            return result
+        finally:
+            await asyncio.to_thread(self._release, cache, key, token)
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,117 @@
+"""
+Keyword search conditions and ranking for articles and resources.
+
+On PostgreSQL (migration 027) each searchable table has a `search_vector`
+tsvector column, kept up to date by a trigger and indexed with GIN, plus
+pg_trgm GIN indexes on the text columns:
+
+    content_articles   headline (A), keywords (B), author (C)
+    resources          name (A), description (B)
+
+A row matches a free-text query when
+    - the tsvector matches websearch_to_tsquery(query)      (stemmed words)
+    - any text column ILIKE '%query%'                       (substrings, trigram index)
+    - the title column is word-similar to the query         (typos, pg_trgm %>)
+and is scored with ts_rank_cd, falling back to trigram word similarity for
+rows that only match on substrings or typos.
+
+Other databases (SQLite in tests and offline benchmarks) get plain ILIKE
+conditions and no rank.
+
+Usage:
+    from services.text_search import ARTICLE_SEARCH, match_condition, rank_expression
+
+    condition = match_condition(db, ARTICLE_SEARCH, "inflation outlook")
+    rank = rank_expression(db, ARTICLE_SEARCH, "inflation outlook")  # None off PostgreSQL
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.orm import Session
+
+from models import ContentArticle, Resource
+
+# Text search configuration used by the triggers in migration 027
+TS_CONFIG = "english"
+
+# ts_rank_cd normalization: rank / (rank + 1), keeps scores in [0, 1)
+RANK_NORMALIZATION = 32
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """A searchable table: its tsvector column and the text columns it covers."""
+    table: str
+    columns: Tuple
+    title_column: object
+
+    @property
+    def vector(self):
+        return literal_column(f"{self.table}.search_vector")
+
+
+ARTICLE_SEARCH = SearchTarget(
+    table="content_articles",
+    columns=(ContentArticle.headline, ContentArticle.keywords),
+    title_column=ContentArticle.headline,
+)
+
+RESOURCE_SEARCH = SearchTarget(
+    table="resources",
+    columns=(Resource.name, Resource.description),
+    title_column=Resource.name,
+)
+
+
+def is_postgres(db: Session) -> bool:
+    """Check if the session is bound to PostgreSQL (full-text search available)."""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def match_condition(db: Session, target: SearchTarget, query: str):
+    """
+    Build the WHERE condition matching a free-text query.
+
+    Args:
+        db: Database session (selects the dialect)
+        target: Table to search
+        query: User search text
+
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    pattern = f"%{query}%"
+    substring = [column.ilike(pattern) for column in target.columns]
+    if not is_postgres(db):
+        return or_(*substring)
+
+    tsquery = func.websearch_to_tsquery(TS_CONFIG, query)
+    return or_(
+        target.vector.op("@@")(tsquery),
+        *substring,
+        target.title_column.op("%>")(query),
+    )
+
+
+def rank_expression(db: Session, target: SearchTarget, query: str) -> Optional[object]:
+    """
+    Build a relevance score in [0, 1] for rows matched by match_condition().
+
+    Args:
+        db: Database session (selects the dialect)
+        target: Table to search
+        query: User search text
+
+    Returns:
+        SQLAlchemy numeric expression, or None if the database has no text ranking
+    """
+    if not is_postgres(db):
+        return None
+
+    tsquery = func.websearch_to_tsquery(TS_CONFIG, query)
+    return func.greatest(
+        func.ts_rank_cd(target.vector, tsquery, RANK_NORMALIZATION),
+        func.word_similarity(query, target.title_column),
+    )
@@ -0,0 +1,248 @@
+"""
+Ticker universe: known symbols, aliases and company names, held in memory.
+
+The universe is a CSV file (symbol,name,aliases; aliases separated by "|")
+loaded once into a sorted symbol array (binary search) and a name/alias
+dictionary. It is read again only when the file changes, so it can be
+refreshed offline by replacing the file, e.g. with update_ticker_universe.py
+from the exchange symbol directory files. TICKER_UNIVERSE_FILE overrides
+the bundled file (services/data/ticker_universe.csv).
+
+Free text is matched against the universe before any market-data call:
+    - $cashtags (unlisted ones too, unless TICKER_UNIVERSE_STRICT is set)
+    - upper-case tokens that are listed symbols
+      (common abbreviations such as ESG, GDP, US, CEO or AI only as $cashtags)
+    - aliases and multi-word company names ("Apple", "Goldman Sachs", "S&P 500")
+
+Usage:
+    symbols = find_symbols("Compare NVDA with Microsoft on ESG", limit=3)  # ["NVDA", "MSFT"]
+    symbol = resolve_symbol("Alphabet")  # "GOOGL"
+"""
+
+import bisect
+import csv
+import logging
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import settings
+
+logger = logging.getLogger("uvicorn")
+
+BUNDLED_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ticker_universe.csv")
+
+# Upper-case words that are rarely meant as tickers in running text ($AI still resolves)
+COMMON_WORDS = frozenset({
+    "A", "AI", "ALL", "AM", "AND", "API", "ARE", "AT", "BE", "BIG", "BP", "BPS", "BY", "CAN", "CEO",
+    "CFO", "CPI", "CTO", "DO", "ECB", "EPS", "ESG", "ETF", "EU", "EUR", "EV", "FED", "FOR", "FX", "GBP",
+    "GDP", "GO", "HAS", "I", "IMF", "IPO", "IS", "IT", "JPY", "KEY", "LOW", "M&A", "NEW", "NOW", "OF",
+    "OK", "ON", "ONE", "OR", "OUT", "PM", "PMI", "Q", "QOQ", "RUN", "SEC", "SEE", "SO", "THE", "TO",
+    "UK", "UP", "US", "USA", "USD", "VS", "YOY", "YTD",
+})
+
+# Trailing words dropped from company names before lookup
+_NAME_SUFFIXES = frozenset({
+    "a", "ag", "b", "c", "class", "co", "company", "corp", "corporation", "etf", "group", "holding",
+    "holdings", "inc", "incorporated", "limited", "lp", "ltd", "n", "nv", "p", "plc", "s", "sa", "se",
+    "trust", "v",
+})
+
+_SYMBOL_PATTERN = re.compile(r"^\^?[A-Z0-9]{1,10}(?:[.-][A-Z0-9]{1,2})?(?:=[A-Z])?$")
+_CASHTAG_PATTERN = re.compile(r"\$([A-Za-z]{1,6}(?:[.-][A-Za-z])?)\b")
+_TOKEN_PATTERN = re.compile(r"(?<![\w$^.-])([A-Z]{1,5}(?:[.-][A-Z])?)(?![\w&-])")
+
+
+def _words(text: str) -> List[str]:
+    """Lower-case words of a text (apostrophes dropped, "&" kept inside words)."""
+    return re.sub(r"[^a-z0-9&]+", " ", re.sub(r"['’]", "", text.lower())).split()
+
+
+def normalize_name(name: str) -> str:
+    """Lookup key of a company name or alias ("The Coca-Cola Company" -> "coca cola")."""
+    words = _words(name)
+    if words and words[0] == "the":
+        words = words[1:]
+    while len(words) > 1 and words[-1] in _NAME_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def _symbol(token: str) -> str:
+    """Yahoo Finance form of a symbol ("brk.b" -> "BRK-B")."""
+    return token.strip().lstrip("$").upper().replace(".", "-")
+
+
+class TickerUniverse:
+    """Sorted symbols with alias and company-name lookup."""
+
+    def __init__(self, rows: Iterable[Tuple[str, str, Iterable[str]]] = ()):
+        """
+        Args:
+            rows: (symbol, company name, aliases); earlier rows win name/alias clashes
+        """
+        symbols = set()
+        names: Dict[str, str] = {}
+        phrases: Dict[str, str] = {}
+        for symbol, name, aliases in rows:
+            symbol = _symbol(symbol)
+            if not symbol:
+                continue
+            symbols.add(symbol)
+            key = normalize_name(name) if name else ""
+            if key:
+                names.setdefault(key, symbol)
+                # Single-word names ("Target", "Block") are too ambiguous in running text
+                if " " in key:
+                    phrases.setdefault(key, symbol)
+            for alias in aliases:
+                key = normalize_name(alias)
+                if key:
+                    names.setdefault(key, symbol)
+                    phrases.setdefault(key, symbol)
+
+        self._symbols: List[str] = sorted(symbols)
+        self._names = names
+        self._phrases = phrases
+        self._max_phrase_words = max((len(p.split()) for p in phrases), default=0)
+
+    @classmethod
+    def load(cls, path: str) -> "TickerUniverse":
+        """Read a symbol,name,aliases CSV file."""
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = [
+                (row["symbol"], row.get("name") or "", [a for a in (row.get("aliases") or "").split("|") if a])
+                for row in csv.DictReader(f)
+            ]
+        return cls(rows)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        symbol = _symbol(symbol)
+        index = bisect.bisect_left(self._symbols, symbol)
+        return index < len(self._symbols) and self._symbols[index] == symbol
+
+    def resolve(self, text: str) -> Optional[str]:
+        """Symbol for a ticker, alias or company name ("aapl", "Apple Inc.", "$BRK.B"), or None."""
+        if not text or not text.strip():
+            return None
+        if text in self:
+            return _symbol(text)
+        return self._names.get(normalize_name(text))
+
+    def find_symbols(self, text: str, limit: Optional[int] = None, strict: bool = True) -> List[str]:
+        """
+        Symbols mentioned in free text.
+
+        Args:
+            text: Query or message
+            limit: Keep only the first symbols
+            strict: Only listed symbols; without, well-formed $cashtags are
+                kept even if they are not in the universe
+
+        Returns:
+            Unique symbols: cashtags, then upper-case tickers (two letters or more),
+            then aliases and company names, each in order of appearance
+        """
+        found: Dict[str, None] = {}
+
+        for match in _CASHTAG_PATTERN.finditer(text):
+            symbol = _symbol(match.group(1))
+            if symbol in self or (not strict and _SYMBOL_PATTERN.match(symbol)):
+                found.setdefault(symbol)
+        for match in _TOKEN_PATTERN.finditer(text):
+            token = match.group(1)
+            if len(token) > 1 and token not in COMMON_WORDS and token in self:
+                found.setdefault(_symbol(token))
+
+        if self._max_phrase_words:
+            words = _words(text)
+            position = 0
+            while position < len(words):
+                for size in range(min(self._max_phrase_words, len(words) - position), 0, -1):
+                    symbol = self._phrases.get(" ".join(words[position:position + size]))
+                    if symbol:
+                        found.setdefault(symbol)
+                        position += size
+                        break
+                else:
+                    position += 1
+
+        symbols = list(found)
+        return symbols[:limit] if limit is not None else symbols
+
+
+_universe: Optional[TickerUniverse] = None
+_loaded_from: Optional[Tuple[str, float]] = None
+_pinned = False
+_load_lock = threading.Lock()
+
+
+def universe_path() -> str:
+    return settings.ticker_universe_file or BUNDLED_FILE
+
+
+def get_universe() -> TickerUniverse:
+    """The ticker universe, loaded on first use and again after its file changed."""
+    global _universe, _loaded_from
+    if _pinned:
+        return _universe
+
+    path = universe_path()
+    try:
+        key = (path, os.path.getmtime(path))
+    except OSError:
+        key = (path, 0.0)
+    if _universe is not None and _loaded_from == key:
+        return _universe
+
+    with _load_lock:
+        if _universe is None or _loaded_from != key:
+            try:
+                _universe = TickerUniverse.load(path)
+                logger.info(f"Loaded ticker universe: {len(_universe)} symbols from {path}")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ticker universe unavailable ({path}): {e}")
+                _universe = _universe or TickerUniverse()
+            _loaded_from = key
+    return _universe
+
+
+def set_universe(universe: Optional[TickerUniverse]) -> Optional[TickerUniverse]:
+    """Install a universe (None: go back to the file); returns the previous one."""
+    global _universe, _loaded_from, _pinned
+    previous = _universe
+    _universe, _loaded_from, _pinned = universe, None, universe is not None
+    return previous
+
+
+def find_symbols(text: str, limit: Optional[int] = None) -> List[str]:
+    """
+    Symbols mentioned in free text (see TickerUniverse.find_symbols).
+
+    $cashtags pass through like tool arguments in resolve_symbol: unlisted
+    ones are kept unless TICKER_UNIVERSE_STRICT is set.
+    """
+    return get_universe().find_symbols(text, limit, strict=settings.ticker_universe_strict)
+
+
+def resolve_symbol(text: str) -> Optional[str]:
+    """
+    Symbol to request from the data provider for a tool argument, or None to reject it.
+
+    Tickers, aliases and company names in the universe resolve to their symbol.
+    Other well-formed tickers pass through unless TICKER_UNIVERSE_STRICT is set
+    or they are common abbreviations (GDP, CEO, ...).
+    """
+    symbol = get_universe().resolve(text)
+    if symbol:
+        return symbol
+    if not text or settings.ticker_universe_strict:
+        return None
+    candidate = _symbol(text)
+    if candidate in COMMON_WORDS or not _SYMBOL_PATTERN.match(candidate):
+        return None
+    return candidate
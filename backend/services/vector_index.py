@@ -0,0 +1,567 @@
+"""
+In-process vector index mirroring the ChromaDB collections.
+
+Each collection (articles, resources) is held in RAM as a float32 matrix of
+unit-normalized embeddings plus the document ids, metadata and documents.
+A query is one matrix-vector product (cosine similarity) and a partial sort,
+after pre-filtering rows with the same `where` filters ChromaDB accepts.
+LocalVectorIndex.query() returns ChromaDB's result shape, so callers can use
+an index in place of a collection.
+
+Lifecycle:
+    initialize()     load the snapshot from VECTOR_INDEX_PATH (memory-mapped)
+                     or build from ChromaDB, then catch up on the change feed
+    record_upsert()  called by VectorService / ResourceService after a write:
+    record_metadata()
+    record_delete()  applied locally and appended to the change feed
+    get_index()      the index to query, or None (disabled / not loaded yet)
+    save_snapshots() write the snapshot (on shutdown)
+
+The change feed is a Redis stream, so every worker process sees writes made
+by the others. Without Redis each process only sees its own writes.
+
+Queries fall back to ChromaDB until the index is loaded, and the index keeps
+serving semantic search when ChromaDB is unreachable.
+"""
+
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from config import settings
+
+logger = logging.getLogger("uvicorn")
+
+ARTICLES = "articles"
+RESOURCES = "resources"
+COLLECTIONS = (ARTICLES, RESOURCES)
+
+CHANGE_STREAM = "vector_index:changes"
+CHANGE_STREAM_MAXLEN = 10000
+FEED_POLL_SECONDS = 1.0
+FEED_BATCH_SIZE = 500
+BUILD_PAGE_SIZE = 500
+INITIAL_CAPACITY = 64
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+_OPERATORS = {
+    "$eq": lambda value, operand: value == operand,
+    "$ne": lambda value, operand: value != operand,
+    "$in": lambda value, operand: value in operand,
+    "$nin": lambda value, operand: value not in operand,
+    "$gt": lambda value, operand: value is not None and value > operand,
+    "$gte": lambda value, operand: value is not None and value >= operand,
+    "$lt": lambda value, operand: value is not None and value < operand,
+    "$lte": lambda value, operand: value is not None and value <= operand,
+}
+
+
+def matches_where(metadata: Dict[str, Any], where: Dict[str, Any]) -> bool:
+    """Evaluate a ChromaDB metadata filter ($and/$or, $eq/$ne/$in/$nin/$gt/...)."""
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches_where(metadata, c) for c in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_where(metadata, c) for c in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for op, operand in condition.items():
+                if not _OPERATORS[op](value, operand):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+def _write_atomic(path: str, write) -> None:
+    """Write a file through a unique temp file in the same directory, then rename it into place."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class LocalVectorIndex:
+    """Brute-force cosine index over one collection."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.RLock()
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._metadatas: List[Dict[str, Any]] = []
+        self._documents: List[Optional[str]] = []
+        self._matrix: Optional[np.ndarray] = None  # (capacity, dim), rows [0, size) in use
+        self._size = 0
+
+    def count(self) -> int:
+        return self._size
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def _ensure_capacity(self, needed: int, dim: int):
+        """Grow the matrix (doubling) and make it writable (copies a memory map)."""
+        if self._matrix is None:
+            self._matrix = np.zeros((max(needed, INITIAL_CAPACITY), dim), dtype=np.float32)
+            return
+        if self._matrix.shape[1] != dim:
+            raise ValueError(
+                f"Embedding dimension {dim} does not match index '{self.name}' ({self._matrix.shape[1]})"
+            )
+        capacity = self._matrix.shape[0]
+        if needed > capacity:
+            capacity = max(needed, capacity * 2)
+        if capacity > self._matrix.shape[0] or not self._matrix.flags.writeable:
+            grown = np.zeros((max(capacity, INITIAL_CAPACITY), dim), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+        documents: Optional[Sequence[Optional[str]]] = None,
+    ):
+        """Insert or replace documents."""
+        if not ids:
+            return
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1))
+        with self._lock:
+            self._ensure_capacity(self._size + len(ids), vectors.shape[1])
+            for i, doc_id in enumerate(ids):
+                position = self._positions.get(doc_id)
+                if position is None:
+                    position = self._size
+                    self._size += 1
+                    self._positions[doc_id] = position
+                    self._ids.append(doc_id)
+                    self._metadatas.append({})
+                    self._documents.append(None)
+                self._matrix[position] = vectors[i]
+                self._metadatas[position] = dict(metadatas[i]) if metadatas else {}
+                self._documents[position] = documents[i] if documents else None
+
+    def update_metadata(self, ids: Sequence[str], metadatas: Sequence[Dict[str, Any]]):
+        """Merge metadata into existing documents, keeping their embeddings (unknown ids are ignored)."""
+        with self._lock:
+            for doc_id, metadata in zip(ids, metadatas):
+                position = self._positions.get(doc_id)
+                if position is not None:
+                    self._metadatas[position] = {**self._metadatas[position], **metadata}
+
+    def delete(self, ids: Sequence[str]):
+        """Remove documents (unknown ids are ignored)."""
+        with self._lock:
+            for doc_id in ids:
+                position = self._positions.pop(doc_id, None)
+                if position is None:
+                    continue
+                if self._matrix is not None:
+                    self._ensure_capacity(self._size, self._matrix.shape[1])
+                last = self._size - 1
+                if position != last:
+                    # Move the last row into the gap
+                    moved = self._ids[last]
+                    self._matrix[position] = self._matrix[last]
+                    self._ids[position] = moved
+                    self._metadatas[position] = self._metadatas[last]
+                    self._documents[position] = self._documents[last]
+                    self._positions[moved] = position
+                self._ids.pop()
+                self._metadatas.pop()
+                self._documents.pop()
+                self._size = last
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def query(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[Sequence[str]] = None,
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Nearest neighbours by cosine similarity, in ChromaDB's result format.
+
+        Args:
+            query_embeddings: One or more query vectors
+            n_results: Results per query
+            where: ChromaDB metadata filter, applied before scoring
+            include: Accepted for compatibility; documents, metadatas and
+                distances (1 - cosine similarity) are always returned
+
+        Returns:
+            Dict with ids, distances, metadatas and documents (one list per query)
+        """
+        queries = _normalize(np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_embeddings), -1))
+        result: Dict[str, List[List[Any]]] = {"ids": [], "distances": [], "metadatas": [], "documents": []}
+
+        with self._lock:
+            if where:
+                candidates = np.fromiter(
+                    (i for i in range(self._size) if matches_where(self._metadatas[i], where)),
+                    dtype=np.int64,
+                )
+                matrix = self._matrix[candidates] if len(candidates) else None
+            else:
+                candidates = None
+                matrix = self._matrix[:self._size] if self._size else None
+
+            for query in queries:
+                if matrix is None or n_results <= 0:
+                    for key in result:
+                        result[key].append([])
+                    continue
+
+                scores = matrix @ query
+                k = min(n_results, len(scores))
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top])]
+                positions = top if candidates is None else candidates[top]
+
+                result["ids"].append([self._ids[p] for p in positions])
+                result["distances"].append([float(1.0 - scores[t]) for t in top])
+                result["metadatas"].append([self._metadatas[p] for p in positions])
+                result["documents"].append([self._documents[p] for p in positions])
+
+        return result
+
+    def get(self, ids: Sequence[str], include: Optional[Sequence[str]] = None) -> Dict[str, List[Any]]:
+        """Documents by id, in ChromaDB's get() result format (unknown ids are skipped)."""
+        with self._lock:
+            positions = [self._positions[doc_id] for doc_id in ids if doc_id in self._positions]
+            return {
+                "ids": [self._ids[p] for p in positions],
+                "metadatas": [self._metadatas[p] for p in positions],
+                "documents": [self._documents[p] for p in positions],
+            }
+
+    # -------------------------------------------------------------------------
+    # Snapshots
+    # -------------------------------------------------------------------------
+
+    def save(self, directory: str, feed_position: str):
+        """Write <name>.npy (embeddings) and <name>.json (ids, metadata, documents)."""
+        with self._lock:
+            vectors = np.array(self._matrix[:self._size]) if self._matrix is not None else np.zeros((0, 0), np.float32)
+            payload = {
+                "ids": list(self._ids),
+                "metadatas": list(self._metadatas),
+                "documents": list(self._documents),
+                "feed_position": feed_position,
+            }
+
+        def write_vectors(path):
+            with open(path, "wb") as f:
+                np.save(f, vectors)
+
+        def write_meta(path):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+
+        # Unique temp files per writer: workers saving at once never share one
+        _write_atomic(os.path.join(directory, f"{self.name}.npy"), write_vectors)
+        _write_atomic(os.path.join(directory, f"{self.name}.json"), write_meta)
+
+    @classmethod
+    def load(cls, name: str, directory: str) -> Optional[Tuple["LocalVectorIndex", str]]:
+        """
+        Load a snapshot, memory-mapping the embeddings (copied on first write).
+
+        Returns:
+            Tuple of (index, feed position), or None if there is no usable snapshot
+        """
+        vectors_path = os.path.join(directory, f"{name}.npy")
+        meta_path = os.path.join(directory, f"{name}.json")
+        if not (os.path.exists(vectors_path) and os.path.exists(meta_path)):
+            return None
+
+        with open(meta_path, encoding="utf-8") as f:
+            payload = json.load(f)
+        matrix = np.load(vectors_path, mmap_mode="r")
+        if matrix.shape[0] != len(payload["ids"]):
+            logger.warning(f"Vector index: snapshot '{name}' is inconsistent, ignoring it")
+            return None
+
+        index = cls(name)
+        index._ids = payload["ids"]
+        index._positions = {doc_id: i for i, doc_id in enumerate(index._ids)}
+        index._metadatas = payload["metadatas"]
+        index._documents = payload["documents"]
+        index._matrix = matrix if matrix.shape[0] else None
+        index._size = matrix.shape[0]
+        return index, payload.get("feed_position", "0-0")
+
+
+# =============================================================================
+# PROCESS-WIDE INDEXES AND CHANGE FEED
+# =============================================================================
+
+_indexes: Dict[str, LocalVectorIndex] = {}
+_ready = False
+_feed_position = "0-0"
+_last_poll = 0.0
+_poll_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return settings.vector_index_enabled
+
+
+def is_ready() -> bool:
+    return _ready
+
+
+def get_index(name: str) -> Optional[LocalVectorIndex]:
+    """
+    Get the local index to query instead of ChromaDB.
+
+    Returns:
+        The index, or None if disabled or not loaded yet (use ChromaDB)
+    """
+    if not _ready:
+        return None
+    _poll_changes()
+    return _indexes.get(name)
+
+
+def _stream_id(position: str) -> Tuple[int, int]:
+    ms, _, seq = position.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _get_feed():
+    """Redis client for the change feed, or None."""
+    from services.content_cache import _get_cache
+    return _get_cache()
+
+
+def _source_collection(name: str):
+    """ChromaDB collection backing an index."""
+    if name == ARTICLES:
+        from services.vector_service import _get_chroma_client
+        return _get_chroma_client()[1]
+    from services.resource_service import _get_resource_collection
+    return _get_resource_collection()
+
+
+def build_from_chroma(name: str) -> Optional[LocalVectorIndex]:
+    """Copy a ChromaDB collection into a new index (None if ChromaDB is unavailable)."""
+    collection = _source_collection(name)
+    if collection is None:
+        return None
+
+    index = LocalVectorIndex(name)
+    offset = 0
+    while True:
+        page = collection.get(
+            include=["embeddings", "metadatas", "documents"],
+            limit=BUILD_PAGE_SIZE,
+            offset=offset,
+        )
+        ids = page["ids"]
+        if not ids:
+            break
+        index.upsert(ids, page["embeddings"], page["metadatas"], page["documents"])
+        offset += len(ids)
+        if len(ids) < BUILD_PAGE_SIZE:
+            break
+    logger.info(f"Vector index: built '{name}' from ChromaDB ({index.count()} documents)")
+    return index
+
+
+def initialize() -> bool:
+    """
+    Load or build the indexes and catch up on the change feed.
+
+    Returns:
+        True if the indexes are ready to serve queries
+    """
+    global _ready, _feed_position
+    if not is_enabled():
+        return False
+
+    feed = _get_feed()
+    feed_start = None
+    if feed is not None:
+        try:
+            info = feed.xinfo_stream(CHANGE_STREAM)
+            first = info.get("first-entry")
+            feed_start = first[0] if first else None
+            last_id = info.get("last-generated-id") or "0-0"
+        except Exception:
+            last_id = "0-0"
+    else:
+        last_id = "0-0"
+
+    positions = []
+    for name in COLLECTIONS:
+        loaded = LocalVectorIndex.load(name, settings.vector_index_path)
+        if loaded is not None:
+            index, position = loaded
+            # Entries after the snapshot were trimmed from the stream: rebuild
+            if feed_start is not None and _stream_id(position) < _stream_id(feed_start):
+                loaded = None
+            else:
+                logger.info(f"Vector index: loaded '{name}' snapshot ({index.count()} documents)")
+                positions.append(position)
+        if loaded is None:
+            index = build_from_chroma(name)
+            if index is None:
+                index = LocalVectorIndex(name)
+            positions.append(last_id)
+        _indexes[name] = index
+
+    _feed_position = min(positions, key=_stream_id)
+    _ready = True
+    _poll_changes(force=True)
+    save_snapshots()
+    return True
+
+
+def save_snapshots():
+    """Write all index snapshots with the current feed position."""
+    if not _ready:
+        return
+    for index in _indexes.values():
+        try:
+            index.save(settings.vector_index_path, _feed_position)
+        except Exception as e:
+            logger.error(f"Vector index: failed to save '{index.name}' snapshot: {e}")
+
+
+def _apply_change(fields: Dict[str, str]):
+    index = _indexes.get(fields.get("collection"))
+    if index is None:
+        return
+    if fields.get("op") == "delete":
+        index.delete([fields["id"]])
+        return
+    payload = json.loads(fields["payload"])
+    if fields.get("op") == "metadata":
+        index.update_metadata([fields["id"]], [payload["metadata"]])
+        return
+    embedding = np.frombuffer(base64.b64decode(payload["embedding"]), dtype=np.float32)
+    index.upsert([fields["id"]], [embedding], [payload.get("metadata") or {}], [payload.get("document")])
+
+
+def _poll_changes(force: bool = False):
+    """Apply change feed entries written since the last poll (at most once per second)."""
+    global _feed_position, _last_poll
+    if not force and time.monotonic() - _last_poll < FEED_POLL_SECONDS:
+        return
+    if not _poll_lock.acquire(blocking=force):
+        return
+    try:
+        _last_poll = time.monotonic()
+        feed = _get_feed()
+        if feed is None:
+            return
+        while True:
+            response = feed.xread({CHANGE_STREAM: _feed_position}, count=FEED_BATCH_SIZE)
+            if not response:
+                break
+            entries = response[0][1]
+            for entry_id, fields in entries:
+                _apply_change(fields)
+                _feed_position = entry_id
+            if len(entries) < FEED_BATCH_SIZE:
+                break
+    except Exception as e:
+        logger.warning(f"Vector index: change feed poll failed: {e}")
+    finally:
+        _poll_lock.release()
+
+
+def _publish(fields: Dict[str, str]):
+    feed = _get_feed()
+    if feed is None:
+        return
+    try:
+        feed.xadd(CHANGE_STREAM, fields, maxlen=CHANGE_STREAM_MAXLEN, approximate=True)
+    except Exception as e:
+        logger.warning(f"Vector index: failed to publish change: {e}")
+
+
+def record_upsert(
+    name: str,
+    doc_id: str,
+    embedding: Sequence[float],
+    metadata: Dict[str, Any],
+    document: Optional[str],
+):
+    """Record a document written to ChromaDB (local index + change feed)."""
+    if not is_enabled():
+        return
+    if name in _indexes:
+        _indexes[name].upsert([doc_id], [embedding], [metadata], [document])
+    vector = np.asarray(embedding, dtype=np.float32)
+    _publish({
+        "collection": name,
+        "op": "upsert",
+        "id": doc_id,
+        "payload": json.dumps({
+            "embedding": base64.b64encode(vector.tobytes()).decode("ascii"),
+            "metadata": metadata,
+            "document": document,
+        }),
+    })
+
+
+def record_metadata(name: str, doc_id: str, metadata: Dict[str, Any]):
+    """Record a metadata-only update in ChromaDB (local index + change feed)."""
+    if not is_enabled():
+        return
+    if name in _indexes:
+        _indexes[name].update_metadata([doc_id], [metadata])
+    _publish({
+        "collection": name,
+        "op": "metadata",
+        "id": doc_id,
+        "payload": json.dumps({"metadata": metadata}),
+    })
+
+
+def record_delete(name: str, doc_id: str):
+    """Record a document deleted from ChromaDB (local index + change feed)."""
+    if not is_enabled():
+        return
+    if name in _indexes:
+        _indexes[name].delete([doc_id])
+    _publish({"collection": name, "op": "delete", "id": doc_id})
+
+
+def reset():
+    """Drop all indexes (used by tests)."""
+    global _ready, _feed_position, _last_poll
+    _indexes.clear()
+    _ready = False
+    _feed_position = "0-0"
+    _last_poll = 0.0
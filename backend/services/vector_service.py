@@ -1,12 +1,21 @@
 """Vector database service using ChromaDB for semantic search."""
 
+import asyncio
+import hashlib
 import chromadb
 from chromadb.config import Settings as ChromaSettings
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 import logging
-from openai import OpenAI
+import weakref
+import httpx
+from openai import AsyncOpenAI, OpenAI
 
 from config import settings
+from metrics import observed
+from resilience import CHROMADB, OPENAI, CircuitOpenError, guard
+from services import vector_index
+from services.llm_client import LLMOverloadedError, estimate_tokens, governor
+from services.single_flight import request_key, single_flight
 
 logger = logging.getLogger("uvicorn")
 
@@ -15,17 +24,45 @@ _chroma_client = None
 _collection = None
 _openai_client = None
 _vectordb_initialized = False
-_vectordb_failed = False
+
+# Async clients are bound to the event loop that created them
+# (event loop -> {"client": ..., "openai": ..., <collection name>: ...})
+_async_state: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+ARTICLE_COLLECTION_METADATA = {
+    "description": "Research articles with semantic embeddings",
+    "hnsw:space": "cosine"  # Cosine similarity for embeddings
+}
+
+
+def _text_hash(text: str) -> str:
+    """SHA-256 of embedded text, stored as `content_hash` to skip re-embedding unchanged text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _apply_http_timeout(client, seconds: float):
+    """Set a per-request deadline on a ChromaDB HttpClient (its httpx session has none)."""
+    session = getattr(getattr(client, "_server", None), "_session", None)
+    if session is not None:
+        session.timeout = httpx.Timeout(seconds)
 
 
 def _get_chroma_client():
-    """Lazy initialization of ChromaDB client."""
-    global _chroma_client, _collection, _vectordb_initialized, _vectordb_failed
+    """
+    Lazy initialization of ChromaDB client.
+
+    Returns (None, None) while the ChromaDB circuit is open. A failed connection
+    is retried on the next half-open probe, so a blip at startup does not
+    disable semantic search for the life of the process.
+    """
+    global _chroma_client, _collection, _vectordb_initialized
 
     if _vectordb_initialized:
+        if not CHROMADB.available():
+            return None, None
         return _chroma_client, _collection
 
-    if _vectordb_failed:
+    if not CHROMADB.allow():
         return None, None
 
     try:
@@ -33,38 +70,39 @@ def _get_chroma_client():
         logger.info(f"  Host: {settings.chroma_host}")
         logger.info(f"  Port: {settings.chroma_port}")
 
-        _chroma_client = chromadb.HttpClient(
+        client = chromadb.HttpClient(
             host=settings.chroma_host,
             port=settings.chroma_port,
             settings=ChromaSettings(
                 anonymized_telemetry=False
             )
         )
+        _apply_http_timeout(client, settings.chroma_timeout_seconds)
 
         # Test connection
-        _chroma_client.heartbeat()
+        client.heartbeat()
 
         # Get or create collection
-        _collection = _chroma_client.get_or_create_collection(
+        collection = client.get_or_create_collection(
             name=settings.chroma_collection_name,
-            metadata={
-                "description": "Research articles with semantic embeddings",
-                "hnsw:space": "cosine"  # Cosine similarity for embeddings
-            }
+            metadata=ARTICLE_COLLECTION_METADATA
         )
 
+        # Every later call goes through the circuit breaker
+        _chroma_client = guard(client, CHROMADB)
+        _collection = guard(collection, CHROMADB)
         _vectordb_initialized = True
+        CHROMADB.record_success()
         logger.info(f"✓ Vector DB: ChromaDB connected successfully")
         logger.info(f"  Collection: {settings.chroma_collection_name}")
-        logger.info(f"  Documents: {_collection.count()}")
+        logger.info(f"  Documents: {collection.count()}")
 
         return _chroma_client, _collection
 
     except Exception as e:
+        CHROMADB.record_failure(e)
         logger.error(f"✗ Vector DB: ChromaDB connection failed: {e}")
-        logger.warning("  Semantic search will be disabled")
-        _vectordb_failed = True
-        _vectordb_initialized = True
+        logger.warning("  Semantic search unavailable until the next reconnect attempt")
         return None, None
 
 
@@ -80,7 +118,11 @@ def _get_openai_client():
         return None
 
     try:
-        _openai_client = OpenAI(api_key=settings.openai_api_key)
+        _openai_client = OpenAI(
+            api_key=settings.openai_api_key,
+            timeout=settings.openai_embedding_timeout_seconds,
+            max_retries=1
+        )
         logger.info(f"✓ OpenAI embeddings initialized: {settings.openai_embedding_model}")
         return _openai_client
     except Exception as e:
@@ -88,22 +130,151 @@ def _get_openai_client():
         return None
 
 
+def _loop_state() -> Dict[str, Any]:
+    """Async clients of the running event loop."""
+    loop = asyncio.get_running_loop()
+    state = _async_state.get(loop)
+    if state is None:
+        state = _async_state[loop] = {}
+    return state
+
+
+def _apply_async_http_timeout(client, seconds: float):
+    """Set a per-request deadline on the pooled httpx client behind an AsyncHttpClient."""
+    get_session = getattr(getattr(client, "_server", None), "_get_client", None)
+    if get_session is not None:
+        get_session().timeout = httpx.Timeout(seconds)
+
+
+async def _aget_chroma_collection(
+    name: Optional[str] = None,
+    metadata: Optional[Dict] = None
+):
+    """
+    Async ChromaDB collection for the running event loop.
+
+    Uses chromadb.AsyncHttpClient (one pooled httpx connection set per loop), so
+    route handlers can await many vector calls concurrently without blocking the
+    worker. Shares the ChromaDB circuit breaker with the sync client.
+
+    Args:
+        name: Collection name (defaults to the articles collection)
+        metadata: Metadata used if the collection has to be created
+
+    Returns:
+        Guarded async collection, or None while ChromaDB is unavailable
+    """
+    name = name or settings.chroma_collection_name
+    state = _loop_state()
+
+    if name in state:
+        return state[name] if CHROMADB.available() else None
+
+    if not CHROMADB.allow():
+        return None
+
+    try:
+        client = state.get("client")
+        if client is None:
+            # Creating the client already calls the server, before the timeout below applies
+            client = await asyncio.wait_for(chromadb.AsyncHttpClient(
+                host=settings.chroma_host,
+                port=settings.chroma_port,
+                settings=ChromaSettings(
+                    anonymized_telemetry=False
+                )
+            ), settings.chroma_timeout_seconds)
+            _apply_async_http_timeout(client, settings.chroma_timeout_seconds)
+            await client.heartbeat()
+            state["client"] = client
+
+        collection = await client.get_or_create_collection(
+            name=name,
+            metadata=metadata or ARTICLE_COLLECTION_METADATA
+        )
+        state[name] = guard(collection, CHROMADB)
+        CHROMADB.record_success()
+        logger.info(f"✓ Vector DB: async collection ready: {name}")
+        return state[name]
+
+    except Exception as e:
+        CHROMADB.record_failure(e)
+        logger.error(f"✗ Vector DB: async ChromaDB connection failed: {e}")
+        return None
+
+
+def _aget_openai_client() -> Optional[AsyncOpenAI]:
+    """Async OpenAI client for embeddings, for the running event loop."""
+    if not settings.openai_api_key:
+        logger.warning("OpenAI API key not configured - embeddings unavailable")
+        return None
+
+    state = _loop_state()
+    if "openai" not in state:
+        state["openai"] = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            timeout=settings.openai_embedding_timeout_seconds,
+            max_retries=1
+        )
+    return state["openai"]
+
+
 class VectorService:
     """Service for vector database operations."""
 
     @staticmethod
+    @observed("openai", "embeddings")
     def _generate_embedding(text: str) -> Optional[List[float]]:
         """Generate embedding vector for text using OpenAI."""
         client = _get_openai_client()
         if not client:
             return None
 
+        model = settings.openai_embedding_model
+
+        def embed():
+            with governor.slot(model, estimate_tokens(text)) as lease:
+                response = OPENAI.call(client.embeddings.create, input=text, model=model)
+                lease.settle(response.usage.total_tokens if response.usage else None)
+            return response.data[0].embedding
+
         try:
-            response = client.embeddings.create(
-                input=text,
-                model=settings.openai_embedding_model
-            )
+            # Identical texts embedded at the same time share one request
+            return single_flight.do("embedding", request_key("embedding", model, text), embed, encode=list, decode=list)
+        except CircuitOpenError:
+            return None
+        except LLMOverloadedError as e:
+            logger.warning(f"Embedding skipped: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Embedding generation failed: {e}")
+            return None
+
+    @staticmethod
+    @observed("openai", "embeddings")
+    async def _agenerate_embedding(text: str) -> Optional[List[float]]:
+        """Async variant of _generate_embedding()."""
+        client = _aget_openai_client()
+        if not client:
+            return None
+
+        model = settings.openai_embedding_model
+
+        async def embed():
+            async with governor.aslot(model, estimate_tokens(text)) as lease:
+                response = await OPENAI.acall(client.embeddings.create, input=text, model=model)
+                await lease.asettle(response.usage.total_tokens if response.usage else None)
             return response.data[0].embedding
+
+        try:
+            return await single_flight.ado(
+                "embedding", request_key("embedding", model, text), embed, encode=list, decode=list
+            )
+        except CircuitOpenError:
+            return None
+        except LLMOverloadedError as e:
+            logger.warning(f"Embedding skipped: {e}")
+            return None
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             return None
@@ -114,6 +285,26 @@ class VectorService:
         return f"article_{article_id}"
 
     @staticmethod
+    def _embedding_text(headline: str, content: str) -> str:
+        """Text embedded for an article (headline and content)."""
+        return f"{headline}\n\n{content}"
+
+    @staticmethod
+    def _document_metadata(article_id: int, headline: str, metadata: Dict) -> Dict[str, Any]:
+        """ChromaDB metadata of an article document (without the content hash)."""
+        return {
+            "article_id": article_id,
+            "headline": headline,
+            "topic": metadata.get("topic", ""),
+            "author": metadata.get("author") or "",
+            "editor": metadata.get("editor") or "",
+            "keywords": metadata.get("keywords") or "",
+            "created_at": str(metadata.get("created_at", "")),
+            "updated_at": str(metadata.get("updated_at", "")),
+        }
+
+    @staticmethod
+    @observed("chromadb", "add_article")
     def add_article(
         article_id: int,
         headline: str,
@@ -139,7 +330,7 @@ class VectorService:
 
         try:
             # Combine headline and content for embedding
-            text_to_embed = f"{headline}\n\n{content}"
+            text_to_embed = VectorService._embedding_text(headline, content)
 
             # Generate embedding
             embedding = VectorService._generate_embedding(text_to_embed)
@@ -149,21 +340,15 @@ class VectorService:
 
             # Add to collection
             doc_id = VectorService._make_document_id(article_id)
+            doc_metadata = VectorService._document_metadata(article_id, headline, metadata)
+            doc_metadata["content_hash"] = _text_hash(text_to_embed)
             collection.add(
                 ids=[doc_id],
                 embeddings=[embedding],
                 documents=[content],
-                metadatas=[{
-                    "article_id": article_id,
-                    "headline": headline,
-                    "topic": metadata.get("topic", ""),
-                    "author": metadata.get("author") or "",
-                    "editor": metadata.get("editor") or "",
-                    "keywords": metadata.get("keywords") or "",
-                    "created_at": str(metadata.get("created_at", "")),
-                    "updated_at": str(metadata.get("updated_at", "")),
-                }]
+                metadatas=[doc_metadata]
             )
+            vector_index.record_upsert(vector_index.ARTICLES, doc_id, embedding, doc_metadata, content)
 
             logger.info(f"✓ Added article {article_id} to vector DB")
             return True
@@ -173,29 +358,102 @@ class VectorService:
             return False
 
     @staticmethod
+    @observed("chromadb", "update_article")
     def update_article(
         article_id: int,
         headline: str,
         content: str,
         metadata: Dict
     ) -> bool:
-        """Update article in vector database."""
+        """
+        Update article in vector database.
+
+        The embedded text (headline + content) is compared with the hash stored
+        alongside the document: if it is unchanged only the metadata is updated
+        (no embedding call), otherwise the document is re-embedded and upserted.
+
+        Args:
+            article_id: Article ID from PostgreSQL
+            headline: Article headline
+            content: Article content
+            metadata: Additional metadata (topic, author, editor, etc.)
+
+        Returns:
+            True if successful, False otherwise
+        """
         _, collection = _get_chroma_client()
         if collection is None:
             return False
 
         try:
-            # Delete old version
-            VectorService.delete_article(article_id)
+            doc_id = VectorService._make_document_id(article_id)
+            text_to_embed = VectorService._embedding_text(headline, content)
+            text_hash = _text_hash(text_to_embed)
+            doc_metadata = VectorService._document_metadata(article_id, headline, metadata)
+            doc_metadata["content_hash"] = text_hash
 
-            # Add new version
-            return VectorService.add_article(article_id, headline, content, metadata)
+            existing = collection.get(ids=[doc_id], include=["metadatas"])
+            stored = existing["metadatas"][0] if existing["ids"] else None
+
+            if stored is not None and stored.get("content_hash") == text_hash:
+                if any(stored.get(key) != value for key, value in doc_metadata.items()):
+                    collection.update(ids=[doc_id], metadatas=[doc_metadata])
+                    vector_index.record_metadata(vector_index.ARTICLES, doc_id, doc_metadata)
+                    logger.info(f"✓ Updated metadata of article {article_id} in vector DB")
+                return True
+
+            embedding = VectorService._generate_embedding(text_to_embed)
+            if not embedding:
+                logger.error(f"Failed to generate embedding for article {article_id}")
+                return False
+
+            collection.upsert(
+                ids=[doc_id],
+                embeddings=[embedding],
+                documents=[content],
+                metadatas=[doc_metadata]
+            )
+            vector_index.record_upsert(vector_index.ARTICLES, doc_id, embedding, doc_metadata, content)
+            logger.info(f"✓ Re-embedded article {article_id} in vector DB")
+            return True
 
         except Exception as e:
             logger.error(f"Error updating article {article_id} in vector DB: {e}")
             return False
 
     @staticmethod
+    @observed("chromadb", "update_article_metadata")
+    def update_article_metadata(article_id: int, headline: str, metadata: Dict) -> bool:
+        """
+        Update an article's metadata in the vector database, keeping its embedding.
+
+        For edits that do not touch the headline or content (author, editor,
+        keywords). Articles not in the vector database are left alone.
+
+        Args:
+            article_id: Article ID from PostgreSQL
+            headline: Article headline (unchanged)
+            metadata: Additional metadata (topic, author, editor, etc.)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        _, collection = _get_chroma_client()
+        if collection is None:
+            return False
+
+        try:
+            doc_id = VectorService._make_document_id(article_id)
+            doc_metadata = VectorService._document_metadata(article_id, headline, metadata)
+            collection.update(ids=[doc_id], metadatas=[doc_metadata])
+            vector_index.record_metadata(vector_index.ARTICLES, doc_id, doc_metadata)
+            return True
+        except Exception as e:
+            logger.error(f"Error updating metadata of article {article_id} in vector DB: {e}")
+            return False
+
+    @staticmethod
+    @observed("chromadb", "delete_article")
     def delete_article(article_id: int) -> bool:
         """Delete article from vector database."""
         _, collection = _get_chroma_client()
@@ -205,6 +463,7 @@ class VectorService:
         try:
             doc_id = VectorService._make_document_id(article_id)
             collection.delete(ids=[doc_id])
+            vector_index.record_delete(vector_index.ARTICLES, doc_id)
             logger.info(f"✓ Deleted article {article_id} from vector DB")
             return True
         except Exception as e:
@@ -212,6 +471,7 @@ class VectorService:
             return False
 
     @staticmethod
+    @observed("chromadb", "semantic_search")
     def semantic_search(
         query: str,
         topic: Optional[str] = None,
@@ -228,7 +488,10 @@ class VectorService:
         Returns:
             List of article IDs with similarity scores
         """
-        _, collection = _get_chroma_client()
+        # Local index (VECTOR_INDEX_ENABLED) when loaded, ChromaDB otherwise
+        collection = vector_index.get_index(vector_index.ARTICLES)
+        if collection is None:
+            _, collection = _get_chroma_client()
         if collection is None:
             return []
 
@@ -248,17 +511,55 @@ class VectorService:
                 where=where_filter
             )
 
-            # Format results
-            articles = []
-            if results['ids'] and len(results['ids']) > 0:
-                for i, doc_id in enumerate(results['ids'][0]):
-                    article_id = int(doc_id.replace('article_', ''))
-                    articles.append({
-                        'article_id': article_id,
-                        'similarity_score': 1 - results['distances'][0][i],  # Convert distance to similarity
-                        'metadata': results['metadatas'][0][i]
-                    })
+            articles = VectorService._format_search_results(results)
+            logger.info(f"✓ Semantic search: {len(articles)} results for '{query[:50]}'")
+            return articles
+
+        except Exception as e:
+            logger.error(f"Semantic search error: {e}")
+            return []
+
+    @staticmethod
+    @observed("chromadb", "semantic_search")
+    async def asemantic_search(
+        query: str,
+        topic: Optional[str] = None,
+        limit: int = 10
+    ) -> List[Dict]:
+        """
+        Async variant of semantic_search() (does not block the event loop).
+
+        Args:
+            query: Search query
+            topic: Optional topic filter
+            limit: Maximum results
 
+        Returns:
+            List of article IDs with similarity scores
+        """
+        # The local index is in-process and answers without I/O
+        local = vector_index.get_index(vector_index.ARTICLES)
+        collection = None if local is not None else await _aget_chroma_collection()
+        if local is None and collection is None:
+            return []
+
+        try:
+            query_embedding = await VectorService._agenerate_embedding(query)
+            if not query_embedding:
+                return []
+
+            where_filter = {"topic": topic} if topic else None
+
+            if local is not None:
+                results = local.query(query_embeddings=[query_embedding], n_results=limit, where=where_filter)
+            else:
+                results = await collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=limit,
+                    where=where_filter
+                )
+
+            articles = VectorService._format_search_results(results)
             logger.info(f"✓ Semantic search: {len(articles)} results for '{query[:50]}'")
             return articles
 
@@ -267,28 +568,47 @@ class VectorService:
             return []
 
     @staticmethod
+    def _format_search_results(results: Dict) -> List[Dict]:
+        """Convert a collection query result into article IDs with similarity scores."""
+        articles = []
+        if results['ids'] and len(results['ids']) > 0:
+            for i, doc_id in enumerate(results['ids'][0]):
+                article_id = int(doc_id.replace('article_', ''))
+                articles.append({
+                    'article_id': article_id,
+                    'similarity_score': 1 - results['distances'][0][i],  # Convert distance to similarity
+                    'metadata': results['metadatas'][0][i]
+                })
+        return articles
+
+    @staticmethod
+    @observed("chromadb", "hybrid_search")
     def hybrid_search(
         query: str,
         keyword_results: List[Dict],
         topic: Optional[str] = None,
         limit: int = 10,
-        semantic_weight: float = 0.6
+        semantic_weight: float = 0.6,
+        semantic_results: Optional[List[Dict]] = None
     ) -> List[Dict]:
         """
         Combine semantic and keyword search results.
 
         Args:
             query: Search query
-            keyword_results: Results from SQL LIKE search
+            keyword_results: Results from SQL keyword search (optionally with 'text_rank')
             topic: Optional topic filter
             limit: Maximum results
             semantic_weight: Weight for semantic score (0-1)
+            semantic_results: Results of semantic_search() for this query, if the
+                caller already has them (avoids a second embedding + query)
 
         Returns:
             Merged and ranked results
         """
         # Get semantic results
-        semantic_results = VectorService.semantic_search(query, topic, limit * 2)
+        if semantic_results is None:
+            semantic_results = VectorService.semantic_search(query, topic, limit * 2)
 
         # If no semantic results, return keyword results
         if not semantic_results:
@@ -297,12 +617,19 @@ class VectorService:
         # Create score maps
         keyword_weight = 1 - semantic_weight
 
-        # Keyword scores (based on position)
+        # Keyword scores: text rank (ts_rank_cd) relative to the best hit when the
+        # keyword search scored its results, otherwise based on position
         keyword_scores = {}
-        for i, article in enumerate(keyword_results):
-            # Higher rank = higher score
-            score = 1.0 - (i / max(len(keyword_results), 1))
-            keyword_scores[article['id']] = score
+        text_ranks = [article.get('text_rank') for article in keyword_results]
+        if keyword_results and all(rank is not None for rank in text_ranks):
+            best = max(text_ranks) or 1.0
+            for article, rank in zip(keyword_results, text_ranks):
+                keyword_scores[article['id']] = rank / best
+        else:
+            for i, article in enumerate(keyword_results):
+                # Higher rank = higher score
+                score = 1.0 - (i / max(len(keyword_results), 1))
+                keyword_scores[article['id']] = score
 
         # Semantic scores
         semantic_scores = {}
@@ -325,6 +652,15 @@ class VectorService:
         return [{'article_id': aid, 'score': score} for aid, score in sorted_ids[:limit]]
 
     @staticmethod
+    def _read_collection():
+        """Article collection for reads: ChromaDB, else the local index copy (if loaded)."""
+        _, collection = _get_chroma_client()
+        if collection is None:
+            collection = vector_index.get_index(vector_index.ARTICLES)
+        return collection
+
+    @staticmethod
+    @observed("chromadb", "get_article_content")
     def get_article_content(article_id: int) -> Optional[str]:
         """
         Get article content from vector database by article ID.
@@ -335,9 +671,9 @@ class VectorService:
         Returns:
             Article content string, or None if not found
         """
-        _, collection = _get_chroma_client()
+        collection = VectorService._read_collection()
         if collection is None:
-            logger.error(f"Vector DB unavailable - cannot retrieve content for article {article_id}")
+            logger.debug(f"Vector DB unavailable - cannot retrieve content for article {article_id}")
             return None
 
         try:
@@ -358,6 +694,7 @@ class VectorService:
             return None
 
     @staticmethod
+    @observed("chromadb", "get_article_data")
     def get_article_data(article_id: int) -> Optional[Dict]:
         """
         Get full article data (content + metadata) from vector database.
@@ -368,9 +705,9 @@ class VectorService:
         Returns:
             Dict with content and metadata, or None if not found
         """
-        _, collection = _get_chroma_client()
+        collection = VectorService._read_collection()
         if collection is None:
-            logger.error(f"Vector DB unavailable - cannot retrieve data for article {article_id}")
+            logger.debug(f"Vector DB unavailable - cannot retrieve data for article {article_id}")
             return None
 
         try:
@@ -394,6 +731,92 @@ class VectorService:
             return None
 
     @staticmethod
+    async def _aread_articles(doc_ids: List[str], include: List[str]) -> Optional[Dict]:
+        """collection.get() on async ChromaDB, else the local index copy (if loaded)."""
+        collection = await _aget_chroma_collection()
+        if collection is not None:
+            return await collection.get(ids=doc_ids, include=include)
+
+        local = vector_index.get_index(vector_index.ARTICLES)
+        if local is not None:
+            return local.get(ids=doc_ids, include=include)
+        return None
+
+    @staticmethod
+    @observed("chromadb", "get_article_content")
+    async def aget_article_content(article_id: int) -> Optional[str]:
+        """
+        Async variant of get_article_content().
+
+        Args:
+            article_id: Article ID from PostgreSQL
+
+        Returns:
+            Article content string, or None if not found
+        """
+        data = await VectorService.aget_articles_data([article_id], include=["documents"])
+        return data[article_id]["content"] if article_id in data else None
+
+    @staticmethod
+    @observed("chromadb", "get_article_data")
+    async def aget_article_data(article_id: int) -> Optional[Dict]:
+        """
+        Async variant of get_article_data().
+
+        Args:
+            article_id: Article ID from PostgreSQL
+
+        Returns:
+            Dict with content and metadata, or None if not found
+        """
+        data = await VectorService.aget_articles_data([article_id])
+        return data.get(article_id)
+
+    @staticmethod
+    @observed("chromadb", "get_articles_data")
+    async def aget_articles_data(
+        article_ids: List[int],
+        include: Optional[List[str]] = None
+    ) -> Dict[int, Dict]:
+        """
+        Get content and metadata for several articles in one ChromaDB request.
+
+        Args:
+            article_ids: Article IDs from PostgreSQL
+            include: Fields to fetch (default documents and metadatas)
+
+        Returns:
+            Dict of article ID -> {"content", "metadata"}; articles that are
+            missing (or everything, while the vector DB is unavailable) are left out
+        """
+        if not article_ids:
+            return {}
+
+        try:
+            result = await VectorService._aread_articles(
+                [VectorService._make_document_id(article_id) for article_id in article_ids],
+                include or ["documents", "metadatas"]
+            )
+        except Exception as e:
+            logger.error(f"Error retrieving {len(article_ids)} articles from vector DB: {e}")
+            return {}
+
+        if result is None:
+            logger.debug(f"Vector DB unavailable - cannot retrieve data for {len(article_ids)} articles")
+            return {}
+
+        documents = result.get('documents') or []
+        metadatas = result.get('metadatas') or []
+        data = {}
+        for i, doc_id in enumerate(result.get('ids') or []):
+            data[int(doc_id.replace('article_', ''))] = {
+                "content": documents[i] if i < len(documents) else None,
+                "metadata": (metadatas[i] if i < len(metadatas) else None) or {}
+            }
+        return data
+
+    @staticmethod
+    @observed("chromadb", "search_articles")
     def search_articles(
         query: str,
         topic: Optional[str] = None,
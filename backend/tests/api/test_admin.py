@@ -11,11 +11,14 @@ Tests for:
 - PUT /api/admin/users/{user_id}/ban (ban user)
 - PUT /api/admin/users/{user_id}/unban (unban user)
 - DELETE /api/admin/users/{user_id} (delete user)
+- POST /api/admin/global/resources/enrich (batch resource enrichment)
 """
 import pytest
+from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
 
-from models import User, Group
+from models import User, Group, Resource, ResourceStatus, ResourceType, TextResource
+from services.resource_enrichment import job_id_for
 
 
 class TestGroupManagement:
@@ -286,3 +289,76 @@ class TestUserManagement:
         """Test deleting a non-existent user."""
         response = client.delete("/api/admin/users/99999", headers=admin_headers)
         assert response.status_code == 404
+
+
+class TestResourceEnrichment:
+    """Test batch resource enrichment endpoint."""
+
+    def test_enrich_no_admin(self, client: TestClient, auth_headers, mock_redis):
+        """Test that non-admin cannot enrich resources."""
+        response = client.post(
+            "/api/admin/global/resources/enrich",
+            json={"resource_ids": [1]},
+            headers=auth_headers
+        )
+        assert response.status_code == 403
+
+    def test_enrich_resources(
+        self, client: TestClient, admin_headers, test_admin, test_user, db_session, mock_redis
+    ):
+        """Test enriching resources writes descriptions and reports progress to the admin."""
+        resource = Resource(
+            hash_id="enrich001",
+            resource_type=ResourceType.TEXT,
+            status=ResourceStatus.PUBLISHED,
+            name="CPI report",
+            created_by=test_user.id,
+        )
+        db_session.add(resource)
+        db_session.flush()
+        db_session.add(TextResource(
+            resource_id=resource.id,
+            content="Inflation eased in March.",
+            chromadb_id=f"resource_text_{resource.id}",
+        ))
+        db_session.commit()
+        metadata = {
+            "success": True,
+            "metadata": {"description": "March CPI", "keywords": ["cpi"], "content_type": "data"},
+        }
+        collection = MagicMock()
+        sent = []
+
+        with patch("services.model_router.routed_chat_model"), \
+             patch("agents.shared.resource_processing_agent.ResourceProcessingAgent.generate_metadata",
+                   return_value=metadata), \
+             patch("services.resource_service._get_resource_collection", return_value=collection), \
+             patch("api.websocket.send_notification_sync", side_effect=lambda user_id, payload: sent.append((user_id, payload))), \
+             patch("database.SessionLocal", return_value=db_session), \
+             patch.object(db_session, "close"):
+            response = client.post(
+                "/api/admin/global/resources/enrich",
+                json={"resource_ids": [resource.id, 99999]},
+                headers=admin_headers
+            )
+
+        # The batch runs as a background task after the response
+        assert response.status_code == 202
+        data = response.json()
+        assert data["job_id"] == job_id_for([resource.id, 99999]) and data["total"] == 2
+        collection.update.assert_called_once()
+        db_session.expire_all()
+        assert db_session.get(Resource, resource.id).description == "March CPI"
+        assert {user_id for user_id, _ in sent} == {str(test_admin.id)}
+        final = sent[-1][1]
+        assert final["finished"] and final["job_id"] == data["job_id"]
+        assert (final["total"], final["succeeded"], final["failed"]) == (2, 1, 1)
+
+    def test_enrich_without_resources(self, client: TestClient, admin_headers, mock_redis):
+        """Test enriching an empty list of resources."""
+        response = client.post(
+            "/api/admin/global/resources/enrich",
+            json={"resource_ids": []},
+            headers=admin_headers
+        )
+        assert response.status_code == 400
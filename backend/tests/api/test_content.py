@@ -2,16 +2,20 @@
 Content management endpoint tests.
 
 Tests for:
-- Reader endpoints (GET articles, search, rate, PDF)
+- Reader endpoints (GET articles, summaries and field selection, search, rate, PDF)
 - Analyst endpoints (create, edit, submit)
 - Editor endpoints (review, reject, publish)
 - Admin endpoints (manage, recall, purge)
+- Admin ChromaDB sync endpoints (content store written before ChromaDB)
 """
+from datetime import datetime
+
 import pytest
 from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
 
 from models import ContentArticle, ArticleStatus
+from services.content_store import ContentStore
 
 
 class TestReaderEndpoints:
@@ -113,6 +117,38 @@ class TestReaderEndpoints:
         )
         assert response.status_code == 200
 
+    def test_get_article_summaries(
+        self, client: TestClient, auth_headers, test_topic, published_article, mock_redis, mock_chromadb
+    ):
+        """Test GET /api/reader/{topic}/articles?include_content=false returns summaries."""
+        response = client.get(
+            f"/api/reader/{test_topic.slug}/articles?include_content=false",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data[0]["headline"] == published_article.headline
+        assert "excerpt" in data[0]
+        assert "content" not in data[0]
+        assert response.headers["etag"]
+
+    def test_get_articles_fields(
+        self, client: TestClient, auth_headers, test_topic, published_article, mock_redis, mock_chromadb
+    ):
+        """Test GET /api/reader/{topic}/articles?fields=... returns only those fields."""
+        response = client.get(
+            f"/api/reader/{test_topic.slug}/articles?fields=id,headline",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json() == [{"id": published_article.id, "headline": published_article.headline}]
+
+        response = client.get(
+            f"/api/reader/{test_topic.slug}/articles?fields=id,body",
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+
 
 class TestAnalystEndpoints:
     """Test analyst-level content endpoints."""
@@ -265,6 +301,30 @@ class TestAdminContentEndpoints:
         )
         assert response.status_code == 200
 
+    def test_get_all_articles_by_cursor(
+        self, client: TestClient, admin_headers, db_session, test_topic, test_article, published_article,
+        mock_redis, mock_chromadb
+    ):
+        """Test paging GET /api/admin/{topic}/articles with X-Next-Cursor."""
+        # SQLite compares the server-default timestamp as text; store full datetimes
+        test_article.created_at = published_article.created_at = datetime(2026, 1, 1, 12, 0)
+        db_session.commit()
+
+        url = f"/api/admin/{test_topic.slug}/articles"
+        first = client.get(url, params={"limit": 1}, headers=admin_headers)
+        assert first.status_code == 200
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = client.get(url, params={"limit": 1, "cursor": cursor}, headers=admin_headers)
+        assert second.status_code == 200
+        ids = {first.json()[0]["id"], second.json()[0]["id"]}
+        assert ids == {test_article.id, published_article.id}
+        # The second page is full but last: no cursor to an empty page
+        assert "X-Next-Cursor" not in second.headers
+
+        invalid = client.get(url, params={"cursor": "garbage"}, headers=admin_headers)
+        assert invalid.status_code == 400
+
     def test_recall_published_article(
         self, client: TestClient, admin_headers, test_topic, published_article, db_session, mock_redis
     ):
@@ -338,3 +398,71 @@ class TestAdminContentEndpoints:
             headers=admin_headers
         )
         assert response.status_code == 200
+
+
+class TestChromaSyncEndpoints:
+    """Test the admin ChromaDB sync endpoints (content and admin routers)."""
+
+    def _payload(self, article, content):
+        return {
+            "article_id": article.id,
+            "headline": article.headline,
+            "content": content,
+            "topic": "macro",
+        }
+
+    @pytest.mark.parametrize("path", ["/api/content/admin/sync-article", "/api/admin/global/sync-article"])
+    def test_sync_article(
+        self, client: TestClient, admin_headers, test_article, db_session, mock_redis, mock_chromadb, path
+    ):
+        """Test POST sync-article stores the content, refreshes the excerpt, invalidates caches and indexes it."""
+        with patch("services.vector_service.VectorService.add_article", return_value=True) as add, \
+             patch("services.content_service.ContentCache.invalidate_article") as invalidate_article, \
+             patch("services.content_service.ContentCache.invalidate_topic") as invalidate_topic:
+            response = client.post(path, json=self._payload(test_article, "Synced body"), headers=admin_headers)
+
+        assert response.status_code == 200
+        assert add.call_args.kwargs["content"] == "Synced body"
+        assert ContentStore.get(db_session, test_article.id) == "Synced body"
+        db_session.refresh(test_article)
+        assert test_article.excerpt == "Synced body"
+        invalidate_article.assert_called_once_with(test_article.id)
+        invalidate_topic.assert_called_once_with(test_article.topic)
+
+    @pytest.mark.parametrize("path", ["/api/content/admin/sync-article", "/api/admin/global/sync-article"])
+    def test_sync_unknown_article(
+        self, client: TestClient, admin_headers, test_article, mock_redis, mock_chromadb, path
+    ):
+        """Test POST sync-article for an article that does not exist."""
+        payload = {**self._payload(test_article, "Body"), "article_id": 99999}
+
+        with patch("services.vector_service.VectorService.add_article", return_value=True) as add:
+            response = client.post(path, json=payload, headers=admin_headers)
+
+        assert response.status_code == 404
+        add.assert_not_called()
+
+    @pytest.mark.parametrize("path", ["/api/content/admin/sync-articles-bulk", "/api/admin/global/sync-articles-bulk"])
+    def test_sync_articles_bulk(
+        self, client: TestClient, admin_headers, test_article, published_article, db_session,
+        mock_redis, mock_chromadb, path
+    ):
+        """Test POST sync-articles-bulk replaces stored content and skips unknown articles."""
+        ContentStore.put(db_session, published_article.id, "Old body")
+        db_session.commit()
+        articles = [
+            self._payload(test_article, "First body"),
+            self._payload(published_article, "Second body"),
+            {**self._payload(test_article, "Lost body"), "article_id": 99999},
+        ]
+
+        with patch("services.vector_service.VectorService.add_article", return_value=True) as add:
+            response = client.post(path, json={"articles": articles}, headers=admin_headers)
+
+        assert response.status_code == 200
+        assert [r["success"] for r in response.json()["results"]] == [True, True, False]
+        assert add.call_count == 2
+        assert ContentStore.get(db_session, test_article.id) == "First body"
+        assert ContentStore.get(db_session, published_article.id) == "Second body"
+        db_session.refresh(published_article)
+        assert published_article.excerpt == "Second body"
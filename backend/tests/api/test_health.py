@@ -1,7 +1,8 @@
 """
 Health endpoint tests.
 
-Tests for: GET /, GET /health, GET /api/health/vectordb, GET /debug/settings
+Tests for: GET /, GET /health, GET /api/health/vectordb, GET /api/health/checkpoints,
+GET /metrics, GET /debug/settings
 """
 import pytest
 from fastapi.testclient import TestClient
@@ -44,6 +45,22 @@ class TestHealthEndpoints:
         assert isinstance(data["linkedin_client_secret_present"], bool)
         assert isinstance(data["openai_api_key_present"], bool)
 
+    def test_checkpoint_stats(self, client: TestClient):
+        """Test GET /api/health/checkpoints reports checkpoint storage."""
+        response = client.get("/api/health/checkpoints")
+        assert response.status_code == 200
+        data = response.json()
+        assert "backend" in data
+
+    def test_metrics_endpoint(self, client: TestClient):
+        """Test GET /metrics exposes route latency in Prometheus format."""
+        client.get("/health")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+        assert 'route="/health"' in response.text
+
 
 @pytest.mark.integration
 class TestVectorDBHealth:
@@ -54,3 +71,12 @@ class TestVectorDBHealth:
         response = client.get("/api/health/vectordb")
         # May fail without real ChromaDB, but should not error with mocks
         assert response.status_code in [200, 500]
+
+    def test_vectordb_health_reports_circuit_breakers(self, client: TestClient, mock_chromadb):
+        """Test GET /api/health/vectordb includes dependency breaker states."""
+        response = client.get("/api/health/vectordb")
+        assert response.status_code == 200
+
+        breakers = response.json()["circuit_breakers"]
+        assert set(breakers) == {"chromadb", "redis", "openai"}
+        assert breakers["chromadb"]["state"] in ("closed", "open", "half_open")
@@ -11,7 +11,7 @@ import os
 import pytest
 from typing import Generator, AsyncGenerator
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import secrets
 
 from sqlalchemy import create_engine, event
@@ -519,9 +519,12 @@ def mock_chromadb():
     creates its own database session that can't see test fixtures.
     """
     with patch("services.vector_service._get_chroma_client") as mock_client, \
+         patch("services.vector_service._aget_chroma_collection", new=AsyncMock(return_value=None)), \
+         patch("services.resource_service._aget_chroma_collection", new=AsyncMock(return_value=None)), \
          patch("services.vector_service.VectorService.get_article_data") as mock_get_data, \
          patch("services.vector_service.VectorService.add_article") as mock_add, \
          patch("services.vector_service.VectorService.delete_article") as mock_delete, \
+         patch("services.vector_service.VectorService._generate_embedding") as mock_embedding, \
          patch("dependencies.get_valid_topics_sync") as mock_topics_sync:
 
         chroma_mock = MagicMock()
@@ -539,6 +542,7 @@ def mock_chromadb():
         mock_get_data.return_value = None  # Return None to use PostgreSQL fallback
         mock_add.return_value = True
         mock_delete.return_value = True
+        mock_embedding.return_value = [0.1] * 8
 
         # Mock get_valid_topics_sync to return test topics
         # This allows require_analyst/require_editor to work in tests
@@ -0,0 +1,130 @@
+"""
+Tests for AnalystAgent article synthesis.
+
+Tests for:
+- New articles written in one structured-output call (content, headline, keywords)
+- Fallback to separate content, headline and keyword calls
+- The article content node creating articles through AnalystAgent
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from agents.shared.analyst_agent import AnalystAgent, ArticleDraft
+from config import settings
+
+RESEARCH = dict(
+    query="What is the outlook for inflation?",
+    articles=[],
+    resources=[],
+    web_results=[{"title": "CPI cools", "snippet": "Inflation eased in March."}],
+    data_results=[],
+)
+
+
+class FakeLLM:
+    """Chat model returning canned replies; structured calls return `draft` (or raise it)."""
+
+    def __init__(self, reply="## Inflation\n\nPrices eased.", draft=None):
+        self.reply = reply
+        self.draft = draft
+        self.calls = []
+
+    def invoke(self, messages):
+        self.calls.append("invoke")
+        return AIMessage(content=self.reply)
+
+    def with_structured_output(self, schema):
+        assert schema is ArticleDraft
+        structured = MagicMock()
+
+        def invoke(messages):
+            self.calls.append("structured")
+            if isinstance(self.draft, Exception):
+                raise self.draft
+            return self.draft
+
+        structured.invoke.side_effect = invoke
+        return structured
+
+
+@pytest.fixture
+def structured(monkeypatch):
+    monkeypatch.setattr(settings, "analyst_structured_article", True)
+
+
+def make_agent(llm, headline_llm=None, keywords_llm=None):
+    return AnalystAgent(
+        topic="macro",
+        llm=llm,
+        db=MagicMock(),
+        headline_llm=headline_llm or FakeLLM(reply='"Inflation Cools Further"'),
+        keywords_llm=keywords_llm or FakeLLM(reply="inflation, CPI, rates"),
+    )
+
+
+class TestSynthesizeArticle:
+    """Test writing a new article's content, headline and keywords."""
+
+    def test_one_structured_call(self, structured):
+        llm = FakeLLM(draft=ArticleDraft(
+            headline='"Inflation Cools Further"',
+            keywords=["inflation", " CPI ", ""],
+            content="## Summary\n\nPrices eased.",
+        ))
+        agent = make_agent(llm)
+
+        content, headline, keywords = agent._synthesize_article(**RESEARCH)
+
+        assert (content, headline, keywords) == ("## Summary\n\nPrices eased.", "Inflation Cools Further", "inflation, CPI")
+        assert llm.calls == ["structured"]
+        assert agent.headline_llm.calls == [] and agent.keywords_llm.calls == []
+
+    def test_falls_back_when_structured_call_fails(self, structured):
+        llm = FakeLLM(draft=ValueError("schema not supported"))
+        agent = make_agent(llm)
+
+        content, headline, keywords = agent._synthesize_article(**RESEARCH)
+
+        assert (content, headline, keywords) == ("## Inflation\n\nPrices eased.", "Inflation Cools Further", "inflation, CPI, rates")
+        assert llm.calls == ["structured", "invoke"]
+        assert agent.headline_llm.calls == ["invoke"] and agent.keywords_llm.calls == ["invoke"]
+
+    def test_falls_back_on_incomplete_draft(self, structured):
+        llm = FakeLLM(draft=ArticleDraft(headline="Inflation", keywords=[], content="  "))
+
+        content, _, _ = make_agent(llm)._synthesize_article(**RESEARCH)
+
+        assert content == "## Inflation\n\nPrices eased."
+        assert llm.calls == ["structured", "invoke"]
+
+    def test_separate_calls_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "analyst_structured_article", False)
+        llm = FakeLLM(draft=ArticleDraft(headline="Unused", keywords=[], content="Unused"))
+
+        make_agent(llm)._synthesize_article(**RESEARCH)
+
+        assert llm.calls == ["invoke"]
+
+
+class TestCreateContentNode:
+    """Test that the article content node writes new articles with AnalystAgent."""
+
+    def test_uses_analyst_agent(self, monkeypatch):
+        from agents.builds.v2.nodes.analyst import article_content_node
+
+        written = {"success": True, "article_id": 7, "headline": "Inflation Cools", "keywords": "inflation", "content": "Body"}
+        research = MagicMock(return_value=written)
+        fallback = MagicMock()
+        monkeypatch.setattr(AnalystAgent, "research_and_write", research)
+        monkeypatch.setattr(article_content_node, "_create_content_fallback", fallback)
+        monkeypatch.setattr("database.SessionLocal", MagicMock())
+
+        result = article_content_node.create_content_node({
+            "query": "inflation outlook", "topic": "macro", "user_context": {"scopes": ["macro:analyst"]},
+        })
+
+        assert result["article_id"] == 7 and result["success"]
+        research.assert_called_once()
+        fallback.assert_not_called()
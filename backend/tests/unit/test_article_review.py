@@ -0,0 +1,220 @@
+"""
+Tests for the sectioned editorial review.
+
+Tests for:
+- Splitting markdown at headings (preamble, code fences, short and long sections)
+- Section reviews running concurrently and merged into one review
+- Unchanged sections served from the cache after an edit
+- Failed sections reported without failing the review
+- Long articles reviewed section by section through the editor node
+"""
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+import services.content_cache as content_cache
+from agents.builds.v2.nodes import editor_node as editor_node_module
+from agents.builds.v2.state import create_user_context
+from config import settings
+from models import ArticleStatus, ContentArticle
+from services.article_review import ArticleReviewer, split_sections
+from services.content_store import ContentStore
+
+PARAGRAPH = "Inflation eased for a third month while core services stayed firm. " * 5
+
+ARTICLE = f"""{PARAGRAPH}
+
+## Inflation
+
+{PARAGRAPH}
+
+## Rates
+
+{PARAGRAPH}
+
+## Outlook
+
+{PARAGRAPH}
+"""
+
+
+class FakeCache:
+    """Dict-backed stand-in for the Redis content cache."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+class FakeLLM:
+    """Chat model recording its prompts; section calls take `delay` seconds."""
+
+    model_name = "gpt-test"
+
+    def __init__(self, delay=0.0, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, messages):
+        prompt = messages[-1].content
+        with self._lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if "Combine these section-by-section findings" in prompt:
+                return AIMessage(content="Quality score: 8\nRecommendation: approve")
+            time.sleep(self.delay)
+            section = prompt.split("Section: ", 1)[1].split("\n", 1)[0]
+            if section == self.fail_on:
+                raise ConnectionError("upstream down")
+            return AIMessage(content=f"Findings for {section}")
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def section_calls(self):
+        return [prompt for prompt in self.prompts if "Combine these section-by-section findings" not in prompt]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fake = FakeCache()
+    monkeypatch.setattr(content_cache, "_get_cache", lambda: fake)
+    return fake
+
+
+class TestSplitSections:
+    """Test splitting articles into sections."""
+
+    def test_headings(self):
+        sections = split_sections(ARTICLE)
+
+        assert [section.title for section in sections] == ["Introduction", "Inflation", "Rates", "Outlook"]
+        assert sections[1].text.startswith("## Inflation")
+
+    def test_headings_in_code_fences_ignored(self):
+        content = f"## Data\n\n{PARAGRAPH}\n\n```python\n# not a heading\n```\n"
+
+        assert [section.title for section in split_sections(content)] == ["Data"]
+
+    def test_short_sections_merged(self):
+        content = f"## Summary\n\n{PARAGRAPH}\n\n## Note\n\nShort.\n"
+
+        sections = split_sections(content)
+
+        assert [section.title for section in sections] == ["Summary"]
+        assert sections[0].text.endswith("Short.")
+
+    def test_long_sections_split(self):
+        content = "## Analysis\n\n" + "\n\n".join([PARAGRAPH] * 6)
+
+        sections = split_sections(content, max_chars=1000)
+
+        assert [section.title for section in sections] == [
+            "Analysis (part 1)", "Analysis (part 2)", "Analysis (part 3)"
+        ]
+        assert all(len(section.text) <= 1000 for section in sections)
+
+
+class TestArticleReviewer:
+    """Test map-reduce reviews."""
+
+    def test_sections_reviewed_concurrently_and_merged(self, cache):
+        llm = FakeLLM(delay=0.1)
+
+        review = ArticleReviewer(llm).review("Disinflation continues", ARTICLE)
+
+        assert len(llm.section_calls()) == 4
+        assert llm.max_active > 1
+        assert review.text.startswith("Quality score: 8")
+        assert "### Rates\nFindings for Rates" in review.text
+        assert [section.title for section in review.sections] == ["Introduction", "Inflation", "Rates", "Outlook"]
+
+    def test_unchanged_sections_cached(self, cache):
+        llm = FakeLLM()
+        ArticleReviewer(llm).review("Disinflation continues", ARTICLE)
+
+        edited = ARTICLE.replace("## Rates\n\n", "## Rates\n\nThe central bank held rates. ")
+        llm = FakeLLM()
+        review = ArticleReviewer(llm).review("Disinflation continues", edited)
+
+        assert len(llm.section_calls()) == 1
+        assert "Section: Rates" in llm.section_calls()[0]
+        assert [section.cached for section in review.sections] == [True, True, False, True]
+
+    def test_failed_section_reported(self, cache):
+        llm = FakeLLM(fail_on="Rates")
+
+        review = ArticleReviewer(llm).review("Disinflation continues", ARTICLE)
+
+        assert "### Rates\nReview unavailable: upstream down" in review.text
+        # Failures are not cached
+        assert len(cache.data) == 3
+
+    def test_all_sections_failed(self, cache):
+        llm = FakeLLM(fail_on="Rates")
+
+        with pytest.raises(RuntimeError):
+            ArticleReviewer(llm).review("Disinflation continues", f"## Rates\n\n{PARAGRAPH}")
+
+
+class _SharedSession:
+    """Test session handed out by SessionLocal; the node's close() leaves it open."""
+
+    def __init__(self, session):
+        self._session = session
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    def close(self):
+        pass
+
+
+class TestEditorNodeReview:
+    """Test the editor node reviewing a long article section by section."""
+
+    def test_long_article_reviewed_by_section(self, db_session, test_topic, test_editor, cache, monkeypatch):
+        article = ContentArticle(
+            topic_id=test_topic.id,
+            topic=test_topic.slug,
+            headline="Disinflation continues",
+            author="Test Analyst",
+            status=ArticleStatus.EDITOR,
+            keywords="inflation",
+            created_by_agent="test",
+        )
+        db_session.add(article)
+        db_session.flush()
+        ContentStore.put(db_session, article.id, ARTICLE)
+        llm = FakeLLM()
+        monkeypatch.setattr("database.SessionLocal", lambda: _SharedSession(db_session))
+        monkeypatch.setattr(editor_node_module, "routed_chat_model", lambda route, **kwargs: llm)
+        monkeypatch.setattr(settings, "editor_review_sectioned_min_chars", len(ARTICLE) - 1)
+
+        result = editor_node_module.editor_node({
+            "intent": {"details": {"action_type": "review_article"}},
+            "user_context": create_user_context(
+                test_editor.id, test_editor.email, test_editor.name, [f"{test_topic.slug}:editor"]
+            ),
+            "navigation_context": {"role": "editor", "topic": test_topic.slug, "article_id": article.id},
+            "messages": [HumanMessage(content="Review this article")],
+        })
+
+        assert result.get("error") is None, result["response_text"]
+        assert len(llm.section_calls()) == 4
+        assert "Quality score: 8" in result["response_text"]
+        assert "## Section Findings" in result["response_text"]
+        assert "### Outlook\nFindings for Outlook" in result["response_text"]
@@ -0,0 +1,70 @@
+"""
+Tests for article list summaries.
+
+Tests for:
+- Excerpt generation and write-through on create/update
+- Summary lists served from PostgreSQL only (no content store or ChromaDB reads)
+- Separate cache keys for summary and full topic lists
+"""
+from unittest.mock import MagicMock, patch
+
+from services.content_cache import ContentCache
+from services.content_service import ContentService
+from services.content_store import ContentStore, make_excerpt
+
+
+class TestExcerpt:
+    """Test excerpt generation."""
+
+    def test_plain_text_cut_at_word(self):
+        content = "## Outlook\n\n**Rates** stay [on hold](https://example.com). " + "More text " * 50
+
+        excerpt = make_excerpt(content, length=40)
+
+        assert excerpt == "Outlook Rates stay on hold. More text…"
+        assert make_excerpt("Short") == "Short"
+
+    def test_written_with_content(self, db_session, test_topic, mock_redis, mock_chromadb):
+        article = ContentService.create_article(
+            db_session, test_topic.slug, "Rates", "First body", "rates", "test"
+        )
+        assert article["excerpt"] == "First body"
+
+        article = ContentService.update_article(db_session, article["id"], content="Second body")
+        assert article["excerpt"] == "Second body"
+
+
+class TestSummaries:
+    """Test summary lists."""
+
+    def test_summaries_skip_content_reads(self, db_session, published_article, mock_redis):
+        published_article.excerpt = "Preview"
+        db_session.flush()
+
+        with patch.object(ContentStore, "get") as store_get:
+            summaries = ContentService.get_published_articles(
+                db_session, published_article.topic, include_content=False
+            )
+
+        store_get.assert_not_called()
+        assert summaries[0]["excerpt"] == "Preview"
+        assert "content" not in summaries[0]
+
+    async def test_async_summaries_skip_content_reads(self, db_session, published_article, mock_redis):
+        with patch.object(ContentStore, "get_many") as get_many:
+            summaries = await ContentService.aget_recent_articles(
+                db_session, published_article.topic, include_content=False
+            )
+
+        get_many.assert_not_called()
+        assert summaries[0]["id"] == published_article.id
+
+    def test_cache_keys(self):
+        cache = MagicMock()
+        cache.get.return_value = None
+        with patch("services.content_cache._get_cache", return_value=cache):
+            ContentCache.set_topic_articles("macro", [], 10, summary=True)
+            ContentCache.get_topic_articles("macro", 10)
+
+        assert cache.setex.call_args[0][0] == "content:topic:macro:10:summary"
+        assert cache.get.call_args[0][0] == "content:topic:macro:10"
@@ -0,0 +1,181 @@
+"""
+Tests for async ChromaDB access.
+
+Tests for:
+- Per-event-loop AsyncHttpClient setup and the shared circuit breaker
+- Batched article reads and async semantic search
+- Async resource search filters
+- Async article hydration in ContentService (no per-article sync reads)
+"""
+from datetime import datetime
+
+import pytest
+
+import services.vector_service as vector_service
+from models import ContentArticle
+from resilience import CHROMADB
+from services.content_service import ContentService
+from services.content_store import ContentStore
+from services.resource_service import ResourceService
+from services.vector_service import VectorService
+
+
+class FakeAsyncCollection:
+    """Async collection recording its calls."""
+
+    def __init__(self, documents=None, query_result=None):
+        self.documents = documents or {}
+        self.query_result = query_result
+        self.calls = []
+
+    async def get(self, ids, include=None):
+        self.calls.append(("get", list(ids)))
+        found = [doc_id for doc_id in ids if doc_id in self.documents]
+        return {
+            "ids": found,
+            "documents": [self.documents[doc_id][0] for doc_id in found],
+            "metadatas": [self.documents[doc_id][1] for doc_id in found],
+        }
+
+    async def query(self, query_embeddings, n_results, where=None):
+        self.calls.append(("query", where))
+        return self.query_result
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake = FakeAsyncCollection({
+        "article_1": ("one", {"headline": "First"}),
+        "article_2": ("two", {"headline": "Second"}),
+    })
+
+    async def get_collection(name=None, metadata=None):
+        return fake
+
+    monkeypatch.setattr(vector_service, "_aget_chroma_collection", get_collection)
+    monkeypatch.setattr("services.resource_service._aget_chroma_collection", get_collection)
+    return fake
+
+
+@pytest.fixture
+def embedding(monkeypatch):
+    async def fake_embedding(text):
+        return [1.0, 0.0]
+
+    monkeypatch.setattr(VectorService, "_agenerate_embedding", staticmethod(fake_embedding))
+
+
+class TestAsyncClient:
+    """Test per-loop client setup."""
+
+    async def test_client_cached_per_loop_and_breaker_counts_failures(self, monkeypatch):
+        attempts = []
+
+        class FakeAsyncClient:
+            async def heartbeat(self):
+                return 1
+
+            async def get_or_create_collection(self, name, metadata):
+                return FakeAsyncCollection()
+
+        async def fake_async_http_client(**kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                raise ConnectionError("refused")
+            return FakeAsyncClient()
+
+        monkeypatch.setattr(vector_service.chromadb, "AsyncHttpClient", fake_async_http_client)
+        monkeypatch.setattr(vector_service, "_async_state", vector_service.weakref.WeakKeyDictionary())
+        CHROMADB.reset()
+        try:
+            assert await vector_service._aget_chroma_collection() is None
+            assert CHROMADB.snapshot()["consecutive_failures"] == 1
+
+            first = await vector_service._aget_chroma_collection()
+            second = await vector_service._aget_chroma_collection()
+            resources = await vector_service._aget_chroma_collection("resources")
+            assert first is second
+            assert resources is not first
+            assert len(attempts) == 2
+            assert CHROMADB.state == "closed"
+        finally:
+            CHROMADB.reset()
+
+
+class TestAsyncVectorService:
+    """Test async reads and search."""
+
+    async def test_articles_data_in_one_request(self, collection):
+        data = await VectorService.aget_articles_data([1, 2, 3])
+
+        assert collection.calls == [("get", ["article_1", "article_2", "article_3"])]
+        assert data[1] == {"content": "one", "metadata": {"headline": "First"}}
+        assert 3 not in data
+        assert await VectorService.aget_article_content(2) == "two"
+        assert await VectorService.aget_article_data(3) is None
+
+    async def test_unavailable_returns_empty(self, monkeypatch):
+        async def unavailable(name=None, metadata=None):
+            return None
+
+        monkeypatch.setattr(vector_service, "_aget_chroma_collection", unavailable)
+
+        assert await VectorService.aget_articles_data([1]) == {}
+        assert await VectorService.asemantic_search("rates") == []
+
+    async def test_semantic_search(self, collection, embedding):
+        collection.query_result = {
+            "ids": [["article_2"]],
+            "distances": [[0.25]],
+            "metadatas": [[{"article_id": 2}]],
+        }
+        results = await VectorService.asemantic_search("rates", topic="macro", limit=1)
+
+        assert collection.calls == [("query", {"topic": "macro"})]
+        assert results[0]["article_id"] == 2
+        assert results[0]["similarity_score"] == 0.75
+
+    async def test_resource_search_filters_ids(self, collection, embedding):
+        collection.query_result = {
+            "ids": [["resource_text_5", "resource_text_6"]],
+            "distances": [[0.25, 0.5]],
+            "metadatas": [[{"resource_id": 5, "name": "Rates", "type": "text"},
+                           {"resource_id": 6, "name": "Other", "type": "text"}]],
+            "documents": [["five", "six"]],
+        }
+        results = await ResourceService.asemantic_search_resources("rates", resource_type="text", resource_ids=[5])
+
+        assert collection.calls == [("query", {"$and": [{"type": "text"}, {"resource_id": {"$in": [5]}}]})]
+        assert [r["resource_id"] for r in results] == [5]
+        assert await ResourceService.asemantic_search_resources("rates", resource_ids=[]) == []
+
+
+class TestAsyncContentService:
+    """Test async article hydration."""
+
+    async def test_articles_to_dicts_batches_reads(self, collection, monkeypatch):
+        def no_sync_reads(article_id):
+            raise AssertionError("sync ChromaDB read from async path")
+
+        backfilled = {}
+        monkeypatch.setattr(VectorService, "get_article_data", staticmethod(no_sync_reads))
+        monkeypatch.setattr(ContentStore, "backfill", staticmethod(backfilled.update))
+        now = datetime.now()
+        articles = [
+            ContentArticle(
+                id=article_id, topic="macro", readership_count=0, rating=None, rating_count=0,
+                priority=0, is_sticky=False, created_at=now, updated_at=now, created_by_agent="analyst",
+                is_active=True, status="published", headline=f"PG {article_id}", author="", editor="", keywords="",
+            )
+            for article_id in (1, 3)
+        ]
+
+        dicts = await ContentService._aarticles_to_dicts(articles)
+
+        assert len(collection.calls) == 1
+        assert backfilled == {1: "one"}
+        assert dicts[0]["headline"] == "First"
+        assert dicts[0]["content"] == "one"
+        # Missing in ChromaDB: PostgreSQL fallback
+        assert dicts[1]["headline"] == "PG 3"
+        assert dicts[1]["content"] == ""
@@ -0,0 +1,116 @@
+"""
+Tests for the benchmark harness.
+
+Tests for:
+- Summary statistics
+- Skipped and failing benchmark cases
+- Baseline comparison verdicts
+- Structured-output responses from the fake OpenAI server
+"""
+import json
+from typing import List
+
+from pydantic import BaseModel
+
+from benchmarks.harness import (
+    Benchmark,
+    BenchmarkSkipped,
+    compare_results,
+    run_benchmark,
+    summarize,
+)
+from benchmarks.stand_ins import STUB_COMPLETION, stub_for_schema
+
+
+def _results(**medians) -> dict:
+    return {
+        "benchmarks": {
+            name: ({"status": "ok", "median_ms": value} if value is not None
+                   else {"status": "skipped", "reason": "n/a"})
+            for name, value in medians.items()
+        }
+    }
+
+
+class TestHarness:
+    """Test timing and result handling."""
+
+    def test_summarize(self):
+        summary = summarize([4.0, 1.0, 3.0, 2.0])
+        assert summary["iterations"] == 4
+        assert summary["min_ms"] == 1.0
+        assert summary["max_ms"] == 4.0
+        assert summary["median_ms"] == 2.5
+        assert summary["p95_ms"] == 4.0
+
+    def test_run_benchmark_ok(self):
+        calls = []
+        bench = Benchmark(
+            name="noop",
+            description="",
+            setup=lambda: (lambda: calls.append(1)),
+            iterations=5,
+            warmup=2,
+        )
+        result = run_benchmark(bench)
+        assert result["status"] == "ok"
+        assert result["iterations"] == 5
+        assert len(calls) == 7
+
+    def test_run_benchmark_skipped(self):
+        def setup():
+            raise BenchmarkSkipped("missing lib")
+
+        result = run_benchmark(Benchmark(name="skip", description="", setup=setup))
+        assert result == {"status": "skipped", "reason": "missing lib"}
+
+    def test_run_benchmark_error_runs_teardown(self):
+        torn_down = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        bench = Benchmark(
+            name="fail",
+            description="",
+            setup=lambda: fail,
+            teardown=lambda: torn_down.append(True),
+        )
+        result = run_benchmark(bench)
+        assert result["status"] == "error"
+        assert "boom" in result["reason"]
+        assert torn_down == [True]
+
+
+class TestCompareResults:
+    """Test baseline comparison."""
+
+    def test_verdicts(self):
+        baseline = _results(slow=10.0, fast=10.0, same=10.0, gone=1.0, skipped=None)
+        current = _results(slow=12.0, fast=5.0, same=10.5, added=1.0, skipped=3.0)
+
+        rows = {row["name"]: row for row in compare_results(baseline, current, threshold=0.10)}
+
+        assert rows["slow"]["verdict"] == "regression"
+        assert rows["slow"]["change"] == 0.2
+        assert rows["fast"]["verdict"] == "improvement"
+        assert rows["same"]["verdict"] == "unchanged"
+        assert rows["gone"]["verdict"] == "missing"
+        assert rows["added"]["verdict"] == "new"
+        assert rows["skipped"]["verdict"] == "not comparable"
+
+
+class TestStandIns:
+    """Test the fake OpenAI server's structured-output payloads."""
+
+    def test_stub_matches_schema(self):
+        class Draft(BaseModel):
+            headline: str
+            keywords: List[str]
+            confidence: float
+
+        stub = stub_for_schema(Draft.model_json_schema())
+
+        assert Draft.model_validate(json.loads(json.dumps(stub))) == Draft(
+            headline=STUB_COMPLETION, keywords=[STUB_COMPLETION] * 3, confidence=1
+        )
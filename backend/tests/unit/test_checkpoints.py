@@ -0,0 +1,191 @@
+"""
+Tests for the v2 checkpoint lifecycle manager.
+
+Tests for:
+- LRU cap on the in-memory checkpointer
+- Which runs need checkpointing
+- Per-run threads and release (threads pending HITL are kept)
+- Checkpoint stats
+"""
+import operator
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langgraph.graph import StateGraph, END
+from langgraph.types import interrupt
+
+from agents.builds.v2.checkpoints import BoundedMemorySaver, CheckpointManager
+
+
+class _CounterState(TypedDict):
+    items: Annotated[List[str], operator.add]
+
+
+def _compile(checkpointer):
+    """Build a one-node graph using the given checkpointer."""
+    workflow = StateGraph(_CounterState)
+    workflow.add_node("step", lambda state: {"items": ["step"]})
+    workflow.set_entry_point("step")
+    workflow.add_edge("step", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+class _HitlState(TypedDict, total=False):
+    items: Annotated[List[str], operator.add]
+    requires_hitl: bool
+
+
+def _compile_hitl(checkpointer, pause: bool = False):
+    """Build a graph whose node requests HITL (and pauses on an interrupt if asked)."""
+    def step(state):
+        if pause:
+            interrupt({"action": "publish"})
+        return {"items": ["step"], "requires_hitl": True}
+
+    workflow = StateGraph(_HitlState)
+    workflow.add_node("step", step)
+    workflow.set_entry_point("step")
+    workflow.add_edge("step", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def _thread(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+@pytest.fixture
+def manager():
+    """CheckpointManager backed by a small in-memory saver."""
+    mgr = CheckpointManager()
+    mgr._checkpointer = BoundedMemorySaver(max_threads=3)
+    return mgr
+
+
+# =============================================================================
+# BOUNDED MEMORY SAVER TESTS
+# =============================================================================
+
+class TestBoundedMemorySaver:
+    """Test LRU eviction in the in-memory checkpointer."""
+
+    def test_evicts_least_recently_used_thread(self):
+        """Test that only max_threads threads are retained."""
+        saver = BoundedMemorySaver(max_threads=2)
+        graph = _compile(saver)
+
+        for thread_id in ["t1", "t2", "t3"]:
+            graph.invoke({"items": []}, _thread(thread_id))
+
+        assert set(saver.storage.keys()) == {"t2", "t3"}
+        assert not any(key[0] == "t1" for key in saver.blobs)
+
+    def test_reused_thread_is_refreshed(self):
+        """Test that touching a thread protects it from eviction."""
+        saver = BoundedMemorySaver(max_threads=2)
+        graph = _compile(saver)
+
+        graph.invoke({"items": []}, _thread("t1"))
+        graph.invoke({"items": []}, _thread("t2"))
+        graph.invoke({"items": []}, _thread("t1"))
+        graph.invoke({"items": []}, _thread("t3"))
+
+        assert set(saver.storage.keys()) == {"t1", "t3"}
+
+    def test_stats_report_count_and_bytes(self):
+        """Test stats include checkpoints and serialized bytes."""
+        saver = BoundedMemorySaver(max_threads=5)
+        graph = _compile(saver)
+        graph.invoke({"items": []}, _thread("t1"))
+
+        stats = saver.stats()
+        assert stats["backend"] == "memory"
+        assert stats["threads"] == 1
+        assert stats["checkpoints"] > 0
+        assert stats["bytes"] > 0
+
+
+# =============================================================================
+# RUN CLASSIFICATION TESTS
+# =============================================================================
+
+class TestRequiresCheckpoint:
+    """Test which runs can reach a HITL interrupt."""
+
+    def test_reader_runs_are_stateless(self):
+        assert not CheckpointManager.requires_checkpoint({"section": "reader_topic"})
+        assert not CheckpointManager.requires_checkpoint({"section": "home"})
+        assert not CheckpointManager.requires_checkpoint(None)
+
+    def test_analyst_runs_are_stateless(self):
+        assert not CheckpointManager.requires_checkpoint({"section": "analyst_editor"})
+
+    def test_editor_and_admin_runs_are_checkpointed(self):
+        assert CheckpointManager.requires_checkpoint({"section": "editor_dashboard"})
+        assert CheckpointManager.requires_checkpoint({"section": "admin_articles"})
+        assert CheckpointManager.requires_checkpoint({"section": "root_users"})
+
+    def test_explicit_thread_is_checkpointed(self):
+        assert CheckpointManager.requires_checkpoint({"section": "home"}, thread_id="chat_1_x")
+
+
+# =============================================================================
+# THREAD LIFECYCLE TESTS
+# =============================================================================
+
+class TestThreadLifecycle:
+    """Test per-run threads and release."""
+
+    def test_thread_slot_is_stable_per_user_and_role(self):
+        nav = {"section": "editor_dashboard"}
+        assert CheckpointManager.thread_slot(7, nav) == "chat_7_editor"
+        assert CheckpointManager.thread_slot(7, nav) == CheckpointManager.thread_slot(7, nav)
+
+    def test_acquire_thread_is_per_run(self, manager):
+        nav = {"section": "editor_dashboard"}
+        assert manager.acquire_thread(7, nav, "req1") == "chat_7_editor_req1"
+        assert manager.acquire_thread(7, nav) != manager.acquire_thread(7, nav)
+
+    def test_acquire_thread_keeps_other_runs(self, manager):
+        nav = {"section": "editor_dashboard"}
+        graph = _compile(manager.checkpointer)
+
+        first = manager.acquire_thread(1, nav, "req1")
+        graph.invoke({"items": []}, _thread(first))
+        second = manager.acquire_thread(1, nav, "req2")
+
+        assert second != first
+        assert first in manager.checkpointer.storage
+
+    def test_finish_run_releases_thread_without_hitl(self, manager):
+        graph = _compile(manager.checkpointer)
+        graph.invoke({"items": []}, _thread("chat_1_admin"))
+
+        manager.finish_run("chat_1_admin", {"requires_hitl": False})
+
+        assert "chat_1_admin" not in manager.checkpointer.storage
+
+    def test_finish_run_keeps_pending_hitl_thread(self, manager):
+        graph = _compile(manager.checkpointer)
+        graph.invoke({"items": []}, _thread("chat_1_editor"))
+
+        manager.finish_run("chat_1_editor", {"requires_hitl": True})
+
+        assert "chat_1_editor" in manager.checkpointer.storage
+
+    def test_release_keeps_thread_requesting_hitl(self, manager):
+        _compile_hitl(manager.checkpointer).invoke({"items": []}, _thread("chat_1_editor_a"))
+
+        assert manager.has_pending_hitl("chat_1_editor_a")
+        manager.release_thread("chat_1_editor_a")
+
+        assert "chat_1_editor_a" in manager.checkpointer.storage
+
+    def test_release_keeps_interrupted_thread(self, manager):
+        _compile_hitl(manager.checkpointer, pause=True).invoke({"items": []}, _thread("chat_1_editor_b"))
+
+        manager.release_thread("chat_1_editor_b")
+
+        assert "chat_1_editor_b" in manager.checkpointer.storage
+
+    def test_unknown_thread_is_not_pending(self, manager):
+        assert not manager.has_pending_hitl("chat_1_editor_missing")
@@ -0,0 +1,76 @@
+"""
+Tests for the compressed article content store.
+
+Tests for:
+- zstd round trip and unchanged-content detection
+- Batched reads
+- Read-through from ChromaDB for articles not stored yet
+- Write-through from ContentService.create_article / update_article
+"""
+from services import content_store
+from services.content_service import ContentService
+from services.content_store import ContentStore
+from services.vector_service import VectorService
+
+
+CONTENT = "Rates are on hold. " * 200
+
+
+class TestContentStore:
+    """Test store reads and writes."""
+
+    def test_put_and_get(self, db_session, test_article):
+        assert ContentStore.put(db_session, test_article.id, CONTENT)
+        assert ContentStore.get(db_session, test_article.id) == CONTENT
+        assert ContentStore.get_hash(db_session, test_article.id) == content_store.content_hash(CONTENT)
+
+        # Same text: nothing to write
+        assert not ContentStore.put(db_session, test_article.id, CONTENT)
+        assert ContentStore.put(db_session, test_article.id, CONTENT + "Update.")
+
+    def test_compressed(self, db_session, test_article):
+        from models import ArticleContent
+
+        ContentStore.put(db_session, test_article.id, CONTENT)
+        row = db_session.get(ArticleContent, test_article.id)
+
+        assert row.size == len(CONTENT)
+        assert len(row.content) < row.size // 10
+        assert content_store.decompress(row.content) == CONTENT
+
+    def test_get_many(self, db_session, test_article, published_article):
+        ContentStore.put(db_session, test_article.id, "draft body")
+
+        contents = ContentStore.get_many(db_session, [test_article.id, published_article.id])
+
+        assert contents == {test_article.id: "draft body"}
+
+    def test_read_through_from_chromadb(self, db_session, test_article, monkeypatch):
+        backfilled = {}
+        monkeypatch.setattr(VectorService, "get_article_content", staticmethod(lambda article_id: "from chroma"))
+        monkeypatch.setattr(ContentStore, "backfill", staticmethod(backfilled.update))
+
+        assert ContentStore.get_content(test_article.id, db_session) == "from chroma"
+        assert backfilled == {test_article.id: "from chroma"}
+
+        ContentStore.put(db_session, test_article.id, "stored")
+        assert ContentStore.get_content(test_article.id, db_session) == "stored"
+
+
+class TestWriteThrough:
+    """Test ContentService writes and reads through the store."""
+
+    def test_create_and_update(self, db_session, test_topic, mock_redis, mock_chromadb):
+        article = ContentService.create_article(
+            db_session, test_topic.slug, "Rates outlook", CONTENT, "rates", "test", author="Analyst"
+        )
+
+        assert article["content"] == CONTENT
+        assert ContentStore.get(db_session, article["id"]) == CONTENT
+
+        updated = ContentService.update_article(db_session, article["id"], content="New body")
+
+        assert updated["content"] == "New body"
+        assert ContentStore.get(db_session, article["id"]) == "New body"
+        # Content came from the store, not from ChromaDB
+        VectorService.get_article_data.assert_not_called()
@@ -0,0 +1,256 @@
+"""
+Tests for the LLM governor.
+
+Tests for:
+- Request and token buckets per model (per-process fallback)
+- Token estimates corrected with reported usage
+- Priority classes leaving capacity to higher classes
+- Bounded queues and deadlines
+- Backing off after a 429
+- The async API keeping bucket updates off the event loop
+- Chat models and embeddings going through the governor
+- The shared Redis buckets (integration, needs a local Redis)
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import redis
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_openai import ChatOpenAI
+
+import services.llm_client as llm_client
+import services.vector_service as vector_service
+from services.content_cache import cache_settings
+from services.llm_client import (
+    BACKGROUND, BULK, INTERACTIVE, GovernedChatOpenAI, LLMGovernor, LLMOverloadedError, current_priority,
+    llm_priority,
+)
+
+MODEL = "gpt-test"
+
+
+@pytest.fixture
+def governor(monkeypatch):
+    """A fresh governor using per-process buckets (no Redis)."""
+    fresh = LLMGovernor()
+    monkeypatch.setattr(llm_client, "governor", fresh)
+    monkeypatch.setattr(vector_service, "governor", fresh)
+    monkeypatch.setattr(llm_client.content_cache, "_get_cache", lambda: None)
+    monkeypatch.setattr(llm_client.settings, "llm_governor_enabled", True)
+    monkeypatch.setattr(llm_client.settings, "llm_requests_per_minute", 10)
+    monkeypatch.setattr(llm_client.settings, "llm_tokens_per_minute", 1000)
+    monkeypatch.setattr(llm_client.settings, "llm_model_limits", "")
+    for priority in (INTERACTIVE, BACKGROUND, BULK):
+        monkeypatch.setattr(llm_client.settings, f"llm_deadline_{priority}_seconds", 1.0)
+    return fresh
+
+
+def tokens_left(governor, model=MODEL):
+    return governor._local._state[model][1]
+
+
+class TestBuckets:
+    """Test the request and token buckets."""
+
+    def test_requests_per_minute(self, governor):
+        for _ in range(10):
+            governor.acquire(MODEL, 1)
+
+        with pytest.raises(LLMOverloadedError, match="deadline passed"):
+            governor.acquire(MODEL, 1)
+
+    def test_tokens_per_minute_and_settle(self, governor):
+        lease = governor.acquire(MODEL, 800)
+        with pytest.raises(LLMOverloadedError):
+            governor.acquire(MODEL, 800)
+
+        # The call used far fewer tokens than estimated
+        lease.settle(100)
+        assert tokens_left(governor) == pytest.approx(900, abs=1)
+        governor.acquire(MODEL, 800)
+
+    def test_model_limits(self, governor, monkeypatch):
+        monkeypatch.setattr(llm_client.settings, "llm_model_limits", "other=1:100, gpt-test=2:5000")
+
+        assert llm_client.model_limits(MODEL) == (2, 5000)
+        assert llm_client.model_limits("unlisted") == (10, 1000)
+
+    def test_waits_for_refill(self, governor, monkeypatch):
+        monkeypatch.setattr(llm_client.settings, "llm_tokens_per_minute", 600)
+        governor.acquire(MODEL, 600)
+
+        start = time.monotonic()
+        governor.acquire(MODEL, 3)
+
+        assert 0.2 < time.monotonic() - start < 2
+        assert governor.queued() == {INTERACTIVE: 0, BACKGROUND: 0, BULK: 0}
+
+    def test_throttled_empties_buckets(self, governor):
+        governor.throttled(MODEL)
+
+        with pytest.raises(LLMOverloadedError):
+            governor.acquire(MODEL, 1)
+
+    def test_disabled(self, governor, monkeypatch):
+        monkeypatch.setattr(llm_client.settings, "llm_governor_enabled", False)
+
+        for _ in range(20):
+            governor.acquire(MODEL, 1000).settle(5)
+
+    def test_async_takes_off_event_loop(self, governor, monkeypatch):
+        threads = []
+        take, adjust = governor._take, governor._adjust
+
+        def record(method):
+            def wrapped(*args):
+                threads.append(threading.get_ident())
+                return method(*args)
+            return wrapped
+
+        monkeypatch.setattr(governor, "_take", record(take))
+        monkeypatch.setattr(governor, "_adjust", record(adjust))
+
+        async def call():
+            async with governor.aslot(MODEL, 800) as lease:
+                await lease.asettle(100)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(call())
+
+        assert len(threads) == 2 and loop_thread not in threads
+        assert tokens_left(governor) == pytest.approx(900, abs=1)
+
+
+class TestPriorities:
+    """Test priority classes and queues."""
+
+    def test_bulk_leaves_half(self, governor):
+        with llm_priority(BULK):
+            for _ in range(5):
+                governor.acquire(MODEL, 1)
+            with pytest.raises(LLMOverloadedError):
+                governor.acquire(MODEL, 1)
+
+        with llm_priority(BACKGROUND):
+            for _ in range(3):
+                governor.acquire(MODEL, 1)
+            with pytest.raises(LLMOverloadedError):
+                governor.acquire(MODEL, 1)
+
+        for _ in range(2):
+            governor.acquire(MODEL, 1)
+
+    def test_nesting_never_raises_priority(self):
+        with llm_priority(BULK):
+            with llm_priority(BACKGROUND):
+                assert current_priority() == BULK
+        with llm_priority(BACKGROUND):
+            assert current_priority() == BACKGROUND
+        assert current_priority() == INTERACTIVE
+
+        with pytest.raises(ValueError):
+            with llm_priority("urgent"):
+                pass
+
+    def test_queue_full(self, governor, monkeypatch):
+        monkeypatch.setattr(llm_client.settings, "llm_queue_interactive", 0)
+        for _ in range(10):
+            governor.acquire(MODEL, 1)
+
+        with pytest.raises(LLMOverloadedError, match="queue full"):
+            governor.acquire(MODEL, 1)
+
+    def test_lower_class_yields_to_waiting_call(self, governor, monkeypatch):
+        monkeypatch.setattr(llm_client.settings, "llm_tokens_per_minute", 600)
+        governor.acquire(MODEL, 600)
+
+        waiting = threading.Thread(target=governor.acquire, args=(MODEL, 5))
+        waiting.start()
+        time.sleep(0.05)
+
+        assert governor.queued()[INTERACTIVE] == 1
+        assert governor._take(MODEL, 1, BULK) == llm_client.OUTRANKED_POLL_SECONDS
+        waiting.join(5)
+        assert governor.queued()[INTERACTIVE] == 0
+
+
+class TestClients:
+    """Test chat models and embeddings through the governor."""
+
+    def test_chat_model_settles_usage(self, governor, monkeypatch):
+        def generate(self, messages, stop=None, run_manager=None, **kwargs):
+            message = AIMessage(content="ok")
+            return ChatResult(
+                generations=[ChatGeneration(message=message)],
+                llm_output={"token_usage": {"total_tokens": 100}, "model_name": MODEL},
+            )
+
+        monkeypatch.setattr(ChatOpenAI, "_generate", generate)
+        llm = GovernedChatOpenAI(model=MODEL, api_key="sk-test", max_tokens=300)
+
+        assert llm.invoke("hello").content == "ok"
+        assert tokens_left(governor) == pytest.approx(900, abs=1)
+
+    def test_chat_model_rate_limited(self, governor, monkeypatch):
+        monkeypatch.setattr(ChatOpenAI, "_generate", lambda *a, **kw: pytest.fail("request sent"))
+        governor.throttled(MODEL)
+
+        with pytest.raises(LLMOverloadedError):
+            GovernedChatOpenAI(model=MODEL, api_key="sk-test").invoke("hello")
+
+    def test_embedding_skipped_when_overloaded(self, governor, monkeypatch):
+        monkeypatch.setattr(vector_service.settings, "openai_embedding_model", MODEL)
+        response = SimpleNamespace(data=[SimpleNamespace(embedding=[0.1])], usage=SimpleNamespace(total_tokens=3))
+        client = SimpleNamespace(embeddings=SimpleNamespace(create=lambda **kw: response))
+        monkeypatch.setattr(vector_service, "_get_openai_client", lambda: client)
+
+        assert vector_service.VectorService._generate_embedding("text") == [0.1]
+        governor.throttled(MODEL)
+        assert vector_service.VectorService._generate_embedding("text") is None
+
+
+@pytest.mark.integration
+class TestRedisBuckets:
+    """Test the shared buckets against a local Redis."""
+
+    @pytest.fixture
+    def redis_governor(self, governor, monkeypatch):
+        client = redis.Redis(
+            host=cache_settings.redis_host, port=cache_settings.redis_port, db=cache_settings.redis_db,
+            password=cache_settings.redis_password, decode_responses=True, socket_connect_timeout=0.2,
+        )
+        try:
+            client.ping()
+        except redis.RedisError:
+            pytest.skip("Redis not available")
+        client.delete(LLMGovernor._key(MODEL))
+        monkeypatch.setattr(llm_client.content_cache, "_get_cache", lambda: client)
+        yield governor, client
+        client.delete(LLMGovernor._key(MODEL))
+
+    def test_shared_between_governors(self, redis_governor):
+        governor, client = redis_governor
+        other = LLMGovernor()
+
+        for _ in range(5):
+            governor.acquire(MODEL, 10)
+            other.acquire(MODEL, 10)
+        with pytest.raises(LLMOverloadedError):
+            other.acquire(MODEL, 1)
+
+        assert float(client.hget(LLMGovernor._key(MODEL), "tok")) == pytest.approx(900, abs=1)
+        assert client.ttl(LLMGovernor._key(MODEL)) > 0
+
+    def test_settle_and_throttle(self, redis_governor):
+        governor, client = redis_governor
+
+        governor.acquire(MODEL, 500).settle(50)
+        assert float(client.hget(LLMGovernor._key(MODEL), "tok")) == pytest.approx(950, abs=1)
+
+        governor.throttled(MODEL)
+        with pytest.raises(LLMOverloadedError):
+            governor.acquire(MODEL, 1)
@@ -0,0 +1,244 @@
+"""
+Tests for the local market-data store.
+
+Tests for:
+- Serving stored bars within the interval TTL
+- Tail top-up from the last stored bar and head top-up for longer periods
+- Serving stored data when the provider fails
+- Bulk downloads for several symbols (one provider call per missing range)
+- Stored company info
+- Vectorized history -> payload conversion and the data download tools
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import services.market_data as market_data
+from agents.tools.data_download_tools import fetch_fx_rate, fetch_fx_rates, fetch_stock_price, fetch_stock_prices
+from services.market_data import MarketData, MarketDataProvider, MarketDataStore, PRICE_COLUMNS, history_records
+
+
+NOW = datetime(2026, 3, 16, 21, 0, tzinfo=timezone.utc)  # Monday evening
+
+
+class FixtureProvider(MarketDataProvider):
+    """Business-day bars (close = 100 + day number) with recorded calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.bulk_calls = []
+        self.info_calls = 0
+        self.fail = False
+
+    def history_many(self, symbols, interval, start, end=None):
+        self.bulk_calls.append((list(symbols), start, end))
+        return super().history_many(symbols, interval, start, end)
+
+    def history(self, symbol, interval, start, end=None):
+        self.calls.append((symbol, interval, start, end))
+        if self.fail:
+            raise ConnectionError("provider down")
+        days = pd.bdate_range(start or datetime(2025, 1, 1, tzinfo=timezone.utc), end or NOW, tz="UTC").normalize()
+        days = days[days < end] if end is not None else days
+        close = 100.0 + np.arange(len(days)) + days.day / 1000
+        return pd.DataFrame({
+            "Open": close - 1, "High": close + 1, "Low": close - 2, "Close": close,
+            "Volume": np.full(len(days), 1000.0),
+        }, index=days)
+
+    def info(self, symbol):
+        self.info_calls += 1
+        if self.fail:
+            raise ConnectionError("provider down")
+        return {"longName": f"{symbol} Inc.", "currency": "USD"}
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    fixture = FixtureProvider()
+    previous = market_data.set_provider(fixture)
+    monkeypatch.setattr(market_data, "store", MarketDataStore(str(tmp_path)))
+    monkeypatch.setattr(market_data, "_now", lambda: NOW)
+    yield fixture
+    market_data.set_provider(previous)
+
+
+class TestHistory:
+    """Test stored history and top-ups."""
+
+    def test_served_from_store_within_ttl(self, provider):
+        first = MarketData.history("aapl", period="1mo")
+        second = MarketData.history("AAPL", period="1mo")
+
+        assert len(provider.calls) == 1
+        assert provider.calls[0][0] == "AAPL"
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+        assert first.index[0] >= pd.Timestamp(NOW - timedelta(days=31)).tz_convert(None)
+        # Daily bars are keyed by date
+        assert first.index.tz is None
+
+    def test_stale_tail_fetched_from_last_bar(self, provider, monkeypatch):
+        MarketData.history("AAPL", period="1mo")
+        later = NOW + timedelta(days=2)
+        monkeypatch.setattr(market_data, "_now", lambda: later)
+
+        hist = MarketData.history("AAPL", period="1mo")
+
+        # From a day before the last stored bar (dates are exchange-local)
+        tail_start = provider.calls[-1][2]
+        assert tail_start == datetime(2026, 3, 15, tzinfo=timezone.utc)
+        assert not hist.index.duplicated().any()
+        assert hist.index.is_monotonic_increasing
+
+    def test_longer_period_fetches_missing_head_only(self, provider):
+        MarketData.history("AAPL", period="1mo")
+        hist = MarketData.history("AAPL", period="3mo")
+
+        _, _, start, end = provider.calls[-1]
+        assert end == NOW - timedelta(days=31)
+        assert start == NOW - timedelta(days=92)
+        assert hist.index[0] >= pd.Timestamp(start).tz_convert(None)
+        # The shorter period now comes from the store
+        MarketData.history("AAPL", period="1mo")
+        assert len(provider.calls) == 2
+
+    def test_session_periods(self, provider):
+        hist = MarketData.history("AAPL", period="5d")
+
+        assert len(hist) == 5
+        assert hist.index[-1] == pd.Timestamp("2026-03-16")
+
+    def test_provider_failure_serves_stored(self, provider, monkeypatch):
+        stored = MarketData.history("AAPL", period="1mo")
+        monkeypatch.setattr(market_data, "_now", lambda: NOW + timedelta(hours=1))
+        provider.fail = True
+
+        assert len(MarketData.history("AAPL", period="1mo")) == len(stored)
+
+        with pytest.raises(ConnectionError):
+            MarketData.history("MSFT", period="1mo")
+
+    def test_unknown_period(self, provider):
+        with pytest.raises(ValueError):
+            MarketData.history("AAPL", period="7w")
+
+
+class TestHistoryMany:
+    """Test bulk downloads."""
+
+    def test_one_call_for_all_missing_symbols(self, provider):
+        frames = MarketData.history_many(["aapl", "MSFT", "AAPL", "^TNX"], period="3mo")
+
+        assert list(frames) == ["AAPL", "MSFT", "^TNX"]
+        assert len(provider.bulk_calls) == 1
+        assert provider.bulk_calls[0][0] == ["AAPL", "MSFT", "^TNX"]
+        # Single-symbol reads are now served from the store
+        pd.testing.assert_frame_equal(MarketData.history("MSFT", period="3mo"), frames["MSFT"], check_freq=False)
+        assert provider.calls == [(s, "1d", NOW - timedelta(days=92), None) for s in ("AAPL", "MSFT", "^TNX")]
+
+    def test_only_missing_symbols_and_ranges_fetched(self, provider, monkeypatch):
+        MarketData.history("AAPL", period="1mo")
+        MarketData.history_many(["AAPL", "MSFT"], period="1mo")
+
+        assert provider.bulk_calls[-1][0] == ["MSFT"]
+
+        monkeypatch.setattr(market_data, "_now", lambda: NOW + timedelta(days=1))
+        MarketData.history_many(["AAPL", "MSFT"], period="1mo")
+
+        # Both tails start at the same bar: one call
+        assert provider.bulk_calls[-1] == (["AAPL", "MSFT"], datetime(2026, 3, 15, tzinfo=timezone.utc), None)
+
+    def test_failed_download(self, provider, monkeypatch):
+        MarketData.history("AAPL", period="1mo")
+        monkeypatch.setattr(market_data, "_now", lambda: NOW + timedelta(hours=1))
+        provider.fail = True
+
+        frames = MarketData.history_many(["AAPL", "MSFT"], period="1mo")
+
+        assert not frames["AAPL"].empty
+        assert frames["MSFT"].empty
+
+
+class TestInfo:
+    """Test stored company info."""
+
+    def test_info_stored(self, provider):
+        assert MarketData.info("AAPL")["longName"] == "AAPL Inc."
+        assert MarketData.info("aapl")["longName"] == "AAPL Inc."
+        assert provider.info_calls == 1
+
+    def test_info_many(self, provider):
+        MarketData.info("AAPL")
+
+        infos = MarketData.info_many(["AAPL", "MSFT", "NVDA"])
+
+        assert [i["longName"] for i in infos.values()] == ["AAPL Inc.", "MSFT Inc.", "NVDA Inc."]
+        assert provider.info_calls == 3
+
+    def test_refresh_failure_serves_stored(self, provider, monkeypatch):
+        MarketData.info("AAPL")
+        monkeypatch.setattr(market_data.settings, "market_data_info_ttl_seconds", 0)
+        provider.fail = True
+
+        assert MarketData.info("AAPL")["currency"] == "USD"
+        assert provider.info_calls == 2
+
+
+class TestPayloads:
+    """Test DataFrame -> payload conversion and the tools."""
+
+    def test_history_records(self):
+        index = pd.to_datetime(["2026-03-13", "2026-03-16"]).tz_localize("America/New_York")
+        hist = pd.DataFrame({"Close": [1.23456, np.nan], "Volume": [10.0, np.nan]}, index=index)
+
+        records = history_records(hist, {"close": ("Close", 2), "volume": ("Volume", None), "open": ("Open", 2)})
+
+        assert records == [
+            {"date": "2026-03-13", "close": 1.23, "volume": 10, "open": 0.0},
+            {"date": "2026-03-16", "close": 0.0, "volume": 0, "open": 0.0},
+        ]
+        assert json.loads(json.dumps(records)) == records
+        assert history_records(hist, PRICE_COLUMNS, tail=1)[0]["date"] == "2026-03-16"
+
+    def test_fetch_stock_price(self, provider):
+        result = json.loads(fetch_stock_price.invoke({"symbol": "AAPL", "period": "3mo"}))
+
+        assert result["success"]
+        assert result["company_name"] == "AAPL Inc."
+        assert len(result["data"]) == 30
+        assert result["data_points"] > 30
+        assert result["latest_price"] == result["data"][-1]["close"]
+
+    def test_fetch_fx_rate(self, provider):
+        result = json.loads(fetch_fx_rate.invoke({"base": "EUR", "target": "USD"}))
+
+        assert result["success"]
+        assert provider.calls[0][0] == "EURUSD=X"
+        assert set(result["data"][0]) == {"date", "rate"}
+
+    def test_fetch_stock_prices(self, provider):
+        result = json.loads(fetch_stock_prices.invoke({"symbols": ["AAPL", "MSFT"], "period": "3mo"}))
+
+        assert result["success"]
+        assert len(provider.bulk_calls) == 1
+        assert result["results"]["MSFT"]["company_name"] == "MSFT Inc."
+        assert len(result["results"]["AAPL"]["data"]) == 30
+        assert result["errors"] == {}
+
+    def test_fetch_stock_prices_reports_missing(self, provider, monkeypatch):
+        monkeypatch.setattr(provider, "history", lambda symbol, interval, start, end=None: pd.DataFrame())
+
+        result = json.loads(fetch_stock_prices.invoke({"symbols": ["NOPE"]}))
+
+        assert not result["success"]
+        assert "NOPE" in result["errors"]
+
+    def test_fetch_fx_rates(self, provider):
+        result = json.loads(fetch_fx_rates.invoke({"pairs": ["EUR/USD", "usdjpy"]}))
+
+        assert result["success"]
+        assert provider.bulk_calls[0][0] == ["EURUSD=X", "USDJPY=X"]
+        assert set(result["results"]) == {"EUR/USD", "USD/JPY"}
@@ -0,0 +1,113 @@
+"""
+Tests for the Prometheus metrics module.
+
+Tests for:
+- Counter and histogram rendering
+- Timer and the observed decorator
+- LangGraph node wrapper
+- Disabled metrics are no-ops
+"""
+import pytest
+
+import metrics
+from metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    Timer,
+    instrument_node,
+    observed,
+)
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    yield registry
+    metrics.set_enabled(True)
+
+
+class TestRendering:
+    """Test the text exposition format."""
+
+    def test_counter(self, registry):
+        counter = registry.register(Counter("requests_total", "Requests", ["cache", "result"]))
+        counter.inc(cache="article", result="hit")
+        counter.inc(2, cache="article", result="hit")
+
+        text = registry.render()
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{cache="article",result="hit"} 3' in text
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        histogram = registry.register(Histogram("op_seconds", "Ops", ["op"], buckets=(0.1, 1.0)))
+        histogram.observe(0.05, op="get")
+        histogram.observe(0.5, op="get")
+        histogram.observe(5.0, op="get")
+
+        text = registry.render()
+        assert 'op_seconds_bucket{op="get",le="0.1"} 1' in text
+        assert 'op_seconds_bucket{op="get",le="1"} 2' in text
+        assert 'op_seconds_bucket{op="get",le="+Inf"} 3' in text
+        assert 'op_seconds_count{op="get"} 3' in text
+        assert histogram.sum(op="get") == pytest.approx(5.55)
+
+    def test_duplicate_registration_rejected(self, registry):
+        registry.register(Counter("dup_total", "Dup"))
+        with pytest.raises(ValueError):
+            registry.register(Counter("dup_total", "Dup"))
+
+
+class TestHelpers:
+    """Test Timer, observed and instrument_node."""
+
+    def test_timer_sets_status(self, registry):
+        histogram = Histogram("t_seconds", "T", ["op", "status"])
+        with Timer(histogram, op="ok"):
+            pass
+        with pytest.raises(RuntimeError):
+            with Timer(histogram, op="fail"):
+                raise RuntimeError("boom")
+
+        assert histogram.count(op="ok", status="ok") == 1
+        assert histogram.count(op="fail", status="error") == 1
+
+    def test_observed_records_dependency(self, registry):
+        @observed("chromadb", "unit_test_op")
+        def query():
+            return 42
+
+        before = metrics.DEPENDENCY_SECONDS.count(system="chromadb", operation="unit_test_op", status="ok")
+        assert query() == 42
+        after = metrics.DEPENDENCY_SECONDS.count(system="chromadb", operation="unit_test_op", status="ok")
+        assert after == before + 1
+
+    async def test_observed_awaits_coroutines(self, registry):
+        @observed("chromadb", "unit_test_async_op")
+        async def query():
+            return 42
+
+        assert await query() == 42
+        assert metrics.DEPENDENCY_SECONDS.count(system="chromadb", operation="unit_test_async_op", status="ok") == 1
+
+    def test_instrument_node(self, registry):
+        node = instrument_node("unit_test_node", lambda state: {"seen": state["x"]}, graph="unit")
+
+        assert node({"x": 1}) == {"seen": 1}
+        assert metrics.GRAPH_NODE_SECONDS.count(graph="unit", node="unit_test_node", status="ok") >= 1
+
+
+class TestDisabled:
+    """Test that disabled metrics record nothing."""
+
+    def test_disabled_is_noop(self, registry):
+        metrics.set_enabled(False)
+        histogram = Histogram("d_seconds", "D", ["op"])
+        fn = lambda state: state
+
+        with Timer(histogram, op="x") as timer:
+            pass
+
+        assert timer.elapsed >= 0
+        assert histogram.count(op="x") == 0
+        assert instrument_node("n", fn) is fn
@@ -0,0 +1,164 @@
+"""
+Tests for chat model routing.
+
+Tests for:
+- Built-in routes (fast model for headlines, keywords and intent classification)
+- LLM_ROUTES overrides by route, node and topic agent type
+- Fallback models after overloads and upstream errors
+- Latency, token and cost accounting per route
+"""
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_openai import ChatOpenAI
+
+import services.llm_client as llm_client
+import services.model_router as model_router
+from metrics import LLM_ROUTE_COST_USD, LLM_ROUTE_SECONDS, LLM_ROUTE_TOKENS
+from services.llm_client import LLMGovernor, LLMOverloadedError
+from services.model_router import resolve, routed_chat_model, topic_agent_type
+from services.single_flight import SingleFlight
+
+
+@pytest.fixture(autouse=True)
+def routing(monkeypatch):
+    """Known models, no overrides, no Redis."""
+    monkeypatch.setattr(model_router.settings, "openai_model", "gpt-big")
+    monkeypatch.setattr(model_router.settings, "llm_fast_model", "gpt-small")
+    monkeypatch.setattr(model_router.settings, "intent_classifier_model", None)
+    monkeypatch.setattr(model_router.settings, "llm_routes", "")
+    monkeypatch.setattr(model_router.settings, "llm_model_prices", "gpt-small=1:2,gpt-big=10:20")
+    monkeypatch.setattr(model_router, "topic_agent_type", lambda topic: {"tech": "equity"}.get(topic))
+    monkeypatch.setattr(llm_client, "governor", LLMGovernor())
+    monkeypatch.setattr(llm_client, "single_flight", SingleFlight())
+    monkeypatch.setattr(llm_client.content_cache, "_get_cache", lambda: None)
+
+
+def reply(content="ok", prompt_tokens=100, completion_tokens=50):
+    return ChatResult(
+        generations=[ChatGeneration(message=AIMessage(content=content))],
+        llm_output={"token_usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }},
+    )
+
+
+class TestResolve:
+    """Test route resolution."""
+
+    def test_defaults(self):
+        assert resolve("content_gen.headline") == model_router.Route("content_gen.headline", "gpt-small", ("gpt-big",))
+        assert resolve("analyst.keywords").model == "gpt-small"
+        assert resolve("content_gen.content") == model_router.Route("content_gen.content", "gpt-big")
+
+    def test_intent_classifier_model(self, monkeypatch):
+        assert resolve("intent.classify").model == "gpt-small"
+
+        monkeypatch.setattr(model_router.settings, "intent_classifier_model", "gpt-intent")
+
+        assert resolve("intent.classify") == model_router.Route("intent.classify", "gpt-intent")
+
+    def test_overrides(self, monkeypatch):
+        monkeypatch.setattr(
+            model_router.settings, "llm_routes",
+            "reader=gpt-a, content_gen.content=gpt-b|gpt-c, equity:content_gen=gpt-d, equity:content_gen.headline=gpt-e",
+        )
+
+        assert resolve("reader.answer").model == "gpt-a"
+        assert resolve("content_gen.content") == model_router.Route("content_gen.content", "gpt-b", ("gpt-c",))
+        assert resolve("content_gen.content", "equity").model == "gpt-d"
+        assert resolve("content_gen.headline", "equity").model == "gpt-e"
+        assert resolve("content_gen.headline", "macro").model == "gpt-small"
+
+    def test_topic_agent_type(self, monkeypatch):
+        monkeypatch.setattr(model_router.settings, "llm_routes", "equity:reader=gpt-equity")
+
+        assert routed_chat_model("reader.answer", topic="tech").model_name == "gpt-equity"
+        assert routed_chat_model("reader.answer", topic="macro").model_name == "gpt-big"
+
+    def test_agent_type_lookup_failure(self, monkeypatch):
+        def broken(topic, epoch):
+            raise RuntimeError("database down")
+
+        monkeypatch.setattr(model_router, "_topic_agent_type", broken)
+
+        assert topic_agent_type("macro") is None
+        assert topic_agent_type(None) is None
+
+
+class TestRoutedCalls:
+    """Test fallbacks and accounting on routed chat models."""
+
+    def test_accounting(self, monkeypatch):
+        monkeypatch.setattr(ChatOpenAI, "_generate", lambda self, messages, **kwargs: reply())
+        seconds = LLM_ROUTE_SECONDS.count(route="content_gen.headline", model="gpt-small", status="ok")
+        tokens = LLM_ROUTE_TOKENS.value(route="content_gen.headline", model="gpt-small", kind="completion")
+        cost = LLM_ROUTE_COST_USD.value(route="content_gen.headline", model="gpt-small")
+
+        routed_chat_model("content_gen.headline", api_key="sk-test").invoke("Headline for the ECB decision")
+
+        assert LLM_ROUTE_SECONDS.count(route="content_gen.headline", model="gpt-small", status="ok") - seconds == 1
+        assert LLM_ROUTE_TOKENS.value(route="content_gen.headline", model="gpt-small", kind="completion") - tokens == 50
+        # 100 prompt tokens at $1/1M plus 50 completion tokens at $2/1M
+        assert LLM_ROUTE_COST_USD.value(route="content_gen.headline", model="gpt-small") - cost == pytest.approx(0.0002)
+
+    def test_falls_back_when_overloaded(self, monkeypatch):
+        models = []
+
+        def generate(self, messages, stop=None, run_manager=None, **kwargs):
+            model = kwargs.get("model", self.model_name)
+            models.append(model)
+            if model == "gpt-small":
+                raise LLMOverloadedError(model, "interactive", "queue full")
+            return reply(content=model)
+
+        monkeypatch.setattr(ChatOpenAI, "_generate", generate)
+        before = LLM_ROUTE_SECONDS.count(route="content_gen.keywords", model="gpt-big", status="ok")
+
+        result = routed_chat_model("content_gen.keywords", api_key="sk-test").invoke("Keywords please")
+
+        assert result.content == "gpt-big"
+        assert models == ["gpt-small", "gpt-big"]
+        assert LLM_ROUTE_SECONDS.count(route="content_gen.keywords", model="gpt-big", status="ok") - before == 1
+
+    def test_last_model_error_raised(self, monkeypatch):
+        def generate(self, messages, stop=None, run_manager=None, **kwargs):
+            raise LLMOverloadedError(kwargs.get("model", self.model_name), "interactive", "queue full")
+
+        monkeypatch.setattr(ChatOpenAI, "_generate", generate)
+
+        with pytest.raises(LLMOverloadedError) as error:
+            routed_chat_model("content_gen.headline", api_key="sk-test").invoke("Headline")
+
+        assert error.value.model == "gpt-big"
+
+    def test_other_errors_not_retried(self, monkeypatch):
+        models = []
+
+        def generate(self, messages, stop=None, run_manager=None, **kwargs):
+            models.append(kwargs.get("model", self.model_name))
+            raise ValueError("bad request")
+
+        monkeypatch.setattr(ChatOpenAI, "_generate", generate)
+        before = LLM_ROUTE_SECONDS.count(route="content_gen.headline", model="gpt-small", status="error")
+
+        with pytest.raises(ValueError):
+            routed_chat_model("content_gen.headline", api_key="sk-test").invoke("Headline")
+
+        assert models == ["gpt-small"]
+        assert LLM_ROUTE_SECONDS.count(route="content_gen.headline", model="gpt-small", status="error") - before == 1
+
+    async def test_async_fallback(self, monkeypatch):
+        async def agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+            model = kwargs.get("model", self.model_name)
+            if model == "gpt-small":
+                raise LLMOverloadedError(model, "interactive", "deadline passed")
+            return reply(content=model)
+
+        monkeypatch.setattr(ChatOpenAI, "_agenerate", agenerate)
+
+        result = await routed_chat_model("article_content.headline", api_key="sk-test").ainvoke("Headline")
+
+        assert result.content == "gpt-big"
@@ -0,0 +1,190 @@
+"""
+Tests for keyset pagination and cached listing totals.
+
+Tests for:
+- Cursor round trip and malformed cursors
+- Keyset pages over rows sharing a created_at
+- Stale totals served while a background recount runs
+- Resource and article listings walking every page by cursor
+"""
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from models import ContentArticle, ArticleStatus, Resource, ResourceType, ResourceStatus
+from services.content_service import ContentService
+from services.pagination import (
+    CountCache, InvalidCursorError, counts, decode_cursor, encode_cursor, page_offset,
+)
+from services.resource_service import ResourceService
+
+
+CREATED = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def resources(db_session):
+    """Seven resources, three of them created at the same instant."""
+    created = [CREATED - timedelta(minutes=m) for m in (0, 1, 1, 1, 2, 3, 4)]
+    rows = []
+    for index, created_at in enumerate(created):
+        resource = Resource(
+            hash_id=f"res{index:03d}",
+            resource_type=ResourceType.TEXT,
+            status=ResourceStatus.PUBLISHED,
+            name=f"Resource {index}",
+            created_at=created_at,
+        )
+        db_session.add(resource)
+        rows.append(resource)
+    db_session.flush()
+    counts.invalidate()
+    yield rows
+    counts.invalidate()
+
+
+class TestCursors:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        position = decode_cursor(encode_cursor(CREATED, 42))
+
+        assert position == {"created_at": CREATED, "id": 42}
+        assert decode_cursor(encode_cursor(offset=40)) == {"offset": 40}
+        assert page_offset(encode_cursor(offset=40), offset=5) == 40
+        assert page_offset(None, offset=5) == 5
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor("yesterday", 1)])
+    def test_malformed(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    def test_keyset_cursor_rejected_for_ranked_listing(self):
+        with pytest.raises(InvalidCursorError):
+            page_offset(encode_cursor(CREATED, 1))
+
+
+class TestCountCache:
+    """Test cached totals."""
+
+    def test_fresh_total_not_recounted(self, db_session):
+        cache = CountCache(refresh_seconds=60)
+        calls = []
+
+        def count(session):
+            calls.append(session)
+            return 7
+
+        assert cache.total(("resources",), count, db_session) == (7, True)
+        assert cache.total(("resources",), count, db_session) == (7, True)
+        assert len(calls) == 1
+
+        assert cache.total(("resources",), count, db_session, exact=True) == (7, True)
+        assert len(calls) == 2
+
+    def test_stale_total_refreshed_in_background(self, db_session, monkeypatch):
+        cache = CountCache(refresh_seconds=0)
+        refreshed = threading.Event()
+        values = iter([3, 5])
+
+        def count(session):
+            value = next(values)
+            if value == 5:
+                refreshed.set()
+            return value
+
+        monkeypatch.setattr("database.SessionLocal", lambda: db_session)
+        monkeypatch.setattr(db_session, "close", lambda: None)
+
+        assert cache.total(("resources",), count, db_session) == (3, True)
+        # Stale: previous value now, recount in the background
+        assert cache.total(("resources",), count, db_session) == (3, False)
+        assert refreshed.wait(5)
+        cache._executor.submit(lambda: None).result(5)
+        assert cache._entries[("resources",)][0] == 5
+
+    def test_invalidate_prefix(self, db_session):
+        cache = CountCache(refresh_seconds=60)
+        cache.total(("resources", 1), lambda s: 1, db_session)
+        cache.total(("articles", 1), lambda s: 2, db_session)
+
+        cache.invalidate("resources")
+
+        assert list(cache._entries) == [("articles", 1)]
+
+
+class TestResourceListing:
+    """Test resource listings by cursor."""
+
+    def test_walk_pages(self, db_session, resources):
+        seen = []
+        cursor = None
+        while True:
+            page = ResourceService.list_resources(db_session, limit=3, cursor=cursor)
+            assert page.total == 7
+            seen.extend(item["id"] for item in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        expected = [r.id for r in sorted(resources, key=lambda r: (r.created_at, r.id), reverse=True)]
+        assert seen == expected
+
+    def test_offset_still_supported(self, db_session, resources):
+        first = ResourceService.list_resources(db_session, limit=3)
+        second = ResourceService.list_resources(db_session, offset=3, limit=3)
+        by_cursor = ResourceService.list_resources(db_session, limit=3, cursor=first.next_cursor)
+
+        assert [i["id"] for i in second.items] == [i["id"] for i in by_cursor.items]
+
+    def test_total_invalidated_on_delete(self, db_session, resources):
+        assert ResourceService.list_resources(db_session, limit=3).total == 7
+
+        counts.invalidate("resources")
+        resources[0].is_active = False
+        db_session.flush()
+
+        page = ResourceService.list_resources(db_session, limit=3)
+        assert (page.total, page.total_exact) == (6, True)
+
+
+class TestArticleListing:
+    """Test admin/editorial article listings by cursor."""
+
+    def test_walk_pages(self, db_session, test_topic, mock_chromadb):
+        for index in range(5):
+            db_session.add(ContentArticle(
+                topic=test_topic.slug, headline=f"Draft {index}", status=ArticleStatus.DRAFT,
+                created_by_agent="test", created_at=CREATED - timedelta(minutes=index // 2),
+            ))
+        db_session.flush()
+
+        seen = []
+        pages = 0
+        cursor = None
+        while True:
+            articles, cursor = ContentService.get_articles_by_status(db_session, test_topic.slug, "draft", limit=2, cursor=cursor)
+            seen.extend(a["headline"] for a in articles)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert sorted(seen) == [f"Draft {index}" for index in range(5)]
+        assert (len(seen), pages) == (5, 3)
+        by_offset, _ = ContentService.get_all_articles_admin(db_session, test_topic.slug, offset=2, limit=2)
+        assert [a["headline"] for a in by_offset] == seen[2:4]
+
+    def test_full_last_page_has_no_cursor(self, db_session, test_topic, mock_chromadb):
+        for index in range(4):
+            db_session.add(ContentArticle(
+                topic=test_topic.slug, headline=f"Draft {index}", status=ArticleStatus.DRAFT,
+                created_by_agent="test", created_at=CREATED - timedelta(minutes=index),
+            ))
+        db_session.flush()
+
+        first, cursor = ContentService.get_all_articles_admin(db_session, test_topic.slug, limit=2)
+        last, after_last = ContentService.get_all_articles_admin(db_session, test_topic.slug, limit=2, cursor=cursor)
+
+        assert len(first) == len(last) == 2
+        assert cursor is not None and after_last is None
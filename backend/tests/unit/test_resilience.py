@@ -0,0 +1,171 @@
+"""
+Tests for dependency circuit breakers.
+
+Tests for:
+- Opening after consecutive failures and failing fast
+- Half-open probes with exponential backoff
+- Guarded clients and which errors count as failures
+- Reconnecting to ChromaDB after a failed first connection
+"""
+import httpx
+import pytest
+
+from resilience import CircuitBreaker, CircuitOpenError, guard
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        "test",
+        failure_threshold=2,
+        recovery_seconds=1.0,
+        max_recovery_seconds=4.0,
+        failure_types=(ConnectionError,),
+        clock=clock,
+    )
+
+
+def _fail():
+    raise ConnectionError("refused")
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        breaker = _breaker(FakeClock())
+        calls = []
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call(_fail)
+        assert breaker.state == "open"
+
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: calls.append(1))
+        assert calls == []
+
+    def test_half_open_probe_backoff_and_recovery(self):
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        # One probe after the delay; concurrent callers still fail fast
+        clock.now = 1.0
+        assert breaker.available()
+        assert breaker.allow()
+        assert breaker.state == "half_open"
+        assert not breaker.allow()
+
+        # Failed probe doubles the delay
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.snapshot()["retry_in_seconds"] == 2.0
+        clock.now = 2.5
+        assert not breaker.allow()
+
+        clock.now = 3.0
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == "closed"
+        assert breaker.snapshot()["consecutive_failures"] == 0
+
+    def test_backoff_is_capped(self):
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        for _ in range(5):
+            clock.now += 10
+            assert breaker.allow()
+            breaker.record_failure()
+        assert breaker.snapshot()["retry_in_seconds"] == 4.0
+
+
+class TestGuard:
+    """Test guarded client proxies."""
+
+    def test_only_failure_types_count(self):
+        breaker = _breaker(FakeClock())
+
+        class Client:
+            name = "client"
+
+            def lookup(self):
+                raise KeyError("missing")
+
+        guarded = guard(Client(), breaker)
+        assert guarded.name == "client"
+        for _ in range(3):
+            with pytest.raises(KeyError):
+                guarded.lookup()
+        assert breaker.state == "closed"
+
+    async def test_async_methods_are_awaited_through_breaker(self):
+        breaker = _breaker(FakeClock())
+
+        class AsyncClient:
+            async def query(self):
+                raise ConnectionError("refused")
+
+        guarded = guard(AsyncClient(), breaker)
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await guarded.query()
+        assert breaker.state == "open"
+
+        with pytest.raises(CircuitOpenError):
+            await guarded.query()
+
+
+class TestChromaReconnect:
+    """Test that a failed first connection is retried."""
+
+    def test_reconnects_after_boot_failure(self, monkeypatch):
+        import services.vector_service as vector_service
+        from resilience import CHROMADB
+
+        attempts = []
+
+        class FakeHttpClient:
+            def __init__(self, **kwargs):
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise httpx.ConnectError("connection refused")
+
+            def heartbeat(self):
+                return 1
+
+            def get_or_create_collection(self, **kwargs):
+                return type("Collection", (), {"count": lambda self: 0})()
+
+        clock = FakeClock()
+        monkeypatch.setattr(vector_service.chromadb, "HttpClient", FakeHttpClient)
+        monkeypatch.setattr(vector_service, "_vectordb_initialized", False)
+        monkeypatch.setattr(CHROMADB, "_clock", clock)
+        CHROMADB.reset()
+        monkeypatch.setattr(CHROMADB, "failure_threshold", 1)
+        try:
+            assert vector_service._get_chroma_client() == (None, None)
+            assert CHROMADB.state == "open"
+
+            # Still within the recovery delay: no new connection attempt
+            assert vector_service._get_chroma_client() == (None, None)
+            assert len(attempts) == 1
+
+            clock.now += CHROMADB.recovery_seconds
+            client, collection = vector_service._get_chroma_client()
+            assert collection is not None
+            assert CHROMADB.state == "closed"
+        finally:
+            CHROMADB.reset()
+            vector_service._vectordb_initialized = False
+            vector_service._chroma_client = None
+            vector_service._collection = None
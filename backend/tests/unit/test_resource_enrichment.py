@@ -0,0 +1,249 @@
+"""
+Tests for concurrent batch resource enrichment.
+
+Tests for:
+- Metadata generated concurrently, written in batches (one commit and one
+  ChromaDB request per batch)
+- Resources missing from ChromaDB embedded and upserted
+- Resuming an interrupted job from its checkpoint
+- Missing, empty and other resource types
+- Progress notifications
+"""
+import json
+import threading
+import time
+
+import pytest
+
+import api.websocket as websocket
+import services.content_cache as content_cache
+import services.resource_enrichment as resource_enrichment
+import services.resource_service as resource_service
+from models import Resource, ResourceStatus, ResourceType, TableResource, TextResource
+from services.resource_enrichment import ResourceEnricher, job_id_for
+
+
+class FakeCache:
+    """Set-backed stand-in for the Redis content cache."""
+
+    def __init__(self):
+        self.sets = {}
+
+    def smembers(self, key):
+        return {str(member) for member in self.sets.get(key, set())}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, cache):
+        self.cache = cache
+        self.commands = []
+
+    def sadd(self, key, *members):
+        self.commands.append((key, members))
+
+    def expire(self, key, ttl):
+        pass
+
+    def execute(self):
+        for key, members in self.commands:
+            self.cache.sets.setdefault(key, set()).update(members)
+
+
+class FakeCollection:
+    """Resource collection recording its requests."""
+
+    def __init__(self):
+        self.calls = []
+        self.documents = {}
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        self.calls.append(("upsert", list(ids)))
+        self.documents.update(zip(ids, documents))
+
+    def update(self, ids, metadatas):
+        self.calls.append(("update", list(ids)))
+
+
+class FakeDescriber:
+    """generate_metadata stand-in; calls take `delay` seconds."""
+
+    def __init__(self, delay=0.0, fail_on=()):
+        self.delay = delay
+        self.fail_on = set(fail_on)
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, resource_id, content, resource_type):
+        with self._lock:
+            self.calls.append(resource_id)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if resource_id in self.fail_on:
+                return {"success": False, "resource_id": resource_id, "error": "upstream down", "metadata": None}
+            return {
+                "success": True,
+                "resource_id": resource_id,
+                "metadata": {
+                    "description": f"About {resource_type} {resource_id}",
+                    "keywords": ["inflation", "rates"],
+                    "topic": "macro",
+                    "content_type": "research",
+                    "entities": [],
+                },
+            }
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fake = FakeCache()
+    monkeypatch.setattr(content_cache, "_get_cache", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake = FakeCollection()
+    monkeypatch.setattr(resource_service, "_get_resource_collection", lambda: fake)
+    monkeypatch.setattr(resource_enrichment.VectorService, "_generate_embedding", lambda text: [1.0, 0.0])
+    return fake
+
+
+@pytest.fixture
+def notifications(monkeypatch):
+    sent = []
+    monkeypatch.setattr(websocket, "send_notification_sync", lambda user_id, payload: sent.append((user_id, payload)))
+    return sent
+
+
+@pytest.fixture
+def library(db_session, test_user):
+    """Four indexed text resources, one text resource missing from ChromaDB and one table."""
+    resources = []
+    for index in range(6):
+        resource_type = ResourceType.TABLE if index == 5 else ResourceType.TEXT
+        resource = Resource(
+            hash_id=f"lib{index:03d}",
+            resource_type=resource_type,
+            status=ResourceStatus.PUBLISHED,
+            name=f"Report {index}",
+            created_by=test_user.id,
+        )
+        db_session.add(resource)
+        db_session.flush()
+        if resource_type == ResourceType.TABLE:
+            db_session.add(TableResource(
+                resource_id=resource.id,
+                table_data=json.dumps({"columns": ["year", "cpi"], "data": [[2024, 3.1], [2025, 2.4]]}),
+                row_count=2,
+                column_count=2,
+                column_names=json.dumps(["year", "cpi"]),
+                chromadb_id=f"resource_table_{resource.id}",
+            ))
+        else:
+            db_session.add(TextResource(
+                resource_id=resource.id,
+                content=f"Inflation report {index}. " + "Prices eased. " * (2000 if index == 4 else 1),
+                chromadb_id=None if index == 4 else f"resource_text_{resource.id}",
+            ))
+        resources.append(resource)
+    db_session.flush()
+    return resources
+
+
+class TestResourceEnricher:
+    """Test batch enrichment."""
+
+    def test_concurrent_batched_writes(self, db_session, library, cache, collection):
+        describe = FakeDescriber(delay=0.05)
+        ids = [resource.id for resource in library]
+
+        report = ResourceEnricher(describe, db_session, concurrency=4, batch_size=3).run(ids)
+
+        assert report["succeeded"] == 6
+        assert describe.max_active > 1
+        assert [result["resource_id"] for result in report["results"]] == ids
+        # Two batches of three, each written to ChromaDB in at most two requests
+        written = [doc_id for _, doc_ids in collection.calls for doc_id in doc_ids]
+        assert len(written) == 6 and len(collection.calls) <= 4
+        unindexed = library[4]
+        assert ("upsert", [f"resource_text_{unindexed.id}"]) in collection.calls
+        assert collection.documents[f"resource_text_{unindexed.id}"] == unindexed.text_resource.content
+
+        db_session.expire_all()
+        assert db_session.get(Resource, library[5].id).description == f"About table {library[5].id}"
+        assert db_session.get(TextResource, unindexed.text_resource.id).chromadb_id == f"resource_text_{unindexed.id}"
+
+    def test_resumes_from_checkpoint(self, db_session, library, cache, collection):
+        ids = [resource.id for resource in library]
+        failing = FakeDescriber(fail_on={ids[2]})
+        first = ResourceEnricher(failing, db_session, batch_size=2).run(ids)
+
+        assert first["failed"] == 1
+        assert cache.sets[f"content:enrichment:{job_id_for(ids)}"] == set(ids) - {ids[2]}
+
+        describe = FakeDescriber()
+        second = ResourceEnricher(describe, db_session, batch_size=2).run(ids)
+
+        assert describe.calls == [ids[2]]
+        assert (second["succeeded"], second["skipped"], second["failed"]) == (1, 5, 0)
+
+    def test_dry_run_not_checkpointed(self, db_session, library, cache, collection):
+        ids = [resource.id for resource in library]
+
+        report = ResourceEnricher(FakeDescriber(), db_session).run(ids, update_resources=False)
+
+        assert report["results"][0]["metadata"]["keywords"] == ["inflation", "rates"]
+        assert collection.calls == []
+        assert cache.sets == {}
+
+    def test_dry_run_ignores_checkpoint(self, db_session, library, cache, collection):
+        ids = [resource.id for resource in library]
+        ResourceEnricher(FakeDescriber(), db_session).run(ids)
+
+        describe = FakeDescriber()
+        report = ResourceEnricher(describe, db_session).run(ids, update_resources=False)
+
+        assert sorted(describe.calls) == sorted(ids)
+        assert report["skipped"] == 0
+        assert all(result["metadata"] for result in report["results"])
+
+    def test_missing_and_other_types(self, db_session, library, cache, collection, test_user):
+        pdf = Resource(
+            hash_id="libpdf", resource_type=ResourceType.PDF, status=ResourceStatus.PUBLISHED,
+            name="Annual report", created_by=test_user.id,
+        )
+        db_session.add(pdf)
+        db_session.flush()
+        handled = []
+
+        def process_other(resource_id, resource_type, created_by):
+            handled.append((resource_id, resource_type, created_by))
+            return {"success": True, "children_created": 2}
+
+        report = ResourceEnricher(FakeDescriber(), db_session, process_other=process_other).run(
+            [pdf.id, 999999, library[0].id]
+        )
+
+        assert handled == [(pdf.id, "pdf", test_user.id)]
+        assert [result["success"] for result in report["results"]] == [True, False, True]
+        assert report["results"][1]["error"] == "Resource not found"
+
+    def test_progress_notifications(self, db_session, library, cache, collection, notifications, test_user):
+        ids = [resource.id for resource in library]
+
+        ResourceEnricher(FakeDescriber(), db_session, user_id=test_user.id, batch_size=4).run(ids)
+
+        payloads = [payload for user_id, payload in notifications if user_id == str(test_user.id)]
+        assert [payload["done"] for payload in payloads] == [4, 6, 6]
+        assert payloads[-1]["finished"] and payloads[-1]["succeeded"] == 6
+        assert all(payload["type"] == "resource_enrichment_progress" for payload in payloads)
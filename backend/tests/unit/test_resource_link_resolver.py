@@ -0,0 +1,152 @@
+"""
+Tests for batch resource-link resolution.
+
+Tests for:
+- Collecting hash_ids from article markdown
+- Loading every referenced resource in a fixed number of queries
+- HTML and PDF renderers using preloaded resources
+"""
+import pytest
+from sqlalchemy import event
+
+from models import Resource, ResourceType, ResourceStatus, TableResource
+from services.resource_link_resolver import ResourceLinkResolver, ResolvedResourceLinks
+from services.article_resource_service import ArticleResourceService
+from services.pdf_service import PDFService
+
+
+def _resource(db, hash_id: str, resource_type: ResourceType, parent=None, is_active=True) -> Resource:
+    resource = Resource(
+        hash_id=hash_id,
+        resource_type=resource_type,
+        status=ResourceStatus.PUBLISHED,
+        name=hash_id,
+        parent_id=parent.id if parent else None,
+        is_active=is_active,
+    )
+    db.add(resource)
+    db.flush()
+    return resource
+
+
+@pytest.fixture
+def linked_resources(db_session):
+    """A table with an image child, an article with HTML/PDF children, and an image."""
+    table = _resource(db_session, "tbl001", ResourceType.TABLE)
+    table_data = TableResource(resource_id=table.id, row_count=1, column_count=2)
+    table_data.columns = ["Ticker", "Price"]
+    table_data.data = [["AAPL", "190"]]
+    db_session.add(table_data)
+    _resource(db_session, "tblimg", ResourceType.IMAGE, parent=table)
+
+    article = _resource(db_session, "art001", ResourceType.ARTICLE)
+    _resource(db_session, "arthtml", ResourceType.HTML, parent=article)
+    _resource(db_session, "artpdf", ResourceType.PDF, parent=article)
+
+    _resource(db_session, "img001", ResourceType.IMAGE)
+    db_session.flush()
+    db_session.expire_all()
+    return db_session
+
+
+@pytest.fixture
+def count_queries(db_session):
+    """Count SELECT statements issued on the session's connection."""
+    counter = {"selects": 0}
+    engine = db_session.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            counter["selects"] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield counter
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+CONTENT = (
+    "Intro [Prices](resource:tbl001) then [Chart](resource:img001).\n"
+    "See [Prior note](resource:art001) and [Missing](resource:nope99).\n"
+    "Again [Prices](resource:tbl001)."
+)
+
+
+# =============================================================================
+# RESOLVER TESTS
+# =============================================================================
+
+class TestResourceLinkResolver:
+    """Test the two-pass resolver."""
+
+    def test_collect_hash_ids_is_unique_and_ordered(self):
+        assert ResourceLinkResolver.collect_hash_ids(CONTENT) == [
+            "tbl001", "img001", "art001", "nope99"
+        ]
+        assert ResourceLinkResolver.collect_hash_ids("") == []
+
+    def test_resolve_without_db_is_empty(self):
+        assert len(ResourceLinkResolver.resolve(None, CONTENT)) == 0
+
+    def test_resolve_loads_children_and_table_data(self, linked_resources):
+        links = ResourceLinkResolver.resolve(linked_resources, CONTENT)
+
+        assert len(links) == 3
+        assert links.get("nope99") is None
+        assert links.resource_type("tbl001") == "table"
+        assert links.child_of_type("tbl001", ResourceType.IMAGE).hash_id == "tblimg"
+        assert links.child_of_type("art001", ResourceType.PDF).hash_id == "artpdf"
+        assert links.get("tbl001").table_resource.columns == ["Ticker", "Price"]
+
+    def test_child_of_type_respects_active_only(self, db_session):
+        table = _resource(db_session, "tbl002", ResourceType.TABLE)
+        _resource(db_session, "tblimg2", ResourceType.IMAGE, parent=table, is_active=False)
+        db_session.expire_all()
+
+        links = ResourceLinkResolver.resolve(db_session, "[t](resource:tbl002)")
+        assert links.child_of_type("tbl002", ResourceType.IMAGE) is not None
+        assert links.child_of_type("tbl002", ResourceType.IMAGE, active_only=True) is None
+
+
+# =============================================================================
+# RENDERER TESTS
+# =============================================================================
+
+class TestRenderersUsePreloadedLinks:
+    """Test that renderers issue no per-link queries."""
+
+    def test_resolve_query_count_is_constant(self, linked_resources, count_queries):
+        ResourceLinkResolver.resolve(linked_resources, CONTENT)
+        baseline = count_queries["selects"]
+
+        count_queries["selects"] = 0
+        many = CONTENT + "".join(f" [x](resource:img{i:03d})" for i in range(50))
+        ResourceLinkResolver.resolve(linked_resources, many)
+
+        assert count_queries["selects"] == baseline
+
+    def test_renderers_do_not_query_with_preloaded_links(self, linked_resources, count_queries):
+        links = ResourceLinkResolver.resolve(linked_resources, CONTENT)
+        count_queries["selects"] = 0
+
+        html_out = ArticleResourceService._process_resource_links(
+            CONTENT, linked_resources, "http://api", links
+        )
+        pdf_out = PDFService.process_resource_links(
+            CONTENT, "http://api", linked_resources, links
+        )
+
+        assert count_queries["selects"] == 0
+        assert "<table" in html_out
+        assert 'href="http://api/api/r/nope99"' in html_out
+        assert "![Prices](http://api/api/r/tblimg)" in pdf_out
+        assert "[HTML](http://api/api/r/arthtml)" in pdf_out
+        assert "[PDF](http://api/api/r/artpdf)" in pdf_out
+        assert "![Chart](http://api/api/r/img001)" in pdf_out
+
+    def test_renderers_resolve_when_links_not_given(self, linked_resources):
+        pdf_out = PDFService.process_resource_links(CONTENT, "http://api", linked_resources)
+        assert "![Prices](http://api/api/r/tblimg)" in pdf_out
+
+    def test_empty_links_fall_back_to_plain_links(self):
+        out = PDFService.process_resource_links(CONTENT, "http://api", links=ResolvedResourceLinks())
+        assert "[Prices](http://api/api/r/tbl001)" in out
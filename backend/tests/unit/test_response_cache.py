@@ -0,0 +1,126 @@
+"""
+Tests for the Redis response cache of article list endpoints.
+
+Tests for:
+- Serialized body round trip (plain and gzip-compressed)
+- ETag / 304 and gzip passthrough
+- Cache hits returned without loading or re-serializing
+- Cache keys built from the validated inputs, not the raw query string
+"""
+import gzip
+from unittest.mock import MagicMock, patch
+
+import orjson
+from starlette.requests import Request
+
+from config import settings
+from dependencies import ArticleProjection, cached_article_list, cached_json_response
+from services.content_cache import CachedResponse
+
+
+class FakeRawCache:
+    """Bytes-valued Redis stand-in."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+
+def make_request(headers=None, query="limit=10"):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/reader/macro/articles",
+        "query_string": query.encode(),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    })
+
+
+class TestCachedResponse:
+    """Test body encoding."""
+
+    def test_round_trip(self, monkeypatch):
+        small = CachedResponse.encode([{"id": 1}])
+        assert not small.gzipped
+        assert CachedResponse.from_bytes(small.to_bytes()) == small
+
+        monkeypatch.setattr(settings, "response_cache_compress_min_bytes", 10)
+        large = CachedResponse.encode([{"id": i, "headline": "Rates"} for i in range(50)])
+        assert large.gzipped
+        assert CachedResponse.from_bytes(large.to_bytes()) == large
+        assert orjson.loads(large.decoded_body())[49]["id"] == 49
+
+    def test_etag_and_gzip_passthrough(self, monkeypatch):
+        monkeypatch.setattr(settings, "response_cache_compress_min_bytes", 10)
+        cached = CachedResponse.encode([{"id": i} for i in range(20)])
+
+        response = cached_json_response(make_request({"Accept-Encoding": "gzip, br"}), cached)
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == cached.etag
+        assert gzip.decompress(response.body) == cached.decoded_body()
+
+        response = cached_json_response(make_request(), cached)
+        assert "content-encoding" not in response.headers
+        assert response.body == cached.decoded_body()
+
+        response = cached_json_response(make_request({"If-None-Match": cached.etag}), cached)
+        assert response.status_code == 304
+
+
+class TestCachedArticleList:
+    """Test the endpoint helper."""
+
+    async def test_hit_skips_loading(self):
+        from api.reader import ArticleResponse
+
+        raw = FakeRawCache()
+        article = {
+            "id": 1, "topic": "macro", "headline": "Rates", "author": "", "editor": "", "excerpt": "",
+            "readership_count": 0, "rating": None, "rating_count": 0, "keywords": "", "status": "published",
+            "priority": 0, "is_sticky": False, "created_at": "", "updated_at": "", "created_by_agent": "test",
+            "is_active": True, "internal": "dropped by the response model",
+        }
+        load = MagicMock()
+
+        async def load_articles():
+            load()
+            return [article]
+
+        with patch("services.content_cache._get_raw_cache", return_value=raw):
+            first = await cached_article_list(make_request(), "macro", ArticleProjection(False), ArticleResponse, 10, load_articles)
+            second = await cached_article_list(make_request(), "macro", ArticleProjection(False), ArticleResponse, 10, load_articles)
+
+        assert load.call_count == 1
+        assert list(raw.values) == ["content:topic:macro:response:/api/reader/macro/articles?limit=10&content=0"]
+        assert second.body == first.body
+        body = orjson.loads(first.body)[0]
+        assert "internal" not in body
+        assert "content" not in body
+
+    async def test_key_ignores_raw_query(self):
+        raw = FakeRawCache()
+
+        async def load_articles():
+            return []
+
+        with patch("services.content_cache._get_raw_cache", return_value=raw):
+            # (query string, limit after the endpoint clamped it)
+            for query, limit in [
+                ("limit=10&include_content=false", 10),
+                ("include_content=false&limit=10", 10),
+                ("limit=10&x=1", 10),
+                ("limit=500&x=2", 50),
+            ]:
+                await cached_article_list(
+                    make_request(query=query), "macro", ArticleProjection(False), dict, limit, load_articles
+                )
+
+        assert sorted(raw.values) == [
+            "content:topic:macro:response:/api/reader/macro/articles?limit=10&content=0",
+            "content:topic:macro:response:/api/reader/macro/articles?limit=50&content=0",
+        ]
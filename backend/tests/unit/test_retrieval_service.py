@@ -0,0 +1,195 @@
+"""
+Tests for the unified retrieval service.
+
+Tests for:
+- Reciprocal rank fusion
+- One embedding and one query per collection/type (and resource id chunk)
+- Semantic and keyword rankings fused
+- Article status filtering and hydration from the retrieved documents
+"""
+import threading
+
+import pytest
+
+from models import ArticleStatus, ContentArticle, Resource, ResourceStatus, ResourceType, TextResource
+from services import retrieval_service, vector_service
+from services.content_store import ContentStore
+from services.retrieval_service import RetrievalService, reciprocal_rank_fusion
+
+
+class _FakeCollection:
+    """Returns canned hits per where filter and records each query."""
+
+    def __init__(self, hits_by_type=None, hits=None):
+        self.hits_by_type = hits_by_type or {}
+        self.hits = hits or []
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def query(self, query_embeddings, n_results, where=None, include=None):
+        with self._lock:
+            self.queries.append(where)
+        hits = self.hits
+        if where and "$and" in where:
+            hits = self.hits_by_type.get(where["$and"][0]["type"], [])
+        elif where and "type" in where:
+            hits = self.hits_by_type.get(where["type"], [])
+        hits = hits[:n_results]
+        return {
+            "ids": [[h["id"] for h in hits]],
+            "documents": [[h.get("document", "") for h in hits]],
+            "metadatas": [[h["metadata"] for h in hits]],
+            "distances": [[h.get("distance", 0.1) for h in hits]],
+        }
+
+
+@pytest.fixture
+def collections(monkeypatch):
+    calls = {"embeddings": 0}
+
+    def fake_embedding(text):
+        calls["embeddings"] += 1
+        return [0.1, 0.2, 0.3]
+
+    articles = _FakeCollection()
+    resources = _FakeCollection()
+    monkeypatch.setattr(vector_service.VectorService, "_generate_embedding", staticmethod(fake_embedding))
+    monkeypatch.setattr(retrieval_service, "_get_chroma_client", lambda: (None, articles))
+    monkeypatch.setattr("services.resource_service._get_resource_collection", lambda: resources)
+    return calls, articles, resources
+
+
+def _resource_hit(resource_id, resource_type, distance=0.1):
+    return {
+        "id": f"resource_{resource_id}",
+        "document": f"{resource_type} content {resource_id}",
+        "metadata": {"resource_id": resource_id, "name": f"R{resource_id}", "type": resource_type},
+        "distance": distance,
+    }
+
+
+class TestReciprocalRankFusion:
+    """Test rank fusion scoring."""
+
+    def test_items_in_several_lists_rank_first(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]], k=60)
+        assert [key for key, _ in fused][:1] == ["c"]
+        assert dict(fused)["a"] == pytest.approx(1 / 61)
+        assert dict(fused)["c"] == pytest.approx(1 / 63 + 1 / 61)
+
+    def test_empty(self):
+        assert reciprocal_rank_fusion([[], []]) == []
+
+
+class TestRetrieve:
+    """Test the retrieval round trip."""
+
+    def test_single_embedding_and_per_type_queries(self, db_session, collections):
+        calls, articles, resources = collections
+        resources.hits_by_type = {
+            "text": [_resource_hit(1, "text", 0.2), _resource_hit(2, "text", 0.4)],
+            "table": [_resource_hit(3, "table", 0.1)],
+        }
+
+        result = RetrievalService.retrieve(
+            db_session, "rates outlook", topic="macro", resource_ids=[1, 2, 3]
+        )
+
+        assert calls["embeddings"] == 1
+        assert articles.queries == [{"topic": "macro"}]
+        assert sorted(w["$and"][0]["type"] for w in resources.queries) == ["table", "text"]
+        # Resources of all types ranked by similarity
+        assert [r["resource_id"] for r in result.resources] == [3, 1, 2]
+
+    def test_resource_scope_queried_in_chunks(self, db_session, collections, monkeypatch):
+        _, _, resources = collections
+        monkeypatch.setattr(retrieval_service, "RESOURCE_ID_CHUNK", 2)
+
+        RetrievalService.retrieve(
+            db_session, "outlook", article_limit=0, resource_types=("text",), resource_ids=[1, 2, 3, 4, 5]
+        )
+
+        assert sorted(w["$and"][1]["resource_id"]["$in"] for w in resources.queries) == [[1, 2], [3, 4], [5]]
+
+    def test_keyword_matches_fused_with_semantic(self, db_session, collections, test_topic, published_article, test_user):
+        _, articles, resources = collections
+        keyword_article = ContentArticle(
+            topic_id=test_topic.id, topic=test_topic.slug, headline="ACME Corp guidance cut",
+            keywords="acme", status=ArticleStatus.PUBLISHED, created_by_agent="test",
+        )
+        db_session.add(keyword_article)
+        db_session.flush()
+        ContentStore.put(db_session, keyword_article.id, "ACME body")
+        resource = Resource(
+            hash_id="acme0001", resource_type=ResourceType.TEXT, status=ResourceStatus.PUBLISHED,
+            name="ACME filings", created_by=test_user.id,
+        )
+        db_session.add(resource)
+        db_session.flush()
+        db_session.add(TextResource(resource_id=resource.id, content="ACME 10-K"))
+        db_session.flush()
+        articles.hits = [
+            {"id": f"article_{published_article.id}", "document": "semantic body",
+             "metadata": {"article_id": published_article.id}},
+        ]
+        resources.hits_by_type = {"text": [_resource_hit(999, "text")]}
+
+        result = RetrievalService.retrieve(
+            db_session, "acme", topic=test_topic.slug, resource_types=("text",)
+        )
+
+        # Only-semantic and only-keyword matches tie; both are returned
+        assert {a["id"] for a in result.articles} == {published_article.id, keyword_article.id}
+        by_id = {a["id"]: a for a in result.articles}
+        assert by_id[keyword_article.id]["content"] == "ACME body"
+        assert by_id[keyword_article.id]["similarity_score"] is None
+        assert {r["resource_id"] for r in result.resources} == {999, resource.id}
+        assert next(r for r in result.resources if r["resource_id"] == resource.id)["content_preview"] == "ACME 10-K"
+
+    def test_match_in_both_rankings_ranks_first(self, db_session, collections, test_topic, published_article):
+        _, articles, _ = collections
+        published_article.headline = "Rates outlook"
+        db_session.flush()
+        other = ContentArticle(
+            topic_id=test_topic.id, topic=test_topic.slug, headline="Equities",
+            status=ArticleStatus.PUBLISHED, created_by_agent="test",
+        )
+        db_session.add(other)
+        db_session.flush()
+        articles.hits = [
+            {"id": f"article_{other.id}", "document": "equities", "metadata": {"article_id": other.id}},
+            {"id": f"article_{published_article.id}", "document": "rates",
+             "metadata": {"article_id": published_article.id}},
+        ]
+
+        result = RetrievalService.retrieve(db_session, "rates", topic=test_topic.slug, resource_limit=0)
+
+        assert [a["id"] for a in result.articles] == [published_article.id, other.id]
+
+    def test_articles_filtered_by_status_and_use_retrieved_content(
+        self, db_session, collections, test_article, published_article
+    ):
+        _, articles, _ = collections
+        articles.hits = [
+            {"id": f"article_{test_article.id}", "document": "draft body",
+             "metadata": {"article_id": test_article.id, "headline": "Draft"}},
+            {"id": f"article_{published_article.id}", "document": "published body",
+             "metadata": {"article_id": published_article.id, "headline": "Published"}},
+        ]
+
+        result = RetrievalService.retrieve(db_session, "outlook", topic="macro", resource_limit=0)
+
+        assert [a["id"] for a in result.articles] == [published_article.id]
+        assert result.articles[0]["content"] == "published body"
+        assert result.articles[0]["headline"] == "Published"
+
+    def test_empty_scope_skips_queries(self, db_session, collections):
+        calls, articles, resources = collections
+
+        result = RetrievalService.retrieve(
+            db_session, "outlook", topics=[], resource_ids=[]
+        )
+
+        assert result.articles == [] and result.resources == []
+        assert calls["embeddings"] == 0
+        assert articles.queries == [] and resources.queries == []
@@ -0,0 +1,226 @@
+"""
+Tests for the web search cache.
+
+Tests for:
+- URL canonicalization and de-duplication across providers
+- Fresh hits keyed by normalized query and parameters
+- Stale results served while a background search refreshes them
+- Failed searches not cached
+- Per-provider concurrency limits
+- Google Custom Search requests served from the cache
+- News searches merging DuckDuckGo and Google results
+"""
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import services.search_cache as search_cache_module
+from agents.shared.web_search_agent import WebSearchAgent
+from services.google_search_service import GoogleSearchService, get_google_search_service
+from services.search_cache import SearchCache, cached_search, canonical_url, dedupe_results
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """A fresh cache using the per-process store (no Redis)."""
+    fresh = SearchCache()
+    monkeypatch.setattr(search_cache_module, "search_cache", fresh)
+    monkeypatch.setattr(search_cache_module.content_cache, "_get_cache", lambda: None)
+    monkeypatch.setattr(search_cache_module.settings, "web_search_cache_enabled", True)
+    return fresh
+
+
+class Searcher:
+    """Search callable returning numbered results."""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("search down")
+        return [{"title": f"Result {self.calls}", "url": f"https://example.com/{self.calls}"}]
+
+
+class TestUrls:
+    """Test URL canonicalization."""
+
+    def test_canonical_url(self):
+        url = "HTTPS://WWW.Reuters.com/markets/fed?utm_source=x&b=2&a=1&fbclid=abc#top"
+
+        assert canonical_url(url) == "https://www.reuters.com/markets/fed?a=1&b=2"
+        assert canonical_url("not a url") == "not a url"
+
+    def test_dedupe_across_providers(self):
+        ddg = [
+            {"title": "Fed holds", "url": "https://www.reuters.com/markets/fed/?utm_medium=rss"},
+            {"title": "Other", "url": "https://ft.com/a"},
+        ]
+        google = [
+            {"title": "Fed holds rates", "link": "http://reuters.com/markets/fed#comments"},
+            {"title": "No link"},
+        ]
+
+        merged = dedupe_results(ddg + google)
+
+        assert [r["title"] for r in merged] == ["Fed holds", "Other", "No link"]
+        assert merged[0]["url"] == "https://www.reuters.com/markets/fed/"
+
+
+class TestSearchCache:
+    """Test cached searches."""
+
+    def test_fresh_hit_with_normalized_query(self, cache):
+        search = Searcher()
+
+        first = cached_search("ddg_news", "Fed  Rates", search, timelimit="w", max_results=5)
+        second = cached_search("ddg_news", " fed rates ", search, timelimit="w", max_results=5)
+
+        assert first == second
+        assert search.calls == 1
+
+        cached_search("ddg_news", "fed rates", search, timelimit="d", max_results=5)
+        cached_search("ddg_text", "fed rates", search, timelimit="w", max_results=5)
+        assert search.calls == 3
+
+    def test_stale_served_and_refreshed(self, cache, monkeypatch):
+        search = Searcher()
+        cached_search("google", "cpi", search)
+        monkeypatch.setattr(search_cache_module.settings, "web_search_cache_fresh_seconds", 0)
+
+        release = threading.Event()
+
+        def slow_search():
+            release.wait(5)
+            return search()
+
+        # One background search however often the stale entry is read
+        stale = cached_search("google", "cpi", slow_search)
+        cached_search("google", "cpi", slow_search)
+        release.set()
+        cache._executor.submit(lambda: None).result(5)
+
+        assert stale[0]["title"] == "Result 1"
+        assert search.calls == 2
+        monkeypatch.setattr(search_cache_module.settings, "web_search_cache_fresh_seconds", 900)
+        assert cached_search("google", "cpi", search)[0]["title"] == "Result 2"
+
+    def test_expired_is_a_miss(self, cache, monkeypatch):
+        search = Searcher()
+        cached_search("google", "cpi", search)
+        monkeypatch.setattr(search_cache_module.settings, "web_search_cache_fresh_seconds", 0)
+        monkeypatch.setattr(search_cache_module.settings, "web_search_cache_stale_seconds", 0)
+
+        assert cached_search("google", "cpi", search)[0]["title"] == "Result 2"
+
+    def test_failure_not_cached(self, cache):
+        with pytest.raises(ConnectionError):
+            cached_search("google", "cpi", Searcher(fail=True))
+
+        search = Searcher()
+        cached_search("google", "cpi", search)
+        assert search.calls == 1
+
+    def test_disabled(self, cache, monkeypatch):
+        monkeypatch.setattr(search_cache_module.settings, "web_search_cache_enabled", False)
+        search = Searcher()
+
+        cached_search("google", "cpi", search)
+        cached_search("google", "cpi", search)
+
+        assert search.calls == 2
+
+    def test_concurrency_limit(self, cache, monkeypatch):
+        monkeypatch.setattr(search_cache_module.settings, "web_search_google_concurrency", 2)
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def search():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+            return []
+
+        threads = [threading.Thread(target=cached_search, args=("google", f"q{i}", search)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert max(peak) == 2
+
+
+class TestGoogleSearchService:
+    """Test Custom Search requests through the cache."""
+
+    def test_repeated_query_uses_one_request(self, cache):
+        service = GoogleSearchService(api_key="", search_engine_id="cse")
+        service.service = MagicMock()
+        service.service.cse.return_value.list.return_value.execute.return_value = {
+            "items": [{"title": "A", "link": "https://a.com/x?utm_campaign=1", "snippet": "", "displayLink": "a.com"}]
+        }
+
+        first = service.search("ECB decision", num_results=5, date_restrict="d7")
+        second = service.search("ecb decision", num_results=5, date_restrict="d7")
+
+        assert first == second == [{"title": "A", "link": "https://a.com/x", "snippet": "", "displayLink": "a.com"}]
+        service.service.cse.return_value.list.assert_called_once_with(q="ECB decision", cx="cse", num=5, dateRestrict="d7")
+
+
+class TestNewsSearch:
+    """Test news searches across DuckDuckGo and Google."""
+
+    DDG = [
+        {"title": "Fed holds", "url": "https://www.reuters.com/markets/fed", "snippet": "", "source": "Reuters", "date": ""},
+        {"title": "Yields fall", "url": "https://ft.com/yields", "snippet": "", "source": "FT", "date": ""},
+    ]
+
+    @pytest.fixture
+    def google(self):
+        google = MagicMock()
+        google.search.return_value = [
+            {"title": "Fed holds rates", "link": "http://reuters.com/markets/fed?utm_source=g", "snippet": "Hold", "displayLink": "reuters.com"},
+            {"title": "ECB outlook", "link": "https://ecb.europa.eu/press", "snippet": "", "displayLink": "ecb.europa.eu"},
+        ]
+        return google
+
+    def test_merges_providers(self, cache, google, monkeypatch):
+        monkeypatch.setattr(WebSearchAgent, "_ddg_news", staticmethod(lambda query, max_results, timelimit: self.DDG))
+        agent = WebSearchAgent(llm=MagicMock(), google_search=google)
+
+        result = agent.search_news("fed decision", max_results=3, timelimit="w")
+
+        assert result["success"] and result["providers"] == ["ddg", "google"]
+        # Alternating providers; Google's copy of the Reuters page is dropped
+        assert [r["title"] for r in result["results"]] == ["Fed holds", "Yields fall", "ECB outlook"]
+        assert result["results"][2]["url"] == "https://ecb.europa.eu/press"
+        google.search.assert_called_once_with("fed decision", num_results=3, date_restrict="w1")
+
+    def test_one_provider_failing(self, cache, google, monkeypatch):
+        def ddg_down(query, max_results, timelimit):
+            raise ConnectionError("ddg down")
+
+        monkeypatch.setattr(WebSearchAgent, "_ddg_news", staticmethod(ddg_down))
+        agent = WebSearchAgent(llm=MagicMock(), google_search=google)
+
+        result = agent.search_news("fed decision", max_results=5)
+
+        assert result["success"] and result["providers"] == ["google"]
+        assert [r["source"] for r in result["results"]] == ["reuters.com", "ecb.europa.eu"]
+
+    def test_without_google(self, cache, monkeypatch):
+        monkeypatch.setattr(search_cache_module.settings, "google_api_key", "")
+        get_google_search_service.cache_clear()
+        monkeypatch.setattr(WebSearchAgent, "_ddg_news", staticmethod(lambda query, max_results, timelimit: self.DDG))
+
+        result = WebSearchAgent(llm=MagicMock()).search_news("fed decision")
+
+        assert result["providers"] == ["ddg"] and result["count"] == 2
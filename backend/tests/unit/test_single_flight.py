@@ -0,0 +1,257 @@
+"""
+Tests for request coalescing.
+
+Tests for:
+- Canonical request keys
+- Concurrent identical calls sharing one upstream call (threads and coroutines)
+- Errors shared with waiting callers, not cached
+- Chat completions and embeddings coalesced
+- Async callers keeping Redis calls off the event loop
+- Coalescing across workers through Redis (integration, needs a local Redis)
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import redis
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_openai import ChatOpenAI
+
+import services.single_flight as single_flight_module
+import services.vector_service as vector_service
+from metrics import LLM_COALESCED_REQUESTS
+from services.content_cache import cache_settings
+from services.llm_client import GovernedChatOpenAI, LLMGovernor
+from services.single_flight import SingleFlight, request_key
+
+
+@pytest.fixture
+def flight(monkeypatch):
+    """A fresh single flight without Redis."""
+    fresh = SingleFlight()
+    monkeypatch.setattr(single_flight_module, "single_flight", fresh)
+    monkeypatch.setattr(single_flight_module.content_cache, "_get_cache", lambda: None)
+    monkeypatch.setattr(single_flight_module.settings, "llm_coalesce_enabled", True)
+    monkeypatch.setattr(single_flight_module.settings, "llm_coalesce_wait_seconds", 5.0)
+    return fresh
+
+
+class Upstream:
+    """Slow upstream call counting its invocations."""
+
+    def __init__(self, delay=0.1, fail=False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("upstream down")
+        return {"answer": self.calls}
+
+
+def run_concurrently(fn, count=5):
+    results = [None] * count
+
+    def run(i):
+        try:
+            results[i] = fn()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+class TestRequestKey:
+    """Test canonical request hashes."""
+
+    def test_canonical(self):
+        a = request_key("chat", {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0})
+        b = request_key("chat", {"temperature": 0, "messages": [{"content": "hi", "role": "user"}], "model": "m"})
+
+        assert a == b
+        assert a != request_key("chat", {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 1})
+
+
+class TestSingleFlight:
+    """Test in-process coalescing."""
+
+    def test_threads_share_one_call(self, flight):
+        upstream = Upstream()
+        before = LLM_COALESCED_REQUESTS.value(kind="test", scope="process")
+
+        results = run_concurrently(lambda: flight.do("test", "k", upstream))
+
+        assert upstream.calls == 1
+        assert results == [{"answer": 1}] * 5
+        # Waiting callers get copies
+        assert len({id(result) for result in results}) == 5
+        assert LLM_COALESCED_REQUESTS.value(kind="test", scope="process") - before == 4
+
+    def test_errors_shared_not_cached(self, flight):
+        failing = Upstream(fail=True)
+
+        results = run_concurrently(lambda: flight.do("test", "k", failing))
+
+        assert failing.calls == 1
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert flight.do("test", "k", Upstream()) == {"answer": 1}
+
+    def test_different_keys_not_shared(self, flight):
+        upstream = Upstream(delay=0)
+
+        flight.do("test", "a", upstream)
+        flight.do("test", "a", upstream)
+        flight.do("test", "b", upstream)
+
+        assert upstream.calls == 3
+
+    def test_disabled(self, flight, monkeypatch):
+        monkeypatch.setattr(single_flight_module.settings, "llm_coalesce_enabled", False)
+        upstream = Upstream()
+
+        run_concurrently(lambda: flight.do("test", "k", upstream))
+
+        assert upstream.calls == 5
+
+    async def test_coroutines_share_one_call(self, flight):
+        calls = []
+
+        async def upstream():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return [0.1, 0.2]
+
+        results = await asyncio.gather(*(flight.ado("test", "k", upstream) for _ in range(4)))
+
+        assert len(calls) == 1
+        assert results == [[0.1, 0.2]] * 4
+
+    async def test_async_redis_off_event_loop(self, flight, monkeypatch):
+        threads = []
+
+        class ThreadRecordingRedis:
+            """Redis stand-in recording the thread of each command."""
+
+            def __init__(self):
+                self.values = {}
+
+            def get(self, key):
+                threads.append(threading.get_ident())
+                return self.values.get(key)
+
+            def set(self, key, value, nx=False, px=None):
+                threads.append(threading.get_ident())
+                return self.values.setdefault(key, value) == value
+
+            def setex(self, key, ttl, value):
+                threads.append(threading.get_ident())
+                self.values[key] = value
+
+            def eval(self, script, count, key, token):
+                threads.append(threading.get_ident())
+                self.values.pop(key, None)
+
+        cache = ThreadRecordingRedis()
+        monkeypatch.setattr(single_flight_module.content_cache, "_get_cache", lambda: cache)
+        monkeypatch.setattr(single_flight_module.settings, "llm_coalesce_redis", True)
+
+        async def upstream():
+            return {"answer": 1}
+
+        result = await flight.ado("test", "k", upstream, encode=dict, decode=dict)
+
+        assert result == {"answer": 1}
+        # get and set (poll), setex (publish), eval (release)
+        assert len(threads) == 4 and threading.get_ident() not in threads
+
+
+class TestClients:
+    """Test chat completions and embeddings through single flight."""
+
+    @pytest.fixture(autouse=True)
+    def no_limits(self, flight, monkeypatch):
+        monkeypatch.setattr("services.llm_client.governor", LLMGovernor())
+        monkeypatch.setattr(vector_service, "governor", LLMGovernor())
+        monkeypatch.setattr("services.llm_client.single_flight", flight)
+        monkeypatch.setattr(vector_service, "single_flight", flight)
+        monkeypatch.setattr("services.llm_client.content_cache._get_cache", lambda: None)
+
+    def test_chat_completions(self, monkeypatch):
+        upstream = Upstream()
+
+        def generate(self, messages, stop=None, run_manager=None, **kwargs):
+            upstream()
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content="shared"))], llm_output={})
+
+        monkeypatch.setattr(ChatOpenAI, "_generate", generate)
+        llm = GovernedChatOpenAI(model="gpt-test", api_key="sk-test", temperature=0)
+
+        results = run_concurrently(lambda: llm.invoke("What moved the ECB?"))
+        llm.invoke("Something else")
+
+        assert [result.content for result in results] == ["shared"] * 5
+        assert upstream.calls == 2
+
+    def test_embeddings(self, monkeypatch):
+        upstream = Upstream()
+
+        def create(**kwargs):
+            upstream()
+            return SimpleNamespace(data=[SimpleNamespace(embedding=[0.5, 0.5])], usage=None)
+
+        client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+        monkeypatch.setattr(vector_service, "_get_openai_client", lambda: client)
+
+        results = run_concurrently(lambda: vector_service.VectorService._generate_embedding("fed rates"))
+
+        assert results == [[0.5, 0.5]] * 5
+        assert upstream.calls == 1
+
+
+@pytest.mark.integration
+class TestAcrossWorkers:
+    """Test coalescing between two processes' single flights through a local Redis."""
+
+    @pytest.fixture
+    def client(self, flight, monkeypatch):
+        client = redis.Redis(
+            host=cache_settings.redis_host, port=cache_settings.redis_port, db=cache_settings.redis_db,
+            password=cache_settings.redis_password, decode_responses=True, socket_connect_timeout=0.2,
+        )
+        try:
+            client.ping()
+        except redis.RedisError:
+            pytest.skip("Redis not available")
+        monkeypatch.setattr(single_flight_module.content_cache, "_get_cache", lambda: client)
+        monkeypatch.setattr(single_flight_module.settings, "llm_coalesce_redis", True)
+        client.delete(*SingleFlight._keys("shared-key"))
+        yield client
+        client.delete(*SingleFlight._keys("shared-key"))
+
+    def test_second_worker_waits_for_result(self, client):
+        upstream = Upstream(delay=0.3)
+        results = []
+
+        def worker():
+            results.append(SingleFlight().do("test", "shared-key", upstream, encode=dict, decode=dict))
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert upstream.calls == 1
+        assert results == [{"answer": 1}] * 2
+        assert client.get(SingleFlight._keys("shared-key")[0]) is None
@@ -0,0 +1,86 @@
+"""
+Tests for keyword search conditions and ranking.
+
+Tests for:
+- PostgreSQL full-text / trigram conditions and ts_rank_cd scoring
+- ILIKE fallback on other databases
+- Text rank used as the keyword score in hybrid search
+"""
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from services import text_search
+from services.vector_service import VectorService
+
+
+def _session(dialect):
+    return SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=dialect))
+
+
+def _sql(expression, dialect) -> str:
+    return str(expression.compile(dialect=dialect))
+
+
+class TestTextSearch:
+    """Test dialect-specific search expressions."""
+
+    def test_postgres_condition(self):
+        dialect = postgresql.dialect()
+        condition = text_search.match_condition(_session(dialect), text_search.ARTICLE_SEARCH, "rates")
+        sql = _sql(condition, dialect)
+
+        assert "content_articles.search_vector @@ websearch_to_tsquery" in sql
+        assert "content_articles.headline ILIKE" in sql
+        assert "content_articles.keywords ILIKE" in sql
+        assert "content_articles.headline %%> " in sql
+
+    def test_postgres_rank(self):
+        dialect = postgresql.dialect()
+        rank = text_search.rank_expression(_session(dialect), text_search.RESOURCE_SEARCH, "rates")
+        sql = _sql(rank, dialect)
+
+        assert "ts_rank_cd(resources.search_vector, websearch_to_tsquery" in sql
+        assert "word_similarity" in sql
+
+    def test_fallback_without_postgres(self):
+        dialect = sqlite.dialect()
+        db = _session(dialect)
+        condition = text_search.match_condition(db, text_search.RESOURCE_SEARCH, "rates")
+        sql = _sql(condition, dialect)
+
+        assert "search_vector" not in sql
+        assert "lower(resources.name) LIKE lower(" in sql
+        assert text_search.rank_expression(db, text_search.RESOURCE_SEARCH, "rates") is None
+
+
+class TestHybridSearchKeywordScores:
+    """Test keyword scoring in VectorService.hybrid_search."""
+
+    def test_uses_text_rank(self):
+        keyword_results = [
+            {"id": 1, "text_rank": 0.2},
+            {"id": 2, "text_rank": 0.8},
+        ]
+        semantic_results = [{"article_id": 3, "similarity_score": 0.5}]
+
+        ranked = VectorService.hybrid_search(
+            "rates", keyword_results, semantic_weight=0.5, semantic_results=semantic_results
+        )
+        scores = {r["article_id"]: r["score"] for r in ranked}
+
+        assert scores[2] == 0.5
+        assert scores[1] == 0.125
+        assert [r["article_id"] for r in ranked] == [2, 3, 1]
+
+    def test_position_without_text_rank(self):
+        keyword_results = [{"id": 1}, {"id": 2}]
+        semantic_results = [{"article_id": 3, "similarity_score": 0.0}]
+
+        ranked = VectorService.hybrid_search(
+            "rates", keyword_results, semantic_weight=0.5, semantic_results=semantic_results
+        )
+        scores = {r["article_id"]: r["score"] for r in ranked}
+
+        assert scores[1] == 0.5
+        assert scores[2] == 0.25
@@ -0,0 +1,133 @@
+"""
+Tests for the ticker universe.
+
+Tests for:
+- Symbols, aliases and company names found in free text
+- Common abbreviations (ESG, GDP, US, CEO, AI) not taken for tickers
+- Resolving tool arguments, strict mode
+- Reloading after the universe file changes
+- Data tools rejecting unknown symbols before any download
+"""
+import json
+import os
+
+import pytest
+
+import services.ticker_universe as ticker_universe
+from agents.tools.data_download_tools import fetch_stock_price, fetch_stock_prices
+from services.market_data import MarketData
+from services.ticker_universe import TickerUniverse, find_symbols, get_universe, normalize_name, resolve_symbol
+
+
+class TestFindSymbols:
+    """Test symbol extraction from queries (bundled universe)."""
+
+    def test_false_positives_ignored(self):
+        assert find_symbols("How do ESG scores, AI and US GDP growth matter to a CEO?") == []
+        assert find_symbols("A new report on IT spending") == []
+
+    def test_tickers_and_names(self):
+        symbols = find_symbols("Compare NVDA with Microsoft and Goldman Sachs on ESG")
+
+        assert symbols == ["NVDA", "MSFT", "GS"]
+
+    def test_cashtags_and_indexes(self):
+        assert find_symbols("$AI against the S&P 500 and the Nasdaq 100") == ["AI", "^GSPC", "^NDX"]
+
+    def test_unlisted_cashtags(self, monkeypatch):
+        query = "Outlook for $RIVN and HOOD vs CRWD, $brk.b"
+
+        assert find_symbols(query) == ["RIVN", "BRK-B"]
+        monkeypatch.setattr(ticker_universe.settings, "ticker_universe_strict", True)
+        assert find_symbols(query) == ["BRK-B"]
+
+    def test_punctuated_names(self):
+        symbols = find_symbols("BRK.B, Johnson & Johnson, AT&T, McDonald's and Coca-Cola")
+
+        assert symbols == ["BRK-B", "JNJ", "T", "MCD", "KO"]
+
+    def test_limit(self):
+        assert find_symbols("AAPL MSFT NVDA AMZN", limit=3) == ["AAPL", "MSFT", "NVDA"]
+
+
+class TestResolve:
+    """Test resolving tool arguments."""
+
+    @pytest.mark.parametrize("text,symbol", [
+        ("aapl", "AAPL"),
+        ("Apple Inc.", "AAPL"),
+        ("Alphabet", "GOOGL"),
+        ("$brk.b", "BRK-B"),
+        ("The Coca-Cola Company", "KO"),
+        ("EURUSD=X", "EURUSD=X"),
+        ("ZZZZ", "ZZZZ"),
+        ("GDP", None),
+        ("no such company", None),
+    ])
+    def test_resolve_symbol(self, text, symbol):
+        assert resolve_symbol(text) == symbol
+
+    def test_strict(self, monkeypatch):
+        monkeypatch.setattr(ticker_universe.settings, "ticker_universe_strict", True)
+
+        assert resolve_symbol("ZZZZ") is None
+        assert resolve_symbol("msft") == "MSFT"
+
+    def test_normalize_name(self):
+        assert normalize_name("The Coca-Cola Company") == "coca cola"
+        assert normalize_name("Novo Nordisk A/S") == "novo nordisk"
+
+
+class TestUniverseFile:
+    """Test loading and reloading the universe file."""
+
+    def test_reloaded_after_change(self, tmp_path, monkeypatch):
+        path = tmp_path / "universe.csv"
+        path.write_text("symbol,name,aliases\nAAA,Alpha Beta Corp,alphab\n")
+        monkeypatch.setattr(ticker_universe.settings, "ticker_universe_file", str(path))
+
+        first = get_universe()
+        assert len(first) == 1
+        assert get_universe() is first
+        assert find_symbols("alphab and Alpha Beta") == ["AAA"]
+
+        path.write_text("symbol,name,aliases\nAAA,Alpha Beta Corp,\nBBB,Beta Gamma Inc.,\n")
+        os.utime(path, (0, os.path.getmtime(path) + 10))
+
+        assert len(get_universe()) == 2
+        assert "BBB" in get_universe()
+
+    def test_set_universe(self):
+        ticker_universe.set_universe(TickerUniverse([("XYZ", "Xyz Widgets Inc.", ["widgets"])]))
+        try:
+            assert find_symbols("XYZ and NVDA, widgets") == ["XYZ"]
+        finally:
+            ticker_universe.set_universe(None)
+        assert "NVDA" in get_universe()
+
+
+class TestDataTools:
+    """Test that unknown symbols cost no download."""
+
+    @pytest.fixture
+    def no_downloads(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("market data requested")
+
+        monkeypatch.setattr(MarketData, "history", fail)
+        monkeypatch.setattr(MarketData, "info", fail)
+
+    def test_single_symbol(self, no_downloads):
+        result = json.loads(fetch_stock_price.invoke({"symbol": "GDP"}))
+
+        assert not result["success"]
+        assert "Unknown symbol" in result["message"]
+
+    def test_batch(self, no_downloads, monkeypatch):
+        requested = []
+        monkeypatch.setattr(MarketData, "history_many", lambda symbols, **kw: requested.extend(symbols) or {})
+
+        result = json.loads(fetch_stock_prices.invoke({"symbols": ["CEO", "Microsoft"]}))
+
+        assert requested == ["MSFT"]
+        assert list(result["errors"]) == ["CEO"]
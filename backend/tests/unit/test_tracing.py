@@ -0,0 +1,121 @@
+"""
+Tests for OpenTelemetry tracing.
+
+Tests for:
+- Node spans nest under the run span (including subgraphs)
+- Dependency spans from the observed decorator
+- SQL statement spans
+- JSON lines file exporter
+- Disabled tracing is a no-op
+"""
+import json
+import operator
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langgraph.graph import StateGraph, END
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from sqlalchemy import create_engine, text
+
+import tracing
+from metrics import instrument_node, observed
+
+
+class _State(TypedDict):
+    steps: Annotated[List[str], operator.add]
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    tracing.set_enabled(True)
+    assert tracing.configure_tracing(exporter=exporter, batch=False)
+    yield exporter
+    tracing.shutdown_tracing()
+    tracing.set_enabled(False)
+
+
+def _spans(exporter):
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+class TestSpans:
+    """Test span nesting and instrumentation points."""
+
+    def test_node_spans_nest_under_run(self, exporter):
+        sub = StateGraph(_State)
+        sub.add_node("inner", instrument_node("inner", lambda s: {"steps": ["inner"]}, graph="sub"))
+        sub.set_entry_point("inner")
+        sub.add_edge("inner", END)
+        subgraph = sub.compile()
+
+        main = StateGraph(_State)
+        main.add_node("outer", instrument_node("outer", lambda s: subgraph.invoke(s)))
+        main.set_entry_point("outer")
+        main.add_edge("outer", END)
+
+        with tracing.span("chat.invoke", {"chat.request_id": "req-1", "chat.topic": None}):
+            main.compile().invoke({"steps": []})
+
+        spans = _spans(exporter)
+        root, outer, inner = spans["chat.invoke"], spans["main.outer"], spans["sub.inner"]
+        assert root.attributes["chat.request_id"] == "req-1"
+        assert "chat.topic" not in root.attributes
+        assert outer.parent.span_id == root.context.span_id
+        assert inner.parent.span_id == outer.context.span_id
+        assert outer.attributes["langgraph.node"] == "outer"
+
+    def test_observed_creates_dependency_span(self, exporter):
+        @observed("chromadb", "unit_test_query")
+        def query():
+            return []
+
+        with tracing.span("parent"):
+            query()
+
+        spans = _spans(exporter)
+        assert spans["chromadb.unit_test_query"].parent.span_id == spans["parent"].context.span_id
+
+    def test_errors_are_recorded(self, exporter):
+        with pytest.raises(ValueError):
+            with tracing.span("failing"):
+                raise ValueError("boom")
+
+        span = _spans(exporter)["failing"]
+        assert not span.status.is_ok
+        assert span.events[0].name == "exception"
+
+    def test_sql_spans(self, exporter):
+        engine = create_engine("sqlite://")
+        tracing.trace_engine(engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        span = _spans(exporter)["sql SELECT"]
+        assert span.attributes["db.system"] == "sqlite"
+        assert span.attributes["db.statement"] == "SELECT 1"
+
+
+class TestExportersAndDisabled:
+    """Test the file exporter and the disabled path."""
+
+    def test_file_exporter(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        tracing.set_enabled(True)
+        try:
+            tracing.configure_tracing(exporter=tracing._build_file_exporter(str(path)), batch=False)
+            with tracing.span("one"):
+                pass
+        finally:
+            tracing.shutdown_tracing()
+            tracing.set_enabled(False)
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["one"]
+
+    def test_disabled_is_noop(self):
+        assert not tracing.configure_tracing()
+        assert not tracing.is_active()
+        with tracing.span("ignored") as span:
+            assert span is None
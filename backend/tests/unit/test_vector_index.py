@@ -0,0 +1,164 @@
+"""
+Tests for the local vector index.
+
+Tests for:
+- Cosine top-k and metadata pre-filtering
+- Delete (row compaction) and metadata-only updates
+- Snapshot save / memory-mapped load
+- Change feed application and the semantic search fast path
+"""
+import base64
+import json
+
+import numpy as np
+import pytest
+
+from config import settings
+from services import vector_index
+from services.vector_index import LocalVectorIndex, matches_where
+
+
+@pytest.fixture
+def index():
+    idx = LocalVectorIndex("articles")
+    idx.upsert(
+        ["a1", "a2", "a3"],
+        [[1.0, 0.0], [0.7, 0.7], [0.0, 1.0]],
+        [{"topic": "macro", "article_id": 1}, {"topic": "macro", "article_id": 2}, {"topic": "equity", "article_id": 3}],
+        ["one", "two", "three"],
+    )
+    return idx
+
+
+@pytest.fixture
+def enabled(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "vector_index_enabled", True)
+    monkeypatch.setattr(settings, "vector_index_path", str(tmp_path))
+    vector_index.reset()
+    yield
+    vector_index.reset()
+
+
+class FakeStream:
+    """Minimal Redis stream (xadd / xread / xinfo_stream)."""
+
+    def __init__(self):
+        self.entries = []
+
+    def xadd(self, name, fields, maxlen=None, approximate=True):
+        entry_id = f"{len(self.entries) + 1}-0"
+        self.entries.append((entry_id, dict(fields)))
+        return entry_id
+
+    def xread(self, streams, count=None):
+        position = vector_index._stream_id(next(iter(streams.values())))
+        new = [e for e in self.entries if vector_index._stream_id(e[0]) > position][:count]
+        return [[vector_index.CHANGE_STREAM, new]] if new else []
+
+    def xinfo_stream(self, name):
+        raise Exception("no such key")
+
+
+class TestLocalVectorIndex:
+    """Test queries and writes."""
+
+    def test_query_ranks_by_cosine(self, index):
+        result = index.query([[1.0, 0.1]], n_results=2)
+
+        assert result["ids"] == [["a1", "a2"]]
+        assert result["documents"] == [["one", "two"]]
+        assert result["distances"][0][0] < result["distances"][0][1]
+
+    def test_query_prefilters(self, index):
+        result = index.query([[1.0, 0.0]], n_results=5, where={"topic": "equity"})
+        assert result["ids"] == [["a3"]]
+
+        result = index.query([[1.0, 0.0]], n_results=5, where={"article_id": {"$in": [2, 3]}})
+        assert result["ids"] == [["a2", "a3"]]
+
+        assert matches_where({"type": "text", "resource_id": 4},
+                             {"$and": [{"type": "text"}, {"resource_id": {"$in": [4]}}]})
+
+    def test_delete_and_reinsert(self, index):
+        index.delete(["a1", "missing"])
+        assert index.count() == 2
+        assert index.query([[1.0, 0.0]], n_results=1)["ids"] == [["a2"]]
+
+        index.upsert(["a1"], [[1.0, 0.0]], [{"topic": "macro"}], ["one"])
+        assert index.query([[1.0, 0.0]], n_results=1)["ids"] == [["a1"]]
+
+    def test_snapshot_roundtrip(self, index, tmp_path):
+        index.save(str(tmp_path), "5-0")
+
+        loaded, position = LocalVectorIndex.load("articles", str(tmp_path))
+        assert position == "5-0"
+        assert isinstance(loaded._matrix, np.memmap)
+        assert loaded.query([[0.0, 1.0]], n_results=1)["ids"] == [["a3"]]
+
+        # First write copies the read-only map
+        loaded.upsert(["a4"], [[-1.0, 0.0]], [{"topic": "esg"}], ["four"])
+        assert loaded.count() == 4
+        assert loaded.query([[-1.0, 0.0]], n_results=1)["ids"] == [["a4"]]
+
+    def test_concurrent_saves(self, index, tmp_path):
+        """Workers saving the same snapshot at once use separate temp files."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda n: index.save(str(tmp_path), f"{n}-0"), range(8)))
+
+        loaded, _ = LocalVectorIndex.load("articles", str(tmp_path))
+        assert loaded.count() == 3
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["articles.json", "articles.npy"]
+
+
+class TestChangeFeed:
+    """Test process-wide indexes and the change feed."""
+
+    def test_changes_from_other_workers(self, enabled, monkeypatch):
+        stream = FakeStream()
+        monkeypatch.setattr(vector_index, "_get_feed", lambda: stream)
+        monkeypatch.setattr(vector_index, "build_from_chroma", lambda name: None)
+        assert vector_index.initialize()
+
+        # Written by another worker
+        stream.xadd(vector_index.CHANGE_STREAM, {
+            "collection": "articles", "op": "upsert", "id": "article_7",
+            "payload": json.dumps({
+                "embedding": base64.b64encode(np.array([0.0, 1.0], np.float32).tobytes()).decode(),
+                "metadata": {"article_id": 7},
+                "document": "seven",
+            }),
+        })
+        vector_index._poll_changes(force=True)
+
+        articles = vector_index.get_index(vector_index.ARTICLES)
+        assert articles.query([[0.0, 1.0]], n_results=1)["ids"] == [["article_7"]]
+
+        vector_index.record_metadata(vector_index.ARTICLES, "article_7", {"editor": "ed@example.com"})
+        stored = articles.get(["article_7"])
+        assert stored["metadatas"] == [{"article_id": 7, "editor": "ed@example.com"}]
+        assert articles.query([[0.0, 1.0]], n_results=1)["ids"] == [["article_7"]]
+        assert stream.entries[-1][1]["op"] == "metadata"
+
+        vector_index.record_delete(vector_index.ARTICLES, "article_7")
+        assert articles.count() == 0
+        assert stream.entries[-1][1]["op"] == "delete"
+
+    def test_semantic_search_uses_local_index(self, enabled, monkeypatch):
+        from services.vector_service import VectorService
+
+        monkeypatch.setattr(vector_index, "_get_feed", lambda: None)
+        monkeypatch.setattr(vector_index, "build_from_chroma", lambda name: None)
+        monkeypatch.setattr(VectorService, "_generate_embedding", staticmethod(lambda text: [1.0, 0.0]))
+        vector_index.initialize()
+
+        vector_index.record_upsert(vector_index.ARTICLES, "article_1", [1.0, 0.0],
+                                   {"article_id": 1, "topic": "macro"}, "body")
+        vector_index.record_upsert(vector_index.ARTICLES, "article_2", [1.0, 0.0],
+                                   {"article_id": 2, "topic": "equity"}, "body")
+
+        results = VectorService.semantic_search("rates", topic="macro")
+
+        assert [r["article_id"] for r in results] == [1]
+        assert results[0]["similarity_score"] == pytest.approx(1.0)
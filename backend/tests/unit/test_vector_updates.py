@@ -0,0 +1,123 @@
+"""
+Tests for article updates in the vector database.
+
+Tests for:
+- Metadata-only update when the embedded text is unchanged (no embedding call)
+- Upsert (no delete) when the text changed
+- ContentService routing metadata-only edits and workflow changes
+"""
+from unittest.mock import patch
+
+import pytest
+
+import services.vector_service as vector_service
+from services.content_service import ContentService
+from services.content_store import ContentStore
+from services.vector_service import VectorService
+
+
+class FakeCollection:
+    """Sync collection recording its calls."""
+
+    def __init__(self):
+        self.metadatas = {}
+        self.calls = []
+
+    def get(self, ids, include=None):
+        found = [doc_id for doc_id in ids if doc_id in self.metadatas]
+        return {"ids": found, "metadatas": [self.metadatas[doc_id] for doc_id in found], "documents": []}
+
+    def add(self, ids, embeddings, documents, metadatas):
+        self.calls.append("add")
+        self.metadatas.update(zip(ids, metadatas))
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        self.calls.append("upsert")
+        self.metadatas.update(zip(ids, metadatas))
+
+    def update(self, ids, metadatas):
+        self.calls.append("update")
+        for doc_id, metadata in zip(ids, metadatas):
+            self.metadatas[doc_id] = {**self.metadatas[doc_id], **metadata}
+
+    def delete(self, ids):
+        self.calls.append("delete")
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake = FakeCollection()
+    monkeypatch.setattr(vector_service, "_get_chroma_client", lambda: (None, fake))
+    return fake
+
+
+@pytest.fixture
+def embeddings(monkeypatch):
+    texts = []
+
+    def fake_embedding(text):
+        texts.append(text)
+        return [1.0, 0.0]
+
+    monkeypatch.setattr(VectorService, "_generate_embedding", staticmethod(fake_embedding))
+    return texts
+
+
+METADATA = {"topic": "macro", "author": "analyst@example.com", "keywords": "rates"}
+
+
+class TestVectorServiceUpdate:
+    """Test change detection in VectorService.update_article."""
+
+    def test_unchanged_text_updates_metadata_only(self, collection, embeddings):
+        assert VectorService.add_article(1, "Rates", "Body", METADATA)
+        assert VectorService.update_article(1, "Rates", "Body", {**METADATA, "editor": "ed@example.com"})
+
+        assert collection.calls == ["add", "update"]
+        assert len(embeddings) == 1
+        assert collection.metadatas["article_1"]["editor"] == "ed@example.com"
+
+        # Nothing changed: no write at all
+        assert VectorService.update_article(1, "Rates", "Body", {**METADATA, "editor": "ed@example.com"})
+        assert collection.calls == ["add", "update"]
+
+    def test_changed_text_is_upserted(self, collection, embeddings):
+        VectorService.add_article(1, "Rates", "Body", METADATA)
+        old_hash = collection.metadatas["article_1"]["content_hash"]
+
+        assert VectorService.update_article(1, "Rates", "New body", METADATA)
+        assert VectorService.update_article(2, "Other", "Body", METADATA)
+
+        assert collection.calls == ["add", "upsert", "upsert"]
+        assert embeddings[1] == "Rates\n\nNew body"
+        assert collection.metadatas["article_1"]["content_hash"] != old_hash
+
+
+class TestContentServiceRouting:
+    """Test which vector operation ContentService edits trigger."""
+
+    def test_metadata_edits_skip_reembedding(self, db_session, test_article, mock_redis, mock_chromadb):
+        ContentStore.put(db_session, test_article.id, "Body")
+        db_session.commit()
+
+        with patch.object(VectorService, "update_article") as update, \
+             patch.object(VectorService, "update_article_metadata") as update_metadata:
+            ContentService.update_article(db_session, test_article.id, keywords="rates,fed")
+            assert update_metadata.call_count == 1
+            assert update_metadata.call_args[0][2]["keywords"] == "rates,fed"
+
+            # Autosave with unchanged content
+            ContentService.update_article(db_session, test_article.id, content="Body", priority=2)
+            update.assert_not_called()
+            assert update_metadata.call_count == 1
+
+            ContentService.update_article(db_session, test_article.id, content="New body")
+            assert update.call_args[1]["content"] == "New body"
+
+    def test_submit_updates_metadata_only(self, db_session, test_article, mock_redis, mock_chromadb):
+        with patch.object(VectorService, "update_article") as update, \
+             patch.object(VectorService, "update_article_metadata") as update_metadata:
+            ContentService.submit_article(db_session, test_article.id, "analyst@example.com")
+
+        update.assert_not_called()
+        assert update_metadata.call_args[0][2]["author"] == "analyst@example.com"
@@ -0,0 +1,229 @@
+"""
+OpenTelemetry tracing for the backend.
+
+Spans cover a chat request end to end:
+    chat.invoke                      root span per graph run (request id, thread id)
+      main.<node>                    each node of the v2 graph (router, role nodes, ...)
+        article_content.<node>       analyst article subgraph nodes
+        resource.<node>              analyst resource subgraph nodes
+        chromadb.<operation>         VectorService / ResourceService calls
+        openai.embeddings            embedding requests
+        sql <VERB>                   every statement on the SQLAlchemy engine
+
+Node and dependency spans come from the same instrumentation points as the
+Prometheus metrics (metrics.instrument_node, metrics.observed).
+
+Exporters (TRACING_EXPORTER):
+    otlp     - OTLP/gRPC to TRACING_OTLP_ENDPOINT (collector, Jaeger, Tempo)
+    file     - one JSON span per line in TRACING_FILE_PATH (offline analysis)
+    console  - pretty-printed spans on stdout
+
+Usage:
+    from tracing import span
+
+    with span("pdf.render", {"article.id": article_id}):
+        ...
+
+Tracing is off by default (TRACING_ENABLED=false); span() then returns a
+shared no-op context manager and nothing is wrapped.
+"""
+
+import contextlib
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+import logging
+
+from config import settings
+
+logger = logging.getLogger("uvicorn")
+
+_enabled = settings.tracing_enabled
+_provider = None
+_tracer = None
+
+_NOOP = contextlib.nullcontext()
+
+MAX_STATEMENT_LENGTH = 500
+
+
+def is_enabled() -> bool:
+    """Check if tracing is enabled in settings."""
+    return _enabled
+
+
+def is_active() -> bool:
+    """Check if a tracer provider has been configured (spans are recorded)."""
+    return _tracer is not None
+
+
+def set_enabled(enabled: bool):
+    """Enable or disable tracing at runtime (used by tests)."""
+    global _enabled
+    _enabled = enabled
+
+
+# =============================================================================
+# SETUP
+# =============================================================================
+
+def _build_file_exporter(path: str):
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+    class JsonLinesSpanExporter(SpanExporter):
+        """Appends finished spans to a file, one JSON object per line."""
+
+        def __init__(self, file_path: str):
+            self._file = open(file_path, "a", encoding="utf-8")
+            self._lock = threading.Lock()
+
+        def export(self, spans):
+            with self._lock:
+                for finished in spans:
+                    self._file.write(finished.to_json(indent=None) + "\n")
+                self._file.flush()
+            return SpanExportResult.SUCCESS
+
+        def shutdown(self):
+            with self._lock:
+                self._file.close()
+
+    return JsonLinesSpanExporter(path)
+
+
+def _build_exporter():
+    """Create the span exporter selected in settings."""
+    kind = settings.tracing_exporter.lower()
+    if kind == "file":
+        return _build_file_exporter(settings.tracing_file_path)
+    if kind == "console":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+        return ConsoleSpanExporter()
+    if kind == "otlp":
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        endpoint = settings.tracing_otlp_endpoint
+        return OTLPSpanExporter(endpoint=endpoint, insecure=endpoint.startswith("http://"))
+    raise ValueError(f"Unknown tracing exporter: {settings.tracing_exporter}")
+
+
+def configure_tracing(exporter=None, batch: bool = True) -> bool:
+    """
+    Set up the tracer provider and exporter.
+
+    Args:
+        exporter: Span exporter to use (default: from settings)
+        batch: Export in a background thread (False exports synchronously)
+
+    Returns:
+        True if tracing is active
+    """
+    global _provider, _tracer
+    if not _enabled:
+        logger.debug("Tracing: disabled")
+        return False
+    if _tracer is not None:
+        return True
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+
+        exporter = exporter or _build_exporter()
+        provider = TracerProvider(
+            resource=Resource.create({"service.name": settings.tracing_service_name})
+        )
+        processor = BatchSpanProcessor(exporter) if batch else SimpleSpanProcessor(exporter)
+        provider.add_span_processor(processor)
+    except Exception as e:
+        logger.error(f"Tracing: failed to configure exporter: {e}")
+        return False
+
+    _provider = provider
+    _tracer = provider.get_tracer("chatbot")
+    logger.info(f"Tracing enabled: exporter={type(exporter).__name__}")
+    return True
+
+
+def shutdown_tracing():
+    """Flush pending spans and drop the tracer provider."""
+    global _provider, _tracer
+    if _provider is not None:
+        _provider.shutdown()
+    _provider = None
+    _tracer = None
+
+
+# =============================================================================
+# SPANS
+# =============================================================================
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """
+    Context manager for a span that is a child of the current span.
+
+    Exceptions are recorded on the span and re-raised.
+
+    Args:
+        name: Span name
+        attributes: Span attributes (None values are dropped)
+    """
+    if _tracer is None:
+        return _NOOP
+    if attributes:
+        attributes = {k: v for k, v in attributes.items() if v is not None}
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def traced(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """Decorator wrapping each call of a function in a span."""
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with span(name, attributes):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# =============================================================================
+# SQLALCHEMY
+# =============================================================================
+
+def trace_engine(engine):
+    """Record a span for every SQL statement executed on an engine."""
+    if not _enabled:
+        return
+
+    from sqlalchemy import event
+
+    db_system = engine.dialect.name
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _tracer is None:
+            return
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement else "UNKNOWN"
+        sql_span = _tracer.start_span(
+            f"sql {verb}",
+            attributes={"db.system": db_system, "db.statement": statement[:MAX_STATEMENT_LENGTH]},
+        )
+        conn.info.setdefault("tracing_spans", []).append(sql_span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get("tracing_spans")
+        if spans:
+            spans.pop().end()
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        spans = context.connection.info.get("tracing_spans") if context.connection else None
+        if spans:
+            from opentelemetry.trace import Status, StatusCode
+            sql_span = spans.pop()
+            sql_span.record_exception(context.original_exception)
+            sql_span.set_status(Status(StatusCode.ERROR, str(context.original_exception)))
+            sql_span.end()
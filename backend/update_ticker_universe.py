@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Rebuild the ticker universe from exchange symbol directory files.
+
+Reads the pipe-delimited NASDAQ Trader symbol directory files
+(nasdaqlisted.txt, otherlisted.txt; downloaded separately, no network access
+needed here) and writes the symbol,name,aliases CSV used by
+services/ticker_universe.py. Rows already in the current file are kept first,
+so their aliases, index symbols and names take precedence. Running services
+pick up the new file on their next lookup.
+
+Run with: uv run python update_ticker_universe.py nasdaqlisted.txt otherlisted.txt [--output PATH]
+"""
+
+import argparse
+import csv
+import os
+import re
+import sys
+import tempfile
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.ticker_universe import universe_path
+
+# Listed symbols kept (class shares like BRK.B included; warrants/preferreds with $ or = skipped)
+LISTED_SYMBOL = re.compile(r"^[A-Z]{1,5}(?:\.[A-Z])?$")
+
+
+def read_listing(path):
+    """(symbol, name) rows of a symbol directory file, without test issues."""
+    rows = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f, delimiter="|"):
+            symbol = (row.get("Symbol") or row.get("ACT Symbol") or "").strip()
+            if not LISTED_SYMBOL.match(symbol) or row.get("Test Issue") == "Y":
+                continue
+            # "Apple Inc. - Common Stock" -> "Apple Inc."
+            name = (row.get("Security Name") or "").split(" - ")[0].strip()
+            rows.append((symbol.replace(".", "-"), name))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("listings", nargs="+", help="nasdaqlisted.txt / otherlisted.txt")
+    parser.add_argument("--output", default=universe_path(), help="Universe CSV to write")
+    args = parser.parse_args()
+
+    rows = {}
+    if os.path.exists(args.output):
+        with open(args.output, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                rows[row["symbol"]] = (row["name"], row.get("aliases") or "")
+    kept = len(rows)
+
+    for path in args.listings:
+        for symbol, name in read_listing(path):
+            rows.setdefault(symbol, (name, ""))
+
+    directory = os.path.dirname(os.path.abspath(args.output))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["symbol", "name", "aliases"])
+        for symbol, (name, aliases) in rows.items():
+            writer.writerow([symbol, name, aliases])
+    os.replace(tmp_path, args.output)
+
+    print(f"=== Done: {len(rows)} symbols written to {args.output} ({kept} kept, {len(rows) - kept} added) ===")
+
+
+if __name__ == "__main__":
+    main()